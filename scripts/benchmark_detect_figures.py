@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+"""
+Micro-benchmark the anchor-prefiltered figure detection in src/body_extract.py.
+
+Times add_figure_metadata() and inject_markers_in_sections() on a corpus of
+translation JSON files (default: data/translated, falling back to the test
+fixtures) with and without the literal-anchor prefilter. The unfiltered run
+patches _figure_anchors() to report every anchor, so every pattern is
+searched on every paragraph. This is the pre-prefilter behavior. Both runs
+must produce identical output for the timings to count.
+
+Results are written to reports/detect_figures_benchmark/benchmark_result.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src import body_extract  # noqa: E402
+from src.body_extract import (  # noqa: E402
+    FIGURE_ANCHORS,
+    add_figure_metadata,
+    inject_markers_in_sections,
+)
+
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "translation"
+
+# Mixed into fixture-only corpora so detections actually happen
+FIGURE_SAMPLES = [
+    "As shown in Figure 3, accuracy improves over the baseline.",
+    "Table 2: Hyperparameters used for all runs.",
+    "如图1所示,数据分布呈正态分布。",
+    "表 3 给出了不同方法的对比结果。",
+]
+
+
+def load_records(corpus_dir: Path) -> List[Dict[str, Any]]:
+    records = []
+    for path in sorted(corpus_dir.glob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict) and (data.get("body_en") or data.get("body_md")):
+            records.append(data)
+    return records
+
+
+def _sections(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+    paragraphs = [p for p in (record.get("body_en") or []) if isinstance(p, str)]
+    return [{"name": "Body", "paragraphs": paragraphs}]
+
+
+def _run(records: List[Dict[str, Any]]) -> List[Any]:
+    out = []
+    for record in records:
+        out.append(add_figure_metadata(copy.deepcopy(record)))
+        out.append(inject_markers_in_sections(_sections(record)))
+    return out
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def benchmark(records: List[Dict[str, Any]], repeat: int) -> dict:
+    unfiltered = patch.object(
+        body_extract, "_figure_anchors", lambda para: set(FIGURE_ANCHORS)
+    )
+
+    prefiltered_out = _run(records)
+    with unfiltered:
+        unfiltered_out = _run(records)
+        unfiltered_s = _time(lambda: _run(records), repeat)
+    prefiltered_s = _time(lambda: _run(records), repeat)
+
+    paragraphs = sum(len(r.get("body_en") or []) for r in records)
+    candidates = sum(
+        1
+        for r in records
+        for p in (r.get("body_en") or [])
+        if isinstance(p, str) and body_extract._figure_anchors(p)
+    )
+    return {
+        "records": len(records),
+        "paragraphs": paragraphs,
+        "candidate_paragraphs": candidates,
+        "identical_output": prefiltered_out == unfiltered_out,
+        "unfiltered_ms": round(unfiltered_s * 1000, 3),
+        "prefiltered_ms": round(prefiltered_s * 1000, 3),
+        "speedup": round(unfiltered_s / prefiltered_s, 2) if prefiltered_s else None,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark figure detection.")
+    parser.add_argument(
+        "--corpus-dir",
+        type=Path,
+        default=REPO_ROOT / "data" / "translated",
+        help="Directory of translation JSON files (default: data/translated).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repeats.")
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=REPO_ROOT / "reports" / "detect_figures_benchmark",
+        help="Directory for benchmark_result.json.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    records = load_records(args.corpus_dir) if args.corpus_dir.exists() else []
+    corpus = str(args.corpus_dir)
+    if not records:
+        records = load_records(FIXTURE_DIR)
+        corpus = str(FIXTURE_DIR)
+        for i, record in enumerate(records):
+            body = list(record.get("body_en") or [])
+            body.append(FIGURE_SAMPLES[i % len(FIGURE_SAMPLES)])
+            record["body_en"] = body
+    if not records:
+        print("No translation records found in corpus", file=sys.stderr)
+        return 1
+
+    metrics = {"corpus": corpus, **benchmark(records, max(1, args.repeat))}
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    result_path = args.out_dir / "benchmark_result.json"
+    result_path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+    print(json.dumps(metrics, indent=2))
+    return 0 if metrics["identical_output"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark figure deduplication in src/figure_pipeline/extractor.py.
+
+Compares the numpy aHash + multi-index lookup against the previous pure-Python
+implementation (bit-string average hash, linear Hamming scan over every
+earlier hash), which is reproduced below. Both run over the same image
+sequence: the embedded images of the PDFs in --pdf-dir, or a synthetic set
+of random figures with re-encoded, resized and noisy near-duplicates mixed
+in. The hashes and every keep/drop decision must be identical for the
+timings to count.
+
+A second, hash-free run times only the lookup on --lookup-size random
+hashes, where the linear scan's quadratic cost shows.
+
+Results are written to reports/figure_dedup_benchmark/benchmark_result.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.figure_pipeline.extractor import (  # noqa: E402
+    HASH_DIFF_THRESHOLD,
+    HASH_SIZE,
+)
+from src.figure_pipeline.image_hash import (  # noqa: E402
+    HASH_ALGORITHMS,
+    HashIndex,
+    hash_image_bytes,
+)
+
+
+def legacy_hash(image_bytes: bytes) -> Optional[str]:
+    """The extractor's original average hash (hex string)."""
+    try:
+        from PIL import Image
+
+        img = Image.open(io.BytesIO(image_bytes))
+        img = img.resize((HASH_SIZE, HASH_SIZE), Image.Resampling.LANCZOS)
+        gray = img.convert("L")
+        pixels = list(gray.getdata())
+        avg = sum(pixels) / len(pixels)
+        bits = "".join("1" if p > avg else "0" for p in pixels)
+        return format(int(bits, 2), f"0{HASH_SIZE * HASH_SIZE // 4}x")
+    except Exception:
+        return None
+
+
+def legacy_decisions(hashes: List[Optional[str]]) -> List[bool]:
+    """True = duplicate, using the original linear Hamming scan."""
+    seen: List[str] = []
+    out = []
+    for new in hashes:
+        dup = bool(new) and any(
+            len(new) == len(old)
+            and bin(int(new, 16) ^ int(old, 16)).count("1") <= HASH_DIFF_THRESHOLD
+            for old in seen
+        )
+        out.append(dup)
+        if new and not dup:
+            seen.append(new)
+    return out
+
+
+def indexed_decisions(hashes: List[Optional[int]]) -> List[bool]:
+    index = HashIndex(HASH_DIFF_THRESHOLD)
+    out = []
+    for new in hashes:
+        dup = new is not None and index.has_within(new)
+        out.append(dup)
+        if new is not None and not dup:
+            index.add(new)
+    return out
+
+
+def pdf_images(pdf_dir: Path, limit: int) -> List[bytes]:
+    import fitz
+
+    images: List[bytes] = []
+    for pdf in sorted(pdf_dir.glob("*.pdf")):
+        with fitz.open(str(pdf)) as doc:
+            for page in doc:
+                for info in page.get_images(full=True):
+                    base = doc.extract_image(info[0])
+                    if base:
+                        images.append(base["image"])
+                    if len(images) >= limit:
+                        return images
+    return images
+
+
+def synthetic_images(count: int, seed: int) -> List[bytes]:
+    """Random figures; about a third are perturbed copies of earlier ones."""
+    from PIL import Image, ImageDraw, ImageFilter
+
+    rng = random.Random(seed)
+    originals: List[Image.Image] = []
+    images: List[bytes] = []
+    for _ in range(count):
+        if originals and rng.random() < 0.35:
+            img = rng.choice(originals)
+            variant = rng.choice(["jpeg", "resize", "blur", "noise"])
+            if variant == "resize":
+                img = img.resize((img.width * 3 // 4, img.height * 3 // 4))
+            elif variant == "blur":
+                img = img.filter(ImageFilter.GaussianBlur(1))
+            elif variant == "noise":
+                img = img.copy()
+                draw = ImageDraw.Draw(img)
+                for _ in range(30):
+                    x, y = rng.randrange(img.width), rng.randrange(img.height)
+                    draw.point((x, y), fill=(rng.randrange(256),) * 3)
+            fmt = "JPEG" if variant == "jpeg" else "PNG"
+        else:
+            img = Image.new(
+                "RGB", (rng.randint(200, 500), rng.randint(150, 400)), "white"
+            )
+            draw = ImageDraw.Draw(img)
+            for _ in range(rng.randint(3, 12)):
+                x0, y0 = rng.randrange(img.width), rng.randrange(img.height)
+                box = [x0, y0, x0 + rng.randint(10, 150), y0 + rng.randint(10, 150)]
+                color = tuple(rng.randrange(256) for _ in range(3))
+                if rng.random() < 0.5:
+                    draw.rectangle(box, fill=color)
+                else:
+                    draw.ellipse(box, outline=color, width=3)
+            originals.append(img)
+            fmt = "PNG"
+        buf = io.BytesIO()
+        img.save(buf, format=fmt)
+        images.append(buf.getvalue())
+    return images
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def benchmark(images: List[bytes], lookup_size: int, repeat: int) -> dict:
+    old_hashes = [legacy_hash(b) for b in images]
+    new_hashes = [hash_image_bytes(b, "ahash", HASH_SIZE) for b in images]
+    hashes_match = [
+        None if h is None else format(h, f"0{HASH_SIZE * HASH_SIZE // 4}x")
+        for h in new_hashes
+    ] == old_hashes
+    old_decisions = legacy_decisions(old_hashes)
+    new_decisions = indexed_decisions(new_hashes)
+
+    hash_old_s = _time(lambda: [legacy_hash(b) for b in images], repeat)
+    hash_new_s = _time(lambda: [hash_image_bytes(b) for b in images], repeat)
+
+    # Lookup-only: random 64-bit hashes, so nearly every image is kept and the
+    # linear scan grows with every accepted hash
+    rng = random.Random(0)
+    ints = [rng.getrandbits(HASH_SIZE * HASH_SIZE) for _ in range(lookup_size)]
+    hexes = [format(h, f"0{HASH_SIZE * HASH_SIZE // 4}x") for h in ints]
+    lookup_old_s = _time(lambda: legacy_decisions(hexes), repeat)
+    lookup_new_s = _time(lambda: indexed_decisions(ints), repeat)
+
+    other_algorithms = {}
+    for algorithm in HASH_ALGORITHMS:
+        if algorithm != "ahash":
+            hashes = [hash_image_bytes(b, algorithm, HASH_SIZE) for b in images]
+            other_algorithms[algorithm] = sum(indexed_decisions(hashes))
+
+    return {
+        "images": len(images),
+        "duplicates": sum(old_decisions),
+        "hashes_identical": hashes_match,
+        "decisions_identical": old_decisions == new_decisions,
+        "hash_legacy_ms": round(hash_old_s * 1000, 3),
+        "hash_numpy_ms": round(hash_new_s * 1000, 3),
+        "lookup_hashes": lookup_size,
+        "lookup_linear_ms": round(lookup_old_s * 1000, 3),
+        "lookup_indexed_ms": round(lookup_new_s * 1000, 3),
+        "lookup_speedup": round(lookup_old_s / lookup_new_s, 2)
+        if lookup_new_s
+        else None,
+        "duplicates_by_algorithm": {"ahash": sum(new_decisions), **other_algorithms},
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark figure deduplication.")
+    parser.add_argument(
+        "--pdf-dir",
+        type=Path,
+        default=REPO_ROOT / "data" / "pdfs",
+        help="PDFs whose embedded images form the corpus (default: data/pdfs).",
+    )
+    parser.add_argument(
+        "--count", type=int, default=600, help="Images (synthetic or max from PDFs)."
+    )
+    parser.add_argument(
+        "--lookup-size", type=int, default=5000, help="Hashes for the lookup run."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats.")
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=REPO_ROOT / "reports" / "figure_dedup_benchmark",
+        help="Directory for benchmark_result.json.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    images = pdf_images(args.pdf_dir, args.count) if args.pdf_dir.exists() else []
+    corpus = str(args.pdf_dir)
+    if not images:
+        images = synthetic_images(args.count, seed=1)
+        corpus = "synthetic"
+
+    metrics = {
+        "corpus": corpus,
+        **benchmark(images, args.lookup_size, max(1, args.repeat)),
+    }
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    result_path = args.out_dir / "benchmark_result.json"
+    result_path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+    print(json.dumps(metrics, indent=2))
+    identical = metrics["hashes_identical"] and metrics["decisions_identical"]
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
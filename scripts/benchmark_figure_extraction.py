@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark FigureExtractor.extract_all() in src/figure_pipeline/extractor.py.
+
+Compares the current extractor against the previous per-image loop, which is
+reproduced below as LegacyFigureExtractor. The legacy loop decodes every
+image before checking its dimensions, computes pixel variance in pure
+Python, decodes an image again each time it reappears on a later page, and
+calls page.get_image_info() once per image instead of once per page.
+
+The corpus is the PDFs in --pdf-dir, or a synthetic figure-heavy PDF:
+a JPEG photo and a lossless chart on every page, a logo and small icons repeated on each
+page, and some figures placed on several pages. Both extractors must accept
+the same images at the same pages and bounding boxes (to 0.001 pt) for
+the timings to count. The extraction cache is disabled for both runs.
+
+Results are written to reports/figure_extraction_benchmark/benchmark_result.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.figure_pipeline.extractor import (  # noqa: E402
+    HASH_DIFF_THRESHOLD,
+    MIN_EDGE_DENSITY,
+    MIN_VARIANCE,
+    FigureExtractor,
+)
+from src.figure_pipeline.image_hash import HashIndex  # noqa: E402
+from src.figure_pipeline.models import PipelineConfig  # noqa: E402
+
+
+class LegacyFigureExtractor(FigureExtractor):
+    """The extractor's per-image loop before per-page metadata and prefilters."""
+
+    def _has_visual_content(self, image_bytes: bytes) -> Tuple[bool, str]:
+        from PIL import Image
+
+        try:
+            gray = Image.open(io.BytesIO(image_bytes)).convert("L")
+            pixels = list(gray.getdata())
+            mean = sum(pixels) / len(pixels)
+            variance = sum((p - mean) ** 2 for p in pixels) / len(pixels)
+            if variance < MIN_VARIANCE:
+                return False, "low variance"
+            width, height = gray.size
+            step = max(1, min(width, height) // 50)
+            edges = sampled = 0
+            for y in range(1, height - 1, step):
+                for x in range(1, width - 1, step):
+                    gx = abs(gray.getpixel((x + 1, y)) - gray.getpixel((x - 1, y)))
+                    gy = abs(gray.getpixel((x, y + 1)) - gray.getpixel((x, y - 1)))
+                    sampled += 1
+                    edges += gx + gy > 30
+            if sampled and edges / sampled < MIN_EDGE_DENSITY:
+                return False, "low edge density"
+            return True, "passed"
+        except Exception as e:
+            return True, f"analysis failed: {e}"
+
+    def extract_all(self, pdf_path: str, output_dir: str) -> List[Any]:
+        os.makedirs(output_dir, exist_ok=True)
+        paper_id = os.path.basename(pdf_path).replace(".pdf", "")
+        figures = []
+        seen_hashes = HashIndex(HASH_DIFF_THRESHOLD)
+        with self.fitz.open(pdf_path) as doc:
+            for page_num in range(len(doc)):
+                page = doc[page_num]
+                for img_info in page.get_images(full=True):
+                    xref = img_info[0]
+                    base_image = doc.extract_image(xref)
+                    if not base_image:
+                        continue
+                    image_bytes = base_image["image"]
+                    width = base_image.get("width")
+                    height = base_image.get("height")
+                    if not self._passes_size_filter(image_bytes, width, height)[0]:
+                        continue
+                    if not self._has_visual_content(image_bytes)[0]:
+                        continue
+                    img_hash = self._compute_perceptual_hash(image_bytes)
+                    if img_hash is not None and seen_hashes.has_within(img_hash):
+                        continue
+                    if img_hash is not None:
+                        seen_hashes.add(img_hash)
+                    bbox = None
+                    for item in page.get_image_info(xrefs=True):
+                        if item.get("xref") == xref:
+                            bbox = item.get("bbox", [0, 0, 0, 0])
+                            break
+                    meta = {
+                        "page": page_num,
+                        "xref": xref,
+                        "ext": base_image.get("ext", "png"),
+                        "bbox": list(bbox) if bbox else None,
+                    }
+                    figures.append(
+                        self._save_figure(
+                            image_bytes,
+                            meta,
+                            str(len(figures) + 1),
+                            paper_id,
+                            output_dir,
+                        )
+                    )
+        return figures
+
+
+def _encode(img, fmt: str = "PNG") -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format=fmt)
+    return buf.getvalue()
+
+
+def _figure(rng: random.Random, width: int, height: int, fmt: str = "PNG") -> bytes:
+    from PIL import Image, ImageDraw
+
+    img = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(img)
+    for _ in range(rng.randint(6, 20)):
+        x0, y0 = rng.randrange(width), rng.randrange(height)
+        box = [x0, y0, x0 + rng.randint(20, 300), y0 + rng.randint(20, 300)]
+        draw.rectangle(box, fill=tuple(rng.randrange(256) for _ in range(3)))
+    for _ in range(width * height // 40):
+        xy = (rng.randrange(width), rng.randrange(height))
+        draw.point(xy, fill=(rng.randrange(256),) * 3)
+    return _encode(img, fmt)
+
+
+def synthetic_pdf(path: Path, pages: int, seed: int) -> None:
+    """A figure-heavy paper with repeated logos, icons and figures."""
+    import fitz
+    from PIL import Image
+
+    rng = random.Random(seed)
+    logo = _encode(Image.new("RGB", (90, 40), (20, 60, 140)))
+    icons = [_figure(rng, 64, 64) for _ in range(3)]
+    shared = [_figure(rng, 700, 500) for _ in range(2)]
+    shared_xrefs: List[int] = []
+    logo_xref = 0
+    icon_xrefs: List[int] = []
+
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page()
+        if logo_xref:
+            page.insert_image(fitz.Rect(20, 20, 110, 60), xref=logo_xref)
+        else:
+            logo_xref = page.insert_image(fitz.Rect(20, 20, 110, 60), stream=logo)
+        for i, icon in enumerate(icons):
+            rect = fitz.Rect(480 + i * 30, 20, 504 + i * 30, 44)
+            if len(icon_xrefs) > i:
+                page.insert_image(rect, xref=icon_xrefs[i])
+            else:
+                icon_xrefs.append(page.insert_image(rect, stream=icon))
+        for slot in range(2):
+            rect = fitz.Rect(60, 80 + slot * 340, 540, 400 + slot * 340)
+            if page_num % 5 == 4 and slot == 0:
+                # Shared figure, embedded once and placed on several pages
+                index = (page_num // 5) % len(shared)
+                if len(shared_xrefs) > index:
+                    page.insert_image(rect, xref=shared_xrefs[index])
+                else:
+                    shared_xrefs.append(page.insert_image(rect, stream=shared[index]))
+            else:
+                # Photos are embedded as JPEG, charts as lossless images
+                width, height = rng.randint(500, 900), rng.randint(350, 650)
+                fmt = "JPEG" if slot else "PNG"
+                page.insert_image(rect, stream=_figure(rng, width, height, fmt))
+    doc.save(str(path))
+    doc.close()
+
+
+def _summary(figures: List[Any]) -> List[Tuple[Any, ...]]:
+    # Bounding boxes come from different PyMuPDF calls, which agree to float
+    # precision only
+    return [
+        (
+            f.figure_number,
+            f.location.page_number,
+            f.location.bounding_box or (),
+            Path(f.original_path).read_bytes(),
+        )
+        for f in figures
+    ]
+
+
+def _same(legacy: List[Tuple[Any, ...]], current: List[Tuple[Any, ...]]) -> bool:
+    return len(legacy) == len(current) and all(
+        a[:2] == b[:2]
+        and a[3] == b[3]
+        and len(a[2]) == len(b[2])
+        and all(
+            math.isclose(x, y, abs_tol=1e-3) for x, y in zip(a[2], b[2], strict=True)
+        )
+        for a, b in zip(legacy, current, strict=True)
+    )
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def benchmark(pdfs: List[Path], repeat: int, work_dir: Path) -> dict:
+    config = PipelineConfig()
+    current = FigureExtractor(config)
+    legacy = LegacyFigureExtractor(config)
+
+    def run(extractor: FigureExtractor, name: str) -> List[Any]:
+        out = []
+        for pdf in pdfs:
+            out.extend(extractor.extract_all(str(pdf), str(work_dir / name / pdf.stem)))
+        return out
+
+    legacy_out = _summary(run(legacy, "legacy"))
+    current_out = _summary(run(current, "current"))
+    legacy_s = _time(lambda: run(legacy, "legacy"), repeat)
+    current_s = _time(lambda: run(current, "current"), repeat)
+
+    import fitz
+
+    pages = images = 0
+    for pdf in pdfs:
+        with fitz.open(str(pdf)) as doc:
+            pages += len(doc)
+            images += sum(len(page.get_images()) for page in doc)
+    return {
+        "pdfs": len(pdfs),
+        "pages": pages,
+        "image_placements": images,
+        "figures": len(current_out),
+        "identical_output": _same(legacy_out, current_out),
+        "legacy_ms": round(legacy_s * 1000, 3),
+        "current_ms": round(current_s * 1000, 3),
+        "speedup": round(legacy_s / current_s, 2) if current_s else None,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark figure extraction.")
+    parser.add_argument(
+        "--pdf-dir",
+        type=Path,
+        default=REPO_ROOT / "data" / "pdfs",
+        help="PDFs to extract from (default: data/pdfs).",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=20, help="Max PDFs from --pdf-dir."
+    )
+    parser.add_argument(
+        "--pages", type=int, default=30, help="Pages in the synthetic PDF."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats.")
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=REPO_ROOT / "reports" / "figure_extraction_benchmark",
+        help="Directory for benchmark_result.json.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    # Both extractors must do the full work on every run
+    os.environ["EXTRACTION_CACHE_DIR"] = ""
+
+    with tempfile.TemporaryDirectory(prefix="figure_extract_bench_") as tmp:
+        work_dir = Path(tmp)
+        pdfs = []
+        if args.pdf_dir.exists():
+            pdfs = sorted(args.pdf_dir.glob("*.pdf"))[: args.limit]
+        corpus = str(args.pdf_dir)
+        if not pdfs:
+            pdfs = [work_dir / "synthetic.pdf"]
+            synthetic_pdf(pdfs[0], args.pages, seed=3)
+            corpus = f"synthetic ({args.pages} pages)"
+        metrics = {
+            "corpus": corpus,
+            **benchmark(pdfs, max(1, args.repeat), work_dir),
+        }
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    result_path = args.out_dir / "benchmark_result.json"
+    result_path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+    print(json.dumps(metrics, indent=2))
+    return 0 if metrics["identical_output"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
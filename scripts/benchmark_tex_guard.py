@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark the single-pass math masking engine in src/tex_guard.py.
+
+Compares mask_math / unmask_math / verify_token_parity against the previous
+sequential implementation (one regex substitution per pattern, one
+str.replace / str.count per token) on ~100 KB bodies built from a corpus of
+translation JSON files (default: data/translated, falling back to the test
+fixtures). Both engines must mask the same spans for the timings to count.
+
+Results are written to reports/tex_guard_benchmark/benchmark_result.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.tex_guard import (  # noqa: E402
+    MATH_PATTERNS,
+    MATH_TOKEN_FMT,
+    Masking,
+    mask_math,
+    unmask_math,
+    verify_token_parity,
+)
+
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "translation"
+
+# Mixed into fixture-only corpora so the benchmark exercises every pattern
+MATH_SAMPLES = [
+    "where $x_i \\in \\mathbb{R}^d$ denotes the input",
+    "$$\\mathcal{L} = -\\sum_{i=1}^{N} y_i \\log \\hat{y}_i$$",
+    "as shown in \\cite{zhang2023} and \\ref{fig:arch}",
+    "\\begin{equation}\nf(x) = \\int_0^1 g(t)\\,dt\n\\end{equation}",
+    "the bound \\(O(n \\log n)\\) holds \\label{eq:bound}",
+    "\\textbf{Result} follows from \\eqref{eq:main}",
+]
+
+
+def legacy_mask_math(text: str) -> Tuple[str, List[Masking]]:
+    mappings: List[Masking] = []
+    out = text
+    for pat in MATH_PATTERNS:
+
+        def _repl(m):
+            token = MATH_TOKEN_FMT.format(len(mappings) + 1)
+            mappings.append(Masking(token=token, content=m.group(0)))
+            return token
+
+        out = pat.sub(_repl, out)
+    return out, mappings
+
+
+def legacy_unmask_math(text: str, mappings: List[Masking]) -> str:
+    out = text
+    for m in mappings:
+        out = out.replace(m.token, m.content)
+    return out
+
+
+def legacy_verify_token_parity(mappings: List[Masking], text: str) -> bool:
+    return all(text.count(m.token) == 1 for m in mappings)
+
+
+def load_paragraphs(corpus_dir: Path) -> List[str]:
+    paragraphs: List[str] = []
+    for path in sorted(corpus_dir.glob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        if data.get("abstract_en"):
+            paragraphs.append(str(data["abstract_en"]))
+        paragraphs.extend(str(p) for p in (data.get("body_en") or []) if p)
+    return paragraphs
+
+
+def build_bodies(paragraphs: List[str], size: int, count: int) -> List[str]:
+    bodies = []
+    for offset in range(count):
+        parts: List[str] = []
+        total = 0
+        idx = offset
+        while total < size:
+            para = paragraphs[idx % len(paragraphs)]
+            parts.append(para)
+            total += len(para) + 2
+            idx += 1
+        bodies.append("\n\n".join(parts)[:size])
+    return bodies
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def benchmark(bodies: List[str], repeat: int) -> dict:
+    legacy = {"mask": 0.0, "unmask": 0.0, "parity": 0.0}
+    current = {"mask": 0.0, "unmask": 0.0, "parity": 0.0}
+    mismatches = 0
+    spans = 0
+
+    for body in bodies:
+        old_masked, old_map = legacy_mask_math(body)
+        new_masked, new_map = mask_math(body)
+        spans += len(new_map)
+        if sorted(m.content for m in old_map) != sorted(m.content for m in new_map):
+            mismatches += 1
+        if unmask_math(new_masked, new_map) != body:
+            mismatches += 1
+
+        legacy["mask"] += _time(lambda b=body: legacy_mask_math(b), repeat)
+        current["mask"] += _time(lambda b=body: mask_math(b), repeat)
+        legacy["unmask"] += _time(
+            lambda t=old_masked, m=old_map: legacy_unmask_math(t, m), repeat
+        )
+        current["unmask"] += _time(
+            lambda t=new_masked, m=new_map: unmask_math(t, m), repeat
+        )
+        legacy["parity"] += _time(
+            lambda t=old_masked, m=old_map: legacy_verify_token_parity(m, t), repeat
+        )
+        current["parity"] += _time(
+            lambda t=new_masked, m=new_map: verify_token_parity(m, t), repeat
+        )
+
+    n = len(bodies)
+    return {
+        "bodies": n,
+        "body_chars": len(bodies[0]) if bodies else 0,
+        "mean_spans_per_body": round(spans / n, 1) if n else 0,
+        "span_mismatches": mismatches,
+        "legacy_ms": {k: round(v / n * 1000, 3) for k, v in legacy.items()},
+        "single_pass_ms": {k: round(v / n * 1000, 3) for k, v in current.items()},
+        "speedup": {
+            k: round(legacy[k] / current[k], 2) if current[k] else None for k in legacy
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark tex_guard masking.")
+    parser.add_argument(
+        "--corpus-dir",
+        type=Path,
+        default=REPO_ROOT / "data" / "translated",
+        help="Directory of translation JSON files (default: data/translated).",
+    )
+    parser.add_argument(
+        "--size", type=int, default=100_000, help="Body size in characters."
+    )
+    parser.add_argument("--bodies", type=int, default=10, help="Bodies to build.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repeats.")
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=REPO_ROOT / "reports" / "tex_guard_benchmark",
+        help="Directory for benchmark_result.json.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    paragraphs = load_paragraphs(args.corpus_dir) if args.corpus_dir.exists() else []
+    corpus = str(args.corpus_dir)
+    if not paragraphs:
+        paragraphs = load_paragraphs(FIXTURE_DIR)
+        corpus = str(FIXTURE_DIR)
+    if not any("$" in p or "\\" in p for p in paragraphs):
+        # Interleave math so every alternative in the scanner is exercised
+        paragraphs = [
+            f"{p} {MATH_SAMPLES[i % len(MATH_SAMPLES)]}."
+            for i, p in enumerate(paragraphs)
+        ]
+    if not paragraphs:
+        print("No paragraphs found in corpus", file=sys.stderr)
+        return 1
+
+    bodies = build_bodies(paragraphs, args.size, args.bodies)
+    metrics = {"corpus": corpus, **benchmark(bodies, args.repeat)}
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    result_path = args.out_dir / "benchmark_result.json"
+    result_path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+    print(json.dumps(metrics, indent=2))
+    return 0 if metrics["span_mismatches"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark figure preprocessing before Gemini translation (src/figure_pipeline/image_prep.py).
+
+Compares sending each figure at native resolution (the previous behaviour)
+with the downscaled/re-encoded input from prepare_image(), per model limit
+in PipelineConfig.translation_max_side.
+
+Offline (default), for every image and model:
+- request size: base64 payload bytes
+- estimated upload time at --uplink-mbps
+- estimated input tokens and cost: Gemini 2.5 image models bill 258 tokens
+  per 768px tile, Gemini 3 Pro Image a fixed count per image, so for Pro the
+  saving is request size and upload time rather than tokens
+- preprocessing time
+
+With --live (needs GEMINI_API_KEY or OPENROUTER_API_KEY, and
+MOONDREAM_API_KEY), every image is also translated both ways and checked
+with FigureValidator.qa_translation(), reporting end-to-end latency and QA
+pass rate.
+
+The corpus is the images in --image-dir, or synthetic figures: large and
+small charts, a photograph stored as PNG, a JPEG photograph and a diagram
+with transparency.
+
+Results are written to reports/translation_input_benchmark/benchmark_result.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.figure_pipeline.gemini_client import GeminiClient  # noqa: E402
+from src.figure_pipeline.image_prep import (  # noqa: E402
+    max_side_for_model,
+    prepare_image,
+)
+from src.figure_pipeline.models import PipelineConfig  # noqa: E402
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+
+# Input pricing at the time of writing (USD per 1M input tokens)
+MODELS = {
+    GeminiClient.MODEL_PRO: {"usd_per_mtok": 2.00, "fixed_tokens": 1120},
+    GeminiClient.MODEL_FLASH: {"usd_per_mtok": 0.30, "fixed_tokens": None},
+}
+TILE = 768
+TOKENS_PER_TILE = 258
+
+
+def input_tokens(model: str, width: int, height: int) -> int:
+    fixed = MODELS[model]["fixed_tokens"]
+    if fixed:
+        return fixed
+    if width <= 384 and height <= 384:
+        return TOKENS_PER_TILE
+    return math.ceil(width / TILE) * math.ceil(height / TILE) * TOKENS_PER_TILE
+
+
+def synthetic_images(out_dir: Path, seed: int) -> List[Path]:
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+
+    def chart(width: int, height: int) -> Image.Image:
+        img = Image.new("RGB", (width, height), "white")
+        draw = ImageDraw.Draw(img)
+        for i in range(12):
+            x = width // 14 * (i + 1)
+            top = rng.randint(height // 5, height * 4 // 5)
+            draw.rectangle([x, top, x + width // 20, height - 60], fill=(40, 90, 200))
+        for i in range(8):
+            y = height // 9 * (i + 1)
+            draw.line([(40, y), (width - 40, y)], fill=(180, 180, 180), width=2)
+        return img
+
+    def photo(width: int, height: int) -> Image.Image:
+        noise = bytes(rng.randrange(64) for _ in range(width * height * 3))
+        base = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+        return Image.blend(base, Image.frombytes("RGB", (width, height), noise), 0.3)
+
+    images = []
+
+    def save(img: Image.Image, name: str, **kwargs) -> None:
+        path = out_dir / name
+        img.save(path, **kwargs)
+        images.append(path)
+
+    save(chart(4000, 3000), "chart_4000.png")
+    save(chart(2600, 1400), "chart_2600.png")
+    save(chart(900, 600), "chart_900.png")
+    save(photo(2400, 1600), "photo_2400.png")
+    save(photo(3000, 2000), "photo_3000.jpg", quality=92)
+    diagram = chart(3200, 1800).convert("RGBA")
+    diagram.putalpha(220)
+    save(diagram, "diagram_alpha_3200.png")
+    return images
+
+
+def _b64_len(path: Path) -> int:
+    return 4 * math.ceil(path.stat().st_size / 3)
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def offline(
+    images: List[Path],
+    config: PipelineConfig,
+    uplink_mbps: float,
+    repeat: int,
+    work_dir: Path,
+) -> Dict[str, dict]:
+    from PIL import Image
+
+    bytes_per_s = uplink_mbps * 1e6 / 8
+    results = {}
+    for model, pricing in MODELS.items():
+        max_side = max_side_for_model(config.translation_max_side, model)
+        rows = []
+        for path in images:
+            work = str(work_dir / f"{path.stem}.{max_side}")
+            prepared = prepare_image(
+                str(path), max_side, work, config.translation_jpeg_quality
+            )
+            prep_s = _time(
+                lambda p=path, w=work, m=max_side: prepare_image(
+                    str(p), m, w, config.translation_jpeg_quality
+                ),
+                repeat,
+            )
+            before_size = Image.open(path).size
+            before_bytes = _b64_len(path)
+            after_bytes = _b64_len(Path(prepared.path))
+            rows.append(
+                {
+                    "image": path.name,
+                    "size_before": list(before_size),
+                    "size_after": list(prepared.sent_size),
+                    "payload_kb_before": round(before_bytes / 1024, 1),
+                    "payload_kb_after": round(after_bytes / 1024, 1),
+                    "upload_ms_before": round(before_bytes / bytes_per_s * 1000, 1),
+                    "upload_ms_after": round(
+                        after_bytes / bytes_per_s * 1000 + prep_s * 1000, 1
+                    ),
+                    "prep_ms": round(prep_s * 1000, 1),
+                    "tokens_before": input_tokens(model, *before_size),
+                    "tokens_after": input_tokens(model, *prepared.sent_size),
+                }
+            )
+        total = {
+            key: round(sum(r[key] for r in rows), 1)
+            for key in (
+                "payload_kb_before",
+                "payload_kb_after",
+                "upload_ms_before",
+                "upload_ms_after",
+                "tokens_before",
+                "tokens_after",
+            )
+        }
+        usd = pricing["usd_per_mtok"] / 1e6
+        total["usd_per_1000_figures_before"] = round(
+            total["tokens_before"] / len(rows) * 1000 * usd, 4
+        )
+        total["usd_per_1000_figures_after"] = round(
+            total["tokens_after"] / len(rows) * 1000 * usd, 4
+        )
+        results[model] = {"max_side": max_side, "total": total, "images": rows}
+    return results
+
+
+def live(images: List[Path], config: PipelineConfig, work_dir: Path) -> dict:
+    from src.figure_pipeline.translator import FigureTranslator
+    from src.figure_pipeline.validator import FigureValidator
+
+    validator = FigureValidator(config)
+    variants = {
+        "native": config.model_copy(
+            update={"translation_max_side": {}, "translation_cache_dir": None}
+        ),
+        "preprocessed": config.model_copy(update={"translation_cache_dir": None}),
+    }
+    results = {}
+    for name, variant in variants.items():
+        translator = FigureTranslator(variant)
+        latencies, passed = [], 0
+        for path in images:
+            start = time.perf_counter()
+            translated: Optional[str] = translator.translate(
+                str(path), path.stem, "benchmark", str(work_dir / name)
+            )
+            latencies.append(time.perf_counter() - start)
+            if translated:
+                qa = validator.qa_translation(str(path), translated)
+                passed += bool(qa.get("passed"))
+        results[name] = {
+            "median_latency_s": round(statistics.median(latencies), 2),
+            "total_latency_s": round(sum(latencies), 2),
+            "qa_pass_rate": round(passed / len(images), 3),
+        }
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark figure preprocessing before translation."
+    )
+    parser.add_argument(
+        "--image-dir", type=Path, help="Figures to use instead of synthetic ones."
+    )
+    parser.add_argument(
+        "--limit", type=int, default=50, help="Max images from --image-dir."
+    )
+    parser.add_argument(
+        "--uplink-mbps",
+        type=float,
+        default=20.0,
+        help="Upload bandwidth for the upload time estimate.",
+    )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Also translate every image both ways and run translation QA.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats.")
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=REPO_ROOT / "reports" / "translation_input_benchmark",
+        help="Directory for benchmark_result.json.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    config = PipelineConfig()
+    with tempfile.TemporaryDirectory(prefix="translation_input_bench_") as tmp:
+        work_dir = Path(tmp)
+        images: List[Path] = []
+        corpus = str(args.image_dir)
+        if args.image_dir and args.image_dir.exists():
+            images = sorted(
+                p
+                for p in args.image_dir.iterdir()
+                if p.suffix.lower() in IMAGE_SUFFIXES
+            )[: args.limit]
+        if not images:
+            synthetic = work_dir / "synthetic"
+            synthetic.mkdir()
+            images = synthetic_images(synthetic, seed=5)
+            corpus = f"synthetic ({len(images)} images)"
+        metrics = {
+            "corpus": corpus,
+            "uplink_mbps": args.uplink_mbps,
+            "offline": offline(
+                images, config, args.uplink_mbps, max(1, args.repeat), work_dir
+            ),
+        }
+        if args.live:
+            if not (
+                os.environ.get("GEMINI_API_KEY") or os.environ.get("OPENROUTER_API_KEY")
+            ):
+                print("--live needs GEMINI_API_KEY or OPENROUTER_API_KEY")
+                return 1
+            metrics["live"] = live(images, config, work_dir)
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    result_path = args.out_dir / "benchmark_result.json"
+    result_path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+    summary = {
+        "corpus": metrics["corpus"],
+        **{model: m["total"] for model, m in metrics["offline"].items()},
+        **({"live": metrics["live"]} if "live" in metrics else {}),
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
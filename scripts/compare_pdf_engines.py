@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+"""
+Compare the pdfminer and PyMuPDF text engines on the synthesis extraction path.
+
+For every PDF in the sample corpus the script runs extract_from_pdf_synthesis()
+with each engine and reports wall time plus paragraph-level agreement
+(fraction of whitespace-normalized paragraphs matched between engines, in
+order). Results are written to reports/pdf_engine_comparison/comparison.json.
+
+Examples:
+    python scripts/compare_pdf_engines.py --pdf-dir data/pdfs --limit 20
+    python scripts/compare_pdf_engines.py tests/fixtures/harvest/sample.pdf
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.body_extract import PDF_TEXT_ENGINES, extract_from_pdf_synthesis  # noqa: E402
+
+
+def _normalize(paragraphs: List[str]) -> List[str]:
+    return [" ".join(p.split()) for p in paragraphs if p and p.strip()]
+
+
+def paragraph_agreement(a: List[str], b: List[str]) -> float:
+    """Share of paragraphs that line up exactly between two extractions."""
+    a_norm, b_norm = _normalize(a), _normalize(b)
+    if not a_norm and not b_norm:
+        return 1.0
+    matcher = difflib.SequenceMatcher(a=a_norm, b=b_norm, autojunk=False)
+    matched = sum(block.size for block in matcher.get_matching_blocks())
+    return 2.0 * matched / (len(a_norm) + len(b_norm))
+
+
+def char_agreement(a: List[str], b: List[str]) -> float:
+    """Character-level similarity of the joined text (tolerates re-wrapping)."""
+    a_text, b_text = " ".join(_normalize(a)), " ".join(_normalize(b))
+    if not a_text and not b_text:
+        return 1.0
+    return difflib.SequenceMatcher(a=a_text, b=b_text, autojunk=False).ratio()
+
+
+def compare_pdf(pdf_path: Path, repeat: int) -> Dict[str, object]:
+    results: Dict[str, Optional[dict]] = {}
+    timings: Dict[str, float] = {}
+    for engine in PDF_TEXT_ENGINES:
+        samples = []
+        extraction = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            extraction = extract_from_pdf_synthesis(str(pdf_path), engine=engine)
+            samples.append(time.perf_counter() - start)
+        timings[engine] = statistics.median(samples)
+        results[engine] = extraction
+
+    paras = {e: (results[e] or {}).get("raw_paragraphs", []) for e in results}
+    base, other = PDF_TEXT_ENGINES
+    return {
+        "pdf": str(pdf_path),
+        "seconds": {e: round(t, 4) for e, t in timings.items()},
+        "speedup": round(timings[base] / timings[other], 2) if timings[other] else None,
+        "paragraphs": {e: len(p) for e, p in paras.items()},
+        "paragraph_agreement": round(paragraph_agreement(paras[base], paras[other]), 4),
+        "char_agreement": round(char_agreement(paras[base], paras[other]), 4),
+        "failed": [e for e, r in results.items() if r is None],
+    }
+
+
+def summarize(rows: List[Dict[str, object]]) -> Dict[str, object]:
+    ok = [r for r in rows if not r["failed"]]
+    base, other = PDF_TEXT_ENGINES
+    total = {e: sum(r["seconds"][e] for r in rows) for e in PDF_TEXT_ENGINES}
+    return {
+        "pdfs": len(rows),
+        "compared": len(ok),
+        "total_seconds": {e: round(t, 3) for e, t in total.items()},
+        "overall_speedup": (
+            round(total[base] / total[other], 2) if total[other] else None
+        ),
+        "mean_paragraph_agreement": (
+            round(statistics.mean(r["paragraph_agreement"] for r in ok), 4)
+            if ok
+            else None
+        ),
+        "mean_char_agreement": (
+            round(statistics.mean(r["char_agreement"] for r in ok), 4) if ok else None
+        ),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare PDF text engines.")
+    parser.add_argument("pdfs", nargs="*", type=Path, help="PDF files to compare.")
+    parser.add_argument(
+        "--pdf-dir",
+        type=Path,
+        help="Directory of PDFs (default: fixtures under tests/fixtures).",
+    )
+    parser.add_argument("--limit", type=int, help="Maximum PDFs to compare.")
+    parser.add_argument("--repeat", type=int, default=1, help="Timing repeats per PDF.")
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=REPO_ROOT / "reports" / "pdf_engine_comparison",
+        help="Directory for comparison.json.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    pdfs = list(args.pdfs)
+    if args.pdf_dir:
+        pdfs.extend(sorted(args.pdf_dir.glob("*.pdf")))
+    if not pdfs:
+        pdfs = sorted((REPO_ROOT / "tests" / "fixtures").rglob("*.pdf"))
+    if args.limit:
+        pdfs = pdfs[: args.limit]
+    if not pdfs:
+        print("No PDFs to compare", file=sys.stderr)
+        return 1
+
+    rows = [compare_pdf(pdf, max(1, args.repeat)) for pdf in pdfs]
+    report = {"summary": summarize(rows), "pdfs": rows}
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = args.out_dir / "comparison.json"
+    out_path.write_text(
+        json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    print(json.dumps(report["summary"], indent=2))
+    print(f"Wrote {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
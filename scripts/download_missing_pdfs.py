@@ -9,13 +9,15 @@ Usage examples:
   python scripts/download_missing_pdfs.py                # all months discovered
   python scripts/download_missing_pdfs.py --months 202508,202509
   python scripts/download_missing_pdfs.py --limit 100    # stop after 100 downloads
+  python scripts/download_missing_pdfs.py --workers 16 --per-host 4
 
-Simplicity-first: sequential downloads with basic summary output.
+Downloads run concurrently (src/pdf_downloader.py) with a per-host limit.
+Interrupted downloads resume via HTTP Range and progress is kept in
+data/pdfs/.download_progress.json, so re-running continues where it stopped.
 """
 from __future__ import annotations
 
 import argparse
-import contextlib
 import json
 import sys
 from pathlib import Path
@@ -25,7 +27,11 @@ ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.pdf_pipeline import download_pdf  # noqa: E402
+from src.pdf_downloader import (  # noqa: E402
+    PROGRESS_FILENAME,
+    BulkPdfDownloader,
+    DownloadJob,
+)
 from src.file_service import ensure_dir  # noqa: E402
 from src.logging_utils import log  # noqa: E402
 
@@ -74,17 +80,19 @@ def download_missing(
     files: List[Path],
     limit: int | None = None,
     allowed_ids: set[str] | None = None,
+    workers: int | None = None,
+    per_host: int | None = None,
+    progress_path: Path | None = None,
+    retry_failed: bool = False,
 ) -> Tuple[int, int, int]:
     import time
 
-    downloaded = 0
     skipped = 0
-    failures = 0
     found_in_records = 0
     ensure_dir(str(PDF_DIR))
 
-    # First pass: count how many need downloading (for progress)
-    to_download = []
+    # First pass: collect what needs downloading
+    jobs: List[DownloadJob] = []
     for rec in iter_records(files):
         rid = rec.get("id") or ""
         pdf_url = (rec.get("pdf_url") or "").strip()
@@ -92,52 +100,33 @@ def download_missing(
             continue
         if allowed_ids is not None and rid not in allowed_ids:
             continue
+        if allowed_ids is not None:
+            found_in_records += 1
         dst = PDF_DIR / f"{rid}.pdf"
         if dst.exists():
+            skipped += 1
             continue
-        to_download.append(rec)
+        # Referer and stable session id (paper id) for Unlocker cookies
+        referer = (rec.get("source_url") or "").strip() or None
+        jobs.append(DownloadJob(rid, pdf_url, str(dst), referer=referer))
 
-    total = len(to_download)
+    # Downloads run concurrently, so --limit caps attempts rather than successes
     if limit:
-        total = min(total, limit)
+        jobs = jobs[:limit]
 
-    log(f"📥 Starting download: {total} PDFs to fetch")
+    log(f"📥 Starting download: {len(jobs)} PDFs to fetch")
     start_time = time.time()
 
-    for i, rec in enumerate(to_download):
-        if limit and downloaded >= limit:
-            break
-
-        rid = rec.get("id") or ""
-        pdf_url = (rec.get("pdf_url") or "").strip()
-
-        if allowed_ids is not None:
-            found_in_records += 1
-
-        dst = PDF_DIR / f"{rid}.pdf"
-        progress = i + 1
-
-        log(f"[{progress}/{total}] Downloading {rid}...")
-
-        # Try with referer and stable session id (paper id) for Unlocker cookies
-        referer = (rec.get("source_url") or "").strip() or None
-        ok = download_pdf(pdf_url, str(dst), referer=referer, session_id=rid)
-
-        if ok:
-            downloaded += 1
-            # Get file size for logging
-            try:
-                size_mb = dst.stat().st_size / (1024 * 1024)
-                log(f"[{progress}/{total}] ✓ Success ({size_mb:.1f} MB)")
-            except Exception:
-                log(f"[{progress}/{total}] ✓ Success")
-        else:
-            failures += 1
-            log(f"[{progress}/{total}] ✗ Failed")
-            # remove any partial
-            if dst.exists():
-                with contextlib.suppress(Exception):
-                    dst.unlink()
+    downloader = BulkPdfDownloader(
+        workers=workers,
+        per_host=per_host,
+        progress_path=str(progress_path or PDF_DIR / PROGRESS_FILENAME),
+        retry_failed=retry_failed,
+    )
+    results = downloader.run(jobs)
+    downloaded = sum(1 for s in results.values() if s in ("downloaded", "fallback"))
+    failures = sum(1 for s in results.values() if s == "failed")
+    skipped += sum(1 for s in results.values() if s in ("exists", "skipped"))
 
     elapsed = time.time() - start_time
     log(f"✅ Download complete in {elapsed:.1f}s: {downloaded} succeeded, {failures} failed")
@@ -161,12 +150,32 @@ def main() -> int:
         "--limit",
         type=int,
         default=0,
-        help="Stop after N successful downloads (default: 0 = no limit)",
+        help="Attempt at most N downloads (default: 0 = no limit)",
     )
     ap.add_argument(
         "--paper-ids",
         help="File containing paper IDs to limit downloads to (one per line)",
     )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        help="Concurrent downloads (default: pdf_download.workers in config)",
+    )
+    ap.add_argument(
+        "--per-host",
+        type=int,
+        help="Concurrent downloads per host (default: pdf_download.per_host)",
+    )
+    ap.add_argument(
+        "--progress",
+        type=Path,
+        help=f"Progress file (default: {PDF_DIR / PROGRESS_FILENAME})",
+    )
+    ap.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Retry papers that failed in a previous run",
+    )
     args = ap.parse_args()
 
     months = [m.strip() for m in (args.months or "").split(",") if m.strip()] or None
@@ -187,7 +196,15 @@ def main() -> int:
         log(f"Filtering to {len(allowed_ids)} requested paper IDs")
 
     log(f"Scanning {len(files)} records files for missing PDFs…")
-    dl, sk, fail = download_missing(files, limit=(args.limit or None), allowed_ids=allowed_ids)
+    dl, sk, fail = download_missing(
+        files,
+        limit=(args.limit or None),
+        allowed_ids=allowed_ids,
+        workers=args.workers,
+        per_host=args.per_host,
+        progress_path=args.progress,
+        retry_failed=args.retry_failed,
+    )
     log("")
     log(f"Summary: downloaded={dl}, skipped_existing_or_missing_url={sk}, failures={fail}")
     return 0
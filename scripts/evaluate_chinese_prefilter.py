@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+
+"""
+Precision/recall of the local Chinese-text prefilter on a labeled sample.
+
+The prefilter (src/figure_pipeline/prefilter.py) lets figures it judges
+Chinese-free skip Moondream validation and Gemini translation. Positives are
+Chinese-free figures, so:
+
+- precision: share of figures judged Chinese-free that really are (a miss
+  here leaves a Chinese figure untranslated; this must stay near 1.0)
+- recall: share of Chinese-free figures the prefilter catches (this is what
+  saves API calls)
+
+The sample is either a directory of real figures with a labels.json mapping
+file name to has_chinese (--labeled-dir), or a synthetic set rendered with
+PyMuPDF: bar charts, line plots and diagrams with Latin or Chinese labels at
+several font sizes and resolutions, plus photo-like images with and without
+captions.
+
+Results are written to reports/chinese_prefilter/evaluation_result.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.figure_pipeline.models import PipelineConfig  # noqa: E402
+from src.figure_pipeline.prefilter import ChineseTextPrefilter  # noqa: E402
+
+# Moondream queries a figure costs before translation ("combined" mode)
+VALIDATION_CALLS_PER_FIGURE = 1
+
+ZH_TEXT = (
+    "温度时间压力速率实验结果样本数量浓度分布模型预测误差对比组方法性能"
+    "年份增长比例区域图表数据分析训练测试准确率损失函数网络结构特征提取"
+)
+LATIN_TEXT = [
+    "Temperature (K)",
+    "Time (s)",
+    "Pressure / MPa",
+    "Growth rate",
+    "Results",
+    "Sample size",
+    "Error %",
+    "Model A",
+    "Baseline",
+    "Accuracy",
+    "Year",
+    "Region 1",
+    "Loss",
+    "Feature map",
+    "Encoder",
+    "Decoder",
+    "RMSE",
+]
+LATIN_FONTS = ["helv", "hebo", "tiro", "cour"]
+
+
+def _chinese_label(rng: random.Random) -> str:
+    size = rng.randint(2, 6)
+    start = rng.randint(0, len(ZH_TEXT) - size)
+    return ZH_TEXT[start : start + size]
+
+
+def _labels(page, rng: random.Random, chinese: bool, fontsize: float) -> None:
+    for _ in range(rng.randint(1, 4)):
+        point = (rng.randint(60, 260), rng.randint(20, 290))
+        if chinese:
+            page.insert_text(
+                point, _chinese_label(rng), fontname="china-s", fontsize=fontsize
+            )
+        else:
+            page.insert_text(
+                point,
+                rng.choice(LATIN_TEXT),
+                fontname=rng.choice(LATIN_FONTS),
+                fontsize=fontsize,
+            )
+
+
+def _draw_chart(page, rng: random.Random) -> None:
+    import fitz
+
+    page.draw_line((50, 250), (380, 250))
+    page.draw_line((50, 250), (50, 20))
+    for i in range(5):
+        page.insert_text((20, 253 - i * 45), str(i * 20), fontsize=8)
+        page.insert_text((60 + i * 65, 264), str(2000 + i * 5), fontsize=8)
+    kind = rng.choice(["bar", "line", "diagram"])
+    if kind == "bar":
+        for i in range(rng.randint(3, 7)):
+            x = 70 + i * 45
+            top = 250 - rng.randint(20, 200)
+            page.draw_rect(
+                fitz.Rect(x, top, x + 25, 250),
+                fill=(rng.random(), rng.random(), rng.random()),
+            )
+    elif kind == "line":
+        points = [(60 + i * 30, 250 - rng.randint(10, 220)) for i in range(11)]
+        page.draw_polyline(points, color=(0, 0, 1), width=1.5)
+        for x, y in points:
+            page.draw_circle((x, y), 2.5, fill=(1, 0, 0))
+    else:
+        for i in range(3):
+            rect = fitz.Rect(70 + i * 105, 110, 150 + i * 105, 160)
+            page.draw_rect(rect, color=(0, 0, 0), width=1.2)
+            if i:
+                page.draw_line((rect.x0 - 25, 135), (rect.x0, 135))
+
+
+def _draw_photo(page, rng: random.Random) -> None:
+    for _ in range(40):
+        x, y = rng.uniform(0, 380), rng.uniform(0, 280)
+        page.draw_circle(
+            (x, y),
+            rng.uniform(5, 60),
+            fill=(rng.random(), rng.random(), rng.random()),
+            fill_opacity=0.6,
+            color=None,
+        )
+
+
+def generate_sample(out_dir: Path, count: int, seed: int) -> Dict[str, bool]:
+    """Render `count` labeled figures into out_dir; returns name -> has_chinese."""
+    import fitz
+
+    rng = random.Random(seed)
+    labels = {}
+    for i in range(count):
+        doc = fitz.open()
+        page = doc.new_page(width=400, height=300)
+        photo = rng.random() < 0.25
+        if photo:
+            _draw_photo(page, rng)
+        else:
+            _draw_chart(page, rng)
+        # Chinese, Latin, or (for photos) no text at all
+        text = rng.choice(["zh", "latin", "none" if photo else "latin"])
+        if rng.random() < 0.5 and text == "zh":
+            _labels(page, rng, chinese=False, fontsize=rng.choice([8, 10, 12]))
+        if text != "none":
+            _labels(
+                page, rng, chinese=text == "zh", fontsize=rng.choice([7, 9, 11, 14])
+            )
+        name = f"fig{i:04d}_{text}.png"
+        page.get_pixmap(dpi=rng.choice([96, 150, 200, 300])).save(str(out_dir / name))
+        doc.close()
+        labels[name] = text == "zh"
+    return labels
+
+
+def evaluate(image_dir: Path, labels: Dict[str, bool], method: str) -> dict:
+    prefilter = ChineseTextPrefilter(PipelineConfig(chinese_prefilter=method))
+    counts = {"tp": 0, "fp": 0, "fn": 0, "tn": 0}
+    misses: List[Tuple[str, str]] = []
+    start = time.perf_counter()
+    for name, has_chinese in sorted(labels.items()):
+        verdict = prefilter.check(str(image_dir / name))
+        if verdict.chinese_free:
+            counts["fp" if has_chinese else "tp"] += 1
+            if has_chinese:
+                misses.append((name, verdict.reason))
+        else:
+            counts["tn" if has_chinese else "fn"] += 1
+    seconds = time.perf_counter() - start
+
+    predicted_free = counts["tp"] + counts["fp"]
+    actually_free = counts["tp"] + counts["fn"]
+    total = len(labels)
+    return {
+        "method": prefilter.method,
+        "figures": total,
+        "chinese_free_figures": actually_free,
+        "confusion": counts,
+        "precision": counts["tp"] / predicted_free if predicted_free else 1.0,
+        "recall": counts["tp"] / actually_free if actually_free else 0.0,
+        "figures_skipped": predicted_free,
+        "validation_calls_saved": predicted_free * VALIDATION_CALLS_PER_FIGURE,
+        "validation_calls_saved_pct": 100.0 * predicted_free / total if total else 0.0,
+        "ms_per_figure": 1000.0 * seconds / total if total else 0.0,
+        "chinese_figures_passed_as_free": misses,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--labeled-dir",
+        type=Path,
+        help="Directory with figures and labels.json ({file: has_chinese})",
+    )
+    parser.add_argument("--count", type=int, default=400, help="Synthetic figures")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--method", default="auto", choices=["auto", "tesseract", "glyph"]
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=REPO_ROOT / "reports" / "chinese_prefilter" / "evaluation_result.json",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="prefilter_eval_") as tmp:
+        if args.labeled_dir:
+            image_dir = args.labeled_dir
+            labels = json.loads((image_dir / "labels.json").read_text(encoding="utf-8"))
+            sample = str(image_dir)
+        else:
+            image_dir = Path(tmp)
+            labels = generate_sample(image_dir, args.count, args.seed)
+            sample = f"synthetic (count={args.count}, seed={args.seed})"
+        result = evaluate(image_dir, labels, args.method)
+
+    result["sample"] = sample
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    print(f"Sample:    {sample}")
+    print(f"Method:    {result['method']}")
+    print(
+        f"Precision: {result['precision']:.3f} (Chinese-free verdicts that are right)"
+    )
+    print(f"Recall:    {result['recall']:.3f} (Chinese-free figures caught)")
+    print(
+        f"Skipped:   {result['figures_skipped']}/{result['figures']} figures "
+        f"({result['validation_calls_saved_pct']:.1f}% of validation calls), "
+        f"{result['ms_per_figure']:.1f} ms/figure"
+    )
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
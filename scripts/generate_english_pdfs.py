@@ -34,7 +34,7 @@ import tempfile
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -52,6 +52,7 @@ load_dotenv()
 # Constants
 MAX_FIGURES_PER_PDF = 15
 B2_BUCKET = os.environ.get("BACKBLAZE_BUCKET", "chinaxiv")
+FIGURE_SHARD_PREFIX = "figures/manifests/"
 
 
 def log(msg: str):
@@ -258,13 +259,45 @@ def md_to_pdf(md_path: str, pdf_path: str, pdf_engine: str) -> bool:
         return False
 
 
-def get_figure_manifest(s3) -> Dict[str, Any]:
-    """Download figure manifest from B2."""
+def get_figure_manifest(s3, paper_ids: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Download figure manifest from B2.
+
+    The combined index (figures/manifest.json) only picks up a paper at the
+    next compaction, so the shards of paper_ids are applied on top of it
+    (see apply_figure_shards).
+    """
     try:
         response = s3.get_object(Bucket=B2_BUCKET, Key="figures/manifest.json")
-        return json.loads(response["Body"].read().decode("utf-8"))
+        manifest = json.loads(response["Body"].read().decode("utf-8"))
     except Exception:
-        return {"papers": {}}
+        manifest = {"papers": {}}
+    apply_figure_shards(s3, manifest, paper_ids)
+    return manifest
+
+
+def apply_figure_shards(s3, figure_manifest: Dict[str, Any], paper_ids: Iterable[str]) -> None:
+    """
+    Overlay each paper's own manifest shard on the figure manifest.
+
+    The pipeline writes figures/manifests/{paper_id}.json as soon as a
+    paper's figures are translated; it takes precedence over the index entry,
+    and a deleted-figures tombstone removes the paper.
+    """
+    papers = figure_manifest.setdefault("papers", {})
+    for paper_id in paper_ids:
+        try:
+            response = s3.get_object(
+                Bucket=B2_BUCKET, Key=f"{FIGURE_SHARD_PREFIX}{paper_id}.json"
+            )
+            shard = json.loads(response["Body"].read().decode("utf-8"))
+        except Exception:
+            continue  # No shard: the index entry (if any) stands
+        if shard.get("deleted"):
+            papers.pop(paper_id, None)
+        else:
+            figures = shard.get("figures", [])
+            papers[paper_id] = {"figure_count": len(figures), "figures": figures}
 
 
 def get_existing_pdf_manifest(s3) -> Dict[str, Any]:
@@ -553,6 +586,9 @@ def main():
         log("No papers to process")
         return
 
+    # Papers processed since the last compaction are only in their shards
+    apply_figure_shards(s3, figure_manifest, [tf.stem for tf in papers_to_process])
+
     # Ensure output directory exists
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
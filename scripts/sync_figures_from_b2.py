@@ -3,7 +3,10 @@
 Sync figure_urls column from B2 manifest.
 
 Downloads the figures/manifest.json from B2 and updates the PostgreSQL
-figure_urls column for matching papers.
+figure_urls column for matching papers. The pipeline writes per-paper
+shards (figures/manifests/{paper_id}.json) that the index only picks up at
+the next `python -m src.tools.compact_figure_manifest`, so shards newer than
+the index are applied on top of it.
 
 Usage:
     # Dry run (show what would be updated)
@@ -38,6 +41,7 @@ load_dotenv()
 
 # Constants
 B2_BUCKET = os.environ.get("BACKBLAZE_BUCKET", "chinaxiv")
+FIGURE_SHARD_PREFIX = "figures/manifests/"
 
 
 def log(msg: str):
@@ -80,6 +84,41 @@ def get_figures_manifest(s3) -> dict:
         raise
 
 
+def apply_pending_shards(s3, manifest: dict) -> int:
+    """
+    Overlay manifest shards written since the last compaction.
+
+    The index records, under "shards", the upload timestamp (ms) of every
+    shard it has folded in; shards not listed there or uploaded later are
+    downloaded and replace the paper's entry (a tombstone removes it).
+
+    Returns:
+        Number of shards applied
+    """
+    papers = manifest.setdefault("papers", {})
+    compacted = manifest.get("shards", {})
+    applied = 0
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=B2_BUCKET, Prefix=FIGURE_SHARD_PREFIX):
+        for obj in page.get("Contents", []):
+            name = obj["Key"][len(FIGURE_SHARD_PREFIX):]
+            if not name.endswith(".json"):
+                continue
+            paper_id = name[: -len(".json")]
+            uploaded_ms = round(obj["LastModified"].timestamp() * 1000)
+            if paper_id in compacted and uploaded_ms <= compacted[paper_id]:
+                continue
+            response = s3.get_object(Bucket=B2_BUCKET, Key=obj["Key"])
+            shard = json.loads(response["Body"].read().decode("utf-8"))
+            if shard.get("deleted"):
+                papers.pop(paper_id, None)
+            else:
+                figures = shard.get("figures", [])
+                papers[paper_id] = {"figure_count": len(figures), "figures": figures}
+            applied += 1
+    return applied
+
+
 def update_figure_urls(figure_data: dict, dry_run: bool = False) -> int:
     """
     Update figure_urls column for papers with figures in B2.
@@ -184,6 +223,9 @@ def main():
     log("Downloading figures manifest from B2...")
     s3 = get_s3_client()
     manifest = get_figures_manifest(s3)
+    pending = apply_pending_shards(s3, manifest)
+    if pending:
+        log(f"Applied {pending} manifest shards newer than the index")
 
     papers = manifest.get("papers", {})
     log(f"Found {len(papers)} papers with figures in manifest")
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import atexit
 import os
 import re
 import tarfile
+import threading
 import zipfile
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
+from . import extraction_cache
 from .utils import log
 
 
@@ -13,50 +17,153 @@ from .utils import log
 # SYNTHESIS MODE: Watermark Detection
 # =============================================================================
 
-# Known watermark patterns to filter from PDF extraction
-WATERMARK_PATTERNS = [
+# Known watermark rules to filter from PDF extraction: (name, pattern, flags).
+# Extended / disabled per deployment via translation.synthesis
+# watermark_rules / disabled_watermark_rules in config.
+WATERMARK_RULES = [
     # Spaced-out letters (common PDF artifact): "X a n i h C", "v i X a n i h C"
-    re.compile(r"^[A-Za-z0-9]\s+[A-Za-z0-9]\s+[A-Za-z0-9]\s+[A-Za-z0-9]"),
+    ("spaced_letters", r"^[A-Za-z0-9]\s+[A-Za-z0-9]\s+[A-Za-z0-9]\s+[A-Za-z0-9]", 0),
     # ChinaXiv watermarks (reversed/spaced)
-    re.compile(r"X\s*a\s*n\s*i\s*h\s*C", re.IGNORECASE),
+    ("chinaxiv_reversed", r"X\s*a\s*n\s*i\s*h\s*C", re.IGNORECASE),
     # "This version posted" spaced out
-    re.compile(r"T\s+h\s+i\s+s\s+v\s+e\s+r\s+s\s+i\s+o\s+n", re.IGNORECASE),
-    re.compile(r"p\s+o\s+s\s+t\s+e\s+d", re.IGNORECASE),
+    ("this_version_spaced", r"T\s+h\s+i\s+s\s+v\s+e\s+r\s+s\s+i\s+o\s+n", re.IGNORECASE),
+    ("posted_spaced", r"p\s+o\s+s\s+t\s+e\s+d", re.IGNORECASE),
     # Version stamps with excessive spacing: "1 v 1 0 0 0 0 . 9 0 5 2 0 2"
-    re.compile(r"\d\s+v\s+\d"),
+    ("version_stamp", r"\d\s+v\s+\d", 0),
     # arXiv-style identifiers with spacing
-    re.compile(r":\s*v\s*i\s*X\s*a\s*n\s*i\s*h\s*C", re.IGNORECASE),
+    ("chinaxiv_identifier", r":\s*v\s*i\s*X\s*a\s*n\s*i\s*h\s*C", re.IGNORECASE),
 ]
 
+# Kept for callers that iterate the individual patterns
+WATERMARK_PATTERNS = [re.compile(p, f) for _, p, f in WATERMARK_RULES]
+
+# Built-in checks that run before the combined rule pattern, cheapest first
+_PAGE_NUMBER_RE = re.compile("^[\\d\\s\\.\\-–—]+$")
+_ALNUM_START_RE = re.compile(r"^[A-Za-z0-9]")
+
+# Hits per rule since start-up (or the last reset_watermark_stats())
+WATERMARK_RULE_HITS: Counter = Counter()
+
+
+def _load_watermark_rules() -> List[tuple]:
+    """Built-in rules plus config additions, minus disabled ones."""
+    try:
+        from .config import get_config
+
+        cfg = (get_config().get("translation") or {}).get("synthesis") or {}
+    except Exception:
+        cfg = {}
+
+    rules = list(WATERMARK_RULES)
+    for i, extra in enumerate(cfg.get("watermark_rules") or []):
+        if not isinstance(extra, dict) or not extra.get("pattern"):
+            continue
+        flags = re.IGNORECASE if extra.get("ignore_case") else 0
+        rules.append((extra.get("name") or f"config_{i}", extra["pattern"], flags))
+
+    disabled = set(cfg.get("disabled_watermark_rules") or [])
+    return [rule for rule in rules if rule[0] not in disabled]
+
+
+class WatermarkMatcher(NamedTuple):
+    """Watermark rules compiled into (at most) two combined patterns."""
+
+    anchored: Optional[re.Pattern]  # rules starting with "^", run with match()
+    floating: Optional[re.Pattern]  # all other rules, run with search()
+    rules: List[tuple]  # (name, compiled) to attribute a hit to its rule
+
+
+_watermark_matcher: Optional[WatermarkMatcher] = None
+
+def compile_watermark_rules(rules: List[tuple]) -> WatermarkMatcher:
+    """
+    Compile (name, pattern, flags) rules into combined patterns.
+
+    Rules anchored at "^" (without any "|" that could un-anchor a branch)
+    share one alternation tried only at the start of the line; the rest
+    share one alternation run with search(). A rule that does not compile,
+    alone or as part of its combined pattern, is logged and skipped.
+    """
+    compiled: List[tuple] = []
+    anchored: List[str] = []
+    floating: List[str] = []
+    for name, pattern, flags in rules:
+        # Scoped form: global inline flags cannot be embedded in a combination
+        scoped = f"(?i:{pattern})" if flags & re.IGNORECASE else f"(?:{pattern})"
+        group = anchored if pattern.startswith("^") and "|" not in pattern else floating
+        try:
+            rule = re.compile(pattern, flags)
+            # Catches clashes between rules too, e.g. duplicate group names
+            re.compile("|".join([*group, scoped]))
+        except re.error as e:
+            log(f"Skipping invalid watermark rule {name!r}: {e}")
+            continue
+        compiled.append((name, rule))
+        group.append(scoped)
+
+    return WatermarkMatcher(
+        anchored=re.compile("|".join(anchored)) if anchored else None,
+        floating=re.compile("|".join(floating)) if floating else None,
+        rules=compiled,
+    )
+
+
+def _get_watermark_matcher() -> WatermarkMatcher:
+    global _watermark_matcher
+    if _watermark_matcher is None:
+        _watermark_matcher = compile_watermark_rules(_load_watermark_rules())
+    return _watermark_matcher
+
+
+def reload_watermark_rules() -> None:
+    """Re-read watermark rules from config on next use."""
+    global _watermark_matcher
+    _watermark_matcher = None
+
+
+def reset_watermark_stats() -> None:
+    WATERMARK_RULE_HITS.clear()
+
 
 def is_watermark_or_garbage(text: str) -> bool:
     """
     Detect PDF artifacts that should be filtered out.
 
     Returns True if text appears to be a watermark, header artifact,
-    or other garbage that shouldn't be translated.
+    or other garbage that shouldn't be translated. The rule that fired is
+    counted in WATERMARK_RULE_HITS.
     """
     text = text.strip()
 
     # Too short to be meaningful content
     if len(text) < 5:
+        WATERMARK_RULE_HITS["too_short"] += 1
+        return True
+
+    # Pure punctuation or numbers (page numbers, etc.)
+    if _PAGE_NUMBER_RE.match(text):
+        WATERMARK_RULE_HITS["page_number"] += 1
         return True
 
     # Mostly whitespace with spaced-out characters (common watermark pattern)
-    non_space = text.replace(" ", "")
-    if len(non_space) > 0:
-        space_ratio = text.count(" ") / len(text)
-        # High space ratio + starts with letter = likely spaced-out watermark
-        if space_ratio > 0.4 and re.match(r"^[A-Za-z0-9]", text):
-            return True
+    # High space ratio + starts with letter = likely spaced-out watermark
+    if text.count(" ") / len(text) > 0.4 and _ALNUM_START_RE.match(text):
+        WATERMARK_RULE_HITS["space_ratio"] += 1
+        return True
 
     # Match known watermark patterns
-    for pattern in WATERMARK_PATTERNS:
-        if pattern.search(text):
-            return True
+    matcher = _get_watermark_matcher()
+    if (matcher.anchored and matcher.anchored.match(text)) or (
+        matcher.floating and matcher.floating.search(text)
+    ):
+        # Attribution re-runs single rules, but only on the rare hit
+        for name, rule in matcher.rules:
+            if rule.search(text):
+                WATERMARK_RULE_HITS[name] += 1
+                break
+        return True
 
-    # Pure punctuation or numbers (page numbers, etc.)
-    return bool(re.match("^[\\d\\s\\.\\-–—]+$", text))
+    return False
 
 
 # =============================================================================
@@ -110,6 +217,11 @@ def detect_section_boundary(text: str) -> Optional[str]:
 # =============================================================================
 
 
+# Lines are stripped before merging, so "ends a sentence" is a last-char check
+_SENTENCE_END_CHARS = frozenset(".?!。！？:：")
+_NEW_SENTENCE_START_RE = re.compile(r"^[A-Z\u4e00-\u9fff]")
+
+
 def merge_pdf_lines_to_paragraphs(
     lines: List[str], min_para_length: int = 50
 ) -> List[str]:
@@ -134,6 +246,10 @@ def merge_pdf_lines_to_paragraphs(
 
     paragraphs = []
     current_buffer: List[str] = []
+    # Running state for the buffer so each line is handled in O(1) instead of
+    # re-joining the whole buffer: joined length and whether it ends a sentence.
+    buffer_len = 0
+    buffer_ends_sentence = False
 
     for line in lines:
         line = line.strip()
@@ -155,23 +271,26 @@ def merge_pdf_lines_to_paragraphs(
             paragraphs.append(line)
             continue
 
+        line_ends_sentence = line[-1] in _SENTENCE_END_CHARS
+
         # Check if this continues previous content or starts new
         if current_buffer:
-            last_text = " ".join(current_buffer)
-            # Does previous buffer end a sentence?
-            ends_sentence = bool(re.search(r"[.?!。！？:：]\s*$", last_text))
             # Does this line start a new sentence (uppercase or Chinese)?
-            starts_new = bool(re.match(r"^[A-Z\u4e00-\u9fff]", line))
+            starts_new = bool(_NEW_SENTENCE_START_RE.match(line))
 
-            if ends_sentence and starts_new and len(last_text) >= min_para_length:
+            if buffer_ends_sentence and starts_new and buffer_len >= min_para_length:
                 # Complete paragraph break
-                paragraphs.append(last_text)
+                paragraphs.append(" ".join(current_buffer))
                 current_buffer = [line]
+                buffer_len = len(line)
             else:
                 # Continue building current paragraph
                 current_buffer.append(line)
+                buffer_len += 1 + len(line)
         else:
             current_buffer = [line]
+            buffer_len = len(line)
+        buffer_ends_sentence = line_ends_sentence
 
     # Flush remaining buffer
     if current_buffer:
@@ -185,7 +304,190 @@ def merge_pdf_lines_to_paragraphs(
 # =============================================================================
 
 
-def extract_from_pdf_synthesis(pdf_path: str) -> Optional[Dict[str, Any]]:
+# Text extraction engines selectable for the synthesis path
+PDF_TEXT_ENGINES = ("pdfminer", "pymupdf")
+DEFAULT_PDF_TEXT_ENGINE = "pdfminer"
+
+
+def resolve_pdf_text_engine(engine: Optional[str] = None) -> str:
+    """
+    Resolve which PDF text engine to use.
+
+    Priority: explicit argument (the orchestrator's --pdf-engine flag, validated
+    once at startup and passed down), translation.synthesis.pdf_text_engine in
+    config, then the pdfminer default.
+    """
+    if not engine:
+        try:
+            from .config import get_config
+
+            synthesis_cfg = (get_config().get("translation") or {}).get(
+                "synthesis"
+            ) or {}
+            engine = synthesis_cfg.get("pdf_text_engine")
+        except Exception:
+            engine = None
+    engine = (engine or DEFAULT_PDF_TEXT_ENGINE).strip().lower()
+    if engine not in PDF_TEXT_ENGINES:
+        raise ValueError(
+            f"Unknown PDF text engine '{engine}' (expected one of {PDF_TEXT_ENGINES})"
+        )
+    return engine
+
+
+# Page-parallel extraction: only worth the process start-up on long documents
+PARALLEL_MIN_PAGES = 24
+MIN_PAGES_PER_SHARD = 4
+MAX_EXTRACT_WORKERS = 8
+
+
+def _pdf_page_count(pdf_path: str) -> int:
+    """Page count via PyMuPDF (cheap: no content parsing). 0 if unreadable."""
+    try:
+        import fitz
+
+        with fitz.open(pdf_path) as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+
+def _resolve_extract_workers(workers: Optional[int]) -> int:
+    if workers is None:
+        try:
+            from .config import get_config
+
+            workers = (get_config().get("pdf_extraction") or {}).get("workers")
+        except Exception:
+            workers = None
+    if not workers:
+        workers = min(os.cpu_count() or 1, MAX_EXTRACT_WORKERS)
+    return max(1, int(workers))
+
+
+_EXTRACT_POOL: Optional[Any] = None
+_EXTRACT_POOL_LOCK = threading.Lock()
+
+
+def _get_extract_pool() -> Any:
+    """
+    Process pool shared by every extraction in this process, created on first use.
+
+    Sized once from pdf_extraction.workers, so concurrent papers queue their
+    shards on the same workers instead of each starting a pool of its own.
+    """
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn: callers (orchestrator, batch workers) are multi-threaded
+            _EXTRACT_POOL = ProcessPoolExecutor(
+                max_workers=_resolve_extract_workers(None),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_EXTRACT_POOL.shutdown)
+        return _EXTRACT_POOL
+
+
+def _extract_page_range(
+    pdf_path: str, engine: str, start: int = 0, end: Optional[int] = None
+) -> str:
+    """
+    Extract text for pages [start, end) (all pages when end is None).
+
+    Module-level so it can run in a worker process. Output for consecutive
+    ranges concatenates (see _PAGE_RANGE_JOINERS) to exactly the text a
+    single whole-document call would return.
+    """
+    if engine == "pymupdf":
+        import fitz
+
+        with fitz.open(pdf_path) as doc:
+            stop = doc.page_count if end is None else end
+            return "\n".join(doc[i].get_text("text") for i in range(start, stop))
+
+    from pdfminer.high_level import extract_text
+
+    page_numbers = None if end is None else range(start, end)
+    return extract_text(pdf_path, page_numbers=page_numbers) or ""
+
+
+# pdfminer terminates every page with a form feed; PyMuPDF pages are joined
+# with a newline by _extract_page_range itself.
+_PAGE_RANGE_JOINERS = {"pdfminer": "", "pymupdf": "\n"}
+
+
+def _shard_pages(page_count: int, shards: int) -> List[tuple]:
+    """Split [0, page_count) into contiguous, near-equal (start, end) ranges."""
+    base, extra = divmod(page_count, shards)
+    ranges = []
+    start = 0
+    for i in range(shards):
+        end = start + base + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def extract_pdf_text(
+    pdf_path: str, engine: Optional[str] = None, *, workers: Optional[int] = None
+) -> str:
+    """
+    Extract raw text from a PDF with the selected engine.
+
+    Both engines return newline-separated lines with pages in order, which is
+    all merge_pdf_lines_to_paragraphs() relies on. With pdfminer, documents
+    with at least PARALLEL_MIN_PAGES pages are sharded into contiguous page
+    ranges across a process pool shared by all callers in the process
+    (pdf_extraction.workers in config, default: CPU count).
+    Shards are reassembled in page order into the same text a sequential
+    extraction produces, so paragraphs spanning a page break (and therefore
+    a shard boundary) are merged exactly as before.
+
+    The text is cached by PDF content hash (see extraction_cache), so later
+    consumers of the same PDF skip the parse entirely.
+    """
+    engine = resolve_pdf_text_engine(engine)
+    cache_section = f"text:{engine}"
+    cached = extraction_cache.load(pdf_path, cache_section)
+    if isinstance(cached, str):
+        return cached
+
+    text = _extract_pdf_text_uncached(pdf_path, engine, workers)
+    extraction_cache.store(pdf_path, cache_section, text)
+    return text
+
+
+def _extract_pdf_text_uncached(
+    pdf_path: str, engine: str, workers: Optional[int]
+) -> str:
+    # PyMuPDF extracts an 80-page thesis faster than a worker process starts
+    workers = _resolve_extract_workers(workers) if engine == "pdfminer" else 1
+
+    page_count = _pdf_page_count(pdf_path) if workers > 1 else 0
+    shards = min(workers, page_count // MIN_PAGES_PER_SHARD)
+    if page_count < PARALLEL_MIN_PAGES or shards < 2:
+        return _extract_page_range(pdf_path, engine)
+
+    ranges = _shard_pages(page_count, shards)
+    # map() returns shard results in page order
+    parts = list(
+        _get_extract_pool().map(
+            _extract_page_range,
+            [pdf_path] * shards,
+            [engine] * shards,
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+        )
+    )
+    return _PAGE_RANGE_JOINERS[engine].join(parts)
+
+
+def extract_from_pdf_synthesis(
+    pdf_path: str, engine: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
     """
     Extract text with intelligent merging for synthesis translation mode.
 
@@ -196,6 +498,8 @@ def extract_from_pdf_synthesis(pdf_path: str) -> Optional[Dict[str, Any]]:
 
     Args:
         pdf_path: Path to PDF file
+        engine: Text extraction engine ("pdfminer" or "pymupdf"); see
+            resolve_pdf_text_engine() for the default
 
     Returns:
         Dict with:
@@ -207,11 +511,19 @@ def extract_from_pdf_synthesis(pdf_path: str) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        from pdfminer.high_level import extract_text
+        engine = resolve_pdf_text_engine(engine)
+    except ValueError as e:
+        log(f"{e}; using {DEFAULT_PDF_TEXT_ENGINE}")
+        engine = DEFAULT_PDF_TEXT_ENGINE
+    cache_section = f"synthesis:{engine}"
+    cached = extraction_cache.load(pdf_path, cache_section)
+    if isinstance(cached, dict):
+        return cached
 
-        raw_text = extract_text(pdf_path) or ""
+    try:
+        raw_text = extract_pdf_text(pdf_path, engine)
     except Exception as e:
-        log(f"PDF synthesis extract failed: {e}")
+        log(f"PDF synthesis extract failed ({engine}): {e}")
         return None
 
     # Split into lines
@@ -249,6 +561,7 @@ def extract_from_pdf_synthesis(pdf_path: str) -> Optional[Dict[str, Any]]:
         "merged_paragraphs": len(paragraphs),
         "detected_sections": len(sections),
         "section_names": [s["name"] for s in sections],
+        "engine": engine,
     }
 
     log(
@@ -256,11 +569,13 @@ def extract_from_pdf_synthesis(pdf_path: str) -> Optional[Dict[str, Any]]:
         f"in {len(sections)} sections"
     )
 
-    return {
+    result = {
         "sections": sections,
         "raw_paragraphs": paragraphs,
         "stats": stats,
     }
+    extraction_cache.store(pdf_path, cache_section, result)
+    return result
 
 
 def _read_text_file(path: str) -> str:
@@ -268,27 +583,61 @@ def _read_text_file(path: str) -> str:
         return f.read()
 
 
-def _find_main_tex(files: List[str], read_file) -> Optional[str]:
-    # Prefer files with \documentclass and \begin{document}
-    candidates = []
-    for name in files:
-        if not name.lower().endswith(".tex"):
-            continue
-        try:
-            txt = read_file(name)
-        except Exception:
-            continue
-        if "\\documentclass" in txt and "\\begin{document}" in txt:
-            candidates.append((name, len(txt)))
-    if candidates:
-        candidates.sort(key=lambda x: -x[1])
-        return candidates[0][0]
-    # Fallback: largest .tex
-    texes = [n for n in files if n.lower().endswith(".tex")]
-    if texes:
-        # Cannot measure size here reliably; pick first
-        return texes[0]
-    return None
+# Bytes of each .tex member scanned for \documentclass / \begin{document}
+MAIN_TEX_HEAD_BYTES = 8 * 1024
+
+
+def _iter_tex_members(archive_path: str) -> Iterator[Tuple[str, int, IO[bytes]]]:
+    """
+    Yield (name, size, file) for each .tex member in archive order.
+
+    Tar archives are read as a stream ("r|gz"): one sequential pass, no
+    member index. Each file object is only valid until the next yield.
+    """
+    if archive_path.lower().endswith(".zip"):
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in zf.infolist():
+                if info.is_dir() or not info.filename.lower().endswith(".tex"):
+                    continue
+                with zf.open(info) as f:
+                    yield info.filename, info.file_size, f
+    else:
+        with tarfile.open(archive_path, "r|gz") as tf:
+            for member in tf:
+                if not member.isfile() or not member.name.lower().endswith(".tex"):
+                    continue
+                f = tf.extractfile(member)
+                if f is not None:
+                    yield member.name, member.size, f
+
+
+def _find_main_tex(archive_path: str) -> Optional[bytes]:
+    """
+    Return the raw bytes of the archive's main .tex file.
+
+    Candidates are ranked by \\documentclass, then \\begin{document} in their
+    first MAIN_TEX_HEAD_BYTES, then size (first seen wins ties). A member is
+    read past its head only when it becomes the leading candidate; without
+    any candidate the largest .tex is read in a second pass.
+    """
+    best_key: Optional[tuple] = None
+    best_data: Optional[bytes] = None
+    fallback: Optional[tuple] = None  # (size, name)
+
+    for name, size, f in _iter_tex_members(archive_path):
+        head = f.read(MAIN_TEX_HEAD_BYTES)
+        key = (b"\\documentclass" in head, b"\\begin{document}" in head, size)
+        if key[0] or key[1]:
+            if best_key is None or key > best_key:
+                best_key, best_data = key, head + f.read()
+        elif fallback is None or size > fallback[0]:
+            fallback = (size, name)
+
+    if best_data is None and fallback is not None:
+        for name, _, f in _iter_tex_members(archive_path):
+            if name == fallback[1]:
+                return f.read()
+    return best_data
 
 
 def _extract_tex_content(tex: str) -> str:
@@ -318,34 +667,13 @@ def extract_from_latex(archive_path: str) -> Optional[List[str]]:
     if not archive_path or not os.path.exists(archive_path):
         return None
     try:
-        if archive_path.lower().endswith(".zip"):
-            with zipfile.ZipFile(archive_path) as zf:
-                names = zf.namelist()
-
-                def read_file(n):
-                    with zf.open(n) as f:
-                        return f.read().decode("utf-8", errors="ignore")
-
-                main = _find_main_tex(names, read_file)
-                if not main:
-                    return None
-                tex = read_file(main)
-        else:
-            with tarfile.open(archive_path, "r:gz") as tf:
-                names = [m.name for m in tf.getmembers() if m.isfile()]
-
-                def read_file(n):
-                    member = tf.getmember(n)
-                    with tf.extractfile(member) as f:
-                        return f.read().decode("utf-8", errors="ignore")
-
-                main = _find_main_tex(names, read_file)
-                if not main:
-                    return None
-                tex = read_file(main)
+        main = _find_main_tex(archive_path)
     except Exception as e:
         log(f"latex extract failed: {e}")
         return None
+    if main is None:
+        return None
+    tex = main.decode("utf-8", errors="ignore")
     content = _extract_tex_content(tex)
     return _split_paragraphs(content)
 
@@ -353,17 +681,20 @@ def extract_from_latex(archive_path: str) -> Optional[List[str]]:
 def extract_from_pdf(pdf_path: str) -> Optional[List[str]]:
     if not pdf_path or not os.path.exists(pdf_path):
         return None
+    cached = extraction_cache.load(pdf_path, "paragraphs")
+    if isinstance(cached, list):
+        return cached
     try:
-        from pdfminer.high_level import extract_text
-
-        txt = extract_text(pdf_path) or ""
+        txt = extract_pdf_text(pdf_path, "pdfminer")
     except Exception as e:
         log(f"pdf extract failed: {e}")
         return None
     # Coalesce into paragraphs using blank lines
     # pdfminer might insert many newlines; compact multiple newlines
     txt = re.sub(r"\n{2,}", "\n\n", txt)
-    return _split_paragraphs(txt)
+    paragraphs = _split_paragraphs(txt)
+    extraction_cache.store(pdf_path, "paragraphs", paragraphs)
+    return paragraphs
 
 
 def extract_body_paragraphs(rec: dict) -> List[str]:
@@ -476,6 +807,43 @@ FIGURE_PATTERNS = [
 # Maximum caption length to extract (improved from 150)
 MAX_CAPTION_LENGTH = 500
 
+# Literal anchors: every FIGURE_PATTERNS / MARKER_PATTERNS match contains at
+# least one of these, so a paragraph without any anchor cannot match. Cheap
+# substring checks find which anchors a paragraph has; only patterns sharing
+# an anchor with it are searched (most body paragraphs have none).
+FIGURE_ANCHORS = ('fig', 'table', 'scheme', 'chart', 'diagram', 'plate', 'panel', '图', '表')
+
+# Characters re.IGNORECASE equates with i / s that str.lower() does not
+# (U+0130 lowers to "i" + U+0307)
+_ANCHOR_CASE_FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's'})
+
+
+def _pattern_anchors(pattern: re.Pattern) -> frozenset:
+    """Anchors that appear literally in a pattern's source."""
+    source = pattern.pattern.lower()
+    return frozenset(a for a in FIGURE_ANCHORS if a in source)
+
+
+def _figure_anchors(para: str) -> set:
+    """Anchors present in a paragraph, case-insensitively (empty: no reference)."""
+    folded = para.lower()
+    if '\u0131' in folded or '\u017f' in folded or '\u0307' in folded:
+        folded = para.translate(_ANCHOR_CASE_FOLD).lower()
+    return {a for a in FIGURE_ANCHORS if a in folded}
+
+
+def _normalize_figure_pattern(pattern_tuple: tuple) -> tuple:
+    # Handle both 2-tuple (old) and 3-tuple (new) formats
+    if len(pattern_tuple) == 3:
+        pattern, fig_type, is_caption_pattern = pattern_tuple
+    else:
+        pattern, fig_type = pattern_tuple
+        is_caption_pattern = False
+    return pattern, fig_type, is_caption_pattern, _pattern_anchors(pattern)
+
+
+_INDEXED_FIGURE_PATTERNS = [_normalize_figure_pattern(t) for t in FIGURE_PATTERNS]
+
 
 def _extract_caption_text(para: str, match_end: int) -> str:
     """
@@ -576,13 +944,15 @@ def detect_figures(paragraphs: List[str]) -> List[Dict[str, Any]]:
         if not para:
             continue
 
-        for pattern_tuple in FIGURE_PATTERNS:
-            # Handle both 2-tuple (old) and 3-tuple (new) formats
-            if len(pattern_tuple) == 3:
-                pattern, fig_type, is_caption_pattern = pattern_tuple
-            else:
-                pattern, fig_type = pattern_tuple
-                is_caption_pattern = False
+        anchors = _figure_anchors(para)
+        if not anchors:
+            continue
+
+        # Patterns keep their FIGURE_PATTERNS order: the first pattern to
+        # claim a (type, number) decides its confidence and caption
+        for pattern, fig_type, is_caption_pattern, pattern_anchors in _INDEXED_FIGURE_PATTERNS:
+            if anchors.isdisjoint(pattern_anchors):
+                continue
 
             match = pattern.search(para)
             if match:
@@ -716,6 +1086,11 @@ MARKER_PATTERNS = [
     (re.compile(r'(表\s*(\d+)([a-z]?))'), 'TABLE'),
 ]
 
+_INDEXED_MARKER_PATTERNS = [
+    (pattern, marker_type, _pattern_anchors(pattern))
+    for pattern, marker_type in MARKER_PATTERNS
+]
+
 
 def inject_figure_markers(
     paragraphs: List[str],
@@ -753,10 +1128,17 @@ def inject_figure_markers(
             marked_paragraphs.append(para)
             continue
 
+        anchors = _figure_anchors(para)
+        if not anchors:
+            marked_paragraphs.append(para)
+            continue
+
         # Find all figure/table references and their positions
         insertions: List[tuple] = []  # (position, marker_text)
 
-        for pattern, marker_type in MARKER_PATTERNS:
+        for pattern, marker_type, pattern_anchors in _INDEXED_MARKER_PATTERNS:
+            if anchors.isdisjoint(pattern_anchors):
+                continue
             for match in pattern.finditer(para):
                 # Extract the number
                 number = match.group(2)
@@ -26,6 +26,7 @@ from .utils import log
 try:
     from .figure_pipeline import FigurePipeline  # type: ignore
     from .figure_pipeline.models import FigureProcessingResult, PipelineConfig  # type: ignore
+    from .figure_pipeline.prefilter import configured_method  # type: ignore
 except Exception:  # pragma: no cover - figure deps may not be installed in tests
     FigurePipeline = None
     FigureProcessingResult = None
@@ -128,6 +129,7 @@ def _process_figures(
             PipelineConfig(
                 pdf_dir=str(pdf_dir),
                 output_dir=str(pdf_dir.parent / "figures"),
+                chinese_prefilter=configured_method(),
             )
         )
     )
@@ -0,0 +1,246 @@
+"""
+Content-addressed cache for PDF extraction results.
+
+The same PDF is read by several stages in one pipeline run (pdf_pipeline text
+extraction, synthesis extraction for translation, figure extraction). Each
+stage stores what it derived in a sidecar JSON keyed by the PDF's sha256,
+EXTRACTOR_VERSION and a fingerprint of the config that shapes extraction
+(translation.synthesis watermark rules, paragraph settings and engine), so
+later consumers read the cached result instead of re-parsing the document.
+
+Entries are grouped into named sections, e.g.:
+  - "text:pdfminer" / "text:pymupdf": whole-document raw text
+  - "paragraphs": legacy extract_from_pdf() paragraphs
+  - "synthesis:pdfminer": extract_from_pdf_synthesis() result
+  - "images" / "images-<hash>": figure extractor image metadata
+
+The directory is capped at pdf_extraction.cache_max_mb: every PRUNE_EVERY
+writes, the least recently used files are deleted until it fits (prune() can
+also be called directly, e.g. from a maintenance job).
+
+The cache is best-effort: read or write failures behave like a miss.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .file_service import read_json, write_json
+
+# Bump when any extractor's output changes so stale entries are ignored
+EXTRACTOR_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join("data", "cache", "extraction")
+DEFAULT_CACHE_MAX_MB = 2048
+
+# translation.synthesis settings that change extraction output
+FINGERPRINT_KEYS = (
+    "filter_watermarks",
+    "merge_fragments",
+    "min_paragraph_length",
+    "pdf_text_engine",
+    "watermark_rules",
+    "disabled_watermark_rules",
+)
+
+# Writes between size checks of the cache directory
+PRUNE_EVERY = 100
+
+# PDFs whose digest is remembered (least recently used dropped first)
+DIGEST_MEMO_SIZE = 4096
+
+_HASH_CHUNK = 1024 * 1024
+
+_lock = threading.Lock()
+# (path, size, mtime_ns) -> sha256, so one process hashes each PDF once
+_digest_memo: OrderedDict[Tuple[str, int, int], str] = OrderedDict()
+_writes_since_prune = 0
+
+
+def _extraction_config() -> Dict[str, Any]:
+    try:
+        from .config import get_config
+
+        cfg = get_config()
+    except Exception:
+        cfg = {}
+    return cfg if isinstance(cfg, dict) else {}
+
+
+def _cache_dir() -> Optional[str]:
+    """
+    Resolve the cache directory.
+
+    EXTRACTION_CACHE_DIR overrides pdf_extraction.cache_dir in config; an
+    empty value (or cache_dir: null) disables caching.
+    """
+    env_dir = os.environ.get("EXTRACTION_CACHE_DIR")
+    if env_dir is not None:
+        return env_dir or None
+    cfg = _extraction_config().get("pdf_extraction") or {}
+    if "cache_dir" in cfg:
+        return cfg.get("cache_dir") or None
+    return DEFAULT_CACHE_DIR
+
+
+def config_fingerprint() -> str:
+    """Short hash of the config settings that change extraction output."""
+    synthesis = (_extraction_config().get("translation") or {}).get("synthesis") or {}
+    relevant = {key: synthesis.get(key) for key in FINGERPRINT_KEYS}
+    blob = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:12]
+
+
+def _cache_max_bytes() -> int:
+    cfg = _extraction_config().get("pdf_extraction") or {}
+    max_mb = cfg.get("cache_max_mb", DEFAULT_CACHE_MAX_MB)
+    try:
+        return int(float(max_mb) * 1024 * 1024)
+    except (TypeError, ValueError):
+        return DEFAULT_CACHE_MAX_MB * 1024 * 1024
+
+
+def pdf_digest(pdf_path: str) -> Optional[str]:
+    """Return the sha256 hex digest of a PDF, or None if it cannot be read."""
+    try:
+        st = os.stat(pdf_path)
+    except OSError:
+        return None
+    memo_key = (os.path.abspath(pdf_path), st.st_size, st.st_mtime_ns)
+    with _lock:
+        cached = _digest_memo.get(memo_key)
+        if cached:
+            _digest_memo.move_to_end(memo_key)
+    if cached:
+        return cached
+
+    hasher = hashlib.sha256()
+    try:
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+                hasher.update(chunk)
+    except OSError:
+        return None
+    digest = hasher.hexdigest()
+    _memoize(memo_key, digest)
+    return digest
+
+
+def remember_digest(pdf_path: str, digest: str) -> None:
+    """Record a digest computed elsewhere (e.g. while downloading the PDF)."""
+    try:
+        st = os.stat(pdf_path)
+    except OSError:
+        return
+    _memoize((os.path.abspath(pdf_path), st.st_size, st.st_mtime_ns), digest)
+
+
+def _memoize(memo_key: Tuple[str, int, int], digest: str) -> None:
+    with _lock:
+        _digest_memo[memo_key] = digest
+        _digest_memo.move_to_end(memo_key)
+        while len(_digest_memo) > DIGEST_MEMO_SIZE:
+            _digest_memo.popitem(last=False)
+
+
+def _entry_path(pdf_path: str) -> Optional[str]:
+    cache_dir = _cache_dir()
+    if not cache_dir:
+        return None
+    digest = pdf_digest(pdf_path)
+    if not digest:
+        return None
+    name = f"{digest}-v{EXTRACTOR_VERSION}-{config_fingerprint()}.json"
+    return os.path.join(cache_dir, digest[:2], name)
+
+
+def _read_entry(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    try:
+        data = read_json(path)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def load(pdf_path: str, section: str) -> Optional[Any]:
+    """Return a cached section for this PDF, or None on a miss."""
+    path = _entry_path(pdf_path)
+    if not path:
+        return None
+    value = _read_entry(path).get(section)
+    if value is not None:
+        # mtime doubles as last use for prune()
+        with contextlib.suppress(OSError):
+            os.utime(path)
+    return value
+
+
+def store(pdf_path: str, section: str, value: Any) -> None:
+    """Store a section for this PDF, keeping other sections intact."""
+    path = _entry_path(pdf_path)
+    if not path:
+        return
+    global _writes_since_prune
+    try:
+        with _lock:
+            entry = _read_entry(path)
+            entry[section] = value
+            write_json(path, entry)
+            _writes_since_prune += 1
+            due = _writes_since_prune >= PRUNE_EVERY
+            if due:
+                _writes_since_prune = 0
+    except Exception:
+        # A failed write only costs a re-parse later
+        return
+    if due:
+        prune()
+
+
+def prune(max_bytes: Optional[int] = None) -> int:
+    """
+    Delete least recently used cache files until the directory fits.
+
+    Covers every file under the cache directory (including page_ocr's "ocr"
+    subdirectory). max_bytes defaults to pdf_extraction.cache_max_mb.
+
+    Returns:
+        Number of files removed
+    """
+    cache_dir = _cache_dir()
+    if not cache_dir or not os.path.isdir(cache_dir):
+        return 0
+    if max_bytes is None:
+        max_bytes = _cache_max_bytes()
+
+    files = []
+    total = 0
+    for root, _dirs, names in os.walk(cache_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+    removed = 0
+    for _mtime, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
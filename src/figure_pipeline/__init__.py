@@ -13,10 +13,12 @@ All processing runs in GitHub Actions - nothing runs locally.
 """
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .circuit_breaker import get_circuit_breaker
 from .models import (
@@ -25,6 +27,7 @@ from .models import (
     PipelineConfig,
     ProcessingStatus,
 )
+from .workspace import PaperWorkspace
 
 
 def log(message: str) -> None:
@@ -54,6 +57,8 @@ class FigurePipeline:
         self._translator = None
         self._validator = None
         self._storage = None
+        self._prefilter = None
+        self._translation_cache = None
 
     @property
     def extractor(self):
@@ -79,6 +84,25 @@ class FigurePipeline:
             self._validator = FigureValidator(self.config)
         return self._validator
 
+    @property
+    def prefilter(self):
+        """Lazy-load local Chinese-text prefilter."""
+        if self._prefilter is None:
+            from .prefilter import ChineseTextPrefilter
+            self._prefilter = ChineseTextPrefilter(self.config)
+        return self._prefilter
+
+    @property
+    def translation_cache(self):
+        """Lazy-load the cross-paper translated-figure cache."""
+        if self._translation_cache is None:
+            from .translation_cache import TranslationCache
+            from .translator import FigureTranslator
+            self._translation_cache = TranslationCache(
+                self.config.translation_cache_dir, FigureTranslator.cache_namespace()
+            )
+        return self._translation_cache
+
     @property
     def storage(self):
         """Lazy-load B2 storage."""
@@ -97,15 +121,26 @@ class FigurePipeline:
 
         Pipeline steps:
         1. Extract images from PDF
-        2. Validate with Moondream (check if needs translation)
-        3. Translate with Gemini 3 Pro Image (parallel)
+        2. Validate with Moondream (check if needs translation), except
+           figures the local prefilter finds Chinese-free and figures
+           already in the translation cache
+        3. Translate with Gemini 3 Pro Image; between passes only residual
+           Chinese is re-checked
         4. QA the translation (compare before/after)
         5. Upload to B2
-        6. Update manifest
+        6. Update manifest, once every figure has finished
+
+        Steps 2-5 stream: each figure moves through them independently, so
+        the paper takes about as long as its slowest figure rather than the
+        sum of the slowest figure at each step.
+
+        Images are written to a PaperWorkspace under config.temp_dir, which
+        is deleted once the paper succeeds. The local paths on the returned
+        figures only stay valid if a figure failed or keep_workspace is set.
 
         Args:
             paper_id: Paper ID (e.g., "chinaxiv-202510.00001")
-            max_concurrent_figures: Max figures to translate concurrently (default: 8)
+            max_concurrent_figures: Max figures in each of steps 2-5 at a time (default: 8)
 
         Returns:
             FigureProcessingResult with all figures and stats
@@ -137,109 +172,55 @@ class FigurePipeline:
             log(f"PDF not found for {paper_id}")
             return result
 
-        # Step 1: Extract figures
-        log(f"Extracting figures from {paper_id}...")
-        figures = self.extractor.extract_all(pdf_path)
-        result.total_figures = len(figures)
-        result.extracted = len([f for f in figures if f.status == ProcessingStatus.EXTRACTED])
+        # Each run gets its own directory, so concurrent papers never share
+        # fig_N files; it is removed on success and kept on failure
+        with PaperWorkspace(
+            self.config.temp_dir, paper_id, keep=self.config.keep_workspace
+        ) as workspace:
+            # Step 1: Extract figures
+            log(f"Extracting figures from {paper_id}...")
+            figures = self.extractor.extract_all(pdf_path, workspace.original_dir)
+            result.total_figures = len(figures)
+            result.extracted = len([f for f in figures if f.status == ProcessingStatus.EXTRACTED])
+
+            if not figures:
+                log(f"No figures found in {paper_id}")
+                return result
+
+            # Steps 2-5 run per figure: each figure moves on to the next
+            # step as soon as its own previous step is done, so one slow
+            # figure no longer holds the whole paper at every step
+            log(f"Processing {len(figures)} figures (max {max_concurrent} concurrent per step)...")
+            self._process_figures(
+                figures, paper_id, workspace.translated_dir, max_concurrent, result
+            )
+            if result.cached:
+                log(f"Translation cache: {result.cached} figures already translated, skipped API calls")
+            if result.prefiltered:
+                log(f"Prefilter: {result.prefiltered} figures have no Chinese text, skipped API calls")
+
+            # Step 6: Update manifest with translated figure URLs, once every
+            # figure has finished
+            if not self.config.dry_run:
+                translated_with_urls = [
+                    {"number": fig.figure_number, "url": fig.translated_url}
+                    for fig in figures
+                    if fig.translated_url
+                ]
+                if translated_with_urls:
+                    log(f"Updating manifest with {len(translated_with_urls)} translated figures...")
+                    self.storage.update_manifest(paper_id, translated_with_urls)
+
+                    # Step 7: Update PostgreSQL has_figures column
+                    self._update_db_has_figures(paper_id)
+
+            result.figures = figures
+            if result.failed:
+                workspace.keep(f"{result.failed} figures failed")
+            log(f"Processed {paper_id}: {result.translated}/{result.total_figures} figures translated")
 
-        if not figures:
-            log(f"No figures found in {paper_id}")
             return result
 
-        # Step 2: Validate and check for Chinese text
-        log(f"Validating {len(figures)} figures...")
-        for fig in figures:
-            if fig.original_path and os.path.exists(fig.original_path):
-                validation = self.validator.validate(fig.original_path)
-                fig.qa_readable = validation.get("readable", True)
-                fig.qa_has_chinese = validation.get("has_chinese", False)
-                fig.qa_figure_type = validation.get("figure_type", "unknown")
-
-                if fig.qa_readable:
-                    fig.status = ProcessingStatus.VALIDATED
-                    result.validated += 1
-
-        # Step 3: Translate figures with Chinese text (PARALLEL)
-        figures_to_translate = [
-            f for f in figures
-            if f.status == ProcessingStatus.VALIDATED
-            and (f.qa_has_chinese or not self.config.skip_translation_if_no_chinese)
-        ]
-        log(f"Translating {len(figures_to_translate)} figures (max {max_concurrent} concurrent)...")
-
-        # Define QA check function for multi-pass iteration
-        def check_has_chinese(image_path: str) -> bool:
-            """Return True if Chinese text detected (translation needs retry)."""
-            validation = self.validator.validate(image_path)
-            return validation.get("has_chinese", False)
-
-        # Translate figures in parallel
-        translation_results = self._translate_figures_parallel(
-            figures_to_translate,
-            paper_id,
-            check_has_chinese,
-            max_concurrent,
-        )
-
-        # Apply results to figures
-        for fig, translated_path, error in translation_results:
-            if translated_path:
-                fig.translated_path = translated_path
-                fig.status = ProcessingStatus.TRANSLATED
-                result.translated += 1
-            elif error:
-                fig.status = ProcessingStatus.FAILED
-                fig.error_message = error
-                result.failed += 1
-
-        # Step 4: QA the translations
-        translated_figures = [f for f in figures if f.status == ProcessingStatus.TRANSLATED]
-        for fig in translated_figures:
-            if fig.original_path and fig.translated_path:
-                qa_result = self.validator.qa_translation(
-                    fig.original_path,
-                    fig.translated_path,
-                )
-                fig.qa_translation_passed = qa_result.get("passed", False)
-                fig.qa_translation_notes = qa_result.get("differences", "")
-
-        # Step 5: Upload to B2
-        if not self.config.dry_run:
-            log("Uploading figures to B2...")
-            for fig in figures:
-                if fig.original_path:
-                    fig.original_url = self.storage.upload(
-                        fig.original_path,
-                        f"figures/{paper_id}/original/{os.path.basename(fig.original_path)}",
-                    )
-                if fig.translated_path:
-                    fig.translated_url = self.storage.upload(
-                        fig.translated_path,
-                        f"figures/{paper_id}/translated/{os.path.basename(fig.translated_path)}",
-                    )
-                if fig.original_url or fig.translated_url:
-                    fig.status = ProcessingStatus.UPLOADED
-                    result.uploaded += 1
-
-            # Step 6: Update manifest with translated figure URLs
-            translated_with_urls = [
-                {"number": fig.figure_number, "url": fig.translated_url}
-                for fig in figures
-                if fig.translated_url
-            ]
-            if translated_with_urls:
-                log(f"Updating manifest with {len(translated_with_urls)} translated figures...")
-                self.storage.update_manifest(paper_id, translated_with_urls)
-
-                # Step 7: Update PostgreSQL has_figures column
-                self._update_db_has_figures(paper_id)
-
-        result.figures = figures
-        log(f"Processed {paper_id}: {result.translated}/{result.total_figures} figures translated")
-
-        return result
-
     def process_batch(
         self,
         paper_ids: List[str],
@@ -298,114 +279,504 @@ class FigurePipeline:
         # TODO: Load from manifest or B2
         raise NotImplementedError("Status retrieval not yet implemented")
 
-    def _translate_figures_parallel(
+    def _process_figures(
         self,
         figures: List[Figure],
         paper_id: str,
-        check_has_chinese,
+        output_dir: str,
         max_concurrent: int,
-    ) -> List[tuple]:
+        result: FigureProcessingResult,
+    ) -> None:
         """
-        Translate multiple figures in parallel using ThreadPoolExecutor.
+        Run steps 2-5 for every figure independently and wait for all of them.
+
+        Each figure goes through validation, translation, QA and upload on its
+        own schedule, on a pool of max_concurrent workers per API step (so
+        every step can stay busy without a thread per figure). Every API step
+        admits at most max_concurrent figures of this paper at a time and is
+        additionally bounded by the shared AdaptiveRateLimiter. Uploads run
+        on a pool of config.upload_concurrency threads, so a figure's
+        original is uploaded while it is still being translated.
 
-        Uses AdaptiveRateLimiter to handle 429 errors gracefully.
+        With config.api_mode "async" the API steps run on an event loop
+        instead (see _process_figures_async) and max_concurrent is unused.
 
         Args:
-            figures: List of Figure objects to translate
-            paper_id: Paper ID for output directory
-            check_has_chinese: Callback to check if Chinese remains (for multi-pass)
-            max_concurrent: Maximum concurrent translation workers
+            figures: Extracted figures (updated in place)
+            paper_id: Paper ID
+            output_dir: Directory for translated images
+            max_concurrent: Maximum figures in any one step at a time
+            result: Counters to update
+        """
+        from .rate_limiter import get_rate_limiter
 
-        Returns:
-            List of (figure, translated_path, error) tuples
+        if self.config.api_mode == "async":
+            asyncio.run(self._process_figures_async(figures, paper_id, output_dir, result))
+            return
+
+        lock = threading.Lock()
+        limits = {
+            step: threading.BoundedSemaphore(max_concurrent)
+            for step in ("validate", "translate", "qa")
+        }
+        uploads = None
+        if not self.config.dry_run:
+            uploads = ThreadPoolExecutor(max_workers=max(1, self.config.upload_concurrency))
+
+        def process_one(fig: Figure) -> None:
+            counts: Dict[str, int] = {}
+            try:
+                self._process_figure(fig, paper_id, output_dir, limits, uploads, counts)
+            finally:
+                # Steps that finished count even if a later one raised
+                with lock:
+                    for field, n in counts.items():
+                        setattr(result, field, getattr(result, field) + n)
+
+        workers = max(1, min(len(figures), max_concurrent * len(limits)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_one, fig) for fig in figures]
+            for fig, future in zip(figures, futures, strict=True):
+                try:
+                    future.result()
+                except Exception as e:
+                    log(f"Unexpected error for figure {fig.figure_number}: {e}")
+                    fig.status = ProcessingStatus.FAILED
+                    fig.error_message = str(e)
+                    result.failed += 1
+        if uploads is not None:
+            uploads.shutdown()
+
+        # Log rate limiter stats at end
+        stats = get_rate_limiter().get_stats()
+        if stats["total_rate_limits"] > 0:
+            log(f"Rate limiter stats: {stats['total_successes']} successes, "
+                f"{stats['total_rate_limits']} rate limits, "
+                f"current concurrency: {stats['current_concurrent']}")
+
+    def _process_figure(
+        self,
+        fig: Figure,
+        paper_id: str,
+        output_dir: str,
+        limits: Dict[str, threading.BoundedSemaphore],
+        uploads: Optional[ThreadPoolExecutor],
+        counts: Dict[str, int],
+    ) -> None:
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        from .rate_limiter import get_rate_limiter, is_rate_limit_error
+        Take one figure through steps 2-5.
 
-        rate_limiter = get_rate_limiter()
+        Args:
+            fig: Extracted figure (updated in place)
+            paper_id: Paper ID
+            output_dir: Directory for translated images
+            limits: Per-step semaphores shared by the paper's figures
+            uploads: Upload pool, or None for a dry run
+            counts: Receives increments for the FigureProcessingResult
+                counters as each step finishes
+        """
+        from .rate_limiter import get_rate_limiter
 
-        def translate_one(fig: Figure) -> tuple:
-            """Translate a single figure, returning (figure, path, error).
+        original_upload = None
+        if uploads is not None and fig.original_path:
+            # The original is final already; upload it while the rest runs
+            original_upload = uploads.submit(
+                self.storage.upload,
+                fig.original_path,
+                f"figures/{paper_id}/original/{os.path.basename(fig.original_path)}",
+            )
+
+        if fig.original_path and os.path.exists(fig.original_path):
+            # Step 2: Validate and check for Chinese text
+            with limits["validate"]:
+                if not self._validate_locally(fig, counts):
+                    with get_rate_limiter().acquire():
+                        validation = self.validator.validate(fig.original_path)
+                    self._apply_validation(fig, validation)
+                if fig.qa_readable:
+                    fig.status = ProcessingStatus.VALIDATED
+                    counts["validated"] = 1
+
+            # Step 3: Translate if it has Chinese text
+            if fig.status == ProcessingStatus.VALIDATED and (
+                fig.qa_has_chinese or not self.config.skip_translation_if_no_chinese
+            ):
+                with limits["translate"]:
+                    translated_path, error = self._translate_figure(fig, paper_id, output_dir)
+                if translated_path:
+                    fig.translated_path = translated_path
+                    fig.status = ProcessingStatus.TRANSLATED
+                    counts["translated"] = 1
+                elif error:
+                    fig.status = ProcessingStatus.FAILED
+                    fig.error_message = error
+                    counts["failed"] = 1
+
+            # Step 4: QA the translation
+            if fig.status == ProcessingStatus.TRANSLATED:
+                with limits["qa"]:
+                    self._qa_translation(fig)
 
-            Uses global semaphore for concurrency control and retries on 429s.
-            """
-            max_retries = 3
+        # Step 5: Upload to B2
+        if uploads is not None:
+            translated_upload = None
+            if fig.translated_path:
+                translated_upload = uploads.submit(
+                    self.storage.upload,
+                    fig.translated_path,
+                    f"figures/{paper_id}/translated/{os.path.basename(fig.translated_path)}",
+                )
+            if original_upload is not None:
+                fig.original_url = original_upload.result()
+            if translated_upload is not None:
+                fig.translated_url = translated_upload.result()
+            if fig.original_url or fig.translated_url:
+                fig.status = ProcessingStatus.UPLOADED
+                counts["uploaded"] = 1
+
+    def _async_clients(self, gate) -> Tuple[Any, Any]:
+        """
+        Clients for the async API steps, all admitted through gate.
 
-            if not fig.original_path:
-                return (fig, None, "No original_path set")
+        Returns:
+            (AsyncGeminiClient, or None without GEMINI_API_KEY like the
+            translator's GeminiClient; AsyncMoondreamClient)
+        """
+        from .async_clients import AsyncGeminiClient, AsyncMoondreamClient
 
-            for attempt in range(max_retries):
-                try:
-                    # Acquire global semaphore to enforce cross-paper concurrency cap
-                    with rate_limiter.acquire():
-                        translated_path = self.translator.translate(
-                            image_path=fig.original_path,
-                            figure_number=fig.figure_number,
-                            paper_id=paper_id,
-                            qa_check=check_has_chinese,
-                        )
-
-                    # FIX P1-1: Only call on_success if translation actually succeeded
-                    if translated_path:
-                        rate_limiter.on_success()
-                        return (fig, translated_path, None)
-                    else:
-                        # Translator returned None = translation failed (exhausted internal retries)
-                        return (fig, None, "Translation returned None after retries")
+        gemini = None
+        if os.environ.get("GEMINI_API_KEY"):
+            gemini = AsyncGeminiClient(gate=gate)
+        moondream = AsyncMoondreamClient(api_key=self.config.moondream_api_key, gate=gate)
+        return gemini, moondream
 
-                except Exception as e:
-                    error_str = str(e)
-                    # FIX M1: Extract status_code from typed exceptions (e.g., HTTPError)
-                    status_code = getattr(e, "status_code", None)
-
-                    # FIX P1-3: Check if this is a rate limit error (429/503) and retry
-                    if is_rate_limit_error(status_code, error_str) and attempt < max_retries - 1:
-                        delay = rate_limiter.on_rate_limit(error_str)
-                        log(f"Rate limit/overload ({status_code}) for figure {fig.figure_number}, "
-                            f"retry {attempt + 1}/{max_retries} after {delay}s...")
-                        time.sleep(delay)
-                        continue  # Retry
-
-                    # Non-retryable error or exhausted retries
-                    log(f"Error translating figure {fig.figure_number}: {e}")
-                    return (fig, None, error_str)
+    async def _process_figures_async(
+        self,
+        figures: List[Figure],
+        paper_id: str,
+        output_dir: str,
+        result: FigureProcessingResult,
+    ) -> None:
+        """
+        Run steps 2-5 for every figure as coroutines on one event loop.
 
-            # Should not reach here, but just in case
-            return (fig, None, "Max retries exceeded")
+        Validation, translation and QA calls go through the async Moondream
+        and Gemini clients, which share the process-wide get_async_rate_gate():
+        that gate alone bounds the requests in flight, across all three steps
+        and every paper being processed. Cache lookups, the prefilter, image
+        preparation and the OpenRouter fallback run on worker threads, and
+        uploads on a pool of config.upload_concurrency threads.
 
-        results = []
+        Args:
+            figures: Extracted figures (updated in place)
+            paper_id: Paper ID
+            output_dir: Directory for translated images
+            result: Counters to update
+        """
+        from .async_clients import get_async_rate_gate
 
-        # Use rate limiter's current concurrency (may be lower after 429s)
-        effective_concurrent = min(max_concurrent, rate_limiter.get_concurrent())
-        log(f"Using {effective_concurrent} concurrent workers (rate limiter: {rate_limiter.get_concurrent()})")
-
-        # Use ThreadPoolExecutor for parallel translation
-        # (translator.translate is synchronous, so we parallelize with threads)
-        with ThreadPoolExecutor(max_workers=effective_concurrent) as executor:
-            # Submit all translation jobs
-            future_to_fig = {
-                executor.submit(translate_one, fig): fig
-                for fig in figures
-            }
+        gate = get_async_rate_gate()
+        limiter = gate.limiter
+        gemini, moondream = self._async_clients(gate)
+        uploads = None
+        if not self.config.dry_run:
+            uploads = ThreadPoolExecutor(max_workers=max(1, self.config.upload_concurrency))
 
-            # Collect results as they complete
-            for future in as_completed(future_to_fig):
-                fig = future_to_fig[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    log(f"Unexpected error for figure {fig.figure_number}: {e}")
-                    results.append((fig, None, str(e)))
+        async def process_one(fig: Figure) -> None:
+            counts: Dict[str, int] = {}
+            try:
+                await self._process_figure_async(
+                    fig, paper_id, output_dir, gemini, moondream, uploads, counts
+                )
+            finally:
+                # Steps that finished count even if a later one raised
+                for field, n in counts.items():
+                    setattr(result, field, getattr(result, field) + n)
 
-        # Log rate limiter stats at end
-        stats = rate_limiter.get_stats()
+        try:
+            outcomes = await asyncio.gather(
+                *(process_one(fig) for fig in figures), return_exceptions=True
+            )
+        finally:
+            for client in (gemini, moondream):
+                if client is not None:
+                    await client.aclose()
+            if uploads is not None:
+                uploads.shutdown()
+
+        for fig, outcome in zip(figures, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                log(f"Unexpected error for figure {fig.figure_number}: {outcome}")
+                fig.status = ProcessingStatus.FAILED
+                fig.error_message = str(outcome)
+                result.failed += 1
+
+        stats = limiter.get_stats()
         if stats["total_rate_limits"] > 0:
-            log(f"Rate limiter stats: {stats['total_successes']} successes, "
+            log(f"Async rate limiter stats: {stats['total_successes']} successes, "
                 f"{stats['total_rate_limits']} rate limits, "
                 f"current concurrency: {stats['current_concurrent']}")
 
-        return results
+    async def _process_figure_async(
+        self,
+        fig: Figure,
+        paper_id: str,
+        output_dir: str,
+        gemini,
+        moondream,
+        uploads: Optional[ThreadPoolExecutor],
+        counts: Dict[str, int],
+    ) -> None:
+        """
+        Take one figure through steps 2-5 (async version of _process_figure).
+
+        Args:
+            fig: Extracted figure (updated in place)
+            paper_id: Paper ID
+            output_dir: Directory for translated images
+            gemini: AsyncGeminiClient, or None for OpenRouter only
+            moondream: AsyncMoondreamClient
+            uploads: Upload pool, or None for a dry run
+            counts: Receives increments for the FigureProcessingResult
+                counters as each step finishes
+        """
+        loop = asyncio.get_running_loop()
+
+        original_upload = None
+        if uploads is not None and fig.original_path:
+            # The original is final already; upload it while the rest runs
+            original_upload = loop.run_in_executor(
+                uploads,
+                self.storage.upload,
+                fig.original_path,
+                f"figures/{paper_id}/original/{os.path.basename(fig.original_path)}",
+            )
+
+        if fig.original_path and os.path.exists(fig.original_path):
+            # Step 2: Validate and check for Chinese text
+            if not await asyncio.to_thread(self._validate_locally, fig, counts):
+                validation = await moondream.validate(
+                    fig.original_path,
+                    combined=self.config.validation_mode == "combined",
+                )
+                self._apply_validation(fig, validation)
+            if fig.qa_readable:
+                fig.status = ProcessingStatus.VALIDATED
+                counts["validated"] = 1
+
+            # Step 3: Translate if it has Chinese text
+            if fig.status == ProcessingStatus.VALIDATED and (
+                fig.qa_has_chinese or not self.config.skip_translation_if_no_chinese
+            ):
+                try:
+                    translated_path = await self.translator.translate_async(
+                        image_path=fig.original_path,
+                        figure_number=fig.figure_number,
+                        paper_id=paper_id,
+                        gemini=gemini,
+                        output_dir=output_dir,
+                        qa_check=lambda path: self._has_residual_chinese_async(
+                            path, moondream
+                        ),
+                    )
+                    error = None if translated_path else "Translation returned None after retries"
+                except Exception as e:
+                    log(f"Error translating figure {fig.figure_number}: {e}")
+                    translated_path, error = None, str(e)
+                if translated_path:
+                    fig.translated_path = translated_path
+                    fig.status = ProcessingStatus.TRANSLATED
+                    counts["translated"] = 1
+                elif error:
+                    fig.status = ProcessingStatus.FAILED
+                    fig.error_message = error
+                    counts["failed"] = 1
+
+            # Step 4: QA the translation
+            if fig.status == ProcessingStatus.TRANSLATED and fig.translated_path:
+                if not await asyncio.to_thread(self._reuse_qa, fig):
+                    qa_result = await moondream.qa_translation(
+                        fig.original_path, fig.translated_path
+                    )
+                    await asyncio.to_thread(self._record_qa, fig, qa_result)
+
+        # Step 5: Upload to B2
+        if uploads is not None:
+            translated_upload = None
+            if fig.translated_path:
+                translated_upload = loop.run_in_executor(
+                    uploads,
+                    self.storage.upload,
+                    fig.translated_path,
+                    f"figures/{paper_id}/translated/{os.path.basename(fig.translated_path)}",
+                )
+            if original_upload is not None:
+                fig.original_url = await original_upload
+            if translated_upload is not None:
+                fig.translated_url = await translated_upload
+            if fig.original_url or fig.translated_url:
+                fig.status = ProcessingStatus.UPLOADED
+                counts["uploaded"] = 1
+
+    async def _has_residual_chinese_async(self, image_path: str, moondream) -> bool:
+        """Async version of _has_residual_chinese(), querying through moondream."""
+        def chinese_free() -> bool:
+            return (
+                self.prefilter.method != "off"
+                and self.prefilter.check(image_path).chinese_free
+            )
+
+        if await asyncio.to_thread(chinese_free):
+            return False
+        return await moondream.has_chinese(image_path)
+
+    def _validate_locally(self, fig: Figure, counts: Dict[str, int]) -> bool:
+        """
+        Settle step 2 without an API call where possible.
+
+        Returns True if the translation cache or the prefilter answered (and
+        fig's QA fields are set), False if the figure needs validating.
+        """
+        if self.translation_cache.get(fig.original_path):
+            # Translated before (in this or another paper), so known
+            # to need translation; the translator reuses the result
+            fig.qa_readable = True
+            fig.qa_has_chinese = True
+            fig.qa_figure_type = "unknown"
+            counts["cached"] = 1
+            return True
+        if (
+            self.config.skip_translation_if_no_chinese
+            and self.prefilter.method != "off"
+            and self.prefilter.check(fig.original_path).chinese_free
+        ):
+            # Confidently Chinese-free locally, so no API calls at all
+            fig.qa_readable = True
+            fig.qa_has_chinese = False
+            fig.qa_figure_type = "unknown"
+            counts["prefiltered"] = 1
+            return True
+        return False
+
+    @staticmethod
+    def _apply_validation(fig: Figure, validation: dict) -> None:
+        """Copy a validator verdict onto the figure."""
+        fig.qa_readable = validation.get("readable", True)
+        fig.qa_has_chinese = validation.get("has_chinese", False)
+        fig.qa_figure_type = validation.get("figure_type", "unknown")
+
+    def _has_residual_chinese(self, image_path: str) -> bool:
+        """
+        Return True if Chinese text remains in a translation (retry needed).
+
+        Between passes only this question matters, so the local prefilter
+        answers it when it is confident and a single Moondream query
+        otherwise. The full translation QA runs once, on the final image.
+        """
+        if self.prefilter.method != "off" and self.prefilter.check(image_path).chinese_free:
+            return False
+        return self.validator.has_chinese(image_path)
+
+    def _translate_figure(
+        self,
+        fig: Figure,
+        paper_id: str,
+        output_dir: Optional[str] = None,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Translate one figure under the shared AdaptiveRateLimiter.
+
+        Uses the global semaphore for concurrency control and retries on 429s.
+
+        Args:
+            fig: Figure to translate
+            paper_id: Paper ID for output directory
+            output_dir: Directory for translated images (default: translator's)
+
+        Returns:
+            (translated_path, error); translated_path is None on failure
+        """
+        from .rate_limiter import get_rate_limiter, is_rate_limit_error
+
+        rate_limiter = get_rate_limiter()
+        max_retries = 3
+
+        if not fig.original_path:
+            return (None, "No original_path set")
+
+        for attempt in range(max_retries):
+            try:
+                # Acquire global semaphore to enforce cross-paper concurrency cap
+                with rate_limiter.acquire():
+                    translated_path = self.translator.translate(
+                        image_path=fig.original_path,
+                        figure_number=fig.figure_number,
+                        paper_id=paper_id,
+                        output_dir=output_dir,
+                        qa_check=self._has_residual_chinese,
+                    )
+
+                # FIX P1-1: Only call on_success if translation actually succeeded
+                if translated_path:
+                    rate_limiter.on_success()
+                    return (translated_path, None)
+                else:
+                    # Translator returned None = translation failed (exhausted internal retries)
+                    return (None, "Translation returned None after retries")
+
+            except Exception as e:
+                error_str = str(e)
+                # FIX M1: Extract status_code from typed exceptions (e.g., HTTPError)
+                status_code = getattr(e, "status_code", None)
+
+                # FIX P1-3: Check if this is a rate limit error (429/503) and retry
+                if is_rate_limit_error(status_code, error_str) and attempt < max_retries - 1:
+                    delay = rate_limiter.on_rate_limit(error_str)
+                    log(f"Rate limit/overload ({status_code}) for figure {fig.figure_number}, "
+                        f"retry {attempt + 1}/{max_retries} after {delay}s...")
+                    time.sleep(delay)
+                    continue  # Retry
+
+                # Non-retryable error or exhausted retries
+                log(f"Error translating figure {fig.figure_number}: {e}")
+                return (None, error_str)
+
+        # Should not reach here, but just in case
+        return (None, "Max retries exceeded")
+
+    def _qa_translation(self, fig: Figure) -> None:
+        """Compare a translated figure with its original (or reuse a cached verdict)."""
+        from .rate_limiter import get_rate_limiter
+
+        if not (fig.original_path and fig.translated_path):
+            return
+        if self._reuse_qa(fig):
+            return
+        with get_rate_limiter().acquire():
+            qa_result = self.validator.qa_translation(
+                fig.original_path,
+                fig.translated_path,
+            )
+        self._record_qa(fig, qa_result)
+
+    def _reuse_qa(self, fig: Figure) -> bool:
+        """Apply a cached QA verdict for fig's original, if there is one."""
+        entry = self.translation_cache.get(fig.original_path)
+        if entry is None or entry.qa_passed is None:
+            return False
+        fig.qa_translation_passed = entry.qa_passed
+        fig.qa_translation_notes = entry.qa_notes
+        return True
+
+    def _record_qa(self, fig: Figure, qa_result: dict) -> None:
+        """Apply a QA result to the figure and remember it in the cache."""
+        fig.qa_translation_passed = qa_result.get("passed", False)
+        fig.qa_translation_notes = qa_result.get("differences", "")
+        self.translation_cache.record_qa(
+            fig.original_path,
+            fig.qa_translation_passed,
+            fig.qa_translation_notes,
+        )
 
     def _find_pdf(self, paper_id: str) -> Optional[str]:
         """Find PDF path for a paper ID."""
@@ -0,0 +1,515 @@
+"""
+asyncio clients for Gemini image translation and Moondream queries.
+
+The threaded pipeline holds one OS thread per in-flight request, which caps
+a process at a few dozen concurrent calls. These clients issue the same
+requests as GeminiClient and FigureValidator from a single event loop, so
+hundreds of figure requests can be in flight at once:
+
+    async with AsyncGeminiClient() as gemini, AsyncMoondreamClient() as md:
+        verdicts = await asyncio.gather(*(md.validate(p) for p in paths))
+
+FigurePipeline uses them when PipelineConfig.api_mode is "async": each
+paper's validation, translation and QA calls run on one event loop.
+
+Concurrency follows AdaptiveRateLimiter semantics: an AsyncRateGate admits
+requests while fewer than limiter.get_concurrent() are active, a transient
+429/503 calls on_rate_limit() (halving the limit) and is retried after the
+cooldown, and successes call on_success() to speed back up. Each client gets
+its own limiter by default (ASYNC_RATE_LIMITER_CONFIG); pass the same
+AsyncRateGate to several clients to share one budget, as the pipeline does
+with get_async_rate_gate() across all papers in the process.
+
+Requires httpx. Endpoints are configurable so tests can point the clients at
+a local fake server.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import os
+import threading
+from contextlib import asynccontextmanager, suppress
+from typing import List, Optional, Tuple
+
+from .circuit_breaker import classify_api_error, get_circuit_breaker
+from .gemini_client import GeminiClient, GeminiFatalError, GeminiRetryableError
+from .rate_limiter import AdaptiveRateLimiter, RateLimiterConfig, is_rate_limit_error
+from .validator import (
+    COMBINED_VALIDATION_PROMPT,
+    FIGURE_TYPE_PROMPT,
+    HAS_CHINESE_PROMPT,
+    QA_CHINESE_PROMPT,
+    QA_COHERENT_PROMPT,
+    QA_ENGLISH_PROMPT,
+    READABLE_PROMPT,
+    is_coherent_answer,
+    parse_combined_answer,
+    parse_figure_type,
+    qa_failure,
+    qa_verdict,
+)
+
+# Far higher bounds than the threaded default (8-16): an in-flight request
+# costs a socket and a coroutine, not a thread
+ASYNC_RATE_LIMITER_CONFIG = RateLimiterConfig(
+    initial_concurrent=64,
+    max_concurrent=512,
+    speedup_increment=8.0,
+)
+
+# Transient rate limits are retried this many times per request
+RATE_LIMIT_RETRIES = 5
+
+MOONDREAM_ENDPOINT = "https://api.moondream.ai/v1"
+
+
+
+class MoondreamAPIError(Exception):
+    """Failed Moondream API call."""
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class AsyncRateGate:
+    """
+    asyncio counterpart of AdaptiveRateLimiter.acquire().
+
+    Admits a request while fewer than limiter.get_concurrent() are active.
+    The count is guarded by a threading lock, so one gate can be shared by
+    event loops in several threads (one per paper in process_batch) and
+    still caps the requests in flight across all of them. A release wakes
+    the waiters of every loop; waiters also re-check the limit every
+    second, so speedups and backoffs made through the limiter take effect
+    without a notification.
+    """
+
+    def __init__(self, limiter: AdaptiveRateLimiter):
+        self.limiter = limiter
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Hold a request slot for the duration of the block."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._active < self.limiter.get_concurrent():
+                    self._active += 1
+                    break
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            # Re-check periodically in case the limit changed
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(waiter, timeout=1.0)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active -= 1
+                waiters, self._waiters = self._waiters, []
+            for waiter_loop, waiter in waiters:
+                # The loop may have finished since (its waiter timed out)
+                with suppress(RuntimeError):
+                    waiter_loop.call_soon_threadsafe(_wake, waiter)
+
+
+class _AsyncAPIClient:
+    """Shared httpx session, rate gate and 429 handling."""
+
+    SERVICE = ""
+
+    def __init__(
+        self,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        timeout: float = 120.0,
+        connect_timeout: float = 10.0,
+        gate: Optional[AsyncRateGate] = None,
+    ):
+        # Clients given the same gate share one count of requests in flight
+        if gate is None:
+            gate = AsyncRateGate(limiter or AdaptiveRateLimiter(ASYNC_RATE_LIMITER_CONFIG))
+        self.limiter = gate.limiter
+        self.gate = gate
+        self._timeout = (timeout, connect_timeout)
+        self._http = None
+
+    @property
+    def http(self):
+        """Lazy-create the httpx.AsyncClient."""
+        if self._http is None:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError("httpx not installed. Install with: pip install httpx")
+
+            timeout, connect_timeout = self._timeout
+            max_connections = self.limiter.config.max_concurrent
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(timeout, connect=connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _post(self, url: str, headers: dict, payload: dict):
+        """
+        POST under the rate gate.
+
+        Transient rate limits back off through the limiter and are retried
+        up to RATE_LIMIT_RETRIES times; any other response is returned for
+        the caller to classify. Network errors propagate as httpx errors.
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            async with self.gate.acquire():
+                response = await self.http.post(url, headers=headers, json=payload)
+            if response.is_success:
+                self.limiter.on_success()
+                return response
+            if attempt < RATE_LIMIT_RETRIES and is_rate_limit_error(
+                response.status_code, response.text
+            ):
+                delay = self.limiter.on_rate_limit(response.text)
+                print(
+                    f"[{self.SERVICE}] Rate limited, retrying in {delay:.1f}s "
+                    f"({attempt + 1}/{RATE_LIMIT_RETRIES})"
+                )
+                await asyncio.sleep(delay)
+                continue
+            return response
+
+
+class AsyncGeminiClient(_AsyncAPIClient):
+    """
+    asyncio version of GeminiClient.translate_image().
+
+    Request body, response parsing and error classification (including
+    circuit breaker recording) are GeminiClient's own.
+    """
+
+    SERVICE = "gemini"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_base: str = GeminiClient.API_BASE,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        timeout: float = 120.0,
+        gate: Optional[AsyncRateGate] = None,
+    ):
+        super().__init__(limiter, timeout, gate=gate)
+        self._gemini = GeminiClient(api_key)
+        self.api_base = api_base.rstrip("/")
+
+    async def _call_api(self, image_path: str, prompt: str, model: str) -> bytes:
+        """
+        Make a single API call.
+
+        Raises:
+            GeminiRetryableError: For transient errors
+            GeminiFatalError: For non-retryable errors
+        """
+        import httpx
+
+        # Reading and base64-encoding a large figure would stall the loop
+        b64_data, mime_type = await asyncio.to_thread(
+            self._gemini._image_to_base64, image_path
+        )
+        headers = {
+            "x-goog-api-key": self._gemini.api_key,
+            "Content-Type": "application/json",
+        }
+        payload = self._gemini._build_payload(prompt, b64_data, mime_type)
+
+        try:
+            response = await self._post(
+                f"{self.api_base}/{model}:generateContent", headers, payload
+            )
+        except httpx.TimeoutException as e:
+            raise GeminiRetryableError(f"Request timeout: {e}")
+        except httpx.HTTPError as e:
+            raise GeminiRetryableError(f"Network error: {e}")
+
+        if not response.is_success:
+            self._gemini._raise_for_status(response.status_code, response.text)
+
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise GeminiRetryableError(f"Invalid JSON response: {e}")
+
+        return await asyncio.to_thread(self._gemini._extract_image, data)
+
+    async def translate_image(
+        self,
+        image_path: str,
+        output_path: str,
+        model: Optional[str] = None,
+        prompt: Optional[str] = None,
+        max_retries: int = 3,
+        retry_delay: float = 2.0,
+    ) -> Optional[str]:
+        """
+        Translate Chinese text in an image to English.
+
+        Same arguments and result as GeminiClient.translate_image().
+
+        Returns:
+            Path to output image, or None if failed
+        """
+        model = model or GeminiClient.MODEL_PRO
+        if not prompt:
+            raise ValueError("prompt is required - use FigureTranslator.TRANSLATION_PROMPT")
+
+        if not os.path.exists(image_path):
+            print(f"[gemini] Image not found: {image_path}")
+            return None
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+        last_error = None
+        for attempt in range(max_retries):
+            try:
+                image_bytes = await self._call_api(image_path, prompt, model)
+                await asyncio.to_thread(_write_bytes, output_path, image_bytes)
+                print(f"[gemini] Translated image saved: {output_path}")
+                return output_path
+            except GeminiRetryableError as e:
+                last_error = e
+                wait_time = retry_delay * (2 ** attempt)
+                print(f"[gemini] Attempt {attempt + 1}/{max_retries} failed: {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(wait_time)
+            except GeminiFatalError as e:
+                print(f"[gemini] Fatal error: {e}")
+                return None
+
+        print(f"[gemini] All retries exhausted: {last_error}")
+        return None
+
+
+class AsyncMoondreamClient(_AsyncAPIClient):
+    """
+    asyncio Moondream Cloud client for figure validation queries.
+
+    Speaks the same /query protocol as moondream.vl(); validate(),
+    has_chinese() and qa_translation() return what FigureValidator's methods
+    of the same name do.
+    """
+
+    SERVICE = "moondream"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        endpoint: str = MOONDREAM_ENDPOINT,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        timeout: float = 120.0,
+        gate: Optional[AsyncRateGate] = None,
+    ):
+        super().__init__(limiter, timeout, gate=gate)
+        self._api_key = api_key
+        self.endpoint = endpoint.rstrip("/")
+
+    @property
+    def api_key(self) -> str:
+        """Get API key, loading from env if needed."""
+        if self._api_key is None:
+            self._api_key = os.environ.get("MOONDREAM_API_KEY")
+            if not self._api_key:
+                raise ValueError("MOONDREAM_API_KEY not set")
+        return self._api_key
+
+    async def query(self, image, question: str) -> dict:
+        """
+        Ask a question about an image (path or PIL image).
+
+        Returns:
+            The API response, with the reply under "answer"
+
+        Raises:
+            MoondreamAPIError: On a failed call
+        """
+        import httpx
+
+        image_url = await asyncio.to_thread(_jpeg_data_url, image)
+        headers = {
+            "X-Moondream-Auth": self.api_key,
+            "Content-Type": "application/json",
+        }
+        payload = {"image_url": image_url, "question": question, "stream": False}
+        try:
+            response = await self._post(f"{self.endpoint}/query", headers, payload)
+        except httpx.HTTPError as e:
+            raise MoondreamAPIError(f"Network error: {e}")
+        if not response.is_success:
+            raise MoondreamAPIError(
+                f"HTTP {response.status_code}: {response.text[:200]}",
+                response.status_code,
+            )
+        try:
+            return response.json()
+        except ValueError as e:
+            raise MoondreamAPIError(f"Invalid JSON response: {e}")
+
+    def _handle_api_error(self, error: Exception, context: str) -> None:
+        """Record billing-related errors to the circuit breaker."""
+        error_code = classify_api_error(getattr(error, "status_code", None), str(error))
+        if error_code:
+            get_circuit_breaker().record_failure(
+                error_code, "moondream", f"{context}: {error}"
+            )
+
+    async def _ask(self, image, question: str, context: str) -> Optional[str]:
+        try:
+            result = await self.query(image, question)
+        except MoondreamAPIError as e:
+            self._handle_api_error(e, context)
+            return None
+        return result.get("answer", "")
+
+    async def validate(self, image_path: str, combined: bool = True) -> dict:
+        """
+        Pre-translation validation, with the combined query unless combined is False.
+
+        Falls back to the three separate queries, issued concurrently, if the
+        combined answer cannot be parsed.
+        """
+        if not os.path.exists(image_path):
+            return {"readable": False, "has_chinese": False, "figure_type": "unknown"}
+
+        # Decode once; every query below reuses the image
+        image = await asyncio.to_thread(_load_image, image_path)
+        if combined:
+            answer = await self._ask(
+                image, COMBINED_VALIDATION_PROMPT, "validate_combined"
+            )
+            verdict = parse_combined_answer(answer) if answer is not None else None
+            if verdict is not None:
+                return verdict
+
+        readable, has_chinese, figure_type = await asyncio.gather(
+            self._ask(image, READABLE_PROMPT, "check_readable"),
+            self._ask(image, HAS_CHINESE_PROMPT, "has_chinese_text"),
+            self._ask(image, FIGURE_TYPE_PROMPT, "get_figure_type"),
+        )
+        return {
+            # Same defaults as FigureValidator when a query fails
+            "readable": readable is None or "yes" in readable.lower(),
+            "has_chinese": has_chinese is not None and "yes" in has_chinese.lower(),
+            "figure_type": parse_figure_type(figure_type),
+        }
+
+    async def has_chinese(self, image_path: str) -> bool:
+        """Check only whether an image still contains Chinese text (one query)."""
+        if not os.path.exists(image_path):
+            return False
+        answer = await self._ask(image_path, HAS_CHINESE_PROMPT, "has_chinese_text")
+        return answer is not None and "yes" in answer.lower()
+
+    async def qa_translation(self, original_path: str, translated_path: str) -> dict:
+        """
+        Post-translation QA, with the five queries issued concurrently.
+
+        Same checks, defaults and result as FigureValidator.qa_translation().
+        """
+        if not os.path.exists(original_path) or not os.path.exists(translated_path):
+            return qa_failure("One or both image files not found")
+
+        try:
+            original, translated = await asyncio.gather(
+                asyncio.to_thread(_load_image, original_path),
+                asyncio.to_thread(_load_image, translated_path),
+            )
+            english, chinese, coherent, original_type, translated_type = (
+                await asyncio.gather(
+                    self._ask(translated, QA_ENGLISH_PROMPT, "qa_translation_english"),
+                    self._ask(translated, QA_CHINESE_PROMPT, "qa_translation_chinese"),
+                    self._ask(
+                        translated, QA_COHERENT_PROMPT, "qa_translation_coherent"
+                    ),
+                    self._ask(original, FIGURE_TYPE_PROMPT, "get_figure_type"),
+                    self._ask(translated, FIGURE_TYPE_PROMPT, "get_figure_type"),
+                )
+            )
+        except Exception as e:
+            self._handle_api_error(e, "qa_translation")
+            return qa_failure(f"QA validation failed: {e}")
+
+        return qa_verdict(
+            has_english=english is not None and "yes" in english.lower(),
+            has_chinese_remaining=chinese is None or "yes" in chinese.lower(),
+            is_coherent=coherent is None or is_coherent_answer(coherent),
+            original_type=parse_figure_type(original_type),
+            translated_type=parse_figure_type(translated_type),
+        )
+
+
+_global_async_rate_gate: Optional[AsyncRateGate] = None
+_global_async_lock = threading.Lock()
+
+
+def get_async_rate_gate() -> AsyncRateGate:
+    """
+    Get the process-wide gate shared by the pipeline's async clients.
+
+    Its limiter is separate from get_rate_limiter(): the bounds
+    (ASYNC_RATE_LIMITER_CONFIG) are sized for coroutines, not threads.
+    """
+    global _global_async_rate_gate
+    with _global_async_lock:
+        if _global_async_rate_gate is None:
+            _global_async_rate_gate = AsyncRateGate(
+                AdaptiveRateLimiter(ASYNC_RATE_LIMITER_CONFIG)
+            )
+        return _global_async_rate_gate
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _load_image(image_path: str):
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        img.load()
+        return img.copy()
+
+
+def _jpeg_data_url(image) -> str:
+    """Encode an image (path or PIL image) the way moondream.vl() does: RGB JPEG, quality 95."""
+    if isinstance(image, str):
+        image = _load_image(image)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=95)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("utf-8")
@@ -7,8 +7,10 @@ Includes size-based filtering to remove icons/decorations and overly large image
 from __future__ import annotations
 
 import os
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from .. import extraction_cache
+from .image_hash import HashIndex, hamming, hash_image_bytes
 from .models import (
     Figure,
     FigureLocation,
@@ -59,6 +61,53 @@ class FigureExtractor:
                 )
         return self._fitz
 
+    def _passes_dimension_filter(
+        self, width: Optional[int], height: Optional[int]
+    ) -> Tuple[bool, str]:
+        """
+        Check image dimensions alone (no image data needed).
+
+        Args:
+            width: Image width in pixels (if known)
+            height: Image height in pixels (if known)
+
+        Returns:
+            Tuple of (passes, reason) - reason explains why it failed if False
+        """
+        if width is not None and width < MIN_IMAGE_DIMENSION:
+            return False, f"width too small ({width}px < {MIN_IMAGE_DIMENSION}px)"
+        if height is not None and height < MIN_IMAGE_DIMENSION:
+            return False, f"height too small ({height}px < {MIN_IMAGE_DIMENSION}px)"
+        return True, "passed"
+
+    def _page_image_bboxes(self, page, image_list: List[tuple]) -> Dict[int, Any]:
+        """
+        Map each xref on a page to the bbox of its first placement.
+
+        Images placed directly on the page are located from the content
+        stream without decoding them. get_image_info(xrefs=True), which
+        decodes and hashes every image on the page to recover xrefs, is only
+        used for images inside Form XObjects, and then once for the page.
+        """
+        bboxes: Dict[int, Any] = {}
+        missing = False
+        for item in image_list:
+            if item[0] in bboxes:
+                continue
+            if item[-1] == 0:  # Not referenced through a Form XObject
+                rect = page.get_image_bbox(item)
+                if rect.is_valid and not rect.is_empty:
+                    bboxes[item[0]] = tuple(rect)
+                    continue
+            missing = True
+
+        if missing:
+            for info in page.get_image_info(xrefs=True):
+                xref = info.get("xref")
+                if xref and xref not in bboxes:
+                    bboxes[xref] = info.get("bbox", [0, 0, 0, 0])
+        return bboxes
+
     def _passes_size_filter(
         self,
         image_bytes: bytes,
@@ -85,12 +134,7 @@ class FigureExtractor:
             return False, f"too large ({size_bytes / 1024 / 1024:.1f}MB > {MAX_IMAGE_SIZE_BYTES / 1024 / 1024}MB)"
 
         # Check dimensions if provided
-        if width is not None and width < MIN_IMAGE_DIMENSION:
-            return False, f"width too small ({width}px < {MIN_IMAGE_DIMENSION}px)"
-        if height is not None and height < MIN_IMAGE_DIMENSION:
-            return False, f"height too small ({height}px < {MIN_IMAGE_DIMENSION}px)"
-
-        return True, "passed"
+        return self._passes_dimension_filter(width, height)
 
     def _has_visual_content(self, image_bytes: bytes) -> Tuple[bool, str]:
         """
@@ -110,7 +154,7 @@ class FigureExtractor:
             Tuple of (has_content, reason) - reason explains why if False
         """
         try:
-            from PIL import Image
+            from PIL import Image, ImageStat
             import io
 
             # Load image
@@ -118,11 +162,10 @@ class FigureExtractor:
 
             # Convert to grayscale for analysis
             gray = img.convert('L')
-            pixels = list(gray.getdata())
 
-            # Calculate variance (low variance = blank/solid)
-            mean = sum(pixels) / len(pixels)
-            variance = sum((p - mean) ** 2 for p in pixels) / len(pixels)
+            # Calculate variance (low variance = blank/solid), from the
+            # histogram rather than a Python loop over every pixel
+            variance = ImageStat.Stat(gray).var[0]
 
             if variance < MIN_VARIANCE:
                 return False, f"low variance ({variance:.1f} < {MIN_VARIANCE})"
@@ -132,28 +175,22 @@ class FigureExtractor:
             if width < 3 or height < 3:
                 return True, "passed"  # Too small to analyze
 
-            edge_count = 0
+            # Sample-based edge detection (faster than full scan), on a
+            # numpy view of the sampled grid and its four neighbours
+            import numpy as np
 
-            # Sample-based edge detection (faster than full scan)
             sample_step = max(1, min(width, height) // 50)
-            sampled_pixels = 0
+            pixels = np.asarray(gray, dtype=np.int16)
+            ys = np.arange(1, height - 1, sample_step)[:, None]
+            xs = np.arange(1, width - 1, sample_step)[None, :]
 
-            for y in range(1, height - 1, sample_step):
-                for x in range(1, width - 1, sample_step):
-                    # Get pixel values around current position
-                    pl = gray.getpixel((x - 1, y))
-                    pr = gray.getpixel((x + 1, y))
-                    pt = gray.getpixel((x, y - 1))
-                    pb = gray.getpixel((x, y + 1))
+            # Simple gradient magnitude
+            gx = np.abs(pixels[ys, xs + 1] - pixels[ys, xs - 1])
+            gy = np.abs(pixels[ys + 1, xs] - pixels[ys - 1, xs])
+            gradient = gx + gy
 
-                    # Simple gradient magnitude
-                    gx = abs(pr - pl)
-                    gy = abs(pb - pt)
-                    gradient = gx + gy
-
-                    sampled_pixels += 1
-                    if gradient > 30:  # Edge threshold
-                        edge_count += 1
+            sampled_pixels = gradient.size
+            edge_count = int(np.count_nonzero(gradient > 30))  # Edge threshold
 
             if sampled_pixels > 0:
                 edge_density = edge_count / sampled_pixels
@@ -166,88 +203,55 @@ class FigureExtractor:
             # If analysis fails, assume it has content
             return True, f"analysis failed: {e}"
 
-    def _compute_perceptual_hash(self, image_bytes: bytes) -> Optional[str]:
+    def _compute_perceptual_hash(self, image_bytes: bytes) -> Optional[int]:
         """
-        Compute perceptual hash (average hash) for deduplication.
+        Compute perceptual hash for deduplication.
 
-        Uses a simple average hash algorithm:
-        1. Resize image to HASH_SIZE x HASH_SIZE
-        2. Convert to grayscale
-        3. Compute average pixel value
-        4. Generate hash: 1 if pixel > average, else 0
+        The algorithm (aHash, dHash or pHash) comes from
+        PipelineConfig.dedup_hash; see image_hash for details.
 
         Args:
             image_bytes: Raw image data
 
         Returns:
-            Hex string of hash, or None if computation fails
+            Hash as an int of HASH_SIZE * HASH_SIZE bits, or None if computation fails
         """
-        try:
-            from PIL import Image
-            import io
-
-            img = Image.open(io.BytesIO(image_bytes))
+        return hash_image_bytes(image_bytes, self.config.dedup_hash, HASH_SIZE)
 
-            # Resize and convert to grayscale
-            img = img.resize((HASH_SIZE, HASH_SIZE), Image.Resampling.LANCZOS)
-            gray = img.convert('L')
-
-            # Get pixels and compute average
-            pixels = list(gray.getdata())
-            avg = sum(pixels) / len(pixels)
-
-            # Generate hash bits
-            bits = ''.join('1' if p > avg else '0' for p in pixels)
-
-            # Convert to hex
-            hash_int = int(bits, 2)
-            return format(hash_int, f'0{HASH_SIZE * HASH_SIZE // 4}x')
-
-        except Exception:
-            return None
-
-    def _hamming_distance(self, hash1: str, hash2: str) -> int:
+    def _hamming_distance(self, hash1: int, hash2: int) -> int:
         """
-        Compute hamming distance between two hex hash strings.
+        Compute hamming distance between two hashes.
 
         Args:
-            hash1: First hex hash
-            hash2: Second hex hash
+            hash1: First hash
+            hash2: Second hash
 
         Returns:
             Number of differing bits
         """
-        if len(hash1) != len(hash2):
-            return 999  # Different lengths = very different
-
-        # Convert hex to int and XOR
-        int1 = int(hash1, 16)
-        int2 = int(hash2, 16)
-        xor = int1 ^ int2
-
-        # Count set bits (hamming distance)
-        return bin(xor).count('1')
+        return hamming(hash1, hash2)
 
-    def _is_duplicate(self, new_hash: str, existing_hashes: list) -> bool:
+    def _is_duplicate(self, new_hash: int, seen_hashes: HashIndex) -> bool:
         """
-        Check if a hash is a duplicate of any existing hash.
+        Check if a hash is a near-duplicate of any earlier hash.
 
         Args:
             new_hash: Hash to check
-            existing_hashes: List of existing hashes
+            seen_hashes: Index of the hashes accepted so far
 
         Returns:
-            True if duplicate found
+            True if a hash within HASH_DIFF_THRESHOLD bits was found
         """
-        for existing in existing_hashes:
-            if self._hamming_distance(new_hash, existing) <= HASH_DIFF_THRESHOLD:
-                return True
-        return False
+        return seen_hashes.has_within(new_hash)
 
     def extract_all(self, pdf_path: str, output_dir: Optional[str] = None) -> List[Figure]:
         """
         Extract all images from PDF.
 
+        The accepted images (page, xref, format, bbox) are recorded in the
+        shared extraction cache. When the same PDF is seen again only those
+        xrefs are decoded; filtering and deduplication are skipped.
+
         Args:
             pdf_path: Path to PDF file
             output_dir: Directory to save extracted images (default: temp_dir)
@@ -262,25 +266,60 @@ class FigureExtractor:
         os.makedirs(output_dir, exist_ok=True)
 
         paper_id = os.path.basename(pdf_path).replace(".pdf", "")
-        figures: List[Figure] = []
 
         doc = self.fitz.open(pdf_path)
         try:
+            # Dedup decisions depend on the hash, so each algorithm gets its
+            # own cache entry (aHash keeps the original one)
+            cache_kind = "images"
+            if self.config.dedup_hash != "ahash":
+                cache_kind = f"images-{self.config.dedup_hash}"
+            cached = extraction_cache.load(pdf_path, cache_kind)
+            if isinstance(cached, list):
+                return self._extract_cached(doc, cached, paper_id, output_dir)
+
+            figures: List[Figure] = []
+            accepted: List[Dict[str, Any]] = []
             image_count = 0
             filtered_count = 0
             duplicate_count = 0
             total_extracted = 0
-            seen_hashes = []  # For deduplication
+            seen_hashes = HashIndex(HASH_DIFF_THRESHOLD)  # For deduplication
+
+            # Outcome of every xref already seen, so images repeated across
+            # pages (logos, headers) are only decoded once
+            seen_xrefs: Dict[int, str] = {}
 
             for page_num in range(len(doc)):
                 page = doc[page_num]
                 image_list = page.get_images(full=True)
+                bboxes: Optional[Dict[int, Any]] = None  # Built on first accepted image
 
                 for img_index, img_info in enumerate(image_list):
                     xref = img_info[0]
 
                     # Extract image
                     try:
+                        outcome = seen_xrefs.get(xref)
+                        if outcome is not None:
+                            total_extracted += 1
+                            if outcome == "filtered":
+                                filtered_count += 1
+                            else:
+                                duplicate_count += 1
+                            continue
+
+                        # Dimensions come from the image dictionary, so tiny
+                        # images are dropped before their stream is decoded
+                        passes, reason = self._passes_dimension_filter(
+                            img_info[2], img_info[3]
+                        )
+                        if not passes:
+                            total_extracted += 1
+                            filtered_count += 1
+                            seen_xrefs[xref] = "filtered"
+                            continue
+
                         base_image = doc.extract_image(xref)
                         if not base_image:
                             continue
@@ -296,54 +335,52 @@ class FigureExtractor:
                         passes, reason = self._passes_size_filter(image_bytes, width, height)
                         if not passes:
                             filtered_count += 1
+                            seen_xrefs[xref] = "filtered"
                             continue
 
                         # Apply visual content detection
                         has_content, content_reason = self._has_visual_content(image_bytes)
                         if not has_content:
                             filtered_count += 1
+                            seen_xrefs[xref] = "filtered"
                             continue
 
                         # Deduplication check
                         img_hash = self._compute_perceptual_hash(image_bytes)
-                        if img_hash and self._is_duplicate(img_hash, seen_hashes):
+                        if img_hash is not None and self._is_duplicate(img_hash, seen_hashes):
                             duplicate_count += 1
+                            seen_xrefs[xref] = "duplicate"
                             continue
-                        if img_hash:
-                            seen_hashes.append(img_hash)
+                        if img_hash is not None:
+                            seen_hashes.add(img_hash)
+                            seen_xrefs[xref] = "accepted"
 
                         # Determine figure number (only count images that pass filtering)
                         image_count += 1
-                        figure_number = str(image_count)
-
-                        # Save to disk
-                        filename = f"fig_{figure_number}.{image_ext}"
-                        output_path = os.path.join(output_dir, filename)
-
-                        with open(output_path, "wb") as f:
-                            f.write(image_bytes)
 
                         # Get bounding box if available
-                        bbox = None
-                        for item in page.get_image_info(xrefs=True):
-                            if item.get("xref") == xref:
-                                bbox = item.get("bbox", [0, 0, 0, 0])
-                                break
-
-                        # Create Figure object
-                        figure = Figure(
-                            paper_id=paper_id,
-                            figure_number=figure_number,
-                            figure_type=FigureType.FIGURE,
-                            location=FigureLocation(
-                                page_number=page_num + 1,
-                                bounding_box=tuple(bbox) if bbox else None,
-                                marker=f"[FIGURE:{figure_number}]",
+                        if bboxes is None:
+                            bboxes = self._page_image_bboxes(page, image_list)
+                        bbox = bboxes.get(xref)
+
+                        meta = {
+                            "page": page_num,
+                            "xref": xref,
+                            "ext": image_ext,
+                            "width": width,
+                            "height": height,
+                            "bbox": list(bbox) if bbox else None,
+                            "hash": (
+                                format(img_hash, f"0{HASH_SIZE * HASH_SIZE // 4}x")
+                                if img_hash is not None else None
                             ),
-                            status=ProcessingStatus.EXTRACTED,
-                            original_path=output_path,
+                        }
+                        figures.append(
+                            self._save_figure(
+                                image_bytes, meta, str(image_count), paper_id, output_dir
+                            )
                         )
-                        figures.append(figure)
+                        accepted.append(meta)
 
                     except Exception as e:
                         print(f"[extractor] Failed to extract image {img_index} from page {page_num}: {e}")
@@ -352,11 +389,66 @@ class FigureExtractor:
             if filtered_count > 0 or duplicate_count > 0:
                 print(f"[extractor] Filtered {filtered_count} (size/content), {duplicate_count} duplicates from {total_extracted} images")
 
+            extraction_cache.store(pdf_path, cache_kind, accepted)
+
         finally:
             doc.close()
 
         return figures
 
+    def _extract_cached(
+        self,
+        doc,
+        accepted: List[Dict[str, Any]],
+        paper_id: str,
+        output_dir: str,
+    ) -> List[Figure]:
+        """Re-extract only the images a previous run accepted."""
+        figures: List[Figure] = []
+        for meta in accepted:
+            try:
+                base_image = doc.extract_image(meta["xref"])
+                if not base_image:
+                    continue
+                figure_number = str(len(figures) + 1)
+                figures.append(
+                    self._save_figure(
+                        base_image["image"], meta, figure_number, paper_id, output_dir
+                    )
+                )
+            except Exception as e:
+                print(f"[extractor] Failed to extract cached image xref {meta.get('xref')}: {e}")
+        return figures
+
+    def _save_figure(
+        self,
+        image_bytes: bytes,
+        meta: Dict[str, Any],
+        figure_number: str,
+        paper_id: str,
+        output_dir: str,
+    ) -> Figure:
+        """Write image bytes to disk and build its Figure record."""
+        filename = f"fig_{figure_number}.{meta.get('ext') or 'png'}"
+        output_path = os.path.join(output_dir, filename)
+
+        with open(output_path, "wb") as f:
+            f.write(image_bytes)
+
+        bbox = meta.get("bbox")
+        return Figure(
+            paper_id=paper_id,
+            figure_number=figure_number,
+            figure_type=FigureType.FIGURE,
+            location=FigureLocation(
+                page_number=meta["page"] + 1,
+                bounding_box=tuple(bbox) if bbox else None,
+                marker=f"[FIGURE:{figure_number}]",
+            ),
+            status=ProcessingStatus.EXTRACTED,
+            original_path=output_path,
+        )
+
     def extract_page(self, pdf_path: str, page_num: int) -> List[Figure]:
         """
         Extract images from a specific page.
@@ -136,6 +136,83 @@ class GeminiClient:
         # Unknown - assume retryable
         return True, error_msg, error_code
 
+    def _build_payload(self, prompt: str, b64_data: str, mime_type: str) -> dict:
+        """Build the generateContent request body for an image edit."""
+        return {
+            "contents": [{
+                "parts": [
+                    {"text": prompt},
+                    {
+                        "inline_data": {
+                            "mime_type": mime_type,
+                            "data": b64_data
+                        }
+                    }
+                ]
+            }],
+            "generationConfig": {
+                "responseModalities": ["TEXT", "IMAGE"],
+            }
+        }
+
+    def _raise_for_status(self, status_code: int, response_text: str) -> None:
+        """
+        Raise the matching error for a failed response.
+
+        Billing/quota errors are recorded to the circuit breaker first.
+
+        Raises:
+            GeminiRetryableError: For transient errors
+            GeminiFatalError: For non-retryable errors
+        """
+        is_retryable, error_msg, error_code = self._classify_error(
+            status_code, response_text
+        )
+
+        # Record billing errors to circuit breaker
+        if error_code:
+            circuit_breaker = get_circuit_breaker()
+            circuit_breaker.record_failure(error_code, "gemini", error_msg)
+
+        if is_retryable:
+            raise GeminiRetryableError(error_msg, status_code)
+        raise GeminiFatalError(error_msg, status_code)
+
+    def _extract_image(self, data: dict) -> bytes:
+        """
+        Extract the generated image from a parsed response.
+
+        Raises:
+            GeminiRetryableError: No image in the response
+            GeminiFatalError: The request was blocked
+        """
+        candidates = data.get("candidates", [])
+        if not candidates:
+            # Check for safety block
+            if "promptFeedback" in data:
+                feedback = data.get("promptFeedback", {})
+                block_reason = feedback.get("blockReason", "unknown")
+                raise GeminiFatalError(f"Request blocked: {block_reason}")
+            raise GeminiRetryableError("No candidates in response")
+
+        content = candidates[0].get("content", {})
+        parts = content.get("parts", [])
+
+        for part in parts:
+            if "inlineData" in part:
+                inline_data = part["inlineData"]
+                b64_image = inline_data.get("data", "")
+                if b64_image:
+                    return base64.b64decode(b64_image)
+
+        # No image found - check if text response
+        for part in parts:
+            if "text" in part:
+                text = part["text"]
+                print(f"[gemini] Model returned text instead of image: {text[:200]}")
+
+        raise GeminiRetryableError("No image in response")
+
     def _call_api(
         self,
         image_path: str,
@@ -168,23 +245,7 @@ class GeminiClient:
             "x-goog-api-key": self.api_key,
             "Content-Type": "application/json",
         }
-
-        payload = {
-            "contents": [{
-                "parts": [
-                    {"text": prompt},
-                    {
-                        "inline_data": {
-                            "mime_type": mime_type,
-                            "data": b64_data
-                        }
-                    }
-                ]
-            }],
-            "generationConfig": {
-                "responseModalities": ["TEXT", "IMAGE"],
-            }
-        }
+        payload = self._build_payload(prompt, b64_data, mime_type)
 
         # Make request
         try:
@@ -203,19 +264,7 @@ class GeminiClient:
 
         # Check response
         if not response.ok:
-            is_retryable, error_msg, error_code = self._classify_error(
-                response.status_code, response.text
-            )
-
-            # Record billing errors to circuit breaker
-            if error_code:
-                circuit_breaker = get_circuit_breaker()
-                circuit_breaker.record_failure(error_code, "gemini", error_msg)
-
-            if is_retryable:
-                raise GeminiRetryableError(error_msg, response.status_code)
-            else:
-                raise GeminiFatalError(error_msg, response.status_code)
+            self._raise_for_status(response.status_code, response.text)
 
         # Parse response
         try:
@@ -223,33 +272,7 @@ class GeminiClient:
         except ValueError as e:
             raise GeminiRetryableError(f"Invalid JSON response: {e}")
 
-        # Extract image from response
-        candidates = data.get("candidates", [])
-        if not candidates:
-            # Check for safety block
-            if "promptFeedback" in data:
-                feedback = data.get("promptFeedback", {})
-                block_reason = feedback.get("blockReason", "unknown")
-                raise GeminiFatalError(f"Request blocked: {block_reason}")
-            raise GeminiRetryableError("No candidates in response")
-
-        content = candidates[0].get("content", {})
-        parts = content.get("parts", [])
-
-        for part in parts:
-            if "inlineData" in part:
-                inline_data = part["inlineData"]
-                b64_image = inline_data.get("data", "")
-                if b64_image:
-                    return base64.b64decode(b64_image)
-
-        # No image found - check if text response
-        for part in parts:
-            if "text" in part:
-                text = part["text"]
-                print(f"[gemini] Model returned text instead of image: {text[:200]}")
-
-        raise GeminiRetryableError("No image in response")
+        return self._extract_image(data)
 
     def translate_image(
         self,
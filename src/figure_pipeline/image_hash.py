@@ -0,0 +1,152 @@
+"""
+Perceptual image hashes and near-duplicate lookup for figure deduplication.
+
+Hashes are plain ints (HASH_SIZE * HASH_SIZE bits, row-major, first pixel in
+the most significant bit), so the Hamming distance is a single popcount:
+
+- ahash: pixel > mean of the downscaled image. Bit-for-bit identical to the
+  extractor's original bit-string implementation.
+- dhash: pixel > its right-hand neighbour (robust to brightness shifts)
+- phash: low-frequency DCT coefficient > median (robust to rescaling and
+  recompression)
+
+HashIndex answers "is there a stored hash within d bits?" with a few dict
+lookups (multi-index hashing) instead of scanning every earlier hash.
+"""
+from __future__ import annotations
+
+import io
+from typing import Dict, Iterator, List, Optional, Tuple
+
+HASH_ALGORITHMS = ("ahash", "dhash", "phash")
+
+HASH_SIZE = 8  # 8x8 = 64 bits
+PHASH_FACTOR = 4  # pHash DCT input is (HASH_SIZE * PHASH_FACTOR)^2 pixels
+
+
+def check_algorithm(algorithm: str) -> str:
+    """Return algorithm, or raise ValueError if it is not in HASH_ALGORITHMS."""
+    if algorithm not in HASH_ALGORITHMS:
+        raise ValueError(
+            f"Unknown hash algorithm: {algorithm!r} (use one of {HASH_ALGORITHMS})"
+        )
+    return algorithm
+
+
+def _pixels(img, width: int, height: int, gray_first: bool = True):
+    import numpy as np
+    from PIL import Image
+
+    if gray_first:
+        img = img.convert("L").resize((width, height), Image.Resampling.LANCZOS)
+    else:
+        # aHash has always resized the original image before converting
+        img = img.resize((width, height), Image.Resampling.LANCZOS).convert("L")
+    return np.asarray(img, dtype=np.float64)
+
+
+def _bits_to_int(bits) -> int:
+    import numpy as np
+
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
+
+
+def _dct_matrix(n: int):
+    import numpy as np
+
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    return np.cos(np.pi * (2 * x + 1) * k / (2 * n))
+
+
+def image_hash(img, algorithm: str = "ahash", hash_size: int = HASH_SIZE) -> int:
+    """Perceptual hash of a PIL image as an int of hash_size**2 bits."""
+    import numpy as np
+
+    check_algorithm(algorithm)
+    if algorithm == "ahash":
+        pixels = _pixels(img, hash_size, hash_size, gray_first=False)
+        return _bits_to_int(pixels > pixels.mean())
+    if algorithm == "dhash":
+        pixels = _pixels(img, hash_size + 1, hash_size)
+        return _bits_to_int(pixels[:, 1:] > pixels[:, :-1])
+    # phash
+    size = hash_size * PHASH_FACTOR
+    dct = _dct_matrix(size)
+    coeffs = dct @ _pixels(img, size, size) @ dct.T
+    low = coeffs[:hash_size, :hash_size]
+    return _bits_to_int(low > np.median(low))
+
+
+def hash_image_bytes(
+    image_bytes: bytes, algorithm: str = "ahash", hash_size: int = HASH_SIZE
+) -> Optional[int]:
+    """image_hash() of encoded image bytes, or None if they cannot be decoded."""
+    from PIL import Image
+
+    check_algorithm(algorithm)
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            return image_hash(img, algorithm, hash_size)
+    except Exception:
+        return None
+
+
+def hamming(hash1: int, hash2: int) -> int:
+    """Number of differing bits."""
+    return (hash1 ^ hash2).bit_count()
+
+
+class HashIndex:
+    """
+    Multi-index hash table for "is there a hash within max_distance bits?".
+
+    The hash bits are split into max_distance + 1 blocks. Two hashes that
+    differ in at most max_distance bits must agree exactly on at least one
+    block (pigeonhole), so each query only compares against hashes sharing a
+    block value, looked up in one dict per block. The answer is exact, same
+    as scanning every stored hash.
+    """
+
+    def __init__(self, max_distance: int, bits: int = HASH_SIZE * HASH_SIZE):
+        self.max_distance = max_distance
+        count = max_distance + 1
+        edges = [round(i * bits / count) for i in range(count + 1)]
+        self._blocks = [
+            (low, (1 << (high - low)) - 1)
+            for low, high in zip(edges, edges[1:], strict=False)
+        ]
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in self._blocks]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: int) -> None:
+        """Store a hash."""
+        for (shift, mask), table in zip(self._blocks, self._tables, strict=True):
+            table.setdefault((value >> shift) & mask, []).append(value)
+        self._size += 1
+
+    def _candidates(self, value: int) -> Iterator[int]:
+        for (shift, mask), table in zip(self._blocks, self._tables, strict=True):
+            yield from table.get((value >> shift) & mask, ())
+
+    def find(self, value: int) -> List[Tuple[int, int]]:
+        """All distinct (distance, hash) pairs within max_distance, nearest first."""
+        found = {
+            candidate: hamming(value, candidate)
+            for candidate in self._candidates(value)
+        }
+        return sorted(
+            (distance, candidate)
+            for candidate, distance in found.items()
+            if distance <= self.max_distance
+        )
+
+    def has_within(self, value: int) -> bool:
+        """True if any stored hash is within max_distance (stops at the first)."""
+        return any(
+            hamming(value, candidate) <= self.max_distance
+            for candidate in self._candidates(value)
+        )
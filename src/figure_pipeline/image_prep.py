@@ -0,0 +1,152 @@
+"""
+Figure preprocessing before Gemini translation.
+
+PDF-embedded images can be several thousand pixels wide. Sending them at
+native resolution inflates the base64 request, the upload time and (for
+tiled models) the input token count, while the image models answer at
+roughly 1-2K pixels anyway. Before each translation call the input is
+therefore:
+
+- downscaled so its longest side fits the model's limit
+  (PipelineConfig.translation_max_side, keyed by model name)
+- re-encoded: JPEG for photographs, PNG for line art and anything with
+  transparency
+
+Images that already fit and are not photographs stored losslessly are sent
+untouched. After the call, a translated image that came back smaller than
+PipelineConfig.translation_min_output_side (or the original, if that is
+smaller) is upscaled to that size; larger outputs are left alone.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# More distinct colors than this in a lossless image means a photograph
+PHOTO_MIN_COLORS = 4096
+
+
+@dataclass
+class PreparedImage:
+    """The image actually sent to the model for one original."""
+
+    path: str
+    original_size: Tuple[int, int]
+    sent_size: Tuple[int, int]
+
+    @property
+    def downscaled(self) -> bool:
+        return self.sent_size != self.original_size
+
+
+def max_side_for_model(limits: Dict[str, int], model: str) -> Optional[int]:
+    """
+    Longest-side limit for a model, or None for no limit.
+
+    Looks up the full model name, then the name without its provider prefix
+    ("google/gemini-3-pro-image-preview" -> "gemini-3-pro-image-preview"),
+    then "default".
+    """
+    for name in (model, model.rsplit("/", 1)[-1], "default"):
+        if name in limits:
+            return limits[name] or None
+    return None
+
+
+def _is_photo(img) -> bool:
+    """True for continuous-tone images, which compress far better as JPEG."""
+    if img.format == "JPEG":
+        return True
+    return img.convert("RGB").getcolors(maxcolors=PHOTO_MIN_COLORS) is None
+
+
+def prepare_image(
+    image_path: str,
+    max_side: Optional[int],
+    work_path: str,
+    jpeg_quality: int = 90,
+) -> PreparedImage:
+    """
+    Write the model input for image_path next to work_path, if it needs one.
+
+    Args:
+        image_path: Original image
+        max_side: Longest side to send, or None for no limit
+        work_path: Path without extension for the re-encoded copy
+        jpeg_quality: JPEG quality for photographs
+
+    Returns:
+        PreparedImage; its path is image_path itself when nothing changed or
+        the image could not be decoded
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(image_path) as img:
+            size = img.size
+            scale = 1.0
+            if max_side and max(size) > max_side:
+                scale = max_side / max(size)
+            new_size = (max(1, round(size[0] * scale)), max(1, round(size[1] * scale)))
+            if img.format == "JPEG":
+                if scale == 1.0:
+                    return PreparedImage(image_path, size, size)
+                # Let the decoder do most of the downscaling (DCT scaling)
+                img.draft("RGB", new_size)
+            img.load()
+            photo = _is_photo(img)
+            has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+            if scale == 1.0 and not photo:
+                return PreparedImage(image_path, size, size)
+
+            out = img.convert("RGBA" if has_alpha else "RGB")
+            if scale < 1.0:
+                out = out.resize(new_size, Image.LANCZOS, reducing_gap=2.0)
+    except Exception as e:
+        print(f"[image_prep] Sending {image_path} unchanged: {e}")
+        return PreparedImage(image_path, (0, 0), (0, 0))
+
+    if photo and not has_alpha:
+        path = f"{work_path}.jpg"
+        out.save(path, format="JPEG", quality=jpeg_quality, optimize=True)
+    else:
+        path = f"{work_path}.png"
+        out.save(path, format="PNG")
+
+    if scale == 1.0 and os.path.getsize(path) >= os.path.getsize(image_path):
+        # Re-encoding alone did not help
+        os.unlink(path)
+        return PreparedImage(image_path, size, size)
+    return PreparedImage(path, size, out.size)
+
+
+def restore_output_size(
+    output_path: str, prepared: PreparedImage, min_side: Optional[int]
+) -> bool:
+    """
+    Upscale a translated image whose input was downscaled, if it came back small.
+
+    The target longest side is min(min_side, original longest side); the
+    output's own aspect ratio is kept. Returns True if the file was rewritten.
+    """
+    if not prepared.downscaled or not min_side:
+        return False
+    from PIL import Image
+
+    target = min(min_side, max(prepared.original_size))
+    try:
+        with Image.open(output_path) as img:
+            img.load()
+            longest = max(img.size)
+            if longest >= target:
+                return False
+            scale = target / longest
+            new_size = (round(img.width * scale), round(img.height * scale))
+            fmt = img.format or "PNG"
+            resized = img.resize(new_size, Image.LANCZOS)
+        resized.save(output_path, format=fmt)
+    except Exception as e:
+        print(f"[image_prep] Could not upscale {output_path}: {e}")
+        return False
+    return True
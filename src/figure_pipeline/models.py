@@ -7,7 +7,7 @@ extraction, translation, and assembly pipeline.
 from __future__ import annotations
 
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -87,6 +87,12 @@ class FigureProcessingResult(BaseModel):
     translated: int = Field(0, description="Successfully translated count")
     uploaded: int = Field(0, description="Successfully uploaded to B2 count")
     failed: int = Field(0, description="Failed count")
+    prefiltered: int = Field(
+        0, description="Judged Chinese-free locally, so no API calls were made"
+    )
+    cached: int = Field(
+        0, description="Translation reused from the figure translation cache, so no API calls were made"
+    )
     figures: List[Figure] = Field(default_factory=list, description="List of Figure objects")
 
     @property
@@ -107,6 +113,12 @@ class PipelineConfig(BaseModel):
     b2_bucket: str = Field("chinaxiv", description="Backblaze B2 bucket name")
     b2_key_id: Optional[str] = Field(None, description="B2 application key ID")
     b2_app_key: Optional[str] = Field(None, description="B2 application key")
+    upload_concurrency: int = Field(
+        16, description="Concurrent B2 uploads (and pooled HTTP connections) per pipeline"
+    )
+    upload_max_attempts: int = Field(
+        3, description="Attempts per object before an upload is given up"
+    )
 
     # Processing options
     max_figures_per_paper: int = Field(50, description="Maximum figures to process per paper")
@@ -114,8 +126,56 @@ class PipelineConfig(BaseModel):
         True, description="Skip translation if figure has no Chinese text"
     )
     dry_run: bool = Field(False, description="If True, don't upload to B2 or modify files")
+    validation_mode: str = Field(
+        "combined",
+        description="Moondream validation: 'combined' (one structured query per image) "
+        "or 'separate' (one query per check)",
+    )
+    api_mode: str = Field(
+        "threads",
+        description="How validation, translation and QA calls run: 'threads' (blocking "
+        "clients on per-step worker threads) or 'async' (asyncio clients on one event "
+        "loop per paper, bounded by the shared async rate limiter)",
+    )
+    dedup_hash: str = Field(
+        "ahash", description="Perceptual hash for figure deduplication: 'ahash', 'dhash' or 'phash'"
+    )
+    chinese_prefilter: str = Field(
+        "off",
+        description="Local check that lets Chinese-free figures skip all API calls: "
+        "'off' (default until precision is measured on real figures), 'auto' "
+        "(tesseract if installed, else glyph), 'tesseract' or 'glyph'",
+    )
+    translation_max_side: Dict[str, int] = Field(
+        default_factory=lambda: {
+            # Answers at up to 2K; larger inputs only add upload time
+            "gemini-3-pro-image-preview": 2048,
+            # Answers at ~1K and bills input by 768px tile
+            "gemini-2.5-flash-image": 1024,
+            "gemini-2.5-flash-image-preview": 1024,
+            "default": 2048,
+        },
+        description="Longest side (px) of the image sent for translation, by model "
+        "name; 0 or a missing entry (and no 'default') sends full resolution",
+    )
+    translation_jpeg_quality: int = Field(
+        90, description="JPEG quality when re-encoding photographic figures for translation"
+    )
+    translation_min_output_side: int = Field(
+        1024,
+        description="Upscale a translated figure whose input was downscaled if its longest "
+        "side comes back below this (capped at the original size; 0 disables)",
+    )
 
     # Paths
     temp_dir: str = Field("/tmp/figure_pipeline", description="Temporary directory for processing")
+    keep_workspace: bool = Field(
+        False, description="Keep each paper's directory under temp_dir even when it succeeds"
+    )
     pdf_dir: str = Field("data/pdfs", description="Directory containing PDF files")
+    translation_cache_dir: Optional[str] = Field(
+        "data/cache/figure_translations",
+        description="Cross-paper cache of translated figures keyed by image content "
+        "(None or empty disables)",
+    )
     output_dir: str = Field("data/figures", description="Output directory for extracted figures")
@@ -0,0 +1,255 @@
+"""
+Local Chinese-text prefilter for extracted figures.
+
+Runs before any paid API call. Figures the prefilter is confident contain no
+Chinese text skip Moondream validation and Gemini translation entirely; every
+other figure goes through the normal pipeline. The prefilter only ever answers
+"Chinese-free" or "don't know", so a miss costs API calls, never a figure left
+untranslated by mistake - as long as "Chinese-free" stays high-precision.
+
+Detectors (PipelineConfig.chinese_prefilter):
+- "tesseract": OCR with chi_sim; Chinese-free when no CJK character is
+  recognised with confidence
+- "glyph": offline CJK-glyph detector on the rasterized image (numpy/scipy,
+  no external binaries). Latin letters and digits almost never stack four or
+  more horizontal strokes in a single column, while most Chinese characters
+  do (日, 国, 温, 量 ...). The detector binarizes the image against its local
+  mean, drops components too large to be text (axes, bars, plot lines),
+  groups the rest into text lines and looks for a column crossing >= 4
+  strokes. Text too small to resolve strokes makes the answer "don't know".
+  Short labels of simple characters (对比, 分布) can slip through, which is
+  why precision is measured rather than assumed.
+- "auto": tesseract when installed with chi_sim, else glyph
+- "off" (default): every figure goes through the API checks. The glyph
+  detector's precision has only been measured on synthetic images, so the
+  prefilter stays opt-in (figures.chinese_prefilter in config.yaml, which
+  also describes how to measure it on real figures).
+
+See scripts/evaluate_chinese_prefilter.py for precision/recall on a labeled
+sample.
+"""
+from __future__ import annotations
+
+import functools
+import shutil
+import subprocess
+from dataclasses import dataclass
+from typing import Optional
+
+from .models import PipelineConfig
+
+PREFILTER_METHODS = ("auto", "tesseract", "glyph", "off")
+
+
+def configured_method() -> str:
+    """figures.chinese_prefilter from config.yaml ("off" when unset)."""
+    from ..config import get_config
+
+    method = (get_config().get("figures") or {}).get("chinese_prefilter")
+    # An unquoted YAML off loads as False
+    return str(method) if method else "off"
+
+# Images are downscaled to at most this many pixels before analysis
+MAX_PIXELS = 4_000_000
+
+# Text-line heights (px) the glyph detector can resolve strokes in
+MIN_GLYPH_HEIGHT = 9
+MAX_GLYPH_HEIGHT = 120
+
+# A text line is CJK-like when any ink column crosses this many strokes
+CJK_MIN_STROKES = 4
+
+# Adaptive binarization: a pixel is ink when it differs from the mean of its
+# LOCAL_WINDOW x LOCAL_WINDOW neighbourhood by more than LOCAL_CONTRAST, so
+# labels on coloured fills and photos are picked up too
+LOCAL_WINDOW = 31
+LOCAL_CONTRAST = 30
+DARK_BACKGROUND = 110
+
+# Line-shaped ink blobs shorter than MIN_GLYPH_HEIGHT count as unresolvable
+# text; more than this many makes the verdict "don't know"
+MAX_UNRESOLVED_LINES = 2
+
+TESSERACT_TIMEOUT = 60  # seconds per figure
+TESSERACT_MIN_CONFIDENCE = 40
+
+
+def _is_cjk(ch: str) -> bool:
+    code = ord(ch)
+    return (
+        0x4E00 <= code <= 0x9FFF  # CJK Unified Ideographs
+        or 0x3400 <= code <= 0x4DBF  # Extension A
+        or 0xF900 <= code <= 0xFAFF  # Compatibility Ideographs
+    )
+
+
+@dataclass
+class PrefilterVerdict:
+    """Outcome of the local prefilter for one figure."""
+    chinese_free: bool
+    method: str
+    reason: str = ""
+
+
+@functools.lru_cache(maxsize=1)
+def tesseract_has_chi_sim() -> bool:
+    """True if the tesseract binary is installed with chi_sim data."""
+    if not shutil.which("tesseract"):
+        return False
+    try:
+        proc = subprocess.run(
+            ["tesseract", "--list-langs"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return "chi_sim" in (proc.stdout + proc.stderr).split()
+
+
+def _ink_masks(gray) -> list:
+    """Dark-on-light ink, and light-on-dark ink where the background is dark."""
+    import numpy as np
+    from scipy import ndimage
+
+    local_mean = ndimage.uniform_filter(gray.astype(np.float32), size=LOCAL_WINDOW)
+    return [
+        gray < local_mean - LOCAL_CONTRAST,
+        (gray > local_mean + LOCAL_CONTRAST) & (local_mean < DARK_BACKGROUND),
+    ]
+
+
+def _load_gray(image_path: str):
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        img = img.convert("L")
+        pixels = img.width * img.height
+        if pixels > MAX_PIXELS:
+            scale = (MAX_PIXELS / pixels) ** 0.5
+            img = img.resize(
+                (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+            )
+        return np.asarray(img, dtype=np.uint8)
+
+
+def _scan_ink(ink, stats: dict) -> None:
+    import numpy as np
+    from scipy import ndimage
+
+    labels, count = ndimage.label(ink, structure=np.ones((3, 3)))
+    keep = np.zeros(count + 1, dtype=bool)
+    for index, box in enumerate(ndimage.find_objects(labels), start=1):
+        height = box[0].stop - box[0].start
+        width = box[1].stop - box[1].start
+        keep[index] = height <= MAX_GLYPH_HEIGHT and width <= 2 * MAX_GLYPH_HEIGHT
+    glyphs = keep[labels]
+
+    # Join neighbouring glyphs (and the radicals of one character) into lines
+    lines, _ = ndimage.label(
+        ndimage.binary_dilation(glyphs, structure=np.ones((3, 9), dtype=bool))
+    )
+    for index, box in enumerate(ndimage.find_objects(lines), start=1):
+        mask = glyphs[box] & (lines[box] == index)
+        height = box[0].stop - box[0].start
+        width = box[1].stop - box[1].start
+        if height > MAX_GLYPH_HEIGHT or not mask.any():
+            continue
+        if height < MIN_GLYPH_HEIGHT:
+            if height >= 3 and width >= 2 * height and mask.mean() > 0.15:
+                stats["unresolved_lines"] += 1
+            continue
+        strokes = (np.diff(mask.astype(np.int8), axis=0) == 1).sum(axis=0) + mask[0]
+        stats["text_lines"] += 1
+        if strokes.max() >= CJK_MIN_STROKES:
+            stats["cjk_lines"] += 1
+
+
+def glyph_scan(gray) -> dict:
+    """
+    Measure CJK-like text lines in a grayscale image array.
+
+    Returns a dict with:
+        - cjk_lines: text lines with a column crossing >= CJK_MIN_STROKES strokes
+        - text_lines: resolvable text lines
+        - unresolved_lines: line-shaped blobs too small to resolve strokes
+    """
+    stats = {"cjk_lines": 0, "text_lines": 0, "unresolved_lines": 0}
+    for ink in _ink_masks(gray):
+        _scan_ink(ink, stats)
+    return stats
+
+
+class ChineseTextPrefilter:
+    """
+    Decide locally whether a figure is confidently free of Chinese text.
+
+    Usage:
+        prefilter = ChineseTextPrefilter(config)
+        if prefilter.check(path).chinese_free:
+            ...  # skip Moondream + Gemini
+    """
+
+    def __init__(self, config: Optional[PipelineConfig] = None):
+        self.config = config or PipelineConfig()
+
+    @property
+    def method(self) -> str:
+        """Detector actually used ("off" if unknown or unavailable)."""
+        method = self.config.chinese_prefilter
+        if method == "auto":
+            return "tesseract" if tesseract_has_chi_sim() else "glyph"
+        if method == "tesseract" and not tesseract_has_chi_sim():
+            return "off"
+        return method if method in PREFILTER_METHODS else "off"
+
+    def check(self, image_path: str) -> PrefilterVerdict:
+        """Run the configured detector; any error means "don't know"."""
+        method = self.method
+        try:
+            if method == "glyph":
+                return self._check_glyphs(image_path)
+            if method == "tesseract":
+                return self._check_tesseract(image_path)
+        except Exception as e:
+            return PrefilterVerdict(False, method, f"error: {e}")
+        return PrefilterVerdict(False, method, "prefilter disabled")
+
+    def _check_glyphs(self, image_path: str) -> PrefilterVerdict:
+        stats = glyph_scan(_load_gray(image_path))
+        if stats["cjk_lines"]:
+            return PrefilterVerdict(
+                False, "glyph", f"{stats['cjk_lines']} CJK-like text lines"
+            )
+        if stats["unresolved_lines"] > MAX_UNRESOLVED_LINES:
+            return PrefilterVerdict(
+                False, "glyph", f"{stats['unresolved_lines']} lines too small to read"
+            )
+        return PrefilterVerdict(
+            True, "glyph", f"no CJK glyphs in {stats['text_lines']} text lines"
+        )
+
+    def _check_tesseract(self, image_path: str) -> PrefilterVerdict:
+        proc = subprocess.run(
+            ["tesseract", image_path, "stdout", "-l", "chi_sim", "--psm", "11", "tsv"],
+            capture_output=True,
+            text=True,
+            timeout=TESSERACT_TIMEOUT,
+            check=True,
+        )
+        cjk_chars = 0
+        for row in proc.stdout.splitlines()[1:]:
+            cols = row.split("\t")
+            if len(cols) < 12:
+                continue
+            try:
+                confidence = float(cols[10])
+            except ValueError:
+                continue
+            if confidence >= TESSERACT_MIN_CONFIDENCE:
+                cjk_chars += sum(1 for ch in cols[11] if _is_cjk(ch))
+        if cjk_chars:
+            return PrefilterVerdict(False, "tesseract", f"{cjk_chars} CJK characters")
+        return PrefilterVerdict(True, "tesseract", "no CJK characters recognised")
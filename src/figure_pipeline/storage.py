@@ -2,17 +2,45 @@
 Figure storage using Backblaze B2.
 
 Handles upload/download of figure images to cloud storage.
+
+Uploads share one B2 session whose connection pool is sized to
+PipelineConfig.upload_concurrency, are retried with backoff, and are
+verified against the SHA-1 that B2 reports for the stored object.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .models import PipelineConfig
 
+# Base delay between upload attempts (doubles each retry)
+UPLOAD_RETRY_DELAY = 1.0
+
+
+def _is_missing(error: Exception) -> bool:
+    """True when B2 reports that a file does not exist (not a transient error)."""
+    try:
+        from b2sdk.v2.exception import FileNotPresent
+    except ImportError:
+        return False
+    return isinstance(error, FileNotPresent)
+
+
+def _sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class FigureStorage:
     """
@@ -20,6 +48,8 @@ class FigureStorage:
 
     B2 storage layout:
     chinaxiv/
+    ├── figures/manifest.json          (compacted index)
+    ├── figures/manifests/{paper_id}.json
     ├── figures/{paper_id}/
     │   ├── original/
     │   │   ├── fig_1.png
@@ -34,11 +64,17 @@ class FigureStorage:
         self.config = config or PipelineConfig()
         self._client = None
         self._bucket = None
+        # Figures upload from several threads; authorize only once
+        self._bucket_lock = threading.Lock()
 
     @property
     def bucket(self):
         """Lazy-load B2 bucket."""
-        if self._bucket is None:
+        if self._bucket is not None:
+            return self._bucket
+        with self._bucket_lock:
+            if self._bucket is not None:
+                return self._bucket
             try:
                 import b2sdk.v2 as b2
 
@@ -65,7 +101,12 @@ class FigureStorage:
                 )
 
                 info = b2.InMemoryAccountInfo()
-                self._client = b2.B2Api(info)
+                self._client = b2.B2Api(
+                    info,
+                    api_config=b2.B2HttpApiConfig(
+                        http_session_factory=self._http_session
+                    ),
+                )
                 self._client.authorize_account("production", key_id, app_key)
                 self._bucket = self._client.get_bucket_by_name(bucket_name)
 
@@ -75,6 +116,18 @@ class FigureStorage:
                 )
         return self._bucket
 
+    def _http_session(self):
+        """Session whose pool keeps a connection per concurrent upload."""
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        pool_size = max(1, self.config.upload_concurrency)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def _get_public_base_url(self) -> str:
         """
         Get the public B2 base URL for file downloads.
@@ -101,6 +154,10 @@ class FigureStorage:
         """
         Upload file to B2.
 
+        Retried up to config.upload_max_attempts times with exponential
+        backoff. B2 checks the SHA-1 sent with the file; a stored object
+        whose reported SHA-1 still differs is uploaded again.
+
         Args:
             local_path: Path to local file
             remote_key: Remote path in bucket (e.g., "figures/paper_id/fig_1.png")
@@ -113,20 +170,57 @@ class FigureStorage:
             return None
 
         try:
-            # Upload file
-            self.bucket.upload_local_file(
-                local_file=local_path,
-                file_name=remote_key,
-            )
-
-            # Generate public URL (requires bucket to be set to allPublic)
-            base_url = self._get_public_base_url()
-            return f"{base_url}/{remote_key}"
-
-        except Exception as e:
+            sha1 = _sha1(local_path)
+        except OSError as e:
             print(f"[storage] Upload failed for {local_path}: {e}")
             return None
 
+        attempts = max(1, self.config.upload_max_attempts)
+        for attempt in range(attempts):
+            try:
+                # Upload file
+                uploaded = self.bucket.upload_local_file(
+                    local_file=local_path,
+                    file_name=remote_key,
+                    sha1_sum=sha1,
+                )
+
+                # Large files are stored in parts and report no whole-file SHA-1
+                stored_sha1 = getattr(uploaded, "content_sha1", None)
+                if isinstance(stored_sha1, str) and stored_sha1 not in (sha1, "none"):
+                    raise ValueError(f"checksum mismatch: {stored_sha1} != {sha1}")
+
+                # Generate public URL (requires bucket to be set to allPublic)
+                base_url = self._get_public_base_url()
+                return f"{base_url}/{remote_key}"
+
+            except Exception as e:
+                print(
+                    f"[storage] Upload attempt {attempt + 1}/{attempts} failed "
+                    f"for {local_path}: {e}"
+                )
+                if attempt < attempts - 1:
+                    time.sleep(UPLOAD_RETRY_DELAY * (2 ** attempt))
+
+        print(f"[storage] Upload failed for {local_path}")
+        return None
+
+    def upload_many(self, items: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Upload several files concurrently over the shared session.
+
+        Args:
+            items: (local_path, remote_key) pairs
+
+        Returns:
+            Public URL or None for each item, in order
+        """
+        if not items:
+            return []
+        workers = min(len(items), max(1, self.config.upload_concurrency))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.upload(*item), items))
+
     def download(self, remote_key: str, local_path: str) -> bool:
         """
         Download file from B2.
@@ -185,7 +279,11 @@ class FigureStorage:
 
     def delete_figures(self, paper_id: str) -> int:
         """
-        Delete all figures for a paper.
+        Delete all figures for a paper, and replace its manifest shard.
+
+        The shard becomes a tombstone ({"deleted": true}), so the next
+        compact_manifest() drops the paper from the index even if it was
+        recorded there before shards existed.
 
         Args:
             paper_id: Paper ID
@@ -203,43 +301,80 @@ class FigureStorage:
         except Exception as e:
             print(f"[storage] Delete failed for {paper_id}: {e}")
 
+        # Overwrites the paper's shard, if it has one
+        tombstone = {
+            "paper_id": paper_id,
+            "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "deleted": True,
+            **_paper_entry([]),
+        }
+        try:
+            self._write_json(self.manifest_shard_key(paper_id), tombstone)
+        except Exception as e:
+            print(f"[storage] Manifest tombstone upload failed for {paper_id}: {e}")
+
         return deleted
 
     # ─────────────────────────────────────────────────────────────────────────
     # Figure Manifest Management
+    #
+    # Each paper writes only its own shard, figures/manifests/{paper_id}.json,
+    # so a write is O(1) and concurrent runners never overwrite each other.
+    # compact_manifest() folds the shards into figures/manifest.json, which
+    # carries a generation number that increases with every compaction.
+    # Readers use the index for the whole corpus, or get_paper_manifest() for
+    # one paper (its shard, falling back to the index).
     # ─────────────────────────────────────────────────────────────────────────
 
     MANIFEST_KEY = "figures/manifest.json"
+    MANIFEST_SHARD_PREFIX = "figures/manifests/"
 
-    def download_manifest(self) -> Optional[Dict[str, Any]]:
-        """
-        Download the figure manifest from B2.
+    def manifest_shard_key(self, paper_id: str) -> str:
+        """B2 key of a paper's manifest shard."""
+        return f"{self.MANIFEST_SHARD_PREFIX}{paper_id}.json"
 
-        Returns:
-            Manifest dict or None if not found/error
-        """
+    def _read_json(self, remote_key: str) -> Dict[str, Any]:
+        """Download and parse a JSON object from B2 (raises on any failure)."""
         import tempfile
 
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+            tmp_path = tmp.name
         try:
-            with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-                tmp_path = tmp.name
-
-            downloaded = self.bucket.download_file_by_name(self.MANIFEST_KEY)
+            downloaded = self.bucket.download_file_by_name(remote_key)
             downloaded.save_to(tmp_path)
-
             with open(tmp_path, "r") as f:
-                manifest = json.load(f)
+                return json.load(f)
+        finally:
+            os.unlink(tmp_path)
+
+    def _write_json(self, remote_key: str, payload: Dict[str, Any]) -> None:
+        """Upload a JSON object to B2 (raises on any failure)."""
+        import tempfile
 
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
+            json.dump(payload, tmp, indent=2)
+            tmp_path = tmp.name
+        try:
+            self.bucket.upload_local_file(local_file=tmp_path, file_name=remote_key)
+        finally:
             os.unlink(tmp_path)
-            return manifest
 
+    def download_manifest(self) -> Optional[Dict[str, Any]]:
+        """
+        Download the compacted figure manifest from B2.
+
+        Returns:
+            Manifest dict or None if not found/error
+        """
+        try:
+            return self._read_json(self.MANIFEST_KEY)
         except Exception as e:
             print(f"[storage] Manifest download failed: {e}")
             return None
 
     def upload_manifest(self, manifest: Dict[str, Any]) -> bool:
         """
-        Upload the figure manifest to B2.
+        Upload the compacted figure manifest to B2.
 
         Args:
             manifest: Manifest dict to upload
@@ -247,21 +382,8 @@ class FigureStorage:
         Returns:
             True if successful
         """
-        import tempfile
-
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as tmp:
-                json.dump(manifest, tmp, indent=2)
-                tmp_path = tmp.name
-
-            self.bucket.upload_local_file(
-                local_file=tmp_path,
-                file_name=self.MANIFEST_KEY,
-            )
-
-            os.unlink(tmp_path)
+            self._write_json(self.MANIFEST_KEY, manifest)
             print(f"[storage] Manifest uploaded with {len(manifest.get('papers', {}))} papers")
             return True
 
@@ -273,11 +395,11 @@ class FigureStorage:
         self, paper_id: str, figures: List[Dict[str, Any]]
     ) -> bool:
         """
-        Update the B2 manifest with translated figure URLs for a paper.
+        Record a paper's translated figure URLs in its manifest shard.
 
         This is called after successfully translating figures for a paper.
-        It downloads the current manifest, adds/updates the paper entry,
-        and uploads the updated manifest.
+        Only the paper's own shard is written; the combined index picks it
+        up at the next compact_manifest().
 
         Args:
             paper_id: Paper ID (e.g., "chinaxiv-202201.00012")
@@ -288,22 +410,124 @@ class FigureStorage:
         Returns:
             True if successful
         """
-        # Download existing manifest or create new one
-        manifest = self.download_manifest()
-        if manifest is None:
-            manifest = {"updated_at": "", "papers": {}}
-
-        # Update timestamp
-        manifest["updated_at"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Add/update paper entry
-        manifest["papers"][paper_id] = {
-            "figure_count": len(figures),
-            "figures": [
-                {"number": fig.get("number", str(i + 1)), "url": fig.get("url", "")}
-                for i, fig in enumerate(figures)
-            ],
+        shard = {
+            "paper_id": paper_id,
+            "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            **_paper_entry(figures),
         }
+        try:
+            self._write_json(self.manifest_shard_key(paper_id), shard)
+            return True
+        except Exception as e:
+            print(f"[storage] Manifest shard upload failed for {paper_id}: {e}")
+            return False
 
-        # Upload updated manifest
-        return self.upload_manifest(manifest)
+    def get_paper_manifest(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get one paper's manifest entry.
+
+        Reads the paper's shard, which is always current, and falls back to
+        the compacted index for papers recorded before shards existed.
+
+        Returns:
+            Dict with figure_count and figures, or None if the paper has none
+        """
+        try:
+            shard = self._read_json(self.manifest_shard_key(paper_id))
+        except Exception:
+            shard = None
+        if shard is not None:
+            if shard.get("deleted"):
+                return None
+            return _paper_entry(shard.get("figures", []))
+        manifest = self.download_manifest() or {}
+        return manifest.get("papers", {}).get(paper_id)
+
+    def compact_manifest(self) -> Optional[Dict[str, Any]]:
+        """
+        Fold the manifest shards into the combined index.
+
+        Incremental: only shards uploaded since the previous compaction are
+        downloaded (tracked by B2 upload timestamp under "shards"). Papers
+        whose shard was deleted or is a delete_figures() tombstone are
+        dropped; papers from before shards existed are otherwise kept as
+        they are. The generation number goes up by one.
+
+        Nothing is written unless the previous index was read, or B2 says it
+        does not exist yet: starting over after a transient error would drop
+        the pre-shard entries and reset the generation.
+
+        Returns:
+            The new manifest, or None if B2 could not be read, listed or written
+        """
+        try:
+            previous = self._read_json(self.MANIFEST_KEY)
+        except Exception as e:
+            if not _is_missing(e):
+                print(f"[storage] Manifest download failed, not compacting: {e}")
+                return None
+            previous = {}
+        papers: Dict[str, Any] = dict(previous.get("papers", {}))
+        seen: Dict[str, int] = dict(previous.get("shards", {}))
+
+        try:
+            listed = {}
+            for file_info, _ in self.bucket.ls(folder_to_list=self.MANIFEST_SHARD_PREFIX):
+                name = os.path.basename(file_info.file_name)
+                if name.endswith(".json"):
+                    listed[name[: -len(".json")]] = file_info.upload_timestamp
+        except Exception as e:
+            print(f"[storage] Manifest shard listing failed: {e}")
+            return None
+
+        for paper_id in set(seen) - set(listed):
+            papers.pop(paper_id, None)
+            del seen[paper_id]
+
+        changed = [pid for pid, ts in listed.items() if seen.get(pid) != ts]
+
+        def read_shard(paper_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self._read_json(self.manifest_shard_key(paper_id))
+            except Exception as e:
+                print(f"[storage] Manifest shard download failed for {paper_id}: {e}")
+                return None
+
+        workers = min(max(1, len(changed)), max(1, self.config.upload_concurrency))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            shards = list(executor.map(read_shard, changed))
+
+        for paper_id, shard in zip(changed, shards, strict=True):
+            if shard is None:
+                # Retried at the next compaction
+                continue
+            if shard.get("deleted"):
+                papers.pop(paper_id, None)
+            else:
+                papers[paper_id] = _paper_entry(shard.get("figures", []))
+            seen[paper_id] = listed[paper_id]
+
+        manifest = {
+            "generation": previous.get("generation", 0) + 1,
+            "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "papers": papers,
+            "shards": seen,
+        }
+        if not self.upload_manifest(manifest):
+            return None
+        print(
+            f"[storage] Compacted manifest generation {manifest['generation']}: "
+            f"{len(changed)} shards updated, {len(papers)} papers"
+        )
+        return manifest
+
+
+def _paper_entry(figures: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Manifest entry for a paper, as stored in its shard and in the index."""
+    return {
+        "figure_count": len(figures),
+        "figures": [
+            {"number": fig.get("number", str(i + 1)), "url": fig.get("url", "")}
+            for i, fig in enumerate(figures)
+        ],
+    }
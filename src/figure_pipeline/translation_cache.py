@@ -0,0 +1,221 @@
+"""
+Content-addressed cache of translated figures, shared across papers.
+
+Logos, standard diagrams and figures carried over between versions of a
+paper (v1/v2) are translated once. Entries are keyed by a hash of the
+decoded pixels (so re-encoding a PNG does not miss) plus a namespace naming
+the translator model and prompt version, and hold the translated image and,
+once QA has run, its verdict:
+
+{cache_dir}/ab/abcdef....png    translated image
+{cache_dir}/ab/abcdef....json   {"ext", "passes", "namespace", "qa_passed", ...}
+
+The key is an exact pixel hash, not a perceptual one: a revised figure that
+changes a single label must miss. An entry whose translation failed QA is
+evicted on lookup, so the figure is translated again. The cache is
+best-effort; read or write failures behave like a miss.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from ..file_service import read_json, write_json
+
+# Bump when the entry layout or key derivation changes
+TRANSLATION_CACHE_VERSION = 1
+
+# Images whose pixel digest is remembered (least recently used dropped first)
+DIGEST_MEMO_SIZE = 4096
+
+_lock = threading.Lock()
+# (path, size, mtime_ns) -> pixel digest, so each image is decoded once
+_digest_memo: OrderedDict[Tuple[str, int, int], str] = OrderedDict()
+
+
+def image_digest(image_path: str) -> Optional[str]:
+    """
+    sha256 of an image's decoded pixels (mode, size and bytes).
+
+    Falls back to the file bytes when the image cannot be decoded; returns
+    None if the file cannot be read.
+    """
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return None
+    memo_key = (os.path.abspath(image_path), st.st_size, st.st_mtime_ns)
+    with _lock:
+        cached = _digest_memo.get(memo_key)
+        if cached:
+            _digest_memo.move_to_end(memo_key)
+    if cached:
+        return cached
+
+    hasher = hashlib.sha256()
+    try:
+        from PIL import Image
+
+        with Image.open(image_path) as img:
+            has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+            pixels = img.convert("RGBA" if has_alpha else "RGB")
+            hasher.update(f"{pixels.mode}:{pixels.width}x{pixels.height}:".encode())
+            hasher.update(pixels.tobytes())
+    except Exception:
+        hasher = hashlib.sha256(b"file:")
+        try:
+            with open(image_path, "rb") as f:
+                hasher.update(f.read())
+        except OSError:
+            return None
+    digest = hasher.hexdigest()
+    with _lock:
+        _digest_memo[memo_key] = digest
+        _digest_memo.move_to_end(memo_key)
+        while len(_digest_memo) > DIGEST_MEMO_SIZE:
+            _digest_memo.popitem(last=False)
+    return digest
+
+
+@dataclass
+class CachedTranslation:
+    """A cache hit: the stored translated image and what is known about it."""
+
+    key: str
+    image_path: str
+    passes: int
+    qa_passed: Optional[bool] = None
+    qa_notes: str = ""
+
+
+class TranslationCache:
+    """
+    Translated-figure store under cache_dir.
+
+    A falsy cache_dir disables the cache: get() always misses and the
+    writers do nothing.
+    """
+
+    def __init__(self, cache_dir: Optional[str], namespace: str):
+        """
+        Args:
+            cache_dir: Root directory (PipelineConfig.translation_cache_dir)
+            namespace: Translator model and prompt version; part of every key
+        """
+        self.cache_dir = cache_dir or None
+        self.namespace = namespace
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_dir is not None
+
+    def key(self, image_path: str) -> Optional[str]:
+        """Cache key for an original image, or None if it cannot be read."""
+        digest = image_digest(image_path)
+        if digest is None:
+            return None
+        blob = f"v{TRANSLATION_CACHE_VERSION}|{self.namespace}|{digest}"
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, image_path: str) -> Optional[CachedTranslation]:
+        """
+        Return the cached translation of an original image, or None.
+
+        A translation that failed QA is evicted and reported as a miss.
+        """
+        if not self.enabled:
+            return None
+        key = self.key(image_path)
+        if key is None:
+            return None
+        try:
+            meta = read_json(self._meta_path(key))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict):
+            return None
+        stored = os.path.join(self.cache_dir, key[:2], f"{key}{meta.get('ext', '')}")
+        if not os.path.exists(stored):
+            return None
+        if meta.get("qa_passed") is False:
+            self._evict(key, stored)
+            return None
+        return CachedTranslation(
+            key=key,
+            image_path=stored,
+            passes=int(meta.get("passes") or 1),
+            qa_passed=meta.get("qa_passed"),
+            qa_notes=meta.get("qa_notes") or "",
+        )
+
+    def _evict(self, key: str, stored: str) -> None:
+        """Remove an entry (metadata first, so a half-removed entry misses)."""
+        with _lock:
+            for path in (self._meta_path(key), stored):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"[translation_cache] Could not evict {path}: {e}")
+                    return
+
+    def put(self, image_path: str, translated_path: str, passes: int) -> None:
+        """Store the translation of an original image (QA verdict unknown yet)."""
+        if not self.enabled:
+            return
+        key = self.key(image_path)
+        if key is None:
+            return
+        ext = os.path.splitext(translated_path)[1]
+        stored = os.path.join(self.cache_dir, key[:2], f"{key}{ext}")
+        tmp = f"{stored}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(stored), exist_ok=True)
+            shutil.copyfile(translated_path, tmp)
+            os.replace(tmp, stored)
+            with _lock:
+                write_json(
+                    self._meta_path(key),
+                    {
+                        "ext": ext,
+                        "passes": passes,
+                        "namespace": self.namespace,
+                        "qa_passed": None,
+                        "qa_notes": "",
+                        "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    },
+                )
+        except Exception as e:
+            # A failed write only costs a future translation
+            print(f"[translation_cache] Could not store {translated_path}: {e}")
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def record_qa(self, image_path: str, passed: bool, notes: str = "") -> None:
+        """Attach the translation QA verdict to an existing entry."""
+        if not self.enabled:
+            return
+        key = self.key(image_path)
+        if key is None:
+            return
+        path = self._meta_path(key)
+        try:
+            with _lock:
+                meta = read_json(path)
+                if not isinstance(meta, dict):
+                    return
+                meta["qa_passed"] = bool(passed)
+                meta["qa_notes"] = notes or ""
+                write_json(path, meta)
+        except (OSError, ValueError):
+            pass
@@ -19,11 +19,15 @@ Includes production-grade error handling with:
 """
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import os
+import shutil
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Callable, Tuple
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 
 import requests
 # Note: Retry logic is now implemented manually in _call_api_with_retry()
@@ -31,6 +35,9 @@ import requests
 
 from .models import PipelineConfig
 from .gemini_client import GeminiClient, GeminiRetryableError, GeminiFatalError
+from .image_prep import PreparedImage, max_side_for_model, prepare_image, restore_output_size
+from .translation_cache import TranslationCache
+from .async_clients import AsyncGeminiClient
 
 
 class TranslationRetryableError(Exception):
@@ -126,6 +133,29 @@ Generate an updated image with ALL remaining Chinese text translated to English.
         self.config = config or PipelineConfig()
         self._api_key = None
         self._gemini_client = None
+        self.cache = TranslationCache(
+            self.config.translation_cache_dir, self.cache_namespace()
+        )
+        self.cache_hits = 0
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def cache_namespace(cls) -> str:
+        """
+        Translation cache namespace: primary model plus prompt version.
+
+        Editing either prompt changes the version, so translations made with
+        an older prompt are no longer reused. Only translations produced by
+        the primary model are stored (see is_primary_model).
+        """
+        prompts = f"{cls.TRANSLATION_PROMPT}\n{cls.FOLLOWUP_PROMPT}"
+        prompt_version = hashlib.sha256(prompts.encode("utf-8")).hexdigest()[:12]
+        return f"{GeminiClient.MODEL_PRO}|prompt-{prompt_version}"
+
+    @staticmethod
+    def is_primary_model(model: Optional[str]) -> bool:
+        """True for the cache namespace's model, via Google or OpenRouter."""
+        return bool(model) and model.split("/")[-1] == GeminiClient.MODEL_PRO
 
     @property
     def gemini_client(self) -> Optional[GeminiClient]:
@@ -374,7 +404,9 @@ Generate an updated image with ALL remaining Chinese text translated to English.
         print(f"[translator] Unexpected image format: {img_data.get('type')}")
         raise TranslationRetryableError("Unexpected image format in response")
 
-    def _call_api(self, image_path: str, prompt: str, output_path: str) -> Optional[str]:
+    def _call_api(
+        self, image_path: str, prompt: str, output_path: str
+    ) -> Tuple[Optional[str], Optional[str]]:
         """
         Translate an image using Google AI Studio API (primary) with OpenRouter fallback.
 
@@ -386,27 +418,143 @@ Generate an updated image with ALL remaining Chinese text translated to English.
         - Gemini 3 Pro: 100% QA pass rate, single pass, ~20s avg
         - Direct Google API preferred over OpenRouter for reliability
 
+        Each model gets the image downscaled to its translation_max_side
+        limit (see image_prep); an output that comes back smaller than
+        translation_min_output_side is upscaled.
+
         Args:
             image_path: Path to input image
             prompt: Translation prompt
             output_path: Where to save output
 
         Returns:
-            Path to output image, or None if failed
+            (path to output image, model that produced it), or (None, None)
+            if every backend failed
 
         Raises:
             InsufficientCreditsError: If OpenRouter account is out of credits (402)
         """
+        prepared: Dict[Optional[int], PreparedImage] = {}
+        try:
+            return self._call_models(image_path, prompt, output_path, prepared)
+        finally:
+            self._remove_prepared(image_path, prepared)
+
+    async def _call_api_async(
+        self,
+        image_path: str,
+        prompt: str,
+        output_path: str,
+        gemini: Optional[AsyncGeminiClient],
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        asyncio version of _call_api().
+
+        The Google request goes through gemini on the running event loop;
+        image preparation and the OpenRouter fallback run on worker threads.
+
+        Args:
+            image_path: Path to input image
+            prompt: Translation prompt
+            output_path: Where to save output
+            gemini: Google AI Studio client, or None to go straight to OpenRouter
+
+        Returns:
+            (path to output image, model that produced it), or (None, None)
+            if every backend failed
+
+        Raises:
+            InsufficientCreditsError: If OpenRouter account is out of credits (402)
+        """
+        prepared: Dict[Optional[int], PreparedImage] = {}
+        try:
+            if gemini is not None:
+                try:
+                    item = await asyncio.to_thread(
+                        self._prepare_input,
+                        image_path,
+                        output_path,
+                        GeminiClient.MODEL_PRO,
+                        prepared,
+                    )
+                    result = await gemini.translate_image(
+                        item.path, output_path, prompt=prompt, max_retries=3
+                    )
+                    if result:
+                        await asyncio.to_thread(
+                            restore_output_size,
+                            result,
+                            item,
+                            self.config.translation_min_output_side,
+                        )
+                        return result, GeminiClient.MODEL_PRO
+                    print("[translator] Google API returned no result, trying OpenRouter fallback...")
+                except Exception as e:
+                    print(f"[translator] Google API error: {e}, trying OpenRouter fallback...")
+            else:
+                print("[translator] Google API not available (no GEMINI_API_KEY), using OpenRouter...")
+
+            return await asyncio.to_thread(
+                self._call_openrouter, image_path, prompt, output_path, prepared
+            )
+        finally:
+            self._remove_prepared(image_path, prepared)
+
+    @staticmethod
+    def _remove_prepared(
+        image_path: str, prepared: Dict[Optional[int], PreparedImage]
+    ) -> None:
+        """Delete the temporary inputs made by _prepare_input()."""
+        for item in prepared.values():
+            if item.path != image_path and os.path.exists(item.path):
+                os.unlink(item.path)
+
+    def _prepare_input(
+        self,
+        image_path: str,
+        output_path: str,
+        model: str,
+        prepared: Dict[Optional[int], PreparedImage],
+    ) -> PreparedImage:
+        """Downscaled/re-encoded input for model, shared by models with the same limit."""
+        max_side = max_side_for_model(self.config.translation_max_side, model)
+        if max_side not in prepared:
+            work_path = f"{os.path.splitext(output_path)[0]}.input-{max_side or 'full'}"
+            prepared[max_side] = prepare_image(
+                image_path, max_side, work_path, self.config.translation_jpeg_quality
+            )
+            item = prepared[max_side]
+            if item.downscaled:
+                print(
+                    f"[translator] Sending {item.sent_size[0]}x{item.sent_size[1]} "
+                    f"(from {item.original_size[0]}x{item.original_size[1]}) to {model}"
+                )
+        return prepared[max_side]
+
+    def _call_models(
+        self,
+        image_path: str,
+        prompt: str,
+        output_path: str,
+        prepared: Dict[Optional[int], PreparedImage],
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Try each backend and model in turn (see _call_api)."""
         # Strategy 1: Try Google AI Studio API (primary)
         if self.gemini_client is not None:
             try:
                 print("[translator] Trying Google AI Studio API (gemini-3-pro-image-preview)...")
+                item = self._prepare_input(
+                    image_path, output_path, GeminiClient.MODEL_PRO, prepared
+                )
                 result = self.gemini_client.translate_image(
-                    image_path, output_path, prompt=prompt, max_retries=3
+                    item.path, output_path, prompt=prompt, max_retries=3
                 )
                 if result:
                     print("[translator] Success with Google AI Studio API")
-                    return result
+                    restore_output_size(
+                        result, item, self.config.translation_min_output_side
+                    )
+                    return result, GeminiClient.MODEL_PRO
                 print("[translator] Google API returned no result, trying OpenRouter fallback...")
             except GeminiRetryableError as e:
                 print(f"[translator] Google API retryable error: {e}, trying OpenRouter fallback...")
@@ -417,10 +565,21 @@ Generate an updated image with ALL remaining Chinese text translated to English.
         else:
             print("[translator] Google API not available (no GEMINI_API_KEY), using OpenRouter...")
 
-        # Strategy 2: Fall back to OpenRouter (only if API key is available)
+        # Strategy 2: Fall back to OpenRouter
+        return self._call_openrouter(image_path, prompt, output_path, prepared)
+
+    def _call_openrouter(
+        self,
+        image_path: str,
+        prompt: str,
+        output_path: str,
+        prepared: Dict[Optional[int], PreparedImage],
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """OpenRouter fallback: each model in turn (see _call_api)."""
+        # Only if API key is available
         if not os.environ.get("OPENROUTER_API_KEY"):
             print("[translator] No OpenRouter API key - skipping fallback")
-            return None
+            return None, None
 
         models = [
             (self.MODEL_PRO, "Pro"),
@@ -429,9 +588,11 @@ Generate an updated image with ALL remaining Chinese text translated to English.
 
         for model, name in models:
             try:
-                result = self._call_api_with_retry(image_path, prompt, output_path, model)
+                item = self._prepare_input(image_path, output_path, model, prepared)
+                result = self._call_api_with_retry(item.path, prompt, output_path, model)
                 print(f"[translator] Success with OpenRouter {name} model")
-                return result
+                restore_output_size(result, item, self.config.translation_min_output_side)
+                return result, model
             except TranslationFatalError as e:
                 print(f"[translator] OpenRouter {name} fatal error: {e}")
                 # Payment error - raise special exception to stop batch processing
@@ -443,7 +604,7 @@ Generate an updated image with ALL remaining Chinese text translated to English.
                     )
                 # Don't fallback on auth errors
                 if e.status_code in (401, 403):
-                    return None
+                    return None, None
                 # Continue to next model for other fatal errors
             except TranslationRetryableError as e:
                 print(f"[translator] OpenRouter {name} failed after 3 attempts: {e}")
@@ -458,7 +619,7 @@ Generate an updated image with ALL remaining Chinese text translated to English.
                 time.sleep(2)
 
         print("[translator] All APIs exhausted")
-        return None
+        return None, None
 
     def translate(
         self,
@@ -475,6 +636,11 @@ Generate an updated image with ALL remaining Chinese text translated to English.
         Uses strong prompting with optional iterative refinement.
         If qa_check is provided, will iterate until QA passes or max_passes reached.
 
+        An image already in the translation cache is copied from there
+        without any API call. Results are cached when qa_check finds no
+        Chinese left (or when there is no qa_check) and every pass was made
+        by the primary model.
+
         Args:
             image_path: Path to original image
             figure_number: Figure number for naming
@@ -492,22 +658,22 @@ Generate an updated image with ALL remaining Chinese text translated to English.
         output_dir = output_dir or os.path.join(self.config.temp_dir, paper_id, "translated")
         os.makedirs(output_dir, exist_ok=True)
 
+        cached = self._reuse_cached(image_path, figure_number, output_dir)
+        if cached is not None:
+            return cached
+
         current_input = image_path
         final_output = None
+        primary_only = True
 
         for pass_num in range(1, max_passes + 1):
             # Use main prompt for first pass, followup for subsequent
             prompt = self.TRANSLATION_PROMPT if pass_num == 1 else self.FOLLOWUP_PROMPT
 
-            # Determine output path
-            ext = Path(image_path).suffix or ".png"
-            if pass_num == 1:
-                output_path = os.path.join(output_dir, f"fig_{figure_number}_en{ext}")
-            else:
-                output_path = os.path.join(output_dir, f"fig_{figure_number}_en_p{pass_num}{ext}")
+            output_path = self._output_path(image_path, figure_number, output_dir, pass_num)
 
             # Call API
-            result = self._call_api(current_input, prompt, output_path)
+            result, model = self._call_api(current_input, prompt, output_path)
 
             if not result:
                 # API failed, return best result so far or None
@@ -515,9 +681,13 @@ Generate an updated image with ALL remaining Chinese text translated to English.
                 return final_output
 
             final_output = result
+            # Fallback-model output must not be served as the primary's
+            primary_only = primary_only and self.is_primary_model(model)
 
             # If no QA check provided, return after first pass
             if qa_check is None:
+                if primary_only:
+                    self.cache.put(image_path, final_output, pass_num)
                 return final_output
 
             # Check if Chinese text remains
@@ -526,6 +696,8 @@ Generate an updated image with ALL remaining Chinese text translated to English.
             if not has_chinese:
                 # Success! No Chinese remaining
                 print(f"[translator] Figure {figure_number} translated successfully in {pass_num} pass(es)")
+                if primary_only:
+                    self.cache.put(image_path, final_output, pass_num)
                 return final_output
 
             # Chinese still present, iterate if we have passes left
@@ -538,6 +710,104 @@ Generate an updated image with ALL remaining Chinese text translated to English.
         print(f"[translator] Figure {figure_number}: Could not fully translate after {max_passes} passes")
         return final_output
 
+    async def translate_async(
+        self,
+        image_path: str,
+        figure_number: str,
+        paper_id: str,
+        gemini: Optional[AsyncGeminiClient],
+        output_dir: Optional[str] = None,
+        max_passes: int = 3,
+        qa_check: Optional[Callable[[str], Awaitable[bool]]] = None,
+    ) -> Optional[str]:
+        """
+        asyncio version of translate(), with the same passes and caching.
+
+        Args:
+            image_path: Path to original image
+            figure_number: Figure number for naming
+            paper_id: Paper ID for organizing output
+            gemini: Google AI Studio client (None: OpenRouter only)
+            output_dir: Directory for output (default: temp_dir)
+            max_passes: Maximum translation attempts (default: 3)
+            qa_check: Optional coroutine function(image_path) -> bool that
+                returns True if Chinese detected
+
+        Returns:
+            Path to translated image, or None if translation failed
+        """
+        if not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image not found: {image_path}")
+
+        output_dir = output_dir or os.path.join(self.config.temp_dir, paper_id, "translated")
+        os.makedirs(output_dir, exist_ok=True)
+
+        cached = await asyncio.to_thread(
+            self._reuse_cached, image_path, figure_number, output_dir
+        )
+        if cached is not None:
+            return cached
+
+        current_input = image_path
+        final_output = None
+        primary_only = True
+
+        for pass_num in range(1, max_passes + 1):
+            prompt = self.TRANSLATION_PROMPT if pass_num == 1 else self.FOLLOWUP_PROMPT
+            output_path = self._output_path(image_path, figure_number, output_dir, pass_num)
+
+            result, model = await self._call_api_async(
+                current_input, prompt, output_path, gemini
+            )
+
+            if not result:
+                print(f"[translator] Translation API failed on pass {pass_num} for figure {figure_number}")
+                return final_output
+
+            final_output = result
+            primary_only = primary_only and self.is_primary_model(model)
+
+            if qa_check is None or not await qa_check(result):
+                if qa_check is not None:
+                    print(f"[translator] Figure {figure_number} translated successfully in {pass_num} pass(es)")
+                if primary_only:
+                    await asyncio.to_thread(
+                        self.cache.put, image_path, final_output, pass_num
+                    )
+                return final_output
+
+            if pass_num < max_passes:
+                print(f"[translator] Figure {figure_number}: Chinese text remaining after pass {pass_num}, retrying...")
+                current_input = result
+                await asyncio.sleep(1)  # Rate limiting between passes
+
+        print(f"[translator] Figure {figure_number}: Could not fully translate after {max_passes} passes")
+        return final_output
+
+    def _reuse_cached(
+        self, image_path: str, figure_number: str, output_dir: str
+    ) -> Optional[str]:
+        """Copy a cached translation of image_path to the first-pass output path."""
+        cached = self.cache.get(image_path)
+        if cached is None:
+            return None
+        output_path = self._output_path(image_path, figure_number, output_dir, 1)
+        shutil.copyfile(cached.image_path, output_path)
+        with self._cache_lock:
+            self.cache_hits += 1
+        print(f"[translator] Figure {figure_number}: reused cached translation")
+        return output_path
+
+    @staticmethod
+    def _output_path(
+        image_path: str, figure_number: str, output_dir: str, pass_num: int
+    ) -> str:
+        """Output path for a translation pass (fig_N_en, then fig_N_en_pK)."""
+        ext = Path(image_path).suffix or ".png"
+        if pass_num == 1:
+            return os.path.join(output_dir, f"fig_{figure_number}_en{ext}")
+        return os.path.join(output_dir, f"fig_{figure_number}_en_p{pass_num}{ext}")
+
     def batch_translate(
         self,
         image_paths: list,
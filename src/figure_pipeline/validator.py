@@ -3,16 +3,184 @@ Figure validation using Moondream API.
 
 Performs QA checks:
 - Pre-translation: Is figure readable? Has Chinese text?
+- Between translation passes: Is any Chinese text left? (has_chinese)
 - Post-translation: Are figures identical except for language?
+
+Pre-translation validation runs in one of two modes (PipelineConfig.validation_mode):
+- "combined" (default): a single structured query answers all three questions
+- "separate": one query per question (three calls per image)
 """
 from __future__ import annotations
 
+import json
 import os
+import re
+import time
 from typing import Optional
 
 from .circuit_breaker import classify_api_error, get_circuit_breaker
 from .models import PipelineConfig
 
+VALID_FIGURE_TYPES = {"chart", "graph", "table", "diagram", "photo", "equation", "other"}
+
+COMBINED_VALIDATION_PROMPT = (
+    "Answer three questions about this image as JSON with the keys "
+    '"readable", "has_chinese" and "figure_type". '
+    "readable: is the image readable and not corrupted? Answer yes or no. "
+    "has_chinese: does the image contain any Chinese characters or text? Answer yes or no. "
+    "figure_type: what type of figure is this? Answer with one word: "
+    "chart, graph, table, diagram, photo, equation, or other."
+)
+
+READABLE_PROMPT = "Is this image readable and not corrupted? Answer yes or no."
+HAS_CHINESE_PROMPT = (
+    "Does this image contain any Chinese characters or text? Answer yes or no."
+)
+FIGURE_TYPE_PROMPT = (
+    "What type of figure is this? Answer with one word: "
+    "chart, graph, table, diagram, photo, equation, or other."
+)
+
+# Post-translation QA queries (qa_translation)
+QA_ENGLISH_PROMPT = "Does this image contain English text? Answer yes or no."
+QA_CHINESE_PROMPT = "Does this image contain any Chinese characters? Answer yes or no."
+QA_COHERENT_PROMPT = (
+    "Read the text in this image. Can you identify any English words? "
+    "Answer 'yes' if you can read English words, 'no' if the text is unreadable."
+)
+
+# Rate-limited combined queries are retried this many times before falling
+# back to the separate queries
+COMBINED_MAX_ATTEMPTS = 3
+
+_YES_NO_RE = {
+    key: re.compile(rf"{key}\W+(yes|no|true|false)", re.IGNORECASE)
+    for key in ("readable", "has_chinese")
+}
+_FIGURE_TYPE_RE = re.compile(r"figure_type\W+([a-z]+)", re.IGNORECASE)
+
+
+def _as_bool(value) -> Optional[bool]:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        word = value.strip().lower()
+        if word in ("yes", "true"):
+            return True
+        if word in ("no", "false"):
+            return False
+    return None
+
+
+def parse_combined_answer(answer: str) -> Optional[dict]:
+    """
+    Parse the answer to COMBINED_VALIDATION_PROMPT.
+
+    Accepts a JSON object (possibly wrapped in prose or a code fence) or
+    "key: value" lines. Returns None if readable/has_chinese are missing, so
+    the caller can fall back to separate queries.
+    """
+    data: dict = {}
+    match = re.search(r"\{.*\}", answer or "", re.DOTALL)
+    if match:
+        try:
+            loaded = json.loads(match.group(0))
+            if isinstance(loaded, dict):
+                data = loaded
+        except ValueError:
+            pass
+
+    result = {}
+    for key in ("readable", "has_chinese"):
+        value = _as_bool(data.get(key))
+        if value is None:
+            found = _YES_NO_RE[key].search(answer or "")
+            value = _as_bool(found.group(1)) if found else None
+        if value is None:
+            return None
+        result[key] = value
+
+    figure_type = data.get("figure_type")
+    if not isinstance(figure_type, str):
+        found = _FIGURE_TYPE_RE.search(answer or "")
+        figure_type = found.group(1) if found else "other"
+    figure_type = figure_type.strip().lower()
+    result["figure_type"] = figure_type if figure_type in VALID_FIGURE_TYPES else "other"
+    return result
+
+
+def parse_figure_type(answer: str) -> str:
+    """Normalize an answer to FIGURE_TYPE_PROMPT, defaulting to "other"."""
+    answer = (answer or "other").lower().strip()
+    return answer if answer in VALID_FIGURE_TYPES else "other"
+
+
+def is_coherent_answer(answer: str) -> bool:
+    """Lenient reading of QA_COHERENT_PROMPT: pass unless the answer is a plain no."""
+    answer = answer.lower()
+    return "yes" in answer or "no" not in answer
+
+
+def qa_failure(details: str) -> dict:
+    """QA result for a translation that could not be checked."""
+    return {
+        "passed": False,
+        "has_english": False,
+        "has_chinese_remaining": True,
+        "is_coherent": False,
+        "figure_type_match": False,
+        "details": details,
+    }
+
+
+def qa_verdict(
+    has_english: bool,
+    has_chinese_remaining: bool,
+    is_coherent: bool,
+    original_type: str,
+    translated_type: str,
+) -> dict:
+    """
+    Combine the QA query answers into a qa_translation() result.
+
+    Pass if: has English AND no Chinese remaining. is_coherent is
+    informational only (Moondream is unreliable for coherence), and
+    figure_type_match is logged but not required (vision models are
+    inconsistent).
+    """
+    figure_type_match = original_type == translated_type
+    passed = has_english and not has_chinese_remaining
+
+    details_parts = []
+    if has_english:
+        details_parts.append("English text detected")
+    else:
+        details_parts.append("WARNING: No English text detected")
+
+    if has_chinese_remaining:
+        details_parts.append("WARNING: Chinese text still present")
+    else:
+        details_parts.append("No Chinese text remaining")
+
+    if is_coherent:
+        details_parts.append("English text is coherent")
+    else:
+        details_parts.append("WARNING: English text may be gibberish/nonsense")
+
+    if figure_type_match:
+        details_parts.append(f"Figure type preserved ({translated_type})")
+    else:
+        details_parts.append(f"WARNING: Figure type changed ({original_type} -> {translated_type})")
+
+    return {
+        "passed": passed,
+        "has_english": has_english,
+        "has_chinese_remaining": has_chinese_remaining,
+        "is_coherent": is_coherent,
+        "figure_type_match": figure_type_match,
+        "details": "; ".join(details_parts),
+    }
+
 
 class FigureValidator:
     """
@@ -84,6 +252,11 @@ class FigureValidator:
 
         img = Image.open(image_path)
 
+        if self.config.validation_mode == "combined":
+            combined = self._validate_combined(img)
+            if combined is not None:
+                return combined
+
         # Check if readable
         readable = self._check_readable(img)
 
@@ -99,13 +272,50 @@ class FigureValidator:
             "figure_type": figure_type,
         }
 
+    def has_chinese(self, image_path: str) -> bool:
+        """
+        Check only whether an image still contains Chinese text (one query).
+
+        Used between translation passes, where readability and figure type
+        are already known. Returns False if the image is missing or the
+        query fails, like validate().
+        """
+        from PIL import Image
+
+        if not os.path.exists(image_path):
+            return False
+        return self._has_chinese_text(Image.open(image_path))
+
+    def _validate_combined(self, img) -> Optional[dict]:
+        """
+        Answer all validation questions with a single structured query.
+
+        Rate-limited calls back off through the shared AdaptiveRateLimiter and
+        retry. Returns None if the query fails or the answer cannot be parsed,
+        in which case validate() falls back to separate queries.
+        """
+        from .rate_limiter import get_rate_limiter, is_rate_limit_error
+
+        for attempt in range(COMBINED_MAX_ATTEMPTS):
+            try:
+                result = self.model.query(img, COMBINED_VALIDATION_PROMPT)
+            except Exception as e:
+                status_code = getattr(e, "status_code", None)
+                if (
+                    is_rate_limit_error(status_code, str(e))
+                    and attempt < COMBINED_MAX_ATTEMPTS - 1
+                ):
+                    time.sleep(get_rate_limiter().on_rate_limit(str(e)))
+                    continue
+                self._handle_api_error(e, "validate_combined")
+                return None
+            return parse_combined_answer(result.get("answer", ""))
+        return None
+
     def _check_readable(self, img) -> bool:
         """Check if figure is readable/not corrupted."""
         try:
-            result = self.model.query(
-                img,
-                "Is this image readable and not corrupted? Answer yes or no."
-            )
+            result = self.model.query(img, READABLE_PROMPT)
             return "yes" in result.get("answer", "").lower()
         except Exception as e:
             self._handle_api_error(e, "check_readable")
@@ -114,10 +324,7 @@ class FigureValidator:
     def _has_chinese_text(self, img) -> bool:
         """Check if figure contains Chinese text."""
         try:
-            result = self.model.query(
-                img,
-                "Does this image contain any Chinese characters or text? Answer yes or no."
-            )
+            result = self.model.query(img, HAS_CHINESE_PROMPT)
             return "yes" in result.get("answer", "").lower()
         except Exception as e:
             self._handle_api_error(e, "has_chinese_text")
@@ -126,13 +333,8 @@ class FigureValidator:
     def _get_figure_type(self, img) -> str:
         """Classify the figure type."""
         try:
-            result = self.model.query(
-                img,
-                "What type of figure is this? Answer with one word: chart, graph, table, diagram, photo, equation, or other."
-            )
-            answer = result.get("answer", "other").lower().strip()
-            valid_types = {"chart", "graph", "table", "diagram", "photo", "equation", "other"}
-            return answer if answer in valid_types else "other"
+            result = self.model.query(img, FIGURE_TYPE_PROMPT)
+            return parse_figure_type(result.get("answer", "other"))
         except Exception as e:
             self._handle_api_error(e, "get_figure_type")
             return "other"
@@ -167,24 +369,14 @@ class FigureValidator:
         from PIL import Image
 
         if not os.path.exists(original_path) or not os.path.exists(translated_path):
-            return {
-                "passed": False,
-                "has_english": False,
-                "has_chinese_remaining": True,
-                "is_coherent": False,
-                "figure_type_match": False,
-                "details": "One or both image files not found",
-            }
+            return qa_failure("One or both image files not found")
 
         try:
             img_translated = Image.open(translated_path)
 
             # Check 1: Does translated image have English text?
             try:
-                result_english = self.model.query(
-                    img_translated,
-                    "Does this image contain English text? Answer yes or no."
-                )
+                result_english = self.model.query(img_translated, QA_ENGLISH_PROMPT)
                 has_english = "yes" in result_english.get("answer", "").lower()
             except Exception as e:
                 self._handle_api_error(e, "qa_translation_english")
@@ -192,10 +384,7 @@ class FigureValidator:
 
             # Check 2: Does translated image still have Chinese text?
             try:
-                result_chinese = self.model.query(
-                    img_translated,
-                    "Does this image contain any Chinese characters? Answer yes or no."
-                )
+                result_chinese = self.model.query(img_translated, QA_CHINESE_PROMPT)
                 has_chinese_remaining = "yes" in result_chinese.get("answer", "").lower()
             except Exception as e:
                 self._handle_api_error(e, "qa_translation_chinese")
@@ -207,14 +396,8 @@ class FigureValidator:
             # The primary quality gate is: has English + no Chinese remaining
             # Coherence is informational only and doesn't block pass/fail
             try:
-                result_coherent = self.model.query(
-                    img_translated,
-                    "Read the text in this image. Can you identify any English words? "
-                    "Answer 'yes' if you can read English words, 'no' if the text is unreadable."
-                )
-                coherent_answer = result_coherent.get("answer", "").lower()
-                # Lenient check - pass if we can identify any English words
-                is_coherent = "yes" in coherent_answer or "no" not in coherent_answer
+                result_coherent = self.model.query(img_translated, QA_COHERENT_PROMPT)
+                is_coherent = is_coherent_answer(result_coherent.get("answer", ""))
             except Exception as e:
                 self._handle_api_error(e, "qa_translation_coherent")
                 is_coherent = True  # Default to coherent if check fails
@@ -223,53 +406,17 @@ class FigureValidator:
             img_original = Image.open(original_path)
             original_type = self._get_figure_type(img_original)
             translated_type = self._get_figure_type(img_translated)
-            figure_type_match = original_type == translated_type
-
-            # Determine overall pass/fail
-            # Pass if: has English AND no Chinese remaining
-            # Note: is_coherent is informational only (Moondream unreliable for coherence)
-            # Note: figure_type_match is logged but not required (vision models inconsistent)
-            passed = has_english and not has_chinese_remaining
-
-            details_parts = []
-            if has_english:
-                details_parts.append("English text detected")
-            else:
-                details_parts.append("WARNING: No English text detected")
-
-            if has_chinese_remaining:
-                details_parts.append("WARNING: Chinese text still present")
-            else:
-                details_parts.append("No Chinese text remaining")
-
-            if is_coherent:
-                details_parts.append("English text is coherent")
-            else:
-                details_parts.append("WARNING: English text may be gibberish/nonsense")
-
-            if figure_type_match:
-                details_parts.append(f"Figure type preserved ({translated_type})")
-            else:
-                details_parts.append(f"WARNING: Figure type changed ({original_type} -> {translated_type})")
-
-            return {
-                "passed": passed,
-                "has_english": has_english,
-                "has_chinese_remaining": has_chinese_remaining,
-                "is_coherent": is_coherent,
-                "figure_type_match": figure_type_match,
-                "details": "; ".join(details_parts),
-            }
+
+            return qa_verdict(
+                has_english,
+                has_chinese_remaining,
+                is_coherent,
+                original_type,
+                translated_type,
+            )
         except Exception as e:
             self._handle_api_error(e, "qa_translation")
-            return {
-                "passed": False,
-                "has_english": False,
-                "has_chinese_remaining": True,
-                "is_coherent": False,
-                "figure_type_match": False,
-                "details": f"QA validation failed: {e}",
-            }
+            return qa_failure(f"QA validation failed: {e}")
 
     def should_translate(self, image_path: str) -> bool:
         """
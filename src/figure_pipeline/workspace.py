@@ -0,0 +1,87 @@
+"""
+Per-paper scratch directories for figure processing.
+
+Extracted and translated images are named fig_N / fig_N_en, so papers that
+share config.temp_dir would overwrite each other's files when processed
+concurrently. Each paper run gets its own directory under temp_dir instead:
+
+{temp_dir}/{paper_id}-XXXXXXXX/
+├── original/      extracted images
+└── translated/    Gemini output
+
+The directory is removed when the run succeeds and kept when it fails (or
+when PipelineConfig.keep_workspace is set) so the images can be inspected.
+"""
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import tempfile
+from typing import Optional
+
+
+def _safe_prefix(paper_id: str) -> str:
+    """Paper ID reduced to characters that are safe in a directory name."""
+    return re.sub(r"[^A-Za-z0-9._-]", "_", paper_id) or "paper"
+
+
+class PaperWorkspace:
+    """
+    Scoped temp directory for one paper.
+
+    Usage:
+        with PaperWorkspace(config.temp_dir, paper_id) as workspace:
+            extractor.extract_all(pdf_path, workspace.original_dir)
+            ...
+            if failed:
+                workspace.keep("2 figures failed")
+    """
+
+    def __init__(self, root: str, paper_id: str, keep: bool = False):
+        """
+        Args:
+            root: Parent directory (PipelineConfig.temp_dir)
+            paper_id: Paper ID, used as the directory name prefix
+            keep: Never delete the directory (for debugging)
+        """
+        self.root = root
+        self.paper_id = paper_id
+        self.path: Optional[str] = None
+        self._keep_reason: Optional[str] = "keep_workspace set" if keep else None
+
+    @property
+    def original_dir(self) -> str:
+        """Directory for extracted images."""
+        return self._subdir("original")
+
+    @property
+    def translated_dir(self) -> str:
+        """Directory for translated images."""
+        return self._subdir("translated")
+
+    def _subdir(self, name: str) -> str:
+        if self.path is None:
+            raise RuntimeError("PaperWorkspace used outside its with block")
+        path = os.path.join(self.path, name)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def keep(self, reason: str) -> None:
+        """Keep the directory after the with block, e.g. because a figure failed."""
+        if self._keep_reason is None:
+            self._keep_reason = reason
+
+    def __enter__(self) -> "PaperWorkspace":
+        os.makedirs(self.root, exist_ok=True)
+        self.path = tempfile.mkdtemp(prefix=f"{_safe_prefix(self.paper_id)}-", dir=self.root)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            self.keep(f"{exc_type.__name__}: {exc}")
+        if self._keep_reason is not None:
+            print(f"[workspace] Keeping {self.path} ({self._keep_reason})")
+        else:
+            shutil.rmtree(self.path, ignore_errors=True)
+        return False
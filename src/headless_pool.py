@@ -0,0 +1,188 @@
+"""
+Long-lived pool of headless browser contexts for fallback PDF fetches.
+
+Connecting to the remote browser dominates the cost of a headless fetch, so
+instead of connecting once per paper the pool keeps up to `size` browser
+contexts open and lends them to callers.
+
+Playwright's sync API is bound to the thread that started it, so every slot
+owns a thread that opens its browser and runs each job lent to it; callers
+block on a Future. Before each job a slot health-checks its browser and
+reconnects if it has dropped. After max_uses jobs (or any unexpected error)
+the browser and context are recycled, since remote sessions go stale and
+long-lived browsers leak memory.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Future
+from contextlib import suppress
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from .utils import log
+
+T = TypeVar("T")
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_USES = 20
+CONTEXT_TIMEOUT_MS = 90_000
+
+# Called on a slot's thread with a session id; returns (browser, shutdown)
+Launcher = Callable[[str], Tuple[Any, Callable[[], None]]]
+
+
+def cdp_launcher(endpoint_for: Callable[[str], str]) -> Launcher:
+    """
+    Launcher connecting to a remote browser over CDP.
+
+    endpoint_for maps a slot session id to the WSS endpoint, so each slot
+    (and each recycle) gets its own sticky proxy session.
+    """
+
+    def launch(session_id: str) -> Tuple[Any, Callable[[], None]]:
+        from playwright.sync_api import sync_playwright
+
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.connect_over_cdp(
+                endpoint_for(session_id), timeout=60_000
+            )
+        except Exception:
+            playwright.stop()
+            raise
+
+        def shutdown() -> None:
+            with suppress(Exception):
+                browser.close()
+            with suppress(Exception):
+                playwright.stop()
+
+        return browser, shutdown
+
+    return launch
+
+
+class _Slot:
+    """One browser context plus the thread that owns it."""
+
+    def __init__(self, pool: "HeadlessBrowserPool", index: int):
+        self.pool = pool
+        self.index = index
+        self.generation = 0
+        self.uses = 0
+        self.browser: Any = None
+        self.context: Any = None
+        self._shutdown: Optional[Callable[[], None]] = None
+        self.thread = threading.Thread(
+            target=self._run, name=f"headless-pool-{index}", daemon=True
+        )
+        self.thread.start()
+
+    def _healthy(self) -> bool:
+        try:
+            return bool(self.browser.is_connected())
+        except Exception:
+            return False
+
+    def _ensure_context(self) -> Any:
+        if self.context is not None and not self._healthy():
+            log(f"Headless pool: slot {self.index} browser disconnected, reconnecting")
+            self._discard()
+        if self.context is None:
+            self.generation += 1
+            session_id = f"pool{self.index}g{self.generation}"
+            self.browser, self._shutdown = self.pool.launcher(session_id)
+            self.context = self.browser.new_context(ignore_https_errors=True)
+            self.context.set_default_timeout(CONTEXT_TIMEOUT_MS)
+            self.uses = 0
+            self.pool._count("launches")
+        return self.context
+
+    def _discard(self) -> None:
+        if self.context is not None:
+            with suppress(Exception):
+                self.context.close()
+        if self._shutdown is not None:
+            with suppress(Exception):
+                self._shutdown()
+        self.browser = self.context = self._shutdown = None
+
+    def _run(self) -> None:
+        try:
+            while True:
+                item = self.pool._jobs.get()
+                if item is None:
+                    return
+                fn, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = fn(self._ensure_context())
+                except BaseException as exc:
+                    future.set_exception(exc)
+                    self._discard()  # the context may be unusable now
+                    continue
+                future.set_result(result)
+                self.uses += 1
+                if self.uses >= self.pool.max_uses:
+                    self._discard()
+        finally:
+            self._discard()
+
+
+class HeadlessBrowserPool:
+    """
+    Lend long-lived browser contexts to callers on any thread.
+
+    Args:
+        launcher: Opens a browser on the calling (slot) thread, see Launcher
+        size: Number of browser contexts (and slot threads)
+        max_uses: Jobs per context before it is recycled
+    """
+
+    def __init__(
+        self,
+        launcher: Launcher,
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        max_uses: int = DEFAULT_MAX_USES,
+    ):
+        self.launcher = launcher
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self.stats = {"launches": 0, "jobs": 0}
+        self._stats_lock = threading.Lock()
+        self._jobs: "queue.Queue[Optional[Tuple[Callable[[Any], Any], Future]]]" = (
+            queue.Queue()
+        )
+        self._closed = False
+        self._slots = [_Slot(self, i) for i in range(self.size)]
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def submit(self, fn: Callable[[Any], T]) -> "Future[T]":
+        """Run fn(context) on the next free browser context."""
+        if self._closed:
+            raise RuntimeError("headless browser pool is closed")
+        future: Future = Future()
+        self._count("jobs")
+        self._jobs.put((fn, future))
+        return future
+
+    def run(self, fn: Callable[[Any], T], timeout: Optional[float] = None) -> T:
+        """Blocking submit(): returns fn's result or raises its exception."""
+        return self.submit(fn).result(timeout=timeout)
+
+    def close(self) -> None:
+        """Stop all slots after queued jobs finish and close their browsers."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._slots:
+            self._jobs.put(None)
+        for slot in self._slots:
+            slot.thread.join()
@@ -45,6 +45,7 @@ import psycopg2
 from psycopg2.extras import RealDictCursor
 
 from .utils import log
+from .body_extract import PDF_TEXT_ENGINES, resolve_pdf_text_engine
 from .alerts import alert_critical, pipeline_complete, pipeline_started, stage_failure
 
 
@@ -770,7 +771,11 @@ def run_harvest(paper_id: str, dry_run: bool = False) -> bool:
         conn.close()
 
 
-def run_text_translation(paper_id: str, dry_run: bool = False) -> bool:
+def run_text_translation(
+    paper_id: str,
+    dry_run: bool = False,
+    pdf_engine: Optional[str] = None,
+) -> bool:
     """
     Run text translation for a paper.
 
@@ -783,7 +788,7 @@ def run_text_translation(paper_id: str, dry_run: bool = False) -> bool:
 
     try:
         # translate_paper returns paper_id on success (saves to DB + local file)
-        result = translate_paper(paper_id, dry_run=dry_run)
+        result = translate_paper(paper_id, dry_run=dry_run, pdf_engine=pdf_engine)
         if result:
             # Verify local backup was written (optional check)
             local_path = f"data/translated/{paper_id}.json"
@@ -806,6 +811,7 @@ def run_figure_translation(paper_id: str, dry_run: bool = False) -> bool:
         True if figure translation succeeded (or paper has no figures), False otherwise
     """
     from .figure_pipeline import FigurePipeline, PipelineConfig
+    from .figure_pipeline.prefilter import configured_method
 
     log(f"  Translating figures for {paper_id}...")
 
@@ -813,6 +819,7 @@ def run_figure_translation(paper_id: str, dry_run: bool = False) -> bool:
         gemini_api_key=os.environ.get("GEMINI_API_KEY"),
         moondream_api_key=os.environ.get("MOONDREAM_API_KEY"),
         dry_run=dry_run,
+        chinese_prefilter=configured_method(),
     )
 
     try:
@@ -958,7 +965,7 @@ def run_pdf_generation(paper_id: str, dry_run: bool = False) -> bool:
     # Get figure manifest from B2
     try:
         s3 = get_s3_client()
-        figure_manifest = get_figure_manifest(s3) if s3 else {}
+        figure_manifest = get_figure_manifest(s3, [paper_id]) if s3 else {}
     except Exception as e:
         log(f"    Warning: Could not fetch figure manifest: {e}")
         figure_manifest = {}
@@ -1094,7 +1101,8 @@ def process_paper(
     paper_id: str,
     stages: list[str],
     dry_run: bool = False,
-    notify: Optional[Callable] = None
+    notify: Optional[Callable] = None,
+    pdf_engine: Optional[str] = None,
 ) -> ProcessingResult:
     """
     Process a single paper through the pipeline stages.
@@ -1104,6 +1112,7 @@ def process_paper(
         stages: List of stages to run (harvest, text, figures, pdf, post)
         dry_run: If True, skip actual processing
         notify: Optional callback for alerts
+        pdf_engine: PDF text engine for the text stage, resolved at startup
 
     Returns:
         ProcessingResult with status and any errors
@@ -1139,7 +1148,9 @@ def process_paper(
                         continue
 
                     update_stage_status(conn, paper_id, 'text', 'processing')
-                    if run_text_translation(paper_id, dry_run=dry_run):
+                    if run_text_translation(
+                        paper_id, dry_run=dry_run, pdf_engine=pdf_engine
+                    ):
                         update_stage_status(conn, paper_id, 'text', 'complete')
                         result.stages_completed.append('text')
                     else:
@@ -1341,6 +1352,7 @@ def run_orchestrator(
     text_only: bool = False,
     figures_only: bool = False,
     include_failed: bool = False,
+    pdf_engine: Optional[str] = None,
 ) -> OrchestratorStats:
     """
     Main orchestrator entry point.
@@ -1354,12 +1366,18 @@ def run_orchestrator(
         text_only: Skip figure translation (runs text + English PDF)
         figures_only: Only run figure translation stage
         include_failed: Include all failed papers (not just old ones)
+        pdf_engine: PDF text engine for the text stage (pdfminer or pymupdf);
+            defaults to translation.synthesis.pdf_text_engine in config
 
     Returns:
         OrchestratorStats with results
     """
     stats = OrchestratorStats()
 
+    # Validate once up front so a bad engine fails the run, not every paper
+    pdf_engine = resolve_pdf_text_engine(pdf_engine)
+    log(f"Using PDF text engine: {pdf_engine}")
+
     # Handle discover scope - DISCOVERY ONLY, no translation
     if scope == 'discover':
         if not target or len(target) != 6:
@@ -1453,7 +1471,10 @@ def run_orchestrator(
     if workers == 1:
         # Sequential processing
         for paper_id in work_queue:
-            result = process_paper(paper_id, stages, dry_run=dry_run, notify=notify)
+            result = process_paper(
+                paper_id, stages, dry_run=dry_run, notify=notify,
+                pdf_engine=pdf_engine,
+            )
             if result.status == 'success':
                 stats.success += 1
             elif result.status == 'skipped':
@@ -1466,7 +1487,9 @@ def run_orchestrator(
         # Parallel processing
         with ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {
-                executor.submit(process_paper, pid, stages, dry_run, notify): pid
+                executor.submit(
+                    process_paper, pid, stages, dry_run, notify, pdf_engine
+                ): pid
                 for pid in work_queue
             }
 
@@ -1576,6 +1599,13 @@ def main():
         help='Include all failed papers (not just old ones). By default, only '
              'failed papers older than 7 days are auto-retried.'
     )
+    parser.add_argument(
+        '--pdf-engine',
+        choices=list(PDF_TEXT_ENGINES),
+        dest='pdf_engine',
+        help='PDF text extraction engine for the text stage '
+             '(default: translation.synthesis.pdf_text_engine in config)'
+    )
 
     args = parser.parse_args()
 
@@ -1593,6 +1623,7 @@ def main():
         text_only=args.text_only,
         figures_only=args.figures_only,
         include_failed=args.include_failed,
+        pdf_engine=args.pdf_engine,
     )
 
     # Exit with error code if any failures
@@ -0,0 +1,229 @@
+"""
+Selective, page-parallel OCR.
+
+Instead of running ocrmypdf over a whole document, only pages whose text
+layer is sparse (fewer than min_page_chars non-whitespace characters) are
+OCR'd. Each selected page is rendered with PyMuPDF and passed to tesseract
+on a thread pool (the work happens in the tesseract subprocess, so threads
+scale). Tesseract emits a one-page searchable PDF that replaces the original
+page, so downstream consumers of the output PDF see the OCR text layer just
+as they would with ocrmypdf.
+
+Tesseract output is cached by the sha256 of the rendered page image (plus
+languages), so re-processing a paper or a duplicate upload skips tesseract
+for pages it has already seen. The cache lives under the extraction cache
+directory (see extraction_cache) in an "ocr" subdirectory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from . import extraction_cache
+from .utils import log
+
+DEFAULT_MIN_PAGE_CHARS = 200
+DEFAULT_DPI = 300
+DEFAULT_LANGUAGES = "chi_sim+eng"
+MAX_OCR_WORKERS = 8
+TESSERACT_TIMEOUT = 300  # seconds per page
+
+
+@dataclass
+class PageOcrResult:
+    output_path: str
+    page_count: int
+    pages: List[int] = field(default_factory=list)  # 0-based pages OCR'd
+    cached_pages: int = 0
+    seconds: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return len(self.pages) / self.seconds if self.seconds else 0.0
+
+
+def page_char_counts(pdf_path: str) -> List[int]:
+    """Non-whitespace characters in each page's text layer."""
+    import fitz
+
+    with fitz.open(pdf_path) as doc:
+        return [
+            sum(1 for ch in page.get_text("text") if not ch.isspace()) for page in doc
+        ]
+
+
+def select_sparse_pages(char_counts: List[int], min_page_chars: int) -> List[int]:
+    """Pages whose text layer is too sparse to trust (0-based indices)."""
+    return [i for i, count in enumerate(char_counts) if count < min_page_chars]
+
+
+def _render_page(doc, index: int, dpi: int) -> bytes:
+    """Render a page to a grayscale PNG (tesseract binarizes anyway)."""
+    import fitz
+
+    pix = doc[index].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+    return pix.tobytes("png")
+
+
+def _cache_path(image_digest: str, languages: str) -> Optional[str]:
+    cache_dir = extraction_cache._cache_dir()
+    if not cache_dir:
+        return None
+    lang_key = languages.replace("+", "_")
+    return os.path.join(
+        cache_dir, "ocr", image_digest[:2], f"{image_digest}-{lang_key}.pdf"
+    )
+
+
+def _run_tesseract(png: bytes, languages: str, dpi: int) -> bytes:
+    """OCR one page image; returns a one-page PDF with a text layer."""
+    with tempfile.TemporaryDirectory(prefix="page_ocr_") as tmp:
+        image_path = os.path.join(tmp, "page.png")
+        out_base = os.path.join(tmp, "page")
+        with open(image_path, "wb") as f:
+            f.write(png)
+        cmd = [
+            "tesseract",
+            image_path,
+            out_base,
+            "-l",
+            languages,
+            "--dpi",
+            str(dpi),
+            "pdf",
+        ]
+        subprocess.run(
+            cmd,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=TESSERACT_TIMEOUT,
+            # Pages already run in parallel; OpenMP threads per process on top
+            # of that oversubscribe the cores and slow every page down.
+            env={**os.environ, "OMP_THREAD_LIMIT": "1"},
+        )
+        with open(f"{out_base}.pdf", "rb") as f:
+            return f.read()
+
+
+def ocr_page_image(png: bytes, languages: str, dpi: int) -> Tuple[bytes, bool]:
+    """
+    OCR a rendered page image, using the page-image cache.
+
+    Returns (one-page PDF bytes, whether it came from the cache).
+    """
+    digest = hashlib.sha256(png).hexdigest()
+    cache_path = _cache_path(digest, languages)
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                return f.read(), True
+        except OSError:
+            pass
+
+    pdf_bytes = _run_tesseract(png, languages, dpi)
+    if cache_path:
+        tmp = f"{cache_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(pdf_bytes)
+            os.replace(tmp, cache_path)
+        except OSError:
+            # A failed write only costs a re-OCR later
+            with suppress(OSError):
+                os.remove(tmp)
+    return pdf_bytes, False
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    if not workers:
+        workers = min(os.cpu_count() or 1, MAX_OCR_WORKERS)
+    return max(1, int(workers))
+
+
+def ocr_sparse_pages(
+    pdf_path: str,
+    output_path: str,
+    *,
+    min_page_chars: int = DEFAULT_MIN_PAGE_CHARS,
+    workers: Optional[int] = None,
+    languages: str = DEFAULT_LANGUAGES,
+    dpi: int = DEFAULT_DPI,
+) -> Optional[PageOcrResult]:
+    """
+    OCR the sparse pages of pdf_path into output_path.
+
+    Pages with a usable text layer are copied unchanged. Returns None (and
+    writes nothing) when no page needs OCR. Tesseract errors propagate.
+    """
+    import fitz
+
+    start = time.time()
+    pages = select_sparse_pages(page_char_counts(pdf_path), min_page_chars)
+    if not pages:
+        return None
+
+    workers = _resolve_workers(workers)
+    window = workers * 2  # bound rendered pages held in memory
+    cached = 0
+
+    def splice(doc, index: int, pdf_bytes: bytes) -> None:
+        # Replace page `index` in place: insert the OCR page before it and
+        # drop the original, so other page indices never shift.
+        with fitz.open("pdf", pdf_bytes) as ocr_doc:
+            doc.insert_pdf(ocr_doc, start_at=index)
+        doc.delete_page(index + 1)
+
+    # PyMuPDF documents are not thread-safe: render and splice on this
+    # thread, only tesseract runs on the pool.
+    with fitz.open(pdf_path) as doc, ThreadPoolExecutor(max_workers=workers) as pool:
+        page_count = doc.page_count
+        pending: Dict[Future, int] = {}
+
+        def drain() -> None:
+            nonlocal cached
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pdf_bytes, from_cache = future.result()
+                cached += from_cache
+                splice(doc, pending.pop(future), pdf_bytes)
+
+        for index in pages:
+            if len(pending) >= window:
+                drain()
+            png = _render_page(doc, index, dpi)
+            pending[pool.submit(ocr_page_image, png, languages, dpi)] = index
+        while pending:
+            drain()
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        tmp = f"{output_path}.tmp"
+        try:
+            doc.save(tmp, garbage=3, deflate=True)
+            os.replace(tmp, output_path)
+        finally:
+            with suppress(OSError):
+                os.remove(tmp)
+
+    result = PageOcrResult(
+        output_path=output_path,
+        page_count=page_count,
+        pages=pages,
+        cached_pages=cached,
+        seconds=time.time() - start,
+    )
+    log(
+        f"OCR'd {len(pages)}/{page_count} pages of {os.path.basename(pdf_path)} "
+        f"({cached} cached) in {result.seconds:.1f}s"
+    )
+    return result
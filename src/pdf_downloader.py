@@ -0,0 +1,398 @@
+"""
+Concurrent bulk PDF downloader.
+
+Downloads many PDFs at once with:
+  - bounded concurrency overall plus a per-host limit
+  - HTTP Range resume of interrupted downloads (<pdf>.part files), guarded
+    by If-Range with the ETag / Last-Modified stored next to the .part file
+    (no stored validator: the download restarts from byte 0)
+  - retries for connection errors, then a fallback queue that runs the
+    Unlocker / headless fetchers on their own workers, so slow fallbacks
+    never block direct downloads
+  - persisted progress, so an interrupted run continues where it stopped
+
+The single-file path (pdf_pipeline.download_pdf) is unchanged; this module
+is used by batch_download_and_extract and scripts/download_missing_pdfs.py.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from . import pdf_pipeline
+from .config import get_config
+from .file_service import read_json, write_json
+from .http_client import get_session
+from .utils import log
+
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
+DEFAULT_FALLBACK_WORKERS = 2
+DEFAULT_MAX_ATTEMPTS = 3
+PROGRESS_FILENAME = ".download_progress.json"
+
+# Direct-fetch outcomes
+OK = "ok"
+NOT_PDF = "not_pdf"  # HTML / error page served instead of the PDF
+HTTP_ERROR = "http_error"  # 4xx/5xx after the session's own retries
+NETWORK_ERROR = "network_error"  # connection dropped / timed out
+REJECTED = "rejected"  # too small or over the size cap
+
+# Outcomes that the Unlocker / headless fallbacks may fix
+_FALLBACK_STATUSES = frozenset({NOT_PDF, HTTP_ERROR, NETWORK_ERROR})
+
+
+@dataclass
+class DownloadJob:
+    paper_id: str
+    url: str
+    output_path: str
+    referer: Optional[str] = None
+
+
+class DownloadProgress:
+    """
+    Per-paper download state persisted as JSON.
+
+    Writes are atomic and batched (every flush_every updates, plus flush()).
+    """
+
+    def __init__(self, path: Optional[str], flush_every: int = 20):
+        self.path = path
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if path and os.path.exists(path):
+            try:
+                data = read_json(path)
+                if isinstance(data, dict):
+                    self.entries = data
+            except (OSError, ValueError) as e:
+                log(f"Download progress unreadable, starting fresh: {path}: {e}")
+
+    def status(self, paper_id: str) -> Optional[str]:
+        with self._lock:
+            return (self.entries.get(paper_id) or {}).get("status")
+
+    def mark(self, paper_id: str, status: str, **fields: Any) -> None:
+        with self._lock:
+            entry = self.entries.setdefault(paper_id, {})
+            entry.update(fields)
+            entry["status"] = status
+            entry["updated_at"] = datetime.now(timezone.utc).isoformat()
+            self._dirty += 1
+            if self._dirty >= self.flush_every:
+                self._write_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._write_locked()
+
+    def _write_locked(self) -> None:
+        if self.path:
+            write_json(self.path, self.entries)
+        self._dirty = 0
+
+
+def _download_settings() -> Dict[str, Any]:
+    try:
+        return get_config().get("pdf_download") or {}
+    except Exception:
+        return {}
+
+
+class BulkPdfDownloader:
+    """
+    Download many PDFs concurrently; see module docstring.
+
+    Args:
+        workers: Concurrent direct downloads
+        per_host: Concurrent direct downloads per host
+        fallback_workers: Concurrent Unlocker / headless fallbacks
+        max_attempts: Direct attempts per PDF (network errors resume via Range)
+        progress_path: JSON progress file (None: do not persist)
+        retry_failed: Re-attempt papers a previous run marked failed
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: Optional[int] = None,
+        per_host: Optional[int] = None,
+        fallback_workers: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        progress_path: Optional[str] = None,
+        retry_failed: bool = False,
+    ):
+        cfg = _download_settings()
+        self.workers = max(1, int(workers or cfg.get("workers") or DEFAULT_WORKERS))
+        self.per_host = max(1, int(per_host or cfg.get("per_host") or DEFAULT_PER_HOST))
+        self.fallback_workers = max(
+            1,
+            int(
+                fallback_workers
+                or cfg.get("fallback_workers")
+                or DEFAULT_FALLBACK_WORKERS
+            ),
+        )
+        self.max_attempts = max(
+            1, int(max_attempts or cfg.get("max_attempts") or DEFAULT_MAX_ATTEMPTS)
+        )
+        self.retry_failed = retry_failed
+        self.progress = DownloadProgress(progress_path)
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            slot = self._host_limits.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host)
+                self._host_limits[host] = slot
+            return slot
+
+    def run(self, jobs: Iterable[DownloadJob]) -> Dict[str, str]:
+        """
+        Download all jobs; returns paper_id -> final status.
+
+        Final statuses: "exists" (already on disk), "skipped" (failed in a
+        previous run), "downloaded", "fallback" (fetched by a fallback) or
+        "failed".
+        """
+        results: Dict[str, str] = {}
+        pending: List[DownloadJob] = []
+        for job in jobs:
+            if os.path.exists(job.output_path):
+                results[job.paper_id] = "exists"
+            elif (
+                not self.retry_failed and self.progress.status(job.paper_id) == "failed"
+            ):
+                results[job.paper_id] = "skipped"
+            else:
+                pending.append(job)
+
+        log(
+            f"Bulk download: {len(pending)} to fetch "
+            f"({self.workers} workers, {self.per_host} per host)"
+        )
+        start = time.time()
+        fallbacks: Dict[Future, DownloadJob] = {}
+        try:
+            with (
+                ThreadPoolExecutor(max_workers=self.fallback_workers) as fallback_pool,
+                ThreadPoolExecutor(max_workers=self.workers) as pool,
+            ):
+                direct = {
+                    pool.submit(self._download_direct, job): job for job in pending
+                }
+                # Hand each failure to the fallback queue as soon as it happens
+                for future in as_completed(direct):
+                    job = direct[future]
+                    try:
+                        status = future.result()
+                    except Exception as e:
+                        self._mark_crashed(job, e, results)
+                        continue
+                    if status == OK:
+                        results[job.paper_id] = "downloaded"
+                    elif status in _FALLBACK_STATUSES:
+                        fallback = fallback_pool.submit(self._download_fallback, job)
+                        fallbacks[fallback] = job
+                    else:
+                        results[job.paper_id] = "failed"
+                        self.progress.mark(job.paper_id, "failed", reason=status)
+
+                for future in as_completed(fallbacks):
+                    job = fallbacks[future]
+                    try:
+                        ok = future.result()
+                    except Exception as e:
+                        self._mark_crashed(job, e, results)
+                        continue
+                    results[job.paper_id] = "fallback" if ok else "failed"
+        finally:
+            self.progress.flush()
+
+        counts: Dict[str, int] = {}
+        for status in results.values():
+            counts[status] = counts.get(status, 0) + 1
+        log(f"Bulk download finished in {time.time() - start:.1f}s: {counts}")
+        return results
+
+    def _mark_crashed(
+        self, job: DownloadJob, error: Exception, results: Dict[str, str]
+    ) -> None:
+        """An unexpected error fails this paper only, not the whole run."""
+        log(f"Download crashed for {job.paper_id}: {type(error).__name__}: {error}")
+        results[job.paper_id] = "failed"
+        self.progress.mark(job.paper_id, "failed", reason="error", error=str(error))
+
+    def _download_direct(self, job: DownloadJob) -> str:
+        status = NETWORK_ERROR
+        for attempt in range(1, self.max_attempts + 1):
+            with self._host_slot(job.url):
+                status, digest = fetch_pdf_resumable(job)
+            if status == OK:
+                self.progress.mark(
+                    job.paper_id,
+                    "done",
+                    sha256=digest,
+                    bytes=os.path.getsize(job.output_path),
+                    attempts=attempt,
+                    via="direct",
+                )
+                return OK
+            if status != NETWORK_ERROR:
+                return status
+            # Back off outside the host slot; the .part file is kept for Range
+            time.sleep(min(2 ** (attempt - 1), 10))
+        return status
+
+    def _download_fallback(self, job: DownloadJob) -> bool:
+        kwargs = {"referer": job.referer, "session_id": job.paper_id}
+        ok = pdf_pipeline._unlocker_raw_fetch(
+            job.url, job.output_path, **kwargs
+        ) or pdf_pipeline._headless_pdf_fetch(job.url, job.output_path, **kwargs)
+        if ok:
+            self.progress.mark(job.paper_id, "done", via="fallback")
+        else:
+            self.progress.mark(job.paper_id, "failed", reason="fallback")
+        return bool(ok)
+
+
+def validator_path(output_path: str) -> str:
+    """Where the ETag / Last-Modified of a .part file's response is kept."""
+    return f"{pdf_pipeline.part_path(output_path)}.validator"
+
+
+def _read_validator(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _response_validator(resp: requests.Response) -> Optional[str]:
+    """A validator usable in If-Range: a strong ETag, else Last-Modified."""
+    etag = resp.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return resp.headers.get("Last-Modified")
+
+
+def _discard_partial(output_path: str) -> None:
+    for path in (pdf_pipeline.part_path(output_path), validator_path(output_path)):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def fetch_pdf_resumable(job: DownloadJob) -> Tuple[str, Optional[str]]:
+    """
+    Fetch one PDF directly, resuming an existing .part file with HTTP Range.
+
+    A resume sends If-Range with the validator saved when the .part file was
+    started, so a file that changed upstream comes back whole (200) and the
+    download restarts from byte 0 instead of splicing two versions.
+
+    Returns (status, sha256 digest or None). A dropped connection keeps the
+    .part file (and its validator) for the next attempt.
+    """
+    session = get_session()
+    kwargs = pdf_pipeline._request_kwargs()
+    if job.referer:
+        pdf_pipeline._warm_referer(session, job.referer, kwargs)
+    headers = {"Referer": job.referer} if job.referer else {}
+    part = pdf_pipeline.part_path(job.output_path)
+    validator_file = validator_path(job.output_path)
+    offset = os.path.getsize(part) if os.path.exists(part) else 0
+    validator = _read_validator(validator_file) if offset else None
+    if offset and validator:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+    elif offset:
+        # Nothing to prove the partial still matches the remote file
+        offset = 0
+    max_bytes = pdf_pipeline._max_pdf_bytes()
+
+    try:
+        resp = session.get(job.url, headers=headers, **kwargs)
+    except requests.RequestException as e:
+        log(f"Download error for {job.paper_id}: {e}")
+        return NETWORK_ERROR, None
+
+    try:
+        if resp.status_code == 416 and offset:
+            # Stale partial (file changed upstream); start over next attempt
+            _discard_partial(job.output_path)
+            return NETWORK_ERROR, None
+        try:
+            resp.raise_for_status()
+        except requests.HTTPError as e:
+            log(f"HTTP error for {job.paper_id}: {e}")
+            return HTTP_ERROR, None
+
+        resuming = bool(offset) and resp.status_code == 206
+        if not resuming:
+            # Fresh body (no partial, validator mismatch or Range ignored)
+            offset = 0
+            _discard_partial(job.output_path)
+
+        declared = pdf_pipeline._declared_length(resp)
+        if declared is not None and offset + declared > max_bytes:
+            log(f"PDF too large for {job.paper_id}: {offset + declared:,} bytes")
+            return REJECTED, None
+
+        chunks = resp.iter_content(chunk_size=pdf_pipeline.DOWNLOAD_CHUNK_BYTES)
+        if not resuming:
+            # The magic check needs the start of the file: only on fresh bodies
+            head = b""
+            for chunk in chunks:
+                head += chunk
+                if len(head) >= pdf_pipeline.PDF_MAGIC_WINDOW:
+                    break
+            if pdf_pipeline.PDF_MAGIC not in head[: pdf_pipeline.PDF_MAGIC_WINDOW]:
+                log(f"Non-PDF response for {job.paper_id} ({job.url})")
+                return NOT_PDF, None
+            chunks = itertools.chain([head], chunks)
+            new_validator = _response_validator(resp)
+            if new_validator:
+                os.makedirs(os.path.dirname(validator_file) or ".", exist_ok=True)
+                with open(validator_file, "w", encoding="utf-8") as f:
+                    f.write(new_validator)
+
+        try:
+            digest = pdf_pipeline._write_pdf_atomic(
+                job.output_path, chunks, max_bytes, resume=True
+            )
+        except requests.RequestException as e:
+            log(f"Download interrupted for {job.paper_id}, will resume: {e}")
+            return NETWORK_ERROR, None
+        if os.path.exists(validator_file):
+            os.remove(validator_file)
+        return (OK, digest) if digest else (REJECTED, None)
+    finally:
+        resp.close()
+
+
+def download_all(
+    jobs: Iterable[DownloadJob],
+    pdf_dir: str,
+    **options: Any,
+) -> Dict[str, str]:
+    """Run a BulkPdfDownloader with progress persisted under pdf_dir."""
+    options.setdefault("progress_path", os.path.join(pdf_dir, PROGRESS_FILENAME))
+    return BulkPdfDownloader(**options).run(jobs)
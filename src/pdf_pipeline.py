@@ -8,17 +8,21 @@ Downloads PDFs from provided URLs and extracts text using pdfminer.
 from __future__ import annotations
 
 import argparse
+import atexit
+import hashlib
+import itertools
 import json
 import os
 import shutil
 import subprocess
-import time
+import threading
 from collections import Counter
 from contextlib import suppress
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
+from . import extraction_cache, headless_pool, page_ocr
 from .http_client import get_session
 from .config import get_proxies, get_config
 from .body_extract import extract_from_pdf
@@ -30,6 +34,128 @@ except ImportError:  # pragma: no cover
     fcntl = None  # type: ignore
 
 
+PDF_MAGIC = b"%PDF-"
+# Readers accept the header anywhere in the first 1 KB (leading junk)
+PDF_MAGIC_WINDOW = 1024
+MIN_PDF_BYTES = 1024
+DEFAULT_MAX_PDF_BYTES = 100 * 1024 * 1024
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+
+def _max_pdf_bytes() -> int:
+    """Download size cap (pdf_download.max_bytes in config)."""
+    try:
+        cfg = get_config().get("pdf_download") or {}
+        return int(cfg.get("max_bytes") or DEFAULT_MAX_PDF_BYTES)
+    except Exception:
+        return DEFAULT_MAX_PDF_BYTES
+
+
+def _declared_length(resp: requests.Response) -> Optional[int]:
+    try:
+        return int(resp.headers.get("content-length", ""))
+    except ValueError:
+        return None
+
+
+def _write_pdf_atomic(
+    output_path: str,
+    chunks: Iterable[bytes],
+    max_bytes: int,
+    *,
+    resume: bool = False,
+) -> Optional[str]:
+    """
+    Stream chunks to output_path via a .part file, hashing as they arrive.
+
+    The file only appears at output_path once complete and at least
+    MIN_PDF_BYTES long. Returns the sha256 hex digest, or None if the body
+    was too small or exceeded max_bytes (nothing is left on disk).
+
+    With resume=True the chunks continue an existing .part file (HTTP Range
+    response), and a connection error mid-stream keeps the .part file so
+    the next attempt can resume; the error is re-raised.
+    """
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    tmp: Optional[str] = part_path(output_path)
+    hasher = hashlib.sha256()
+    size = 0
+    mode = "wb"
+    if resume and os.path.exists(tmp):
+        with open(tmp, "rb") as f:
+            for block in iter(lambda: f.read(DOWNLOAD_CHUNK_BYTES), b""):
+                hasher.update(block)
+                size += len(block)
+        mode = "ab"
+    try:
+        with open(tmp, mode) as f:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > max_bytes:
+                    log(f"PDF exceeds {max_bytes:,} bytes, aborting: {output_path}")
+                    return None
+                hasher.update(chunk)
+                f.write(chunk)
+        if size < MIN_PDF_BYTES:
+            log(f"Downloaded PDF too small ({size} bytes): {output_path}")
+            return None
+        os.replace(tmp, output_path)
+        tmp = None
+    except requests.RequestException:
+        if resume:
+            tmp = None  # keep the partial body for a Range request
+        raise
+    finally:
+        if tmp:
+            with suppress(OSError):
+                os.remove(tmp)
+
+    digest = hasher.hexdigest()
+    # Later extraction-cache lookups for this file skip re-hashing it
+    extraction_cache.remember_digest(output_path, digest)
+    return digest
+
+
+def part_path(output_path: str) -> str:
+    """Where an in-progress download of output_path is written."""
+    return f"{output_path}.part"
+
+
+def _request_kwargs() -> Dict[str, Any]:
+    """requests kwargs for PDF fetches, honoring the configured proxies."""
+    proxies, source = get_proxies()
+    kwargs: Dict[str, Any] = {
+        "timeout": 60,
+        "stream": True,
+        "allow_redirects": True,
+    }
+    if source == "config" and proxies:
+        kwargs["proxies"] = proxies
+        kwargs["verify"] = False  # proxy MITM can break cert chain
+    elif source == "env" and proxies:
+        kwargs["proxies"] = proxies
+        kwargs["verify"] = False  # Bright Data proxy uses MITM cert
+    return kwargs
+
+
+def _warm_referer(session: requests.Session, referer: str, kwargs: Dict[str, Any]) -> None:
+    """Warm up cookies by hitting the referer (abstract page) first."""
+    try:
+        ref_resp = session.get(
+            referer,
+            timeout=30,
+            allow_redirects=True,
+            verify=kwargs.get("verify", True),
+            proxies=kwargs.get("proxies"),
+        )
+        ref_resp.raise_for_status()
+        log(f"Referer warmup ok for {referer} (status={ref_resp.status_code})")
+    except Exception as ref_err:
+        log(f"Referer warmup failed for {referer}: {ref_err}")
+
+
 @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3))
 def download_pdf(
     url: str,
@@ -41,6 +167,11 @@ def download_pdf(
     """
     Download a PDF from a URL with validation.
 
+    The body is streamed: the %PDF magic is checked on the first bytes
+    (non-PDF responses go to the Unlocker / headless fallbacks), bodies over
+    pdf_download.max_bytes are aborted, and the file is hashed while written
+    to a .part file that is renamed into place only when complete.
+
     Args:
         url: PDF URL
         output_path: Local path to save PDF
@@ -50,33 +181,11 @@ def download_pdf(
     """
     try:
         session = get_session()
-        proxies, source = get_proxies()
-        kwargs = {
-            "timeout": 60,
-            "stream": True,
-            "allow_redirects": True,
-        }
-        if source == "config" and proxies:
-            kwargs["proxies"] = proxies
-            kwargs["verify"] = False  # proxy MITM can break cert chain
-        elif source == "env" and proxies:
-            kwargs["proxies"] = proxies
-            kwargs["verify"] = False  # Bright Data proxy uses MITM cert
+        kwargs = _request_kwargs()
 
         # Warm up cookies by hitting referer first if provided
         if referer:
-            try:
-                ref_resp = session.get(
-                    referer,
-                    timeout=30,
-                    allow_redirects=True,
-                    verify=kwargs.get("verify", True),
-                    proxies=kwargs.get("proxies"),
-                )
-                ref_resp.raise_for_status()
-                log(f"Referer warmup ok for {referer} (status={ref_resp.status_code})")
-            except Exception as ref_err:
-                log(f"Referer warmup failed for {referer}: {ref_err}")
+            _warm_referer(session, referer, kwargs)
 
         # Add referer header if provided (helps some endpoints)
         if referer:
@@ -97,16 +206,28 @@ def download_pdf(
             )
             raise http_err
 
-        # Validate PDF content
-        content_type = resp.headers.get("content-type", "").lower()
-        if "pdf" not in content_type and not resp.content.startswith(b"%PDF-"):
-            preview = ""
-            with suppress(Exception):
-                preview = (resp.text or "")[:200]
+        # Reject oversize bodies before reading them when the size is declared
+        max_bytes = _max_pdf_bytes()
+        declared = _declared_length(resp)
+        if declared is not None and declared > max_bytes:
+            log(f"PDF too large for {url}: {declared:,} bytes > {max_bytes:,}")
+            resp.close()
+            return False
+
+        # Validate PDF magic on the first bytes, before downloading the rest
+        chunks = resp.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES)
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= PDF_MAGIC_WINDOW:
+                break
+        if PDF_MAGIC not in head[:PDF_MAGIC_WINDOW]:
+            content_type = resp.headers.get("content-type", "").lower()
+            preview = head[:200].decode("utf-8", errors="replace")
+            resp.close()
             log(
                 f"Invalid PDF content for {url}: status={resp.status_code}, "
-                f"content_type={content_type}, length={len(resp.content)}, "
-                f"preview={preview!r}"
+                f"content_type={content_type}, preview={preview!r}"
             )
             log("Falling back to Unlocker proxy, then headless browser if needed")
             if _unlocker_raw_fetch(
@@ -115,26 +236,15 @@ def download_pdf(
                 return True
             return bool(_headless_pdf_fetch(url, output_path, referer=referer, session_id=session_id))
 
-        # Check file size (minimum 1KB)
-        content_length = len(resp.content)
-        if content_length < 1024:
-            log(f"PDF too small for {url}: {content_length} bytes")
-            return False
-
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-        with open(output_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                if not chunk:
-                    continue
-                f.write(chunk)
-
-        # Verify downloaded file
-        if os.path.getsize(output_path) < 1024:
-            log(f"Downloaded PDF too small: {output_path}")
-            os.remove(output_path)
+        try:
+            digest = _write_pdf_atomic(
+                output_path, itertools.chain([head], chunks), max_bytes
+            )
+        finally:
+            resp.close()
+        if digest is None:
             return False
-
+        log(f"Downloaded {url} -> {output_path} (sha256={digest[:12]})")
         return True
     except Exception as e:
         log(f"Failed to download {url}: {e}")
@@ -173,6 +283,166 @@ def _inject_session_into_wss(wss_url: str, session_id: str) -> str:
     return re.sub(pattern, replacement, wss_url)
 
 
+_HEADLESS_POOL: Optional[headless_pool.HeadlessBrowserPool] = None
+_HEADLESS_POOL_LOCK = threading.Lock()
+
+
+def _get_headless_pool(endpoint: str) -> Optional[headless_pool.HeadlessBrowserPool]:
+    """
+    Shared headless browser pool, created on first use.
+
+    Returns None when pooling is disabled (pdf_download.headless_pool_size: 0).
+    """
+    global _HEADLESS_POOL
+    settings = get_config().get("pdf_download") or {}
+    size = int(settings.get("headless_pool_size", headless_pool.DEFAULT_POOL_SIZE) or 0)
+    if size <= 0:
+        return None
+    with _HEADLESS_POOL_LOCK:
+        if _HEADLESS_POOL is None:
+            _HEADLESS_POOL = headless_pool.HeadlessBrowserPool(
+                headless_pool.cdp_launcher(
+                    lambda session: _inject_session_into_wss(endpoint, session)
+                ),
+                size=size,
+                max_uses=int(
+                    settings.get("headless_max_uses")
+                    or headless_pool.DEFAULT_MAX_USES
+                ),
+            )
+            atexit.register(_HEADLESS_POOL.close)
+        return _HEADLESS_POOL
+
+
+def _fetch_pdf_in_context(context, url: str, referer: str | None) -> Optional[Dict]:
+    """
+    Fetch a PDF inside a browser context; returns the JS fetch() result dict.
+
+    Strategy for ChinaXiv (IP-bound UUIDs):
+    1. Navigate to abstract page (referer) to get fresh UUID
+    2. Extract PDF link from page (fresh UUID)
+    3. Use JavaScript fetch() to download PDF (maintains same IP context)
+    4. Transfer via base64 (see _save_headless_pdf)
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    page = context.new_page()
+    try:
+        page.set_default_timeout(90_000)
+
+        # STEP 1: Navigate to abstract page to get fresh UUID
+        # ChinaXiv UUIDs are IP-bound. The UUID passed in `url` was generated by
+        # a different IP (the harvester). We must visit the abstract page from
+        # THIS browser's IP to get a UUID that will work for the PDF download.
+        pdf_url = url
+        if referer:
+            try:
+                log(f"Headless: navigating to abstract page {referer}")
+                page.goto(referer, wait_until="domcontentloaded", timeout=90_000)
+                page.wait_for_timeout(1000)
+
+                # Extract fresh PDF link - this contains a UUID bound to our current IP
+                pdf_link = page.query_selector('a[href*="filetype=pdf"]')
+                if pdf_link:
+                    href = pdf_link.get_attribute("href")
+                    if href:
+                        if href.startswith("/"):
+                            pdf_url = f"https://chinaxiv.org{href}"
+                        else:
+                            pdf_url = href
+                        log(f"Headless: extracted fresh PDF URL: {pdf_url}")
+            except PlaywrightTimeoutError:
+                log(f"Headless: abstract page timed out for {referer}")
+            except Exception as warm_err:
+                log(f"Headless: abstract page failed for {referer}: {warm_err}")
+
+        # STEP 2: Download PDF using JavaScript fetch() API
+        # Why JS fetch() instead of page.goto()? BrightData Browser has navigation
+        # limits that cause "Page.navigate limit reached" errors on the second nav.
+        # Using fetch() within the browser context:
+        # - Bypasses navigation limits (fetch is not a navigation)
+        # - Maintains same IP/session context (critical for IP-bound UUIDs)
+        # - Returns binary data we can transfer back via base64
+        log(f"Headless: fetching PDF via JS fetch(): {pdf_url}")
+        js_fetch_code = """
+            async (url) => {
+                try {
+                    const response = await fetch(url, {
+                        method: "GET",
+                        credentials: "include"
+                    });
+                    if (!response.ok) {
+                        return {error: "HTTP " + response.status, status: response.status};
+                    }
+                    const buffer = await response.arrayBuffer();
+                    const bytes = new Uint8Array(buffer);
+                    let binary = "";
+                    for (let i = 0; i < bytes.length; i++) {
+                        binary += String.fromCharCode(bytes[i]);
+                    }
+                    const base64 = btoa(binary);
+                    return {
+                        success: true,
+                        status: response.status,
+                        contentType: response.headers.get("content-type"),
+                        size: bytes.length,
+                        base64: base64
+                    };
+                } catch (e) {
+                    return {error: e.toString()};
+                }
+            }
+        """
+        result = page.evaluate(js_fetch_code, pdf_url)
+        if isinstance(result, dict):
+            result["url"] = pdf_url
+        return result
+    finally:
+        with suppress(Exception):
+            page.close()
+
+
+def _save_headless_pdf(result: Optional[Dict], url: str, output_path: str) -> bool:
+    """Validate a JS fetch() result and write the PDF atomically."""
+    import base64
+
+    pdf_url = (result or {}).get("url", url)
+    if not result:
+        log(f"Headless: JS fetch returned null for {pdf_url}")
+        return False
+
+    if result.get("error"):
+        log(f"Headless: JS fetch error for {pdf_url}: {result['error']}")
+        return False
+
+    if not result.get("success") or not result.get("base64"):
+        log(f"Headless: JS fetch failed for {pdf_url}: {result}")
+        return False
+
+    # STEP 3: Transfer PDF from browser to Python via base64
+    # Playwright's evaluate() can only return JSON-serializable data, so we
+    # encoded the binary PDF as base64 in JavaScript. Decode it here.
+    pdf_bytes = base64.b64decode(result["base64"])
+    size = len(pdf_bytes)
+    log(f"Headless: received {size:,} bytes from JS fetch")
+
+    if size < 1024:
+        log(f"Headless: PDF too small ({size} bytes) for {pdf_url}")
+        return False
+
+    if not pdf_bytes.startswith(b"%PDF-"):
+        preview = pdf_bytes[:200].decode("utf-8", errors="replace")
+        log(f"Headless: response not PDF for {pdf_url}, preview: {preview[:100]}")
+        return False
+
+    # Save PDF
+    if not _write_pdf_atomic(output_path, [pdf_bytes], _max_pdf_bytes()):
+        return False
+
+    log(f"Headless fallback succeeded for {url} ({size:,} bytes)")
+    return True
+
+
 def _headless_pdf_fetch(
     url: str,
     output_path: str,
@@ -183,24 +453,15 @@ def _headless_pdf_fetch(
     """
     Fetch a PDF via Bright Data's remote browser endpoint using Playwright.
 
-    Strategy for ChinaXiv (IP-bound UUIDs):
-    1. Connect with session ID to maintain same IP throughout
-    2. Navigate to abstract page (referer) to get fresh UUID
-    3. Extract PDF link from page (fresh UUID)
-    4. Use JavaScript fetch() to download PDF (maintains same IP context)
-    5. Transfer via base64 and save
+    Borrows a context from the shared headless browser pool (see
+    headless_pool); each pool slot keeps its own sticky session, so the
+    abstract page and PDF are still fetched from the same IP. With pooling
+    disabled, connects a fresh browser using session_id for this paper.
     """
-    import base64
-
     endpoint = os.getenv("BRIGHTDATA_BROWSER_WSS")
     if not endpoint:
         return False
 
-    # Inject session ID into WSS URL for IP stickiness
-    if session_id:
-        endpoint = _inject_session_into_wss(endpoint, session_id)
-        log(f"Headless: using session {session_id} for IP stickiness")
-
     try:
         from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         from playwright.sync_api import sync_playwright
@@ -208,7 +469,21 @@ def _headless_pdf_fetch(
         log(f"Playwright not available for headless fallback: {exc}")
         return False
 
-    page = None
+    pool = _get_headless_pool(endpoint)
+    if pool is not None:
+        try:
+            log(f"Headless fallback: borrowing pooled browser context for {url}")
+            result = pool.run(lambda context: _fetch_pdf_in_context(context, url, referer))
+        except Exception as exc:
+            log(f"Headless pooled fetch failed for {url}: {exc}")
+            return False
+        return _save_headless_pdf(result, url, output_path)
+
+    # Inject session ID into WSS URL for IP stickiness
+    if session_id:
+        endpoint = _inject_session_into_wss(endpoint, session_id)
+        log(f"Headless: using session {session_id} for IP stickiness")
+
     browser = None
     try:
         log(f"Headless fallback: connecting to Bright Data browser for {url}")
@@ -216,110 +491,8 @@ def _headless_pdf_fetch(
             browser = p.chromium.connect_over_cdp(endpoint, timeout=60_000)
             context = browser.new_context(ignore_https_errors=True)
             context.set_default_timeout(90_000)
-
-            page = context.new_page()
-            page.set_default_timeout(90_000)
-
-            # STEP 1: Navigate to abstract page to get fresh UUID
-            # ChinaXiv UUIDs are IP-bound. The UUID passed in `url` was generated by
-            # a different IP (the harvester). We must visit the abstract page from
-            # THIS browser's IP to get a UUID that will work for the PDF download.
-            pdf_url = url
-            if referer:
-                try:
-                    log(f"Headless: navigating to abstract page {referer}")
-                    page.goto(referer, wait_until="domcontentloaded", timeout=90_000)
-                    page.wait_for_timeout(1000)
-
-                    # Extract fresh PDF link - this contains a UUID bound to our current IP
-                    pdf_link = page.query_selector('a[href*="filetype=pdf"]')
-                    if pdf_link:
-                        href = pdf_link.get_attribute("href")
-                        if href:
-                            if href.startswith("/"):
-                                pdf_url = f"https://chinaxiv.org{href}"
-                            else:
-                                pdf_url = href
-                            log(f"Headless: extracted fresh PDF URL: {pdf_url}")
-                except PlaywrightTimeoutError:
-                    log(f"Headless: abstract page timed out for {referer}")
-                except Exception as warm_err:
-                    log(f"Headless: abstract page failed for {referer}: {warm_err}")
-
-            # STEP 2: Download PDF using JavaScript fetch() API
-            # Why JS fetch() instead of page.goto()? BrightData Browser has navigation
-            # limits that cause "Page.navigate limit reached" errors on the second nav.
-            # Using fetch() within the browser context:
-            # - Bypasses navigation limits (fetch is not a navigation)
-            # - Maintains same IP/session context (critical for IP-bound UUIDs)
-            # - Returns binary data we can transfer back via base64
-            log(f"Headless: fetching PDF via JS fetch(): {pdf_url}")
-            js_fetch_code = """
-                async (url) => {
-                    try {
-                        const response = await fetch(url, {
-                            method: "GET",
-                            credentials: "include"
-                        });
-                        if (!response.ok) {
-                            return {error: "HTTP " + response.status, status: response.status};
-                        }
-                        const buffer = await response.arrayBuffer();
-                        const bytes = new Uint8Array(buffer);
-                        let binary = "";
-                        for (let i = 0; i < bytes.length; i++) {
-                            binary += String.fromCharCode(bytes[i]);
-                        }
-                        const base64 = btoa(binary);
-                        return {
-                            success: true,
-                            status: response.status,
-                            contentType: response.headers.get("content-type"),
-                            size: bytes.length,
-                            base64: base64
-                        };
-                    } catch (e) {
-                        return {error: e.toString()};
-                    }
-                }
-            """
-            result = page.evaluate(js_fetch_code, pdf_url)
-
-            if not result:
-                log(f"Headless: JS fetch returned null for {pdf_url}")
-                return False
-
-            if result.get("error"):
-                log(f"Headless: JS fetch error for {pdf_url}: {result['error']}")
-                return False
-
-            if not result.get("success") or not result.get("base64"):
-                log(f"Headless: JS fetch failed for {pdf_url}: {result}")
-                return False
-
-            # STEP 3: Transfer PDF from browser to Python via base64
-            # Playwright's evaluate() can only return JSON-serializable data, so we
-            # encoded the binary PDF as base64 in JavaScript. Decode it here.
-            pdf_bytes = base64.b64decode(result["base64"])
-            size = len(pdf_bytes)
-            log(f"Headless: received {size:,} bytes from JS fetch")
-
-            if size < 1024:
-                log(f"Headless: PDF too small ({size} bytes) for {pdf_url}")
-                return False
-
-            if not pdf_bytes.startswith(b"%PDF-"):
-                preview = pdf_bytes[:200].decode("utf-8", errors="replace")
-                log(f"Headless: response not PDF for {pdf_url}, preview: {preview[:100]}")
-                return False
-
-            # Save PDF
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, "wb") as f:
-                f.write(pdf_bytes)
-
-            log(f"Headless fallback succeeded for {url} ({size:,} bytes)")
-            return True
+            result = _fetch_pdf_in_context(context, url, referer)
+            return _save_headless_pdf(result, url, output_path)
 
     except PlaywrightTimeoutError as exc:
         log(f"Headless Playwright timeout for {url}: {exc}")
@@ -335,9 +508,6 @@ def _headless_pdf_fetch(
         log(f"Headless Playwright fallback failed for {url}: {exc}")
         return False
     finally:
-        if page:
-            with suppress(Exception):
-                page.close()
         if browser:
             with suppress(Exception):
                 browser.close()
@@ -419,13 +589,8 @@ def _unlocker_raw_fetch(
         )
         return False
 
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "wb") as f:
-        f.write(body)
-
-    if os.path.getsize(output_path) < 1024:
-        log(f"Downloaded PDF too small after Unlocker fallback: {output_path}")
-        os.remove(output_path)
+    if not _write_pdf_atomic(output_path, [body], _max_pdf_bytes()):
+        log(f"Unlocker fallback PDF rejected for {url}")
         return False
     log(f"Unlocker fallback succeeded for {url}")
     return True
@@ -436,6 +601,10 @@ def fix_pdf_url(pdf_url: str, paper_id: str) -> str:
     return pdf_url
 
 
+class _NoSparsePages(Exception):
+    """Selective OCR found no page below the text density threshold."""
+
+
 def _write_ocr_record(report_dir: str, paper_id: str, record: Dict[str, Any]) -> None:
     """Persist OCR detection/execution details with coarse file locking."""
     report_path = os.path.join(report_dir, "ocr_report.json")
@@ -544,6 +713,8 @@ def process_paper(
     min_multiplier = float(ocr_cfg.get("min_multiplier", 5.0))
     min_alpha_ratio = float(ocr_cfg.get("min_alpha_ratio", 0.0))
     max_most_common_ratio = float(ocr_cfg.get("max_most_common_ratio", 1.0))
+    # "selective": OCR only sparse pages in parallel; "full": ocrmypdf
+    ocr_mode = str(ocr_cfg.get("mode", "selective")).lower()
 
     # Extract text
     log(f"Extracting text from {paper_id}...")
@@ -573,27 +744,45 @@ def process_paper(
     }
 
     # Run OCR if needed and possible
-    if need_ocr and shutil.which("ocrmypdf") and shutil.which("tesseract"):
+    ocr_tools = ["tesseract"] if ocr_mode == "selective" else ["ocrmypdf", "tesseract"]
+    if need_ocr and all(shutil.which(tool) for tool in ocr_tools):
         original_paragraphs = paragraphs
         try:
             ocr_dir = os.path.join(pdf_dir, "ocr")
             os.makedirs(ocr_dir, exist_ok=True)
             ocr_out = os.path.join(ocr_dir, f"{paper_id}.pdf")
-            # Use chi_sim+eng to cover Chinese and English; skip pages with text
-            cmd = [
-                "ocrmypdf",
-                "--skip-text",
-                "--optimize",
-                "0",
-                "--language",
-                "chi_sim+eng",
-                pdf_path,
-                ocr_out,
-            ]
-            log(f"Running OCR for {paper_id}…")
-            subprocess.run(
-                cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
+            ocr_record["ocr_mode"] = ocr_mode
+            if ocr_mode == "selective":
+                log(f"Running selective OCR for {paper_id}…")
+                page_result = page_ocr.ocr_sparse_pages(
+                    pdf_path,
+                    ocr_out,
+                    min_page_chars=int(
+                        ocr_cfg.get("min_page_chars", page_ocr.DEFAULT_MIN_PAGE_CHARS)
+                    ),
+                    workers=ocr_cfg.get("workers"),
+                )
+                if page_result is None:
+                    raise _NoSparsePages
+                ocr_record["ocr_pages"] = len(page_result.pages)
+                ocr_record["ocr_cached_pages"] = page_result.cached_pages
+                ocr_record["ocr_seconds"] = round(page_result.seconds, 2)
+            else:
+                # Use chi_sim+eng to cover Chinese and English; skip pages with text
+                cmd = [
+                    "ocrmypdf",
+                    "--skip-text",
+                    "--optimize",
+                    "0",
+                    "--language",
+                    "chi_sim+eng",
+                    pdf_path,
+                    ocr_out,
+                ]
+                log(f"Running OCR for {paper_id}…")
+                subprocess.run(
+                    cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                )
             # Re-extract
             paragraphs = extract_from_pdf(ocr_out)
             post_metrics = _compute_text_metrics(paragraphs)
@@ -639,6 +828,13 @@ def process_paper(
                     f"OCR did not meet improvement thresholds for {paper_id} "
                     f"(char_gain_ok={char_gain_ok}, quality_ok={quality_ok})"
                 )
+        except _NoSparsePages:
+            log(
+                f"No pages below the text density threshold in {paper_id}; "
+                "skipping OCR"
+            )
+            ocr_record["ocr_pages"] = 0
+            paragraphs = original_paragraphs
         except Exception as e:
             log(f"OCR failed for {paper_id}: {e}")
             paragraphs = original_paragraphs
@@ -678,43 +874,53 @@ def batch_download_and_extract(
     records_file: str = "data/records/ia_all_20251004_215726.json",
     pdf_dir: str = "data/pdfs",
     output_file: Optional[str] = None,
+    workers: Optional[int] = None,
 ) -> Dict[str, Dict]:
     """
     Download and extract text from multiple papers.
 
+    PDFs are fetched concurrently first (see pdf_downloader), then text is
+    extracted per paper.
+
     Args:
         paper_ids: List of paper IDs to process
         records_file: Path to records JSON with pdf_url
         pdf_dir: Directory to store PDFs
         output_file: Optional path to save extraction results
+        workers: Concurrent downloads (default: pdf_download.workers)
 
     Returns:
         Dict mapping paper_id to extraction results
     """
+    from .pdf_downloader import DownloadJob, download_all
+
     # Load records
     records = read_json(records_file)
     id_to_rec = {r["id"]: r for r in records}
 
-    results = {}
-
+    jobs = []
     for paper_id in paper_ids:
         if paper_id not in id_to_rec:
             log(f"Paper {paper_id} not found in records")
             continue
 
-        rec = id_to_rec[paper_id]
-        pdf_url = rec.get("pdf_url")
-
+        pdf_url = id_to_rec[paper_id].get("pdf_url")
         if not pdf_url:
             log(f"No PDF URL for {paper_id}")
             continue
 
-        result = process_paper(paper_id, pdf_url, pdf_dir)
-        if result:
-            results[paper_id] = result
+        pdf_path = os.path.join(pdf_dir, f"{paper_id}.pdf")
+        jobs.append(DownloadJob(paper_id, fix_pdf_url(pdf_url, paper_id), pdf_path))
 
-        # Optional pacing for remote servers
-        time.sleep(0.2)
+    download_all(jobs, pdf_dir, workers=workers)
+
+    results = {}
+    for job in jobs:
+        if not os.path.exists(job.output_path):
+            continue
+        result = process_paper(job.paper_id, job.url, pdf_dir)
+        if result:
+            results[job.paper_id] = result
 
     # Save results
     if output_file:
@@ -734,6 +940,9 @@ def run_cli():
     parser.add_argument("--pdf-dir", default="data/pdfs", help="Directory for PDFs")
     parser.add_argument("--output", help="Output JSON file for extraction results")
     parser.add_argument("--test", action="store_true", help="Test on first 10 papers")
+    parser.add_argument(
+        "--workers", type=int, help="Concurrent downloads (default: from config)"
+    )
 
     args = parser.parse_args()
 
@@ -752,6 +961,7 @@ def run_cli():
         records_file=args.records,
         pdf_dir=args.pdf_dir,
         output_file=args.output,
+        workers=args.workers,
     )
 
     log(f"\nProcessed {len(results)}/{len(paper_ids)} papers successfully")
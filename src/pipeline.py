@@ -394,11 +394,13 @@ def run_cli() -> None:
     if args.with_figures and not args.dry_run and successes > 0:
         log("\nFigure translation step…")
         from .figure_pipeline import FigurePipeline, PipelineConfig
+        from .figure_pipeline.prefilter import configured_method
 
         figure_config = PipelineConfig(
             gemini_api_key=os.environ.get("GEMINI_API_KEY"),
             moondream_api_key=os.environ.get("MOONDREAM_API_KEY"),
             dry_run=False,
+            chinese_prefilter=configured_method(),
         )
         figure_pipeline = FigurePipeline(figure_config)
 
@@ -7,15 +7,21 @@ while preserving math and citations. Fails loudly if LLM formatting is unavailab
 
 from __future__ import annotations
 
+import hashlib
 import json
-from typing import Any, Dict, Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
 from ..config import get_config, get_proxies
-from ..http_client import openrouter_headers, parse_openrouter_error
+from ..file_service import read_json, write_json
+from ..http_client import get_session, openrouter_headers, parse_openrouter_error
 from ..monitoring import monitoring_service, alert_critical
 from ..tex_guard import mask_math, unmask_math, verify_token_parity
+from ..token_utils import chunk_paragraphs
 import contextlib
 
 # Removed heuristic formatting imports - LLM formatting only
@@ -47,6 +53,17 @@ FORMATTER_SYSTEM_PROMPT = (
     "- Prioritize readability over compactness - err on the side of more spacing.\n"
 )
 
+# Sentinel joining body paragraphs so the model can see paragraph boundaries
+PARA_SEPARATOR = "\n\n⟪PARA_BREAK⟫\n\n"
+
+# Bump when the request shape changes so stale cache entries are ignored
+FORMATTER_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = "data/cache/formatting"
+DEFAULT_MAX_WORKERS = 4
+# Body chunk size for concurrent formatting; typical papers stay one request
+DEFAULT_MAX_CHUNK_TOKENS = 8000
+
 
 class FormattingService:
     """Service to format translations into consistent Markdown using LLM only."""
@@ -61,6 +78,17 @@ class FormattingService:
             ),
         )
         self.temperature: float = float(fmt.get("temperature", 0.1))
+        # Content-hash result cache; set cache_dir to null/"" to disable
+        cache_dir = fmt.get("cache_dir", DEFAULT_CACHE_DIR)
+        self.cache_dir: Optional[str] = str(cache_dir) if cache_dir else None
+        self.max_workers: int = max(1, int(fmt.get("max_workers", DEFAULT_MAX_WORKERS)))
+        self.max_chunk_tokens: int = int(
+            fmt.get("max_chunk_tokens", DEFAULT_MAX_CHUNK_TOKENS)
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Chunks are formatted on worker threads
+        self._stats_lock = threading.Lock()
 
     def _parse_formatter_json(self, content: str) -> Dict[str, Any]:
         """
@@ -114,17 +142,89 @@ class FormattingService:
     # Removed _heuristic method - LLM formatting only
 
     def _llm_format(self, translation: Dict[str, Any]) -> Dict[str, Any]:
-        """LLM-based formatting with math preservation guard."""
+        """
+        LLM-based formatting with math preservation guard.
+
+        Long bodies are split into paragraph-aligned chunks that are formatted
+        concurrently and reassembled in their original order. The title and
+        abstract travel with the first chunk only.
+
+        Bodies over max_chunk_tokens (default 8000) are therefore formatted
+        without the rest of the paper in context, so their output can differ
+        from a single-request format (e.g. heading levels or list numbering
+        across a chunk boundary). Shorter bodies are one request, as before.
+        """
         title = (translation.get("title_en") or "").strip()
         abstract = (translation.get("abstract_en") or "").strip()
-        body_paras = translation.get("body_en") or []
+        body_paras = [
+            (p or "").strip()
+            for p in (translation.get("body_en") or [])
+            if p and p.strip()
+        ]
+
+        chunks = chunk_paragraphs(body_paras, max_tokens=self.max_chunk_tokens) or [[]]
+        units = [(title, abstract, PARA_SEPARATOR.join(chunks[0]))] + [
+            ("", "", PARA_SEPARATOR.join(chunk)) for chunk in chunks[1:]
+        ]
+
+        if len(units) == 1:
+            results = [self._format_unit(*units[0])]
+        else:
+            workers = min(self.max_workers, len(units))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map() yields in submission order regardless of completion order
+                results = list(executor.map(lambda u: self._format_unit(*u), units))
+
+        abstract_md = results[0][0]
+        body_md = "\n\n".join(body for _, body in results if body)
+
+        out = {**translation}
+        if abstract_md:
+            out["abstract_md"] = abstract_md
+        if body_md:
+            out["body_md"] = body_md
+        return out
 
-        # Join body with sentinel so the model can see paragraph boundaries
-        PARA = "\n\n⟪PARA_BREAK⟫\n\n"
-        body_joined = PARA.join(
-            (p or "").strip() for p in body_paras if p and p.strip()
+    def _cache_key(self, payload: Dict[str, Any]) -> str:
+        """Content hash of a formatter request (model, prompt and inputs)."""
+        blob = json.dumps(
+            {"version": FORMATTER_CACHE_VERSION, "payload": payload},
+            ensure_ascii=False,
+            sort_keys=True,
         )
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _cache_path(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
 
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._cache_path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            cached = read_json(path)
+        except (OSError, ValueError):
+            return None
+        return cached if isinstance(cached, dict) else None
+
+    def _cache_put(self, key: str, abstract_md: str, body_md: str) -> None:
+        path = self._cache_path(key)
+        if not path:
+            return
+        # Best-effort: a failed write only costs a future LLM call
+        with contextlib.suppress(Exception):
+            write_json(path, {"abstract_md": abstract_md, "body_md": body_md})
+
+    def _format_unit(
+        self, title: str, abstract: str, body_joined: str
+    ) -> Tuple[str, str]:
+        """
+        Format one (title, abstract, body) unit, consulting the result cache.
+
+        Returns the unmasked (abstract_md, body_md) pair.
+        """
         # Mask math across combined strings to protect content
         abstract_masked, abstract_map = mask_math(abstract)
         body_masked, body_map = mask_math(body_joined)
@@ -134,7 +234,7 @@ class FormattingService:
             "title": title,
             "abstract": abstract_masked,
             "body_joined": body_masked,
-            "paragraph_separator": PARA,
+            "paragraph_separator": PARA_SEPARATOR,
         }
 
         payload = {
@@ -153,6 +253,66 @@ class FormattingService:
             "temperature": self.temperature,
         }
 
+        key = self._cache_key(payload)
+        cached = self._cache_get(key)
+        if cached is not None:
+            with self._stats_lock:
+                self.cache_hits += 1
+            return cached.get("abstract_md") or "", cached.get("body_md") or ""
+        with self._stats_lock:
+            self.cache_misses += 1
+
+        content, answered_by = self._request_completion(payload)
+
+        # Parse JSON response safely
+        try:
+            content_str = content
+            if content_str.startswith("```") and content_str.endswith("```"):
+                # Strip triple backticks and optional json hint
+                inner = content_str.strip().strip("`")
+                if inner.startswith("json\n"):
+                    inner = inner[5:]
+                content_str = inner
+            parsed = self._parse_formatter_json(content_str)
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to parse formatter JSON: {e}; content head: {content[:120]}"
+            )
+
+        abstract_md_masked = (parsed.get("abstract_md") or "").strip()
+        body_md_masked = (parsed.get("body_md") or "").strip()
+
+        # Verify math token parity for each part separately
+        if not verify_token_parity(abstract_map, abstract_md_masked):
+            raise RuntimeError(
+                "Math placeholder parity check failed in abstract formatting output"
+            )
+        if not verify_token_parity(body_map, body_md_masked):
+            raise RuntimeError(
+                "Math placeholder parity check failed in body formatting output"
+            )
+
+        # Unmask with original maps
+        abstract_md = unmask_math(abstract_md_masked, abstract_map)
+        body_md = unmask_math(body_md_masked, body_map)
+
+        # The key names the requested model; another model's output must not
+        # be served as its result
+        if self._is_requested_model(answered_by):
+            self._cache_put(key, abstract_md, body_md)
+        return abstract_md, body_md
+
+    def _is_requested_model(self, model: Optional[str]) -> bool:
+        """True if model (as reported by OpenRouter) is self.model or a variant (":free")."""
+        return not model or model.split(":")[0] == self.model.split(":")[0]
+
+    def _request_completion(self, payload: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """
+        Send a formatter request to OpenRouter.
+
+        Returns the message content and the model OpenRouter reports as
+        having answered (None if the response does not say).
+        """
         proxies, source = get_proxies()
         try:
             kwargs = {
@@ -162,7 +322,8 @@ class FormattingService:
             }
             if source == "config" and proxies:
                 kwargs["proxies"] = proxies
-            resp = requests.post(
+            # Share the pooled OpenRouter session with the rest of the pipeline
+            resp = get_session().post(
                 "https://openrouter.ai/api/v1/chat/completions", **kwargs
             )
             if not resp.ok:
@@ -205,6 +366,7 @@ class FormattingService:
                 )
             data = resp.json()
             content = data["choices"][0]["message"]["content"].strip()
+            answered_by = data.get("model")
         except requests.exceptions.RequestException as e:
             with contextlib.suppress(Exception):
                 monitoring_service.record_error(
@@ -217,42 +379,4 @@ class FormattingService:
             raise RuntimeError(f"Network error calling OpenRouter API: {e}")
         except Exception as e:
             raise RuntimeError(f"Formatter API failed: {e}")
-
-        # Parse JSON response safely
-        try:
-            content_str = content
-            if content_str.startswith("```") and content_str.endswith("```"):
-                # Strip triple backticks and optional json hint
-                inner = content_str.strip().strip("`")
-                if inner.startswith("json\n"):
-                    inner = inner[5:]
-                content_str = inner
-            parsed = self._parse_formatter_json(content_str)
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to parse formatter JSON: {e}; content head: {content[:120]}"
-            )
-
-        abstract_md_masked = (parsed.get("abstract_md") or "").strip()
-        body_md_masked = (parsed.get("body_md") or "").strip()
-
-        # Verify math token parity for each part separately
-        if not verify_token_parity(abstract_map, abstract_md_masked):
-            raise RuntimeError(
-                "Math placeholder parity check failed in abstract formatting output"
-            )
-        if not verify_token_parity(body_map, body_md_masked):
-            raise RuntimeError(
-                "Math placeholder parity check failed in body formatting output"
-            )
-
-        # Unmask with original maps
-        abstract_md = unmask_math(abstract_md_masked, abstract_map)
-        body_md = unmask_math(body_md_masked, body_map)
-
-        out = {**translation}
-        if abstract_md:
-            out["abstract_md"] = abstract_md
-        if body_md:
-            out["body_md"] = body_md
-        return out
+        return content, answered_by
@@ -911,6 +911,7 @@ Remember: Produce flowing, readable academic English. Merge fragments into compl
         record: Dict[str, Any],
         dry_run: bool = False,
         glossary_override: Optional[List[Dict[str, str]]] = None,
+        pdf_engine: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Translate a record using synthesis mode for readable output.
@@ -921,6 +922,7 @@ Remember: Produce flowing, readable academic English. Merge fragments into compl
             record: Record to translate
             dry_run: If True, skip actual translation
             glossary_override: Custom glossary entries
+            pdf_engine: PDF text engine (pdfminer or pymupdf); None uses config
 
         Returns:
             Translated record dict
@@ -997,7 +999,7 @@ Remember: Produce flowing, readable academic English. Merge fragments into compl
             if pdf_path:
                 # Use synthesis extraction
                 try:
-                    extraction = extract_from_pdf_synthesis(pdf_path)
+                    extraction = extract_from_pdf_synthesis(pdf_path, pdf_engine)
                 except Exception as e:
                     log(f"Error extracting from PDF {pdf_path}: {e}")
                     extraction = None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass
 from typing import List, Tuple
 
@@ -10,6 +11,8 @@ from typing import List, Tuple
 MATH_TOKEN_FMT = "⟪MATH_{:04d}⟫"
 
 
+# Reference definition of what gets masked, in precedence order. mask_math()
+# uses the equivalent single-pass _COMBINED_MATH_RE below; keep them in sync.
 MATH_PATTERNS = [
     # Display $$...$$ (greedy but non-nesting)
     re.compile(r"\$\$(.+?)\$\$", re.DOTALL),
@@ -39,6 +42,29 @@ MATH_PATTERNS = [
 ]
 
 
+# Single combined scanner. Alternatives are tried in the same precedence order
+# as MATH_PATTERNS at each position, so one left-to-right pass finds every span
+# the sequential substitutions would, without re-scanning the text per pattern.
+# Outer spans win over anything nested inside them (e.g. $..$ inside \[..\]).
+# Branches are factored on their first character ($ or \\) so the engine can
+# skip ordinary prose quickly; (?<!\\\$) is the inline-$ lookbehind moved
+# past the consumed opening dollar.
+_COMBINED_MATH_RE = re.compile(
+    r"\$(?:\$.+?\$\$|(?<!\\\$).+?(?<!\\)\$)"
+    r"|\\(?:"
+    r"\[.+?\\\]"
+    r"|\(.+?\\\)"
+    r"|begin\{(?P<env>equation\*?|align\*?|gather\*?|multline\*?)\}.+?\\end\{(?P=env)\}"
+    r"|(?:cite|ref|eqref|label|textbf|textit|emph|section|subsection|subsubsection)"
+    r"\{[^}]*\}"
+    r")",
+    re.DOTALL,
+)
+
+# Matches any placeholder emitted by MATH_TOKEN_FMT (width grows past 9999)
+_TOKEN_RE = re.compile(r"⟪MATH_\d{4,}⟫")
+
+
 @dataclass
 class Masking:
     token: str
@@ -47,33 +73,28 @@ class Masking:
 
 def mask_math(text: str) -> Tuple[str, List[Masking]]:
     mappings: List[Masking] = []
-    out = text
-
-    # Apply patterns sequentially; replace matches with stable tokens
-    for pat in MATH_PATTERNS:
 
-        def _repl(m: re.Match) -> str:
-            token = MATH_TOKEN_FMT.format(len(mappings) + 1)
-            mappings.append(Masking(token=token, content=m.group(0)))
-            return token
+    def _repl(m: re.Match) -> str:
+        token = MATH_TOKEN_FMT.format(len(mappings) + 1)
+        mappings.append(Masking(token=token, content=m.group(0)))
+        return token
 
-        out = pat.sub(_repl, out)
+    # One pass over the text; replace matches with stable tokens
+    out = _COMBINED_MATH_RE.sub(_repl, text)
     return out, mappings
 
 
 def unmask_math(text: str, mappings: List[Masking]) -> str:
-    out = text
-    for m in mappings:
-        out = out.replace(m.token, m.content)
-    return out
+    if not mappings:
+        return text
+    table = {m.token: m.content for m in mappings}
+    # Single regex pass with a lookup table; unknown tokens are left untouched
+    return _TOKEN_RE.sub(lambda m: table.get(m.group(0), m.group(0)), text)
 
 
 def verify_token_parity(source_mappings: List[Masking], translated_text: str) -> bool:
     # Ensure each token appears exactly once in translation
-    ok = True
-    for m in source_mappings:
-        count = translated_text.count(m.token)
-        if count != 1:
-            ok = False
-            break
-    return ok
+    if not source_mappings:
+        return True
+    counts = Counter(_TOKEN_RE.findall(translated_text))
+    return all(counts[m.token] == 1 for m in source_mappings)
@@ -0,0 +1,39 @@
+"""
+Fold per-paper figure manifest shards into figures/manifest.json on B2.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Iterable, Optional
+
+from src.figure_pipeline.models import PipelineConfig
+from src.figure_pipeline.storage import FigureStorage
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compact figure manifest shards into the combined index."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Shards downloaded in parallel (default: 16).",
+    )
+    args = parser.parse_args(argv)
+
+    storage = FigureStorage(PipelineConfig(upload_concurrency=args.concurrency))
+    manifest = storage.compact_manifest()
+    if manifest is None:
+        print("Figure manifest compaction failed.")
+        return 1
+    print(
+        f"Figure manifest generation {manifest['generation']} "
+        f"with {len(manifest['papers'])} papers."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
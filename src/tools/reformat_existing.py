@@ -9,6 +9,7 @@ and applies the improved formatting with better spacing and readability.
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 
@@ -66,6 +67,11 @@ def main():
         help="Show what would be done without making changes",
     )
     parser.add_argument("--ids", nargs="+", help="Specific paper IDs to process")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Papers to format concurrently (default: formatting.max_workers)",
+    )
     args = parser.parse_args()
 
     # Get configuration
@@ -111,17 +117,27 @@ def main():
 
     log(f"🚀 Starting reformatting of {total_count} papers...")
 
-    for i, file_path in enumerate(json_files, 1):
-        log(f"[{i}/{total_count}] Processing {file_path.name}")
+    workers = max(1, args.workers or formatting_service.max_workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map() yields results in file order even though papers run concurrently
+        results = executor.map(
+            lambda fp: reformat_translation(str(fp), formatting_service), json_files
+        )
+        for i, (file_path, ok) in enumerate(zip(json_files, results, strict=True), 1):
+            log(f"[{i}/{total_count}] Processed {file_path.name}")
 
-        if reformat_translation(str(file_path), formatting_service):
-            success_count += 1
+            if ok:
+                success_count += 1
 
-        # Progress update every 10 files
-        if i % 10 == 0:
-            log(f"Progress: {i}/{total_count} ({i/total_count*100:.1f}%)")
+            # Progress update every 10 files
+            if i % 10 == 0:
+                log(f"Progress: {i}/{total_count} ({i/total_count*100:.1f}%)")
 
     log("✅ Reformatting complete!")
+    log(
+        f"Formatter cache: {formatting_service.cache_hits} hits, "
+        f"{formatting_service.cache_misses} LLM calls"
+    )
     log(f"Successfully reformatted: {success_count}/{total_count} papers")
 
     if success_count < total_count:
@@ -11,6 +11,7 @@ import argparse
 import glob
 import os
 from datetime import datetime, timezone
+from typing import Optional
 
 from .db_utils import get_paper_for_translation, save_translation_result
 from .file_service import read_json, write_json
@@ -22,6 +23,7 @@ from .services.translation_service import TranslationService
 def translate_paper(
     paper_id: str,
     dry_run: bool = False,
+    pdf_engine: Optional[str] = None,
 ) -> str:
     """
     Translate a single paper by ID using synthesis mode.
@@ -29,17 +31,19 @@ def translate_paper(
     Args:
         paper_id: Paper identifier
         dry_run: If True, skip actual translation
+        pdf_engine: PDF text engine (pdfminer or pymupdf); None uses config
 
     Returns:
         Paper ID on success (translation saved to database and local file)
     """
-    return translate_paper_synthesis(paper_id, dry_run=dry_run)
+    return translate_paper_synthesis(paper_id, dry_run=dry_run, pdf_engine=pdf_engine)
 
 
 def translate_paper_synthesis(
     paper_id: str,
     dry_run: bool = False,
     db_conn=None,
+    pdf_engine: Optional[str] = None,
 ) -> str:
     """
     Translate a paper using synthesis mode for readable output.
@@ -58,6 +62,7 @@ def translate_paper_synthesis(
         paper_id: Paper identifier
         dry_run: If True, skip actual translation
         db_conn: Optional database connection for reuse
+        pdf_engine: PDF text engine (pdfminer or pymupdf); None uses config
 
     Returns:
         Paper ID (translation saved to database)
@@ -132,7 +137,9 @@ def translate_paper_synthesis(
             rec["files"] = {"pdf_path": pdf_path}
 
     # Translate using synthesis mode
-    translation = service.translate_record_synthesis(rec, dry_run=dry_run)
+    translation = service.translate_record_synthesis(
+        rec, dry_run=dry_run, pdf_engine=pdf_engine
+    )
 
     # Run QA
     qa_filter = SynthesisQAFilter()
@@ -640,3 +640,16 @@ def clear_filter_caches():
     clear_category_caches()
     yield
     clear_category_caches()
+
+
+@pytest.fixture(autouse=True)
+def disable_extraction_cache(monkeypatch):
+    """
+    Disable the PDF extraction cache for all tests.
+
+    Many tests mock the text extractor for byte-identical placeholder PDFs,
+    which would otherwise share one content-addressed cache entry. Tests of
+    the cache itself point EXTRACTION_CACHE_DIR at a tmp_path.
+    """
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", "")
+    yield
@@ -0,0 +1,90 @@
+"""
+Local stand-in for the Gemini and Moondream HTTP APIs.
+
+Serves POST /v1beta/models/<model>:generateContent (echoes the input image
+back as the "translation") and POST /v1/query (answers with answer_fn), with
+optional latency and scripted error responses (fail_next). Records the peak number of
+requests in flight, so tests can check how far a client fans out.
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GEMINI_PATH = re.compile(r"^/v1beta/models/([^/:]+):generateContent$")
+
+
+class FakeFigureAPI:
+    def __init__(self, latency=0.0, answer_fn=None):
+        self.latency = latency
+        self.answer_fn = answer_fn or (lambda question: "no")
+        # (status, message) replies for the next requests, e.g. [(429, "...")]
+        self.fail_next = []
+        self.requests = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def gemini_base(self):
+        return f"{self._url}/v1beta/models"
+
+    @property
+    def moondream_endpoint(self):
+        return f"{self._url}/v1"
+
+    def __enter__(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                status, reply = api._handle(self.path, dict(self.headers), body)
+                data = json.dumps(reply).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 1024
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        self._url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handle(self, path, headers, body):
+        with self._lock:
+            self.requests.append((path, headers, body))
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            failure = self.fail_next.pop(0) if self.fail_next else None
+        try:
+            time.sleep(self.latency)
+            if failure:
+                status, message = failure
+                return status, {"error": {"message": message}}
+            match = GEMINI_PATH.match(path)
+            if match:
+                image = body["contents"][0]["parts"][1]["inline_data"]["data"]
+                part = {"inlineData": {"mimeType": "image/png", "data": image}}
+                return 200, {"candidates": [{"content": {"parts": [part]}}]}
+            if path == "/v1/query":
+                return 200, {"answer": self.answer_fn(body["question"])}
+            return 404, {"error": "not found"}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
@@ -1,3 +1,4 @@
+import copy
 import json
 import shutil
 from pathlib import Path
@@ -33,6 +34,12 @@ def _make_record(record_id: str, pdf_path: Path) -> dict:
     }
 
 
+def _set_ocr_mode(monkeypatch: pytest.MonkeyPatch, mode: str) -> None:
+    cfg = copy.deepcopy(pdf_pipeline.get_config())
+    cfg.setdefault("validation_thresholds", {}).setdefault("ocr", {})["mode"] = mode
+    monkeypatch.setattr(pdf_pipeline, "get_config", lambda: cfg)
+
+
 def test_pipeline_smoke_passes_all_gates(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fixture_pdf: Path
 ) -> None:
@@ -135,6 +142,7 @@ def test_process_paper_records_ocr_improvement(
     """
     Ensure process_paper records OCR improvements when the OCR tools are available.
     """
+    _set_ocr_mode(monkeypatch, "full")
     workspace = tmp_path
     monkeypatch.chdir(workspace)
 
@@ -184,3 +192,98 @@ def test_process_paper_records_ocr_improvement(
     assert record["improved"] is True
     assert record["quality_ok"] is True
     assert record["post_ocr_chars"] > record["pre_ocr_chars"]
+
+
+def test_process_paper_selective_ocr_records_pages(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Selective mode OCRs sparse pages via page_ocr and records per-page telemetry.
+    """
+    _set_ocr_mode(monkeypatch, "selective")
+    monkeypatch.chdir(tmp_path)
+
+    fixture_pdf = (OCR_FIXTURE_DIR / "scanned_text.pdf").resolve()
+    record_id = "chinaxiv-250101.00003"
+    pdf_output_dir = tmp_path / "data" / "pdfs"
+
+    def fake_download(url: str, output_path: str) -> bool:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(fixture_pdf, output_path)
+        return True
+
+    def fake_extract(path: str) -> list[str]:
+        if "ocr" in Path(path).parts:
+            return [" ".join(["improved text output"] * 120)]
+        return ["brief"]
+
+    def fake_ocr_sparse_pages(pdf_path, output_path, **kwargs):
+        shutil.copyfile(pdf_path, output_path)
+        return pdf_pipeline.page_ocr.PageOcrResult(
+            output_path=output_path,
+            page_count=3,
+            pages=[0, 2],
+            cached_pages=1,
+            seconds=0.5,
+        )
+
+    monkeypatch.setattr(pdf_pipeline, "download_pdf", fake_download)
+    monkeypatch.setattr(pdf_pipeline, "extract_from_pdf", fake_extract)
+    monkeypatch.setattr(pdf_pipeline.shutil, "which", lambda b: f"/usr/bin/{b}")
+    monkeypatch.setattr(
+        pdf_pipeline.page_ocr, "ocr_sparse_pages", fake_ocr_sparse_pages
+    )
+
+    result = pdf_pipeline.process_paper(
+        record_id, str(fixture_pdf), pdf_dir=str(pdf_output_dir)
+    )
+    assert result is not None
+    assert Path(result["pdf_path"]).parent.name == "ocr"
+
+    report_path = Path("reports/ocr_report.json")
+    record = json.loads(report_path.read_text(encoding="utf-8"))[record_id]
+    assert record["ran_ocr"] is True
+    assert record["improved"] is True
+    assert record["ocr_mode"] == "selective"
+    assert record["ocr_pages"] == 2
+    assert record["ocr_cached_pages"] == 1
+
+
+def test_process_paper_selective_ocr_without_sparse_pages_skips_ocr(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    No page below the density threshold is not an OCR failure: OCR is skipped.
+    """
+    _set_ocr_mode(monkeypatch, "selective")
+    monkeypatch.chdir(tmp_path)
+
+    fixture_pdf = (OCR_FIXTURE_DIR / "scanned_text.pdf").resolve()
+    record_id = "chinaxiv-250101.00004"
+    pdf_output_dir = tmp_path / "data" / "pdfs"
+    logged: list[str] = []
+
+    def fake_download(url: str, output_path: str) -> bool:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(fixture_pdf, output_path)
+        return True
+
+    monkeypatch.setattr(pdf_pipeline, "download_pdf", fake_download)
+    monkeypatch.setattr(pdf_pipeline, "extract_from_pdf", lambda path: ["brief"])
+    monkeypatch.setattr(pdf_pipeline, "log", logged.append)
+    monkeypatch.setattr(pdf_pipeline.shutil, "which", lambda b: f"/usr/bin/{b}")
+    monkeypatch.setattr(
+        pdf_pipeline.page_ocr, "ocr_sparse_pages", lambda *args, **kwargs: None
+    )
+
+    result = pdf_pipeline.process_paper(
+        record_id, str(fixture_pdf), pdf_dir=str(pdf_output_dir)
+    )
+    assert result is not None
+    assert result["paragraphs"] == ["brief"]
+    assert not any(line.startswith("OCR failed") for line in logged)
+
+    report_path = Path("reports/ocr_report.json")
+    record = json.loads(report_path.read_text(encoding="utf-8"))[record_id]
+    assert record["ran_ocr"] is False
+    assert record["ocr_pages"] == 0
@@ -0,0 +1,212 @@
+"""
+Tests for the asyncio Gemini and Moondream clients, against a local fake API.
+"""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from src.figure_pipeline.async_clients import (
+    AsyncGeminiClient,
+    AsyncMoondreamClient,
+    AsyncRateGate,
+)
+from src.figure_pipeline.rate_limiter import AdaptiveRateLimiter, RateLimiterConfig
+from src.figure_pipeline.validator import COMBINED_VALIDATION_PROMPT
+from tests.fake_figure_api import FakeFigureAPI
+
+
+@pytest.fixture
+def figure(tmp_path):
+    path = tmp_path / "fig_1.png"
+    Image.new("RGB", (64, 32), "white").save(path)
+    return str(path)
+
+
+def _limiter(**kwargs):
+    config = {
+        "initial_concurrent": 256,
+        "max_concurrent": 256,
+        "cooldown_seconds": 0.01,
+    }
+    config.update(kwargs)
+    return AdaptiveRateLimiter(RateLimiterConfig(**config))
+
+
+def _gemini(api, limiter):
+    return AsyncGeminiClient(api_key="key", api_base=api.gemini_base, limiter=limiter)
+
+
+class TestAsyncRateGate:
+    def test_never_exceeds_limiter_concurrency(self):
+        gate = AsyncRateGate(_limiter(initial_concurrent=3))
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with gate.acquire():
+                peak = max(peak, gate.active)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(*(request() for _ in range(20)))
+
+        asyncio.run(main())
+
+        assert peak == 3
+        assert gate.active == 0
+
+    def test_cap_is_shared_by_event_loops_in_several_threads(self):
+        gate = AsyncRateGate(_limiter(initial_concurrent=3))
+        peak = 0
+        lock = threading.Lock()
+
+        async def request():
+            nonlocal peak
+            async with gate.acquire():
+                with lock:
+                    peak = max(peak, gate.active)
+                await asyncio.sleep(0.01)
+
+        async def paper():
+            await asyncio.gather(*(request() for _ in range(20)))
+
+        threads = [
+            threading.Thread(target=asyncio.run, args=(paper(),)) for _ in range(4)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 3
+        assert gate.active == 0
+        # Releases wake the other loops' waiters, not just the 1s re-check
+        assert time.perf_counter() - start < 2
+
+
+class TestAsyncGeminiClient:
+    def test_hundreds_of_requests_in_flight(self, tmp_path, figure):
+        async def main(api):
+            async with _gemini(api, _limiter()) as client:
+                return await asyncio.gather(
+                    *(
+                        client.translate_image(
+                            figure, str(tmp_path / f"out_{i}.png"), prompt="Translate"
+                        )
+                        for i in range(200)
+                    )
+                )
+
+        with FakeFigureAPI(latency=0.5) as api:
+            start = time.perf_counter()
+            outputs = asyncio.run(main(api))
+            elapsed = time.perf_counter() - start
+
+        assert all(outputs)
+        assert api.peak_in_flight >= 150
+        # 200 sequential calls would take 100s
+        assert elapsed < 10
+        path, headers, body = api.requests[0]
+        assert path == "/v1beta/models/gemini-3-pro-image-preview:generateContent"
+        assert headers["x-goog-api-key"] == "key"
+        assert body["contents"][0]["parts"][0] == {"text": "Translate"}
+        with open(figure, "rb") as f1, open(outputs[0], "rb") as f2:
+            assert f1.read() == f2.read()
+
+    def test_rate_limit_backs_off_and_retries(self, tmp_path, figure):
+        limiter = _limiter(initial_concurrent=8)
+
+        async def main(api):
+            async with _gemini(api, limiter) as client:
+                return await client.translate_image(
+                    figure, str(tmp_path / "out.png"), prompt="Translate"
+                )
+
+        with FakeFigureAPI() as api:
+            api.fail_next = [(429, "Too many requests")] * 2
+            output = asyncio.run(main(api))
+
+        assert output
+        assert len(api.requests) == 3
+        stats = limiter.get_stats()
+        assert stats["total_rate_limits"] == 2
+        assert stats["current_concurrent"] == 2
+
+    def test_bad_request_is_not_retried(self, tmp_path, figure):
+        async def main(api):
+            async with _gemini(api, _limiter()) as client:
+                return await client.translate_image(
+                    figure, str(tmp_path / "out.png"), prompt="Translate"
+                )
+
+        with FakeFigureAPI() as api:
+            api.fail_next = [(400, "Invalid image")]
+            output = asyncio.run(main(api))
+
+        assert output is None
+        assert len(api.requests) == 1
+
+
+class TestAsyncMoondreamClient:
+    def test_combined_validation(self, figure):
+        answers = {
+            COMBINED_VALIDATION_PROMPT: json.dumps(
+                {"readable": "yes", "has_chinese": "yes", "figure_type": "chart"}
+            )
+        }
+
+        async def main(api):
+            async with AsyncMoondreamClient(
+                api_key="key", endpoint=api.moondream_endpoint, limiter=_limiter()
+            ) as client:
+                return await asyncio.gather(
+                    *(client.validate(figure) for _ in range(50))
+                )
+
+        with FakeFigureAPI(latency=0.2, answer_fn=answers.get) as api:
+            results = asyncio.run(main(api))
+
+        assert results[0] == {
+            "readable": True,
+            "has_chinese": True,
+            "figure_type": "chart",
+        }
+        assert len(api.requests) == 50
+        assert api.peak_in_flight > 10
+        path, headers, body = api.requests[0]
+        assert headers["X-Moondream-Auth"] == "key"
+        assert body["stream"] is False
+        assert body["image_url"].startswith("data:image/jpeg;base64,")
+        base64.b64decode(body["image_url"].split(",", 1)[1])
+
+    def test_unparseable_answer_falls_back_to_separate_queries(self, figure):
+        def answer(question):
+            if question == COMBINED_VALIDATION_PROMPT:
+                return "I am not sure"
+            if "type of figure" in question:
+                return "Table"
+            return "Yes"
+
+        async def main(api):
+            async with AsyncMoondreamClient(
+                api_key="key", endpoint=api.moondream_endpoint, limiter=_limiter()
+            ) as client:
+                return await client.validate(figure), await client.has_chinese(figure)
+
+        with FakeFigureAPI(answer_fn=answer) as api:
+            verdict, has_chinese = asyncio.run(main(api))
+
+        assert verdict == {
+            "readable": True,
+            "has_chinese": True,
+            "figure_type": "table",
+        }
+        assert has_chinese is True
+        assert len(api.requests) == 5
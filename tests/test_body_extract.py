@@ -4,9 +4,12 @@ Tests both legacy extraction and synthesis mode functions.
 """
 
 import io
+import random
+import re
 import tarfile
 from pathlib import Path
 
+import pytest
 
 from src.body_extract import (
     extract_body_paragraphs,
@@ -15,6 +18,7 @@ from src.body_extract import (
     is_watermark_or_garbage,
     detect_section_boundary,
     merge_pdf_lines_to_paragraphs,
+    resolve_pdf_text_engine,
 )
 
 
@@ -54,6 +58,94 @@ def test_body_extract_prefers_latex(tmp_path, monkeypatch):
     assert len(paras) >= 1
 
 
+MAIN_TEX = r"""
+\documentclass{article}
+\begin{document}
+Main body paragraph.
+\end{document}
+""".strip()
+
+
+def _write_archive(tmp_path: Path, name: str, members: dict) -> str:
+    path = tmp_path / name
+    if name.endswith(".zip"):
+        import zipfile
+
+        with zipfile.ZipFile(path, "w") as zf:
+            for member, text in members.items():
+                zf.writestr(member, text)
+    else:
+        with tarfile.open(path, "w:gz") as tf:
+            for member, text in members.items():
+                info = tarfile.TarInfo(member)
+                data = text.encode("utf-8")
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+class TestMainTexSelection:
+    @pytest.mark.parametrize("name", ["src.tar.gz", "src.zip"])
+    def test_main_file_beats_larger_includes(self, tmp_path, name):
+        archive = _write_archive(
+            tmp_path,
+            name,
+            {
+                "sections/intro.tex": "Included section text. " * 2000,
+                "main.tex": MAIN_TEX,
+                "sections/appendix.tex": "Appendix text. " * 3000,
+            },
+        )
+
+        assert extract_from_latex(archive) == ["Main body paragraph."]
+
+    def test_non_candidates_read_only_head(self, tmp_path, monkeypatch):
+        from src import body_extract
+
+        archive = _write_archive(
+            tmp_path,
+            "src.tar.gz",
+            {
+                "chapters/long.tex": "x" * (body_extract.MAIN_TEX_HEAD_BYTES * 4),
+                "main.tex": MAIN_TEX,
+            },
+        )
+        reads = []
+        original = body_extract._iter_tex_members
+
+        def tracking(path):
+            for name, size, f in original(path):
+                real_read = f.read
+
+                def read(n=-1, _name=name, _read=real_read):
+                    data = _read(n)
+                    reads.append((_name, len(data)))
+                    return data
+
+                f.read = read
+                yield name, size, f
+
+        monkeypatch.setattr(body_extract, "_iter_tex_members", tracking)
+
+        assert extract_from_latex(archive) == ["Main body paragraph."]
+        long_bytes = sum(n for name, n in reads if name == "chapters/long.tex")
+        assert long_bytes == body_extract.MAIN_TEX_HEAD_BYTES
+
+    def test_falls_back_to_largest_tex(self, tmp_path):
+        archive = _write_archive(
+            tmp_path,
+            "src.tar.gz",
+            {"a.tex": "Short.", "b.tex": "A longer fallback paragraph."},
+        )
+
+        assert extract_from_latex(archive) == ["A longer fallback paragraph."]
+
+    def test_no_tex_members(self, tmp_path):
+        archive = _write_archive(tmp_path, "src.zip", {"README.md": "hello"})
+
+        assert extract_from_latex(archive) is None
+
+
 # =============================================================================
 # Synthesis mode tests: Watermark Detection
 # =============================================================================
@@ -107,6 +199,121 @@ class TestWatermarkDetection:
         assert is_watermark_or_garbage("abcd") is True  # 4 chars, too short
 
 
+def _legacy_is_watermark_or_garbage(text: str) -> bool:
+    """Per-pattern implementation the combined rule matcher replaced."""
+    from src.body_extract import WATERMARK_PATTERNS
+
+    text = text.strip()
+    if len(text) < 5:
+        return True
+    if text.count(" ") / len(text) > 0.4 and re.match(r"^[A-Za-z0-9]", text):
+        return True
+    if any(pattern.search(text) for pattern in WATERMARK_PATTERNS):
+        return True
+    return bool(re.match("^[\\d\\s\\.\\-–—]+$", text))
+
+
+class TestWatermarkRules:
+    """Combined, config-driven watermark rules."""
+
+    @pytest.fixture
+    def rules_config(self, monkeypatch):
+        from src import body_extract
+
+        def apply(synthesis_cfg):
+            monkeypatch.setattr(
+                "src.config.get_config",
+                lambda: {"translation": {"synthesis": synthesis_cfg}},
+            )
+            body_extract.reload_watermark_rules()
+
+        yield apply
+        body_extract.reload_watermark_rules()
+
+    def test_matches_per_pattern_filter(self):
+        rng = random.Random(33)
+        alphabet = "ab XaniChpostedvTHIS0123456789 .:-图表中文\t"
+        for _ in range(20000):
+            line = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            assert is_watermark_or_garbage(line) == _legacy_is_watermark_or_garbage(
+                line
+            ), line
+
+    def test_counts_hits_per_rule(self):
+        from src.body_extract import WATERMARK_RULE_HITS, reset_watermark_stats
+
+        reset_watermark_stats()
+        is_watermark_or_garbage("abc")
+        is_watermark_or_garbage("- 12 -")
+        is_watermark_or_garbage("Release 1 v 2 of the dataset")
+        is_watermark_or_garbage("A normal sentence about results.")
+
+        assert WATERMARK_RULE_HITS["too_short"] == 1
+        assert WATERMARK_RULE_HITS["page_number"] == 1
+        assert WATERMARK_RULE_HITS["version_stamp"] == 1
+        assert sum(WATERMARK_RULE_HITS.values()) == 3
+
+    def test_config_rules_extend_and_disable(self, rules_config):
+        rules_config(
+            {
+                "watermark_rules": [
+                    {
+                        "name": "footer",
+                        "pattern": "chinaxiv合作期刊",
+                        "ignore_case": True,
+                    }
+                ],
+                "disabled_watermark_rules": ["version_stamp"],
+            }
+        )
+
+        assert is_watermark_or_garbage("本文由 ChinaXiv合作期刊 提供") is True
+        assert is_watermark_or_garbage("Release 1 v 2 of the dataset") is False
+        assert is_watermark_or_garbage("X a n i h C") is True
+
+    def test_invalid_config_rule_is_skipped(self, rules_config):
+        rules_config({"watermark_rules": [{"name": "bad", "pattern": "(unclosed"}]})
+
+        assert is_watermark_or_garbage("A normal sentence (unclosed") is False
+        assert is_watermark_or_garbage(":viXanihC") is True
+
+    def test_character_class_rules_match_literally(self, rules_config):
+        rules_config(
+            {
+                "watermark_rules": [
+                    {"name": "dot_page", "pattern": "[.-]page"},
+                    {"name": "z_dash", "pattern": "[z-]x"},
+                ]
+            }
+        )
+
+        assert is_watermark_or_garbage("Downloaded from site.page today") is True
+        assert is_watermark_or_garbage("The quick brown fox, -x marks") is True
+        # "[.-]" is not a range: other punctuation must not match
+        assert is_watermark_or_garbage("A normal sentence about /page layout") is False
+
+    def test_alternation_after_caret_is_not_anchored(self, rules_config):
+        rules_config(
+            {"watermark_rules": [{"name": "either", "pattern": "^Draft|Preprint"}]}
+        )
+
+        assert is_watermark_or_garbage("This article is a Preprint copy") is True
+        assert is_watermark_or_garbage("Draft of the manuscript text") is True
+
+    def test_clashing_rule_is_skipped(self, rules_config):
+        rules_config(
+            {
+                "watermark_rules": [
+                    {"name": "first", "pattern": "(?P<tag>Footer)"},
+                    {"name": "second", "pattern": "(?P<tag>Header)"},
+                ]
+            }
+        )
+
+        assert is_watermark_or_garbage("Journal Footer text") is True
+        assert is_watermark_or_garbage("Journal Header text") is False
+
+
 # =============================================================================
 # Synthesis mode tests: Section Boundary Detection
 # =============================================================================
@@ -306,6 +513,70 @@ class TestEdgeCases:
         assert "References" in result
 
 
+def _reference_merge(lines, min_para_length=50):
+    """Previous quadratic implementation, kept as the oracle for equivalence."""
+    paragraphs = []
+    current_buffer = []
+    for line in lines:
+        line = line.strip()
+        if not line or is_watermark_or_garbage(line):
+            continue
+        if detect_section_boundary(line):
+            if current_buffer:
+                paragraphs.append(" ".join(current_buffer))
+                current_buffer = []
+            paragraphs.append(line)
+            continue
+        if current_buffer:
+            last_text = " ".join(current_buffer)
+            ends_sentence = bool(re.search(r"[.?!。！？:：]\s*$", last_text))
+            starts_new = bool(re.match(r"^[A-Z\u4e00-\u9fff]", line))
+            if ends_sentence and starts_new and len(last_text) >= min_para_length:
+                paragraphs.append(last_text)
+                current_buffer = [line]
+            else:
+                current_buffer.append(line)
+        else:
+            current_buffer = [line]
+    if current_buffer:
+        paragraphs.append(" ".join(current_buffer))
+    return paragraphs
+
+
+class TestParagraphMergingEquivalence:
+    """Property-style check: running-state merge matches the reference."""
+
+    FRAGMENTS = [
+        "The model converges quickly.",
+        "and then continues",
+        "实验结果表明该方法有效。",
+        "研究背景",
+        "Results",
+        "2.1 Data Collection",
+        "see Table 3:",
+        "lowercase continuation without end",
+        "What does this imply?",
+        "12",
+        "X a n i h C",
+        "   padded line with spaces.   ",
+        "",
+        "A",
+        "Short.",
+        "如图1所示：",
+        "Wow!",
+        "\tTabbed sentence end.\t",
+    ]
+
+    def test_matches_reference_on_random_documents(self):
+        rng = random.Random(20240706)
+        for _ in range(500):
+            lines = [rng.choice(self.FRAGMENTS) for _ in range(rng.randint(0, 60))]
+            min_len = rng.choice([0, 5, 10, 20, 50, 120])
+            assert merge_pdf_lines_to_paragraphs(
+                lines, min_para_length=min_len
+            ) == _reference_merge(lines, min_para_length=min_len)
+
+
 # =============================================================================
 # Synthesis mode tests: extract_from_pdf_synthesis()
 # =============================================================================
@@ -489,3 +760,211 @@ class TestPipelineQAIntegration:
         assert hasattr(result, "status")
         assert hasattr(result, "score")
         assert result.status in [QAStatus.PASS, QAStatus.FLAG_FORMATTING]
+
+
+class TestPdfTextEngines:
+    """Engine selection for extract_from_pdf_synthesis."""
+
+    FIXTURE = Path(__file__).parent / "fixtures" / "ocr" / "native_text.pdf"
+
+    def test_engines_agree_on_native_text_pdf(self):
+        pdfminer = extract_from_pdf_synthesis(str(self.FIXTURE), engine="pdfminer")
+        pymupdf = extract_from_pdf_synthesis(str(self.FIXTURE), engine="pymupdf")
+
+        assert pdfminer is not None and pymupdf is not None
+        assert pymupdf["stats"]["engine"] == "pymupdf"
+        assert pymupdf["raw_paragraphs"] == pdfminer["raw_paragraphs"]
+
+    def test_engine_ignores_environment(self, monkeypatch):
+        monkeypatch.setenv("PDF_TEXT_ENGINE", "pymupdf")
+        assert resolve_pdf_text_engine("pdfminer") == "pdfminer"
+        assert resolve_pdf_text_engine(" PyMuPDF ") == "pymupdf"
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError):
+            resolve_pdf_text_engine("poppler")
+
+    def test_unknown_engine_falls_back_during_extraction(self):
+        result = extract_from_pdf_synthesis(str(self.FIXTURE), engine="poppler")
+
+        assert result is not None
+        assert result["stats"]["engine"] == "pdfminer"
+
+
+class TestPageParallelExtraction:
+    """Sharded extraction must reassemble to the sequential text."""
+
+    @staticmethod
+    def _make_pdf(path, pages):
+        import fitz
+
+        doc = fitz.open()
+        for i in range(pages):
+            page = doc.new_page()
+            page.insert_text(
+                (72, 72),
+                f"Page {i} carries a sentence that continues\n"
+                f"onto the next line without ending",
+                fontsize=11,
+            )
+        doc.save(str(path))
+        doc.close()
+
+    def test_shard_pages_covers_all_pages_in_order(self):
+        from src.body_extract import _shard_pages
+
+        ranges = _shard_pages(26, 4)
+        assert ranges[0][0] == 0 and ranges[-1][1] == 26
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:], strict=False))
+
+    def test_parallel_pdfminer_matches_sequential(self, tmp_path):
+        from src.body_extract import PARALLEL_MIN_PAGES, extract_pdf_text
+
+        pdf_path = tmp_path / "thesis.pdf"
+        self._make_pdf(pdf_path, PARALLEL_MIN_PAGES + 2)
+
+        sequential = extract_pdf_text(str(pdf_path), "pdfminer", workers=1)
+        parallel = extract_pdf_text(str(pdf_path), "pdfminer", workers=2)
+
+        assert parallel == sequential
+        assert sequential.count("\f") == PARALLEL_MIN_PAGES + 2
+
+    def test_concurrent_papers_share_one_process_pool(self, tmp_path, monkeypatch):
+        import concurrent.futures
+        import threading
+
+        from src import body_extract
+
+        monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setattr(body_extract, "_EXTRACT_POOL", None)
+        resolve = body_extract._resolve_extract_workers
+        monkeypatch.setattr(
+            body_extract,
+            "_resolve_extract_workers",
+            lambda workers: 2 if workers is None else resolve(workers),
+        )
+        pools = []
+
+        class CountingPool(concurrent.futures.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", CountingPool)
+
+        paths = []
+        for i in range(3):
+            pdf_path = tmp_path / f"paper{i}.pdf"
+            self._make_pdf(pdf_path, body_extract.PARALLEL_MIN_PAGES + i)
+            paths.append(str(pdf_path))
+        texts = {}
+
+        def extract(path):
+            texts[path] = body_extract.extract_pdf_text(path, "pdfminer", workers=2)
+
+        threads = [threading.Thread(target=extract, args=(p,)) for p in paths]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            if pools:
+                pools[0].shutdown()
+
+        assert len(pools) == 1
+        assert pools[0]._max_workers == 2
+        for i, path in enumerate(paths):
+            assert texts[path].count("\f") == body_extract.PARALLEL_MIN_PAGES + i
+
+
+# =============================================================================
+# Figure detection: anchor prefilter
+# =============================================================================
+
+FIGURE_FRAGMENTS = [
+    "As shown in Figure 3, accuracy improves.",
+    "Fig. 2b: Ablation results",
+    "Figures 1-3 summarize the runs",
+    "Table S1 lists hyperparameters.",
+    "Supplementary Figure S4 shows more",
+    "see Tables 2 and 3",
+    "Scheme 1: Synthesis route",
+    "Panel 4. Overview",
+    "如图1所示,数据分布呈正态分布",
+    "图2：模型结构",
+    "表 3-5 给出了结果",
+    "附图S2 和 扩展数据表 1",
+    "图表4：对比",
+    "流程图 6 描述了过程",
+    "fig 7a and TABLE 8)",
+    "The model is trained for 10 epochs with a learning rate of 0.001.",
+    "我们提出了一种新的方法。",
+    "Results are reported below",
+    "ﬁgure 9 uses a ligature",
+    "FİGURE 10 and ſcheme 2: dotted capitals",
+]
+
+
+def _random_paragraphs(rng: random.Random, count: int):
+    paras = []
+    for _ in range(count):
+        parts = rng.sample(FIGURE_FRAGMENTS, rng.randint(0, 4))
+        paras.append(" ".join(parts))
+    return paras
+
+
+class TestFigureDetectionPrefilter:
+    """The anchor prefilter must not change any detection result."""
+
+    @staticmethod
+    def _without_prefilter():
+        from unittest.mock import patch
+
+        from src import body_extract
+
+        return patch.object(
+            body_extract,
+            "_figure_anchors",
+            lambda para: set(body_extract.FIGURE_ANCHORS),
+        )
+
+    def test_every_pattern_has_an_anchor(self):
+        from src.body_extract import (
+            _INDEXED_FIGURE_PATTERNS,
+            _INDEXED_MARKER_PATTERNS,
+        )
+
+        assert all(entry[3] for entry in _INDEXED_FIGURE_PATTERNS)
+        assert all(entry[2] for entry in _INDEXED_MARKER_PATTERNS)
+
+    def test_plain_paragraph_skipped(self):
+        from src.body_extract import _figure_anchors, detect_figures
+
+        para = "The model is trained for 10 epochs."
+        assert _figure_anchors(para) == set()
+        assert detect_figures([para]) == []
+
+    def test_matches_unfiltered_detection(self):
+        from src.body_extract import add_figure_metadata, inject_markers_in_sections
+
+        rng = random.Random(32)
+        for _ in range(200):
+            translation = {
+                "body_en": _random_paragraphs(rng, 6),
+                "body_md": "\n".join(_random_paragraphs(rng, 4)),
+                "body_zh": _random_paragraphs(rng, 5),
+            }
+            sections = [
+                {"name": "Intro", "paragraphs": _random_paragraphs(rng, 4)},
+                {"name": "Method", "paragraphs": _random_paragraphs(rng, 4)},
+            ]
+
+            fast = add_figure_metadata(dict(translation))
+            fast_markers = inject_markers_in_sections(sections)
+            with self._without_prefilter():
+                slow = add_figure_metadata(dict(translation))
+                slow_markers = inject_markers_in_sections(sections)
+
+            assert fast == slow
+            assert fast_markers == slow_markers
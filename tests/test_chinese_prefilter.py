@@ -0,0 +1,210 @@
+"""
+Tests for the local Chinese-text prefilter in src/figure_pipeline/prefilter.py.
+"""
+
+import subprocess
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from src.figure_pipeline import FigurePipeline
+from src.figure_pipeline import prefilter as prefilter_module
+from src.figure_pipeline.models import (
+    Figure,
+    FigureType,
+    PipelineConfig,
+    ProcessingStatus,
+)
+from src.figure_pipeline.prefilter import ChineseTextPrefilter
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("scipy")
+
+
+def _render(tmp_path, name, labels, dpi=150, background=None, fontsize=12):
+    """Render a small bar chart with (text, fontname) labels to a PNG."""
+    doc = fitz.open()
+    page = doc.new_page(width=300, height=200)
+    if background:
+        page.draw_rect(page.rect, fill=background)
+    page.draw_line((40, 170), (280, 170))
+    page.draw_line((40, 170), (40, 20))
+    for i in range(4):
+        page.draw_rect(fitz.Rect(60 + i * 50, 170 - 30 * (i + 1), 90 + i * 50, 170))
+    color = (1, 1, 1) if background else (0, 0, 0)
+    for i, (text, fontname) in enumerate(labels):
+        page.insert_text(
+            (60, 30 + i * 20), text, fontname=fontname, fontsize=fontsize, color=color
+        )
+    path = tmp_path / name
+    page.get_pixmap(dpi=dpi).save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def glyph_prefilter():
+    return ChineseTextPrefilter(PipelineConfig(chinese_prefilter="glyph"))
+
+
+class TestGlyphDetector:
+    def test_latin_chart_is_chinese_free(self, tmp_path, glyph_prefilter):
+        path = _render(
+            tmp_path, "latin.png", [("Temperature (K)", "helv"), ("Model A", "tiro")]
+        )
+
+        verdict = glyph_prefilter.check(path)
+
+        assert verdict.chinese_free
+        assert verdict.method == "glyph"
+
+    def test_chinese_labels_are_not_chinese_free(self, tmp_path, glyph_prefilter):
+        path = _render(tmp_path, "zh.png", [("温度变化曲线", "china-s")])
+
+        assert not glyph_prefilter.check(path).chinese_free
+
+    def test_mixed_labels_are_not_chinese_free(self, tmp_path, glyph_prefilter):
+        path = _render(
+            tmp_path, "mixed.png", [("Accuracy", "helv"), ("实验结果", "china-s")]
+        )
+
+        assert not glyph_prefilter.check(path).chinese_free
+
+    def test_light_text_on_dark_background(self, tmp_path, glyph_prefilter):
+        path = _render(
+            tmp_path, "dark.png", [("数据分析", "china-s")], background=(0.1, 0.1, 0.3)
+        )
+
+        assert not glyph_prefilter.check(path).chinese_free
+
+    def test_text_too_small_to_resolve_is_not_cleared(self, tmp_path, glyph_prefilter):
+        labels = [("1200 3400 5600", "helv")] * 6
+        path = _render(tmp_path, "tiny.png", labels, dpi=72, fontsize=6)
+
+        verdict = glyph_prefilter.check(path)
+
+        assert not verdict.chinese_free
+        assert "too small" in verdict.reason
+
+    def test_unreadable_image_is_not_cleared(self, tmp_path, glyph_prefilter):
+        path = tmp_path / "broken.png"
+        path.write_bytes(b"PNG")
+
+        verdict = glyph_prefilter.check(str(path))
+
+        assert not verdict.chinese_free
+        assert verdict.reason.startswith("error")
+
+
+class TestMethodSelection:
+    def test_off_by_default(self):
+        prefilter = ChineseTextPrefilter(PipelineConfig())
+
+        assert prefilter.method == "off"
+
+    @pytest.mark.parametrize(
+        "figures, method",
+        [
+            ({}, "off"),
+            ({"chinese_prefilter": False}, "off"),
+            ({"chinese_prefilter": "glyph"}, "glyph"),
+        ],
+    )
+    def test_configured_method(self, monkeypatch, figures, method):
+        monkeypatch.setattr("src.config.get_config", lambda: {"figures": figures})
+
+        assert prefilter_module.configured_method() == method
+
+    def test_shipped_config_keeps_prefilter_off(self):
+        assert prefilter_module.configured_method() == "off"
+
+    def test_auto_falls_back_to_glyph_without_tesseract(self, monkeypatch):
+        monkeypatch.setattr(prefilter_module, "tesseract_has_chi_sim", lambda: False)
+        config = PipelineConfig(chinese_prefilter="auto")
+
+        assert ChineseTextPrefilter(config).method == "glyph"
+
+    def test_tesseract_unavailable_disables_prefilter(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(prefilter_module, "tesseract_has_chi_sim", lambda: False)
+        prefilter = ChineseTextPrefilter(PipelineConfig(chinese_prefilter="tesseract"))
+
+        assert prefilter.method == "off"
+        assert not prefilter.check(str(tmp_path / "any.png")).chinese_free
+
+    @pytest.mark.parametrize(
+        ("words", "chinese_free"),
+        [
+            ([("95", "Accuracy"), ("91", "2020")], True),
+            ([("93", "Accuracy"), ("88", "温度")], False),
+            # Low-confidence CJK guesses on noise are ignored
+            ([("12", "图")], True),
+        ],
+    )
+    def test_tesseract_counts_confident_cjk(self, monkeypatch, words, chinese_free):
+        monkeypatch.setattr(prefilter_module, "tesseract_has_chi_sim", lambda: True)
+        header = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\t"
+        header += "left\ttop\twidth\theight\tconf\ttext"
+        rows = [header] + [f"5\t1\t1\t1\t1\t1\t0\t0\t9\t9\t{c}\t{t}" for c, t in words]
+        completed = subprocess.CompletedProcess([], 0, stdout="\n".join(rows))
+
+        with patch.object(prefilter_module.subprocess, "run", return_value=completed):
+            prefilter = ChineseTextPrefilter(PipelineConfig(chinese_prefilter="auto"))
+            verdict = prefilter.check("fig.png")
+
+        assert verdict.method == "tesseract"
+        assert verdict.chinese_free is chinese_free
+
+
+class TestPipelineIntegration:
+    @patch.object(FigurePipeline, "_find_pdf")
+    @patch.object(FigurePipeline, "extractor", new_callable=PropertyMock)
+    @patch.object(FigurePipeline, "validator", new_callable=PropertyMock)
+    @patch.object(FigurePipeline, "translator", new_callable=PropertyMock)
+    def test_chinese_free_figures_skip_api_calls(
+        self,
+        mock_translator_prop,
+        mock_validator_prop,
+        mock_extractor_prop,
+        mock_find_pdf,
+        tmp_path,
+    ):
+        mock_find_pdf.return_value = str(tmp_path / "paper.pdf")
+        latin = _render(tmp_path, "fig1.png", [("Time (s)", "helv")])
+        chinese = _render(tmp_path, "fig2.png", [("压力分布", "china-s")])
+        figures = [
+            Figure(
+                paper_id="paper-001",
+                figure_number=str(i),
+                figure_type=FigureType.FIGURE,
+                status=ProcessingStatus.EXTRACTED,
+                original_path=path,
+            )
+            for i, path in enumerate([latin, chinese], start=1)
+        ]
+        mock_extractor_prop.return_value = MagicMock(
+            extract_all=MagicMock(return_value=figures)
+        )
+        validator = MagicMock()
+        validator.validate.return_value = {
+            "readable": True,
+            "has_chinese": True,
+            "figure_type": "chart",
+        }
+        validator.qa_translation.return_value = {"passed": True}
+        mock_validator_prop.return_value = validator
+        translator = MagicMock()
+        translator.translate.return_value = str(tmp_path / "fig2_en.png")
+        mock_translator_prop.return_value = translator
+
+        pipeline = FigurePipeline(
+            PipelineConfig(dry_run=True, chinese_prefilter="glyph")
+        )
+        result = pipeline.process_paper("paper-001")
+
+        assert result.prefiltered == 1
+        assert result.validated == 2
+        validator.validate.assert_called_once_with(chinese)
+        translator.translate.assert_called_once()
+        assert translator.translate.call_args.kwargs["image_path"] == chinese
+        assert figures[0].qa_has_chinese is False
+        assert figures[0].translated_path is None
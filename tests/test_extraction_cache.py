@@ -0,0 +1,235 @@
+"""
+Tests for the content-addressed PDF extraction cache.
+"""
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src import extraction_cache
+from src.body_extract import (
+    extract_from_pdf,
+    extract_from_pdf_synthesis,
+    extract_pdf_text,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(path))
+    return path
+
+
+def _write_pdf(tmp_path: Path, name: str, body: bytes = b"%PDF-1.4 a") -> str:
+    pdf = tmp_path / name
+    pdf.write_bytes(body)
+    return str(pdf)
+
+
+class TestExtractionCacheStore:
+    def test_digest_memo_keeps_most_recent_pdfs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(extraction_cache, "DIGEST_MEMO_SIZE", 2)
+        monkeypatch.setattr(extraction_cache, "_digest_memo", OrderedDict())
+        a, b, c = (_write_pdf(tmp_path, f"{name}.pdf") for name in "abc")
+
+        extraction_cache.pdf_digest(a)
+        extraction_cache.remember_digest(b, "b" * 64)
+        extraction_cache.pdf_digest(a)
+        extraction_cache.pdf_digest(c)
+
+        remembered = {key[0] for key in extraction_cache._digest_memo}
+        assert remembered == {os.path.abspath(a), os.path.abspath(c)}
+
+    def test_roundtrip_keeps_sections(self, tmp_path, cache_dir):
+        pdf = _write_pdf(tmp_path, "a.pdf")
+
+        assert extraction_cache.load(pdf, "paragraphs") is None
+        extraction_cache.store(pdf, "paragraphs", ["one", "two"])
+        extraction_cache.store(pdf, "text:pdfminer", "one\ntwo")
+
+        assert extraction_cache.load(pdf, "paragraphs") == ["one", "two"]
+        assert extraction_cache.load(pdf, "text:pdfminer") == "one\ntwo"
+
+    def test_keyed_by_content_not_path(self, tmp_path, cache_dir):
+        first = _write_pdf(tmp_path, "a.pdf")
+        copy = _write_pdf(tmp_path, "b.pdf")
+        other = _write_pdf(tmp_path, "c.pdf", b"%PDF-1.4 different")
+
+        extraction_cache.store(first, "paragraphs", ["cached"])
+
+        assert extraction_cache.load(copy, "paragraphs") == ["cached"]
+        assert extraction_cache.load(other, "paragraphs") is None
+
+    def test_entry_name_includes_extractor_version(self, tmp_path, cache_dir):
+        pdf = _write_pdf(tmp_path, "a.pdf")
+        extraction_cache.store(pdf, "paragraphs", [])
+
+        digest = extraction_cache.pdf_digest(pdf)
+        entry = (
+            cache_dir
+            / digest[:2]
+            / (
+                f"{digest}-v{extraction_cache.EXTRACTOR_VERSION}"
+                f"-{extraction_cache.config_fingerprint()}.json"
+            )
+        )
+        assert entry.exists()
+
+    def test_extraction_config_change_is_a_miss(self, tmp_path, cache_dir):
+        pdf = _write_pdf(tmp_path, "a.pdf")
+        base = {"translation": {"synthesis": {"min_paragraph_length": 50}}}
+        with patch("src.config.get_config", return_value=base):
+            extraction_cache.store(pdf, "paragraphs", ["cached"])
+            assert extraction_cache.load(pdf, "paragraphs") == ["cached"]
+
+        ruled = {
+            "translation": {
+                "synthesis": {
+                    "min_paragraph_length": 50,
+                    "watermark_rules": [{"name": "footer", "pattern": "Footer"}],
+                }
+            }
+        }
+        with patch("src.config.get_config", return_value=ruled):
+            assert extraction_cache.load(pdf, "paragraphs") is None
+
+        # Settings that don't shape extraction keep the entry
+        tuned = {
+            "translation": {
+                "synthesis": {"min_paragraph_length": 50, "temperature": 0.9}
+            }
+        }
+        with patch("src.config.get_config", return_value=tuned):
+            assert extraction_cache.load(pdf, "paragraphs") == ["cached"]
+
+    def test_disabled_by_empty_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("EXTRACTION_CACHE_DIR", "")
+        pdf = _write_pdf(tmp_path, "a.pdf")
+
+        extraction_cache.store(pdf, "paragraphs", ["x"])
+
+        assert extraction_cache.load(pdf, "paragraphs") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path, cache_dir):
+        pdf = _write_pdf(tmp_path, "a.pdf")
+        extraction_cache.store(pdf, "paragraphs", ["x"])
+        digest = extraction_cache.pdf_digest(pdf)
+        entry = next((cache_dir / digest[:2]).glob("*.json"))
+        entry.write_text("{not json", encoding="utf-8")
+
+        assert extraction_cache.load(pdf, "paragraphs") is None
+
+
+class TestExtractionCachePrune:
+    def test_prune_removes_least_recently_used(self, tmp_path, cache_dir):
+        pdfs = [
+            _write_pdf(tmp_path, f"{i}.pdf", f"%PDF-1.4 {i}".encode()) for i in range(3)
+        ]
+        for i, pdf in enumerate(pdfs):
+            extraction_cache.store(pdf, "paragraphs", ["x" * 1000])
+            entry = next(cache_dir.rglob(f"{extraction_cache.pdf_digest(pdf)}*"))
+            os.utime(entry, (1000 + i, 1000 + i))
+        # A hit marks the oldest entry as recently used
+        assert extraction_cache.load(pdfs[0], "paragraphs")
+
+        entry_size = entry.stat().st_size
+        removed = extraction_cache.prune(max_bytes=2 * entry_size)
+
+        assert removed == 1
+        assert extraction_cache.load(pdfs[0], "paragraphs")
+        assert extraction_cache.load(pdfs[1], "paragraphs") is None
+        assert extraction_cache.load(pdfs[2], "paragraphs")
+
+    def test_store_prunes_periodically(self, tmp_path, cache_dir, monkeypatch):
+        monkeypatch.setattr(extraction_cache, "PRUNE_EVERY", 2)
+        monkeypatch.setattr(extraction_cache, "_writes_since_prune", 0)
+        pdf = _write_pdf(tmp_path, "a.pdf")
+
+        with patch.object(extraction_cache, "prune") as mock_prune:
+            extraction_cache.store(pdf, "paragraphs", ["one"])
+            mock_prune.assert_not_called()
+            extraction_cache.store(pdf, "text:pdfminer", "one")
+
+        mock_prune.assert_called_once_with()
+
+
+class TestSharedParse:
+    def test_consumers_share_one_pdfminer_parse(self, tmp_path, cache_dir):
+        pdf = _write_pdf(tmp_path, "paper.pdf")
+        text = (
+            "This paper studies a problem in detail.\n"
+            "The method is described below.\n\n"
+            "Results improve on prior work."
+        )
+
+        with patch(
+            "pdfminer.high_level.extract_text", return_value=text
+        ) as mock_extract:
+            legacy = extract_from_pdf(pdf)
+            synthesis = extract_from_pdf_synthesis(pdf, engine="pdfminer")
+            again = extract_from_pdf_synthesis(pdf, engine="pdfminer")
+
+        assert mock_extract.call_count == 1
+        assert legacy
+        assert synthesis is not None
+        assert again == synthesis
+
+    def test_engines_cached_separately(self, tmp_path, cache_dir):
+        pdf = _write_pdf(tmp_path, "paper.pdf")
+
+        with patch("pdfminer.high_level.extract_text", return_value="miner"):
+            assert extract_pdf_text(pdf, "pdfminer", workers=1) == "miner"
+
+        assert extraction_cache.load(pdf, "text:pdfminer") == "miner"
+        assert extraction_cache.load(pdf, "text:pymupdf") is None
+
+
+class TestFigureExtractorCache:
+    def _pdf_with_image(self, tmp_path: Path) -> str:
+        import io
+        import random
+
+        fitz = pytest.importorskip("fitz")
+        Image = pytest.importorskip("PIL.Image")
+
+        rng = random.Random(7)
+        img = Image.new("RGB", (200, 200))
+        img.putdata(
+            [tuple(rng.randrange(256) for _ in range(3)) for _ in range(200 * 200)]
+        )
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_image(fitz.Rect(50, 50, 250, 250), stream=buf.getvalue())
+        path = tmp_path / "figs.pdf"
+        doc.save(str(path))
+        doc.close()
+        return str(path)
+
+    def test_second_run_skips_filtering(self, tmp_path, cache_dir):
+        from src.figure_pipeline.extractor import FigureExtractor
+
+        pdf = self._pdf_with_image(tmp_path)
+        extractor = FigureExtractor()
+
+        first = extractor.extract_all(pdf, str(tmp_path / "out1"))
+        assert len(first) == 1
+        assert extraction_cache.load(pdf, "images")[0]["page"] == 0
+
+        with patch.object(
+            FigureExtractor, "_has_visual_content", side_effect=AssertionError
+        ):
+            second = extractor.extract_all(pdf, str(tmp_path / "out2"))
+
+        assert len(second) == 1
+        assert second[0].location == first[0].location
+        assert (
+            Path(second[0].original_path).read_bytes()
+            == Path(first[0].original_path).read_bytes()
+        )
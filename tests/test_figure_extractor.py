@@ -0,0 +1,126 @@
+"""
+Tests for image filtering and placement lookup in FigureExtractor.extract_all().
+"""
+
+import io
+import random
+from unittest.mock import patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.figure_pipeline.extractor import FigureExtractor
+
+fitz = pytest.importorskip("fitz")
+
+
+@pytest.fixture(autouse=True)
+def no_extraction_cache(monkeypatch):
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", "")
+
+
+def _png(img: Image.Image) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _noisy_figure(seed: int, size=(400, 300)) -> bytes:
+    rng = random.Random(seed)
+    img = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(img)
+    for _ in range(size[0] * size[1] // 20):
+        xy = (rng.randrange(size[0]), rng.randrange(size[1]))
+        draw.point(xy, fill=tuple(rng.randrange(256) for _ in range(3)))
+    return _png(img)
+
+
+def _paper(tmp_path):
+    """Three pages, each with a small logo; one figure repeated on pages 1 and 3."""
+    doc = fitz.open()
+    logo_xref = shared_xref = 0
+    for page_num in range(3):
+        page = doc.new_page()
+        logo_rect = fitz.Rect(20, 20, 80, 50)
+        if logo_xref:
+            page.insert_image(logo_rect, xref=logo_xref)
+        else:
+            logo = _png(Image.new("RGB", (60, 30), (10, 40, 120)))
+            logo_xref = page.insert_image(logo_rect, stream=logo)
+        rect = fitz.Rect(100, 100 + page_num * 10, 500, 400 + page_num * 10)
+        if page_num == 1:
+            page.insert_image(rect, stream=_noisy_figure(2))
+        elif shared_xref:
+            page.insert_image(rect, xref=shared_xref)
+        else:
+            shared_xref = page.insert_image(rect, stream=_noisy_figure(1))
+    path = tmp_path / "paper.pdf"
+    doc.save(str(path))
+    doc.close()
+    return str(path), logo_xref, shared_xref
+
+
+class TestExtractAll:
+    def test_figures_pages_and_bboxes(self, tmp_path):
+        pdf, _, _ = _paper(tmp_path)
+
+        figures = FigureExtractor().extract_all(pdf, str(tmp_path / "out"))
+
+        assert [f.location.page_number for f in figures] == [1, 2]
+        with fitz.open(pdf) as doc:
+            expected = [
+                doc[0].get_image_info(xrefs=True)[1]["bbox"],
+                doc[1].get_image_info(xrefs=True)[1]["bbox"],
+            ]
+        for figure, bbox in zip(figures, expected, strict=True):
+            assert figure.location.bounding_box == pytest.approx(bbox, abs=1e-3)
+
+    def test_small_and_repeated_images_are_not_decoded(self, tmp_path):
+        pdf, logo_xref, shared_xref = _paper(tmp_path)
+        calls = []
+        original = fitz.Document.extract_image
+
+        def spy(doc, xref):
+            calls.append(xref)
+            return original(doc, xref)
+
+        with patch.object(fitz.Document, "extract_image", spy):
+            figures = FigureExtractor().extract_all(pdf, str(tmp_path / "out"))
+
+        assert len(figures) == 2
+        assert logo_xref not in calls
+        assert calls.count(shared_xref) == 1
+
+    def test_page_images_are_not_hashed_for_bboxes(self, tmp_path):
+        pdf, _, _ = _paper(tmp_path)
+
+        with patch.object(fitz.Page, "get_image_info", side_effect=AssertionError):
+            figures = FigureExtractor().extract_all(pdf, str(tmp_path / "out"))
+
+        assert len(figures) == 2
+        assert all(f.location.bounding_box for f in figures)
+
+
+class TestVisualContent:
+    def test_blank_image_has_low_variance(self):
+        blank = _png(Image.new("L", (300, 300), 200))
+
+        has_content, reason = FigureExtractor()._has_visual_content(blank)
+
+        assert not has_content
+        assert reason.startswith("low variance")
+
+    def test_single_edge_has_low_edge_density(self):
+        img = Image.new("L", (300, 300), 0)
+        img.paste(255, (0, 0, 150, 300))
+
+        has_content, reason = FigureExtractor()._has_visual_content(_png(img))
+
+        assert not has_content
+        assert reason.startswith("low edge density")
+
+    def test_noisy_figure_has_content(self):
+        assert FigureExtractor()._has_visual_content(_noisy_figure(0)) == (
+            True,
+            "passed",
+        )
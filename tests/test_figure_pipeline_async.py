@@ -0,0 +1,128 @@
+"""
+Tests for FigurePipeline with api_mode="async", against a local fake API.
+"""
+
+import json
+
+import pytest
+from PIL import Image
+
+from src.figure_pipeline import FigurePipeline
+from src.figure_pipeline.async_clients import AsyncGeminiClient, AsyncMoondreamClient
+from src.figure_pipeline.models import (
+    Figure,
+    FigureProcessingResult,
+    FigureType,
+    PipelineConfig,
+    ProcessingStatus,
+)
+from src.figure_pipeline.validator import (
+    COMBINED_VALIDATION_PROMPT,
+    FIGURE_TYPE_PROMPT,
+    HAS_CHINESE_PROMPT,
+    QA_CHINESE_PROMPT,
+    QA_COHERENT_PROMPT,
+    QA_ENGLISH_PROMPT,
+)
+from tests.fake_figure_api import FakeFigureAPI
+
+ANSWERS = {
+    COMBINED_VALIDATION_PROMPT: json.dumps(
+        {"readable": "yes", "has_chinese": "yes", "figure_type": "chart"}
+    ),
+    HAS_CHINESE_PROMPT: "no",
+    QA_ENGLISH_PROMPT: "yes",
+    QA_CHINESE_PROMPT: "no",
+    QA_COHERENT_PROMPT: "yes",
+    FIGURE_TYPE_PROMPT: "chart",
+}
+
+
+@pytest.fixture
+def figures(tmp_path):
+    original_dir = tmp_path / "original"
+    original_dir.mkdir()
+    figures = []
+    for number in range(30):
+        path = original_dir / f"fig_{number}.png"
+        Image.new("RGB", (64, 32), "white").save(path)
+        figures.append(
+            Figure(
+                paper_id="paper",
+                figure_number=str(number),
+                figure_type=FigureType.FIGURE,
+                status=ProcessingStatus.EXTRACTED,
+                original_path=str(path),
+            )
+        )
+    return figures
+
+
+def _pipeline(tmp_path, monkeypatch, api):
+    monkeypatch.setenv("GEMINI_API_KEY", "key")
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+    pipeline = FigurePipeline(
+        PipelineConfig(
+            api_mode="async",
+            dry_run=True,
+            chinese_prefilter="off",
+            translation_cache_dir=None,
+            temp_dir=str(tmp_path / "work"),
+        )
+    )
+
+    def clients(gate):
+        return (
+            AsyncGeminiClient(api_key="key", api_base=api.gemini_base, gate=gate),
+            AsyncMoondreamClient(
+                api_key="key", endpoint=api.moondream_endpoint, gate=gate
+            ),
+        )
+
+    monkeypatch.setattr(pipeline, "_async_clients", clients)
+    return pipeline
+
+
+class TestAsyncFigurePipeline:
+    def test_steps_run_through_async_clients(self, tmp_path, monkeypatch, figures):
+        output_dir = tmp_path / "translated"
+        output_dir.mkdir()
+        result = FigureProcessingResult(paper_id="paper", total_figures=30)
+
+        with FakeFigureAPI(latency=0.2, answer_fn=ANSWERS.get) as api:
+            pipeline = _pipeline(tmp_path, monkeypatch, api)
+            pipeline._process_figures(figures, "paper", str(output_dir), 2, result)
+
+        assert (result.validated, result.translated, result.failed) == (30, 30, 0)
+        assert all(fig.status == ProcessingStatus.TRANSLATED for fig in figures)
+        assert all(fig.qa_translation_passed for fig in figures)
+        assert all(fig.qa_figure_type == "chart" for fig in figures)
+        paths = [path for path, _, _ in api.requests]
+        # validate + translate + residual check + five QA queries per figure
+        assert paths.count("/v1/query") == 30 * 7
+        assert len(paths) == 30 * 8
+        # Not held to max_concurrent=2 per step by threads
+        assert api.peak_in_flight > 6
+
+    def test_failed_translation_marks_figure_failed(
+        self, tmp_path, monkeypatch, figures
+    ):
+        output_dir = tmp_path / "translated"
+        output_dir.mkdir()
+        result = FigureProcessingResult(paper_id="paper", total_figures=1)
+
+        with FakeFigureAPI(answer_fn=ANSWERS.get) as api:
+            pipeline = _pipeline(tmp_path, monkeypatch, api)
+
+            def answer(question):
+                # Validation succeeds, then Gemini rejects the image
+                api.fail_next = [(400, "Invalid image")]
+                return ANSWERS.get(question)
+
+            api.answer_fn = answer
+            pipeline._process_figures(figures[:1], "paper", str(output_dir), 2, result)
+
+        fig = figures[0]
+        assert fig.status == ProcessingStatus.FAILED
+        assert fig.error_message == "Translation returned None after retries"
+        assert (result.validated, result.translated, result.failed) == (1, 0, 1)
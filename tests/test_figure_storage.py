@@ -1,11 +1,17 @@
 """Tests for figure pipeline storage module."""
 from __future__ import annotations
 
+import hashlib
+import io
+import json
 import os
 import tempfile
+import threading
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
+from b2sdk.v2.exception import FileNotPresent
 
 from src.figure_pipeline.models import PipelineConfig
 
@@ -242,12 +248,92 @@ class TestFigureStorageUpload:
                     temp_path = f.name
 
                 try:
-                    result = storage.upload(temp_path, "figures/test/fig_1.png")
+                    with patch("src.figure_pipeline.storage.time.sleep"):
+                        result = storage.upload(temp_path, "figures/test/fig_1.png")
                     assert result is None  # Should not raise, just return None
+                    assert mock_bucket.upload_local_file.call_count == 3
                 finally:
                     os.unlink(temp_path)
 
 
+class TestFigureStorageUploadReliability:
+    """Tests for upload retries, checksum verification and batching."""
+
+    @pytest.fixture
+    def storage(self):
+        from src.figure_pipeline.storage import FigureStorage
+
+        storage = FigureStorage(PipelineConfig())
+        storage._bucket = MagicMock()
+        storage._bucket.name = "chinaxiv"
+        return storage
+
+    @pytest.fixture
+    def figure_file(self, tmp_path):
+        path = tmp_path / "fig_1.png"
+        path.write_bytes(b"fake image data")
+        return str(path)
+
+    def test_sends_sha1_and_retries_transient_failure(self, storage, figure_file):
+        sha1 = hashlib.sha1(b"fake image data").hexdigest()
+        storage.bucket.upload_local_file.side_effect = [
+            Exception("connection reset"),
+            MagicMock(content_sha1=sha1),
+        ]
+
+        with patch("src.figure_pipeline.storage.time.sleep") as sleep:
+            url = storage.upload(figure_file, "figures/p/fig_1.png")
+
+        assert url.endswith("/chinaxiv/figures/p/fig_1.png")
+        assert storage.bucket.upload_local_file.call_args.kwargs["sha1_sum"] == sha1
+        sleep.assert_called_once()
+
+    def test_checksum_mismatch_is_uploaded_again(self, storage, figure_file):
+        storage.bucket.upload_local_file.side_effect = [
+            MagicMock(content_sha1="0" * 40),
+            MagicMock(content_sha1="none"),  # large file: no whole-file SHA-1
+        ]
+
+        with patch("src.figure_pipeline.storage.time.sleep"):
+            url = storage.upload(figure_file, "figures/p/fig_1.png")
+
+        assert url is not None
+        assert storage.bucket.upload_local_file.call_count == 2
+
+    def test_upload_many_runs_concurrently_in_order(self, storage, tmp_path):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def upload_local_file(local_file, file_name, sha1_sum):
+            # Only returns once all four uploads are in flight together
+            barrier.wait()
+            return MagicMock(content_sha1=sha1_sum)
+
+        storage.bucket.upload_local_file.side_effect = upload_local_file
+        items = []
+        for i in range(4):
+            path = tmp_path / f"fig_{i}.png"
+            path.write_bytes(f"image {i}".encode())
+            items.append((str(path), f"figures/p/fig_{i}.png"))
+
+        urls = storage.upload_many(items)
+
+        assert [url.rsplit("/", 1)[-1] for url in urls] == [
+            "fig_0.png",
+            "fig_1.png",
+            "fig_2.png",
+            "fig_3.png",
+        ]
+
+    def test_http_pool_matches_upload_concurrency(self):
+        from src.figure_pipeline.storage import FigureStorage
+
+        storage = FigureStorage(PipelineConfig(upload_concurrency=24))
+
+        adapter = storage._http_session().get_adapter("https://api.backblazeb2.com")
+
+        assert adapter._pool_maxsize == 24
+
+
 class TestFigureStorageManifest:
     """Tests for manifest operations."""
 
@@ -291,7 +377,6 @@ class TestFigureStorageManifest:
 
                 # Simulate no existing manifest
                 mock_bucket.download_file_by_name.side_effect = Exception("Not found")
-                mock_bucket.upload_local_file.return_value = MagicMock()
 
                 from src.figure_pipeline.storage import FigureStorage
 
@@ -304,4 +389,300 @@ class TestFigureStorageManifest:
                 )
 
                 assert result is True
+                # Only the paper's own shard is written; nothing is read
+                mock_bucket.download_file_by_name.assert_not_called()
                 mock_bucket.upload_local_file.assert_called_once()
+                key = mock_bucket.upload_local_file.call_args.kwargs["file_name"]
+                assert key == "figures/manifests/chinaxiv-202201.00001.json"
+
+
+class FakeBucket:
+    """In-memory stand-in for the b2sdk bucket calls the manifest uses."""
+
+    def __init__(self):
+        self.files = {}
+        self.downloads = []
+        self.fail_downloads = set()
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def upload_local_file(self, local_file, file_name):
+        with open(local_file, "rb") as f:
+            data = f.read()
+        with self._lock:
+            self._clock += 1
+            self.files[file_name] = (data, self._clock)
+
+    def download_file_by_name(self, file_name):
+        if file_name in self.fail_downloads:
+            raise ConnectionError(f"Connection reset: {file_name}")
+        if file_name not in self.files:
+            raise FileNotPresent(file_id_or_name=file_name)
+        self.downloads.append(file_name)
+        data = self.files[file_name][0]
+
+        def save_to(path):
+            with open(path, "wb") as f:
+                f.write(data)
+
+        return MagicMock(save_to=save_to)
+
+    def _info(self, file_name):
+        return MagicMock(
+            id_=file_name,
+            file_name=file_name,
+            upload_timestamp=self.files[file_name][1],
+        )
+
+    def ls(self, folder_to_list):
+        for name in sorted(self.files):
+            if name.startswith(folder_to_list):
+                yield self._info(name), None
+
+    def get_file_info_by_name(self, file_name):
+        if file_name not in self.files:
+            raise FileNotPresent(file_id_or_name=file_name)
+        return self._info(file_name)
+
+    def delete_file_version(self, file_id, file_name):
+        del self.files[file_name]
+
+
+class TestFigureManifestShards:
+    """Tests for per-paper manifest shards and compaction."""
+
+    @pytest.fixture
+    def storage(self):
+        from src.figure_pipeline.storage import FigureStorage
+
+        storage = FigureStorage(PipelineConfig())
+        storage._bucket = FakeBucket()
+        return storage
+
+    def test_concurrent_papers_do_not_drop_each_other(self, storage):
+        papers = [f"chinaxiv-2024{i:02d}.00001" for i in range(20)]
+        threads = [
+            threading.Thread(
+                target=storage.update_manifest,
+                args=(pid, [{"number": "1", "url": f"https://b2/{pid}/fig_1_en.png"}]),
+            )
+            for pid in papers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        manifest = storage.compact_manifest()
+
+        assert manifest["generation"] == 1
+        assert sorted(manifest["papers"]) == papers
+        assert storage.download_manifest() == manifest
+
+    def test_compaction_is_incremental(self, storage):
+        figures = [{"number": "1", "url": "https://b2/a/fig_1_en.png"}]
+        storage.update_manifest("a", figures)
+        storage.update_manifest("b", figures)
+        storage.compact_manifest()
+        storage.bucket.downloads.clear()
+
+        storage.update_manifest("b", figures * 2)
+        manifest = storage.compact_manifest()
+
+        assert manifest["generation"] == 2
+        assert manifest["papers"]["b"]["figure_count"] == 2
+        assert storage.bucket.downloads == [
+            "figures/manifest.json",
+            "figures/manifests/b.json",
+        ]
+
+    def test_legacy_entries_kept_and_deleted_shards_dropped(self, storage):
+        legacy = {"figure_count": 1, "figures": [{"number": "1", "url": "u"}]}
+        storage.upload_manifest({"updated_at": "", "papers": {"legacy": legacy}})
+        storage.update_manifest("a", [{"number": "1", "url": "https://b2/a.png"}])
+        storage.compact_manifest()
+
+        storage.delete_figures("a")
+        manifest = storage.compact_manifest()
+
+        assert manifest["papers"] == {"legacy": legacy}
+        assert manifest["generation"] == 2
+
+    def test_reader_prefers_shard_over_index(self, storage):
+        storage.update_manifest("a", [{"number": "1", "url": "old"}])
+        storage.compact_manifest()
+        storage.update_manifest("a", [{"number": "1", "url": "new"}])
+
+        assert storage.get_paper_manifest("a")["figures"][0]["url"] == "new"
+        assert storage.download_manifest()["papers"]["a"]["figures"][0]["url"] == "old"
+
+        del storage.bucket.files["figures/manifests/a.json"]
+        assert storage.get_paper_manifest("a")["figures"][0]["url"] == "old"
+        assert storage.get_paper_manifest("missing") is None
+
+    def test_deleting_legacy_paper_drops_it_from_index(self, storage):
+        legacy = {"figure_count": 1, "figures": [{"number": "1", "url": "u"}]}
+        storage.upload_manifest({"updated_at": "", "papers": {"legacy": legacy}})
+
+        storage.delete_figures("legacy")
+        manifest = storage.compact_manifest()
+
+        assert manifest["papers"] == {}
+        assert storage.get_paper_manifest("legacy") is None
+
+    def test_transient_index_error_aborts_compaction(self, storage):
+        legacy = {"figure_count": 1, "figures": [{"number": "1", "url": "u"}]}
+        storage.upload_manifest(
+            {"generation": 7, "updated_at": "", "papers": {"legacy": legacy}}
+        )
+        storage.update_manifest("a", [{"number": "1", "url": "https://b2/a.png"}])
+        storage.bucket.fail_downloads.add("figures/manifest.json")
+
+        assert storage.compact_manifest() is None
+
+        storage.bucket.fail_downloads.clear()
+        manifest = storage.download_manifest()
+        assert manifest["generation"] == 7
+        assert manifest["papers"] == {"legacy": legacy}
+
+
+class FakeS3:
+    """boto3 S3 client calls the manifest readers make, over a FakeBucket."""
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+
+    def get_object(self, Bucket, Key):
+        from botocore.exceptions import ClientError
+
+        if Key not in self.bucket.files:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.bucket.files[Key][0])}
+
+    def get_paginator(self, operation):
+        files = self.bucket.files
+
+        def paginate(Bucket, Prefix):
+            yield {
+                "Contents": [
+                    {
+                        "Key": key,
+                        "LastModified": datetime.fromtimestamp(
+                            ts / 1000, timezone.utc
+                        ),
+                    }
+                    for key, (_, ts) in sorted(files.items())
+                    if key.startswith(Prefix)
+                ]
+            }
+
+        return MagicMock(paginate=paginate)
+
+
+class TestManifestReaders:
+    """The PDF and DB readers see a paper's shard before compaction."""
+
+    PAPER = "chinaxiv-202401.00001"
+
+    @pytest.fixture
+    def storage(self):
+        from src.figure_pipeline.storage import FigureStorage
+
+        storage = FigureStorage(PipelineConfig())
+        storage._bucket = FakeBucket()
+        return storage
+
+    def _process_paper(self, storage, tmp_path):
+        from PIL import Image
+
+        from src.figure_pipeline import FigurePipeline
+        from src.figure_pipeline.models import Figure, FigureType, ProcessingStatus
+
+        def extract_all(pdf_path, output_dir):
+            path = os.path.join(output_dir, "fig_1.png")
+            Image.new("RGB", (32, 32), "white").save(path)
+            return [
+                Figure(
+                    paper_id=self.PAPER,
+                    figure_number="1",
+                    figure_type=FigureType.FIGURE,
+                    status=ProcessingStatus.EXTRACTED,
+                    original_path=path,
+                )
+            ]
+
+        def translate(image_path, figure_number, paper_id, output_dir, qa_check):
+            out = os.path.join(output_dir, f"fig_{figure_number}_en.png")
+            Image.new("RGB", (32, 32), "white").save(out)
+            return out
+
+        pipeline = FigurePipeline(
+            PipelineConfig(
+                chinese_prefilter="off",
+                translation_cache_dir=None,
+                temp_dir=str(tmp_path / "work"),
+            )
+        )
+        pipeline._storage = storage
+        pipeline._extractor = MagicMock(extract_all=extract_all)
+        pipeline._validator = MagicMock()
+        pipeline._validator.validate.return_value = {
+            "readable": True,
+            "has_chinese": True,
+            "figure_type": "chart",
+        }
+        pipeline._validator.qa_translation.return_value = {"passed": True}
+        pipeline._translator = MagicMock()
+        pipeline._translator.translate.side_effect = translate
+        with (
+            patch.object(pipeline, "_find_pdf", return_value="paper.pdf"),
+            patch.object(
+                storage,
+                "upload",
+                side_effect=lambda path, key: f"https://b2.example.com/{key}",
+            ),
+        ):
+            result = pipeline.process_paper(self.PAPER)
+        assert result.translated == 1
+
+    def test_pdf_built_right_after_figures_has_them(
+        self, storage, tmp_path, monkeypatch
+    ):
+        import scripts.generate_english_pdfs as pdfs
+        from src.orchestrator import run_pdf_generation
+
+        self._process_paper(storage, tmp_path)
+        monkeypatch.chdir(tmp_path)
+        translation = tmp_path / "data" / "translated" / f"{self.PAPER}.json"
+        translation.parent.mkdir(parents=True)
+        translation.write_text(json.dumps({"id": self.PAPER}))
+        generate = MagicMock(return_value=(True, 1))
+
+        with (
+            patch.object(pdfs, "check_pdf_tools", return_value="xelatex"),
+            patch.object(pdfs, "get_s3_client", return_value=FakeS3(storage.bucket)),
+            patch.object(pdfs, "generate_pdf_for_paper", generate),
+        ):
+            assert run_pdf_generation(self.PAPER)
+
+        # No compaction ran: the figures come from the paper's shard
+        assert "figures/manifest.json" not in storage.bucket.files
+        figures = generate.call_args.kwargs["figure_manifest"]["papers"][self.PAPER]
+        assert figures["figure_count"] == 1
+        assert figures["figures"][0]["url"].endswith("/fig_1_en.png")
+
+    def test_db_sync_applies_shards_newer_than_index(self, storage):
+        from scripts.sync_figures_from_b2 import apply_pending_shards
+
+        storage.update_manifest("a", [{"number": "1", "url": "old"}])
+        storage.update_manifest("b", [{"number": "1", "url": "b"}])
+        storage.compact_manifest()
+        storage.update_manifest("a", [{"number": "1", "url": "new"}])
+        storage.update_manifest("c", [{"number": "1", "url": "c"}])
+        storage.delete_figures("b")
+        s3 = FakeS3(storage.bucket)
+        manifest = storage.download_manifest()
+
+        assert apply_pending_shards(s3, manifest) == 3
+        assert sorted(manifest["papers"]) == ["a", "c"]
+        assert manifest["papers"]["a"]["figures"][0]["url"] == "new"
@@ -0,0 +1,203 @@
+"""
+Tests for per-figure streaming through validate -> translate -> QA -> upload.
+"""
+
+import os
+import threading
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from src.figure_pipeline import FigurePipeline
+from src.figure_pipeline.models import (
+    Figure,
+    FigureProcessingResult,
+    FigureType,
+    PipelineConfig,
+    ProcessingStatus,
+)
+from src.figure_pipeline.rate_limiter import get_rate_limiter
+
+
+@pytest.fixture
+def pipeline_mocks(tmp_path):
+    get_rate_limiter().reset()
+    with (
+        patch.object(FigurePipeline, "_find_pdf") as find_pdf,
+        patch.object(FigurePipeline, "extractor", new_callable=PropertyMock) as ext,
+        patch.object(FigurePipeline, "validator", new_callable=PropertyMock) as val,
+        patch.object(FigurePipeline, "translator", new_callable=PropertyMock) as tr,
+        patch.object(FigurePipeline, "storage", new_callable=PropertyMock) as st,
+    ):
+        find_pdf.return_value = str(tmp_path / "paper.pdf")
+
+        def extract_all(pdf_path, output_dir):
+            figures = []
+            for number in ("1", "2"):
+                path = os.path.join(output_dir, f"fig_{number}.png")
+                with open(path, "wb") as f:
+                    f.write(b"PNG")
+                figures.append(
+                    Figure(
+                        paper_id="paper",
+                        figure_number=number,
+                        figure_type=FigureType.FIGURE,
+                        status=ProcessingStatus.EXTRACTED,
+                        original_path=path,
+                    )
+                )
+            return figures
+
+        ext.return_value = MagicMock(extract_all=extract_all)
+        validator = MagicMock()
+        validator.validate.return_value = {
+            "readable": True,
+            "has_chinese": True,
+            "figure_type": "chart",
+        }
+        validator.qa_translation.return_value = {"passed": True}
+        val.return_value = validator
+
+        def translate(image_path, figure_number, paper_id, output_dir, qa_check):
+            out = os.path.join(output_dir, f"fig_{figure_number}_en.png")
+            with open(out, "wb") as f:
+                f.write(b"PNG")
+            return out
+
+        translator = MagicMock()
+        translator.translate.side_effect = translate
+        tr.return_value = translator
+
+        storage = MagicMock()
+        storage.upload.side_effect = lambda path, key: f"https://b2.example.com/{key}"
+        st.return_value = storage
+
+        yield validator, translator, storage
+
+
+def _config(tmp_path, **kwargs):
+    return PipelineConfig(
+        chinese_prefilter="off",
+        translation_cache_dir=None,
+        temp_dir=str(tmp_path / "work"),
+        **kwargs,
+    )
+
+
+class TestFigureStreaming:
+    def test_slow_figure_does_not_hold_back_others(self, pipeline_mocks, tmp_path):
+        validator, translator, storage = pipeline_mocks
+        other_uploaded = threading.Event()
+        translate = translator.translate.side_effect
+
+        def slow_translate(image_path, figure_number, paper_id, output_dir, qa_check):
+            if figure_number == "1":
+                # In barrier phases figure 2 could not be QA'd or uploaded
+                # before every translation had finished
+                assert other_uploaded.wait(timeout=10)
+            return translate(image_path, figure_number, paper_id, output_dir, qa_check)
+
+        def upload(path, key):
+            if key.endswith("translated/fig_2_en.png"):
+                other_uploaded.set()
+            return f"https://b2.example.com/{key}"
+
+        translator.translate.side_effect = slow_translate
+        storage.upload.side_effect = upload
+
+        result = FigurePipeline(_config(tmp_path)).process_paper("paper")
+
+        assert result.translated == 2
+        assert result.uploaded == 2
+        assert validator.qa_translation.call_count == 2
+
+    def test_original_uploads_while_figure_translates(self, pipeline_mocks, tmp_path):
+        _, translator, storage = pipeline_mocks
+        originals_uploaded = threading.Barrier(3, timeout=10)
+        translate = translator.translate.side_effect
+
+        def upload(path, key):
+            if "/original/" in key:
+                originals_uploaded.wait()
+            return f"https://b2.example.com/{key}"
+
+        def slow_translate(image_path, figure_number, paper_id, output_dir, qa_check):
+            if figure_number == "1":
+                # Figure 1 is still translating when both originals are uploaded
+                originals_uploaded.wait()
+            return translate(image_path, figure_number, paper_id, output_dir, qa_check)
+
+        storage.upload.side_effect = upload
+        translator.translate.side_effect = slow_translate
+
+        result = FigurePipeline(_config(tmp_path)).process_paper("paper")
+
+        assert result.uploaded == 2
+        assert storage.upload.call_count == 4
+
+    def test_manifest_written_once_after_all_figures(self, pipeline_mocks, tmp_path):
+        _, _, storage = pipeline_mocks
+
+        FigurePipeline(_config(tmp_path)).process_paper("paper")
+
+        storage.update_manifest.assert_called_once()
+        paper_id, entries = storage.update_manifest.call_args[0]
+        assert paper_id == "paper"
+        assert sorted(e["number"] for e in entries) == ["1", "2"]
+        assert storage.upload.call_count == 4
+
+    def test_error_in_one_figure_does_not_stop_the_other(
+        self, pipeline_mocks, tmp_path
+    ):
+        validator, _, _ = pipeline_mocks
+
+        def qa_translation(original_path, translated_path):
+            if translated_path.endswith("fig_1_en.png"):
+                raise RuntimeError("QA crashed")
+            return {"passed": True}
+
+        validator.qa_translation.side_effect = qa_translation
+
+        result = FigurePipeline(_config(tmp_path, dry_run=True)).process_paper("paper")
+
+        by_number = {f.figure_number: f for f in result.figures}
+        assert by_number["1"].status == ProcessingStatus.FAILED
+        assert by_number["1"].error_message == "QA crashed"
+        assert by_number["2"].qa_translation_passed is True
+        assert (result.validated, result.translated, result.failed) == (2, 2, 1)
+
+    def test_worker_threads_bounded_by_step_concurrency(self, pipeline_mocks, tmp_path):
+        _, translator, _ = pipeline_mocks
+        threads = set()
+        translate = translator.translate.side_effect
+
+        def recording_translate(
+            image_path, figure_number, paper_id, output_dir, qa_check
+        ):
+            threads.add(threading.get_ident())
+            return translate(image_path, figure_number, paper_id, output_dir, qa_check)
+
+        translator.translate.side_effect = recording_translate
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        figures = []
+        for number in range(20):
+            path = output_dir / f"fig_{number}.png"
+            path.write_bytes(b"PNG")
+            figures.append(
+                Figure(
+                    paper_id="paper",
+                    figure_number=str(number),
+                    figure_type=FigureType.FIGURE,
+                    status=ProcessingStatus.EXTRACTED,
+                    original_path=str(path),
+                )
+            )
+        result = FigureProcessingResult(paper_id="paper", total_figures=20)
+        pipeline = FigurePipeline(_config(tmp_path, dry_run=True))
+
+        pipeline._process_figures(figures, "paper", str(output_dir), 1, result)
+
+        assert result.translated == 20
+        # One worker per slot of the validate, translate and QA steps
+        assert len(threads) <= 3
@@ -0,0 +1,229 @@
+"""
+Tests for Moondream figure validation (src/figure_pipeline/validator.py).
+"""
+
+import threading
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from src.figure_pipeline import FigurePipeline, PipelineConfig
+from src.figure_pipeline.models import (
+    Figure,
+    FigureProcessingResult,
+    FigureType,
+    ProcessingStatus,
+)
+from src.figure_pipeline.prefilter import PrefilterVerdict
+from src.figure_pipeline.rate_limiter import get_rate_limiter
+from src.figure_pipeline.validator import (
+    COMBINED_VALIDATION_PROMPT,
+    FigureValidator,
+    parse_combined_answer,
+)
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    from PIL import Image
+
+    path = tmp_path / "fig.png"
+    Image.new("RGB", (32, 32), "white").save(path)
+    return str(path)
+
+
+def _validator(mode: str, answers):
+    validator = FigureValidator(PipelineConfig(validation_mode=mode))
+    validator._model = MagicMock()
+    validator._model.query.side_effect = [{"answer": a} for a in answers]
+    return validator
+
+
+class TestParseCombinedAnswer:
+    def test_json_answer(self):
+        answer = '{"readable": "yes", "has_chinese": "no", "figure_type": "Chart"}'
+
+        assert parse_combined_answer(answer) == {
+            "readable": True,
+            "has_chinese": False,
+            "figure_type": "chart",
+        }
+
+    def test_json_in_code_fence_with_booleans(self):
+        answer = '```json\n{"readable": true, "has_chinese": true, "figure_type": "table"}\n```'
+
+        assert parse_combined_answer(answer)["has_chinese"] is True
+
+    def test_key_value_lines(self):
+        answer = "readable: yes\nhas_chinese: yes\nfigure_type: diagram"
+
+        assert parse_combined_answer(answer) == {
+            "readable": True,
+            "has_chinese": True,
+            "figure_type": "diagram",
+        }
+
+    def test_unknown_figure_type_is_other(self):
+        answer = '{"readable": "yes", "has_chinese": "no", "figure_type": "map"}'
+
+        assert parse_combined_answer(answer)["figure_type"] == "other"
+
+    def test_missing_answer_returns_none(self):
+        assert parse_combined_answer("It is a chart.") is None
+        assert parse_combined_answer('{"readable": "yes"}') is None
+
+
+class TestCombinedValidation:
+    def test_one_query_per_image(self, image_path):
+        validator = _validator(
+            "combined",
+            ['{"readable": "yes", "has_chinese": "yes", "figure_type": "graph"}'],
+        )
+
+        result = validator.validate(image_path)
+
+        assert result == {"readable": True, "has_chinese": True, "figure_type": "graph"}
+        assert validator._model.query.call_count == 1
+        assert validator._model.query.call_args[0][1] == COMBINED_VALIDATION_PROMPT
+
+    def test_unparseable_answer_falls_back_to_separate(self, image_path):
+        validator = _validator("combined", ["not sure", "yes", "no", "photo"])
+
+        result = validator.validate(image_path)
+
+        assert result == {
+            "readable": True,
+            "has_chinese": False,
+            "figure_type": "photo",
+        }
+        assert validator._model.query.call_count == 4
+
+    def test_separate_mode_uses_three_queries(self, image_path):
+        validator = _validator("separate", ["yes", "yes", "table"])
+
+        result = validator.validate(image_path)
+
+        assert result["figure_type"] == "table"
+        assert validator._model.query.call_count == 3
+
+    def test_rate_limit_backs_off_and_retries(self, image_path):
+        error = Exception("429 Too Many Requests")
+        error.status_code = 429
+        validator = FigureValidator(PipelineConfig())
+        validator._model = MagicMock()
+        validator._model.query.side_effect = [
+            error,
+            {
+                "answer": '{"readable": "yes", "has_chinese": "no", "figure_type": "chart"}'
+            },
+        ]
+        limiter = MagicMock()
+        limiter.on_rate_limit.return_value = 0
+
+        with patch(
+            "src.figure_pipeline.rate_limiter.get_rate_limiter", return_value=limiter
+        ):
+            result = validator.validate(image_path)
+
+        assert result["figure_type"] == "chart"
+        limiter.on_rate_limit.assert_called_once()
+
+
+class TestResidualChineseCheck:
+    def test_has_chinese_is_one_query(self, image_path):
+        validator = _validator("separate", ["Yes, there is Chinese text."])
+
+        assert validator.has_chinese(image_path) is True
+        assert validator._model.query.call_count == 1
+
+    @patch.object(FigurePipeline, "prefilter", new_callable=PropertyMock)
+    @patch.object(FigurePipeline, "validator", new_callable=PropertyMock)
+    def test_confident_prefilter_skips_query(
+        self, mock_validator_prop, mock_prefilter_prop, image_path
+    ):
+        mock_prefilter_prop.return_value = MagicMock(
+            method="glyph",
+            check=MagicMock(return_value=PrefilterVerdict(True, "glyph")),
+        )
+        validator = MagicMock()
+        mock_validator_prop.return_value = validator
+
+        pipeline = FigurePipeline(PipelineConfig(dry_run=True))
+
+        assert pipeline._has_residual_chinese(image_path) is False
+        validator.has_chinese.assert_not_called()
+        validator.validate.assert_not_called()
+
+    @patch.object(FigurePipeline, "prefilter", new_callable=PropertyMock)
+    @patch.object(FigurePipeline, "validator", new_callable=PropertyMock)
+    def test_uncertain_prefilter_asks_one_question(
+        self, mock_validator_prop, mock_prefilter_prop, image_path
+    ):
+        mock_prefilter_prop.return_value = MagicMock(
+            method="glyph",
+            check=MagicMock(return_value=PrefilterVerdict(False, "glyph")),
+        )
+        validator = MagicMock()
+        validator.has_chinese.return_value = True
+        mock_validator_prop.return_value = validator
+
+        pipeline = FigurePipeline(PipelineConfig(dry_run=True))
+
+        assert pipeline._has_residual_chinese(image_path) is True
+        validator.has_chinese.assert_called_once_with(image_path)
+        validator.validate.assert_not_called()
+
+
+class TestParallelValidation:
+    @patch.object(FigurePipeline, "translator", new_callable=PropertyMock)
+    @patch.object(FigurePipeline, "validator", new_callable=PropertyMock)
+    def test_validates_figures_concurrently(
+        self, mock_validator_prop, mock_translator_prop, tmp_path
+    ):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def validate(path):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            threading.Event().wait(0.01)
+            with lock:
+                state["active"] -= 1
+            return {"readable": True, "has_chinese": path.endswith("0.png")}
+
+        mock_validator = MagicMock()
+        mock_validator.validate.side_effect = validate
+        mock_validator_prop.return_value = mock_validator
+
+        figures = []
+        for i in range(20):
+            path = tmp_path / f"fig{i}.png"
+            path.write_bytes(b"PNG")
+            figures.append(
+                Figure(
+                    paper_id="p",
+                    figure_number=str(i),
+                    figure_type=FigureType.FIGURE,
+                    status=ProcessingStatus.EXTRACTED,
+                    original_path=str(path),
+                )
+            )
+
+        mock_translator_prop.return_value = MagicMock()
+
+        get_rate_limiter().reset()
+        config = PipelineConfig(
+            dry_run=True, chinese_prefilter="off", translation_cache_dir=None
+        )
+        pipeline = FigurePipeline(config)
+        result = FigureProcessingResult(paper_id="p")
+        pipeline._process_figures(
+            figures, "p", str(tmp_path / "out"), max_concurrent=4, result=result
+        )
+
+        assert mock_validator.validate.call_count == 20
+        assert 1 < state["peak"] <= 4
+        assert result.validated == 20
+        assert figures[10].qa_has_chinese is True
+        assert figures[11].qa_has_chinese is False
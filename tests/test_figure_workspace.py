@@ -0,0 +1,128 @@
+"""
+Tests for per-paper figure workspaces (src/figure_pipeline/workspace.py).
+"""
+
+import os
+import threading
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from src.figure_pipeline import FigurePipeline
+from src.figure_pipeline.models import (
+    Figure,
+    FigureType,
+    PipelineConfig,
+    ProcessingStatus,
+)
+from src.figure_pipeline.workspace import PaperWorkspace
+
+
+class TestPaperWorkspace:
+    def test_removed_on_success(self, tmp_path):
+        with PaperWorkspace(str(tmp_path), "chinaxiv-202510.00001") as workspace:
+            path = workspace.path
+            with open(os.path.join(workspace.original_dir, "fig_1.png"), "wb") as f:
+                f.write(b"PNG")
+
+        assert os.path.basename(path).startswith("chinaxiv-202510.00001-")
+        assert not os.path.exists(path)
+
+    def test_kept_on_exception(self, tmp_path):
+        with pytest.raises(ValueError):
+            with PaperWorkspace(str(tmp_path), "paper") as workspace:
+                path = workspace.translated_dir
+                raise ValueError("boom")
+
+        assert os.path.isdir(path)
+
+    def test_kept_when_marked_or_configured(self, tmp_path):
+        with PaperWorkspace(str(tmp_path), "paper") as marked:
+            marked.keep("1 figures failed")
+        with PaperWorkspace(str(tmp_path), "paper", keep=True) as configured:
+            pass
+
+        assert os.path.isdir(marked.path)
+        assert os.path.isdir(configured.path)
+
+    def test_same_paper_gets_separate_directories(self, tmp_path):
+        with PaperWorkspace(str(tmp_path), "a/b") as first:
+            with PaperWorkspace(str(tmp_path), "a/b") as second:
+                assert first.path != second.path
+                assert os.path.dirname(first.path) == str(tmp_path)
+
+
+class TestPipelineWorkspaces:
+    @patch.object(FigurePipeline, "_find_pdf")
+    @patch.object(FigurePipeline, "extractor", new_callable=PropertyMock)
+    @patch.object(FigurePipeline, "validator", new_callable=PropertyMock)
+    @patch.object(FigurePipeline, "translator", new_callable=PropertyMock)
+    def test_concurrent_papers_do_not_share_files(
+        self,
+        mock_translator_prop,
+        mock_validator_prop,
+        mock_extractor_prop,
+        mock_find_pdf,
+        tmp_path,
+    ):
+        mock_find_pdf.side_effect = lambda paper_id: str(tmp_path / f"{paper_id}.pdf")
+        both_extracted = threading.Barrier(2, timeout=10)
+        dirs = {}
+
+        def extract_all(pdf_path, output_dir):
+            paper_id = os.path.basename(pdf_path)[: -len(".pdf")]
+            dirs[paper_id] = output_dir
+            path = os.path.join(output_dir, "fig_1.png")
+            with open(path, "w") as f:
+                f.write(paper_id)
+            both_extracted.wait()
+            return [
+                Figure(
+                    paper_id=paper_id,
+                    figure_number="1",
+                    figure_type=FigureType.FIGURE,
+                    status=ProcessingStatus.EXTRACTED,
+                    original_path=path,
+                )
+            ]
+
+        mock_extractor_prop.return_value = MagicMock(extract_all=extract_all)
+        seen = {}
+
+        def validate(path):
+            with open(path) as f:
+                seen[path] = f.read()
+            return {"readable": True, "has_chinese": True, "figure_type": "chart"}
+
+        validator = MagicMock()
+        validator.validate.side_effect = validate
+        validator.qa_translation.return_value = {"passed": True}
+        mock_validator_prop.return_value = validator
+
+        def translate(image_path, figure_number, paper_id, output_dir, qa_check):
+            if paper_id == "paper-b":
+                return None
+            out = os.path.join(output_dir, f"fig_{figure_number}_en.png")
+            with open(out, "w") as f:
+                f.write(paper_id)
+            return out
+
+        translator = MagicMock()
+        translator.translate.side_effect = translate
+        mock_translator_prop.return_value = translator
+
+        config = PipelineConfig(
+            dry_run=True, chinese_prefilter="off", temp_dir=str(tmp_path / "work")
+        )
+        results = FigurePipeline(config).process_batch(
+            ["paper-a", "paper-b"], workers=2
+        )
+
+        assert sorted(seen.values()) == ["paper-a", "paper-b"]
+        assert dirs["paper-a"] != dirs["paper-b"]
+        by_id = {r.paper_id: r for r in results}
+        assert by_id["paper-a"].translated == 1
+        assert by_id["paper-b"].failed == 1
+        # The successful paper is cleaned up, the failed one kept for debugging
+        assert not os.path.exists(dirs["paper-a"])
+        assert os.path.exists(os.path.join(dirs["paper-b"], "fig_1.png"))
@@ -1,3 +1,5 @@
+import json
+
 from src.services.formatting_service import FormattingService
 
 
@@ -21,3 +23,97 @@ def test_parse_formatter_json_raises_for_non_object():
         assert "JSON object" in str(exc)
     else:
         raise AssertionError("Expected ValueError for non-object payload")
+
+
+class _FakeResponse:
+    ok = True
+    status_code = 200
+
+    def __init__(self, content, model=None):
+        self._content = content
+        self._model = model
+
+    def json(self):
+        data = {"choices": [{"message": {"content": self._content}}]}
+        if self._model:
+            data["model"] = self._model
+        return data
+
+
+class _EchoSession:
+    """Returns the masked input back as the formatted output."""
+
+    def __init__(self):
+        self.calls = 0
+        self.model = None
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        payload = json.loads(kwargs["data"])
+        user = payload["messages"][1]["content"]
+        data = json.loads(user.split("Input JSON:\n", 1)[1])
+        body = data["body_joined"].replace(data["paragraph_separator"], "\n\n")
+        return _FakeResponse(
+            json.dumps({"abstract_md": data["abstract"], "body_md": body}),
+            model=self.model,
+        )
+
+
+def _service(monkeypatch, tmp_path, **fmt):
+    import src.services.formatting_service as fs
+
+    session = _EchoSession()
+    monkeypatch.setattr(fs, "get_session", lambda: session)
+    monkeypatch.setattr(fs, "openrouter_headers", lambda: {})
+    monkeypatch.setattr(fs, "get_proxies", lambda: ({}, "none"))
+    cfg = {"model": "stub-model", "temperature": 0, "cache_dir": str(tmp_path)}
+    cfg.update(fmt)
+    return FormattingService(config={"formatting": cfg}), session
+
+
+def test_format_translation_cache_skips_llm_on_rerun(monkeypatch, tmp_path):
+    svc, session = _service(monkeypatch, tmp_path)
+    translation = {
+        "title_en": "T",
+        "abstract_en": "Abstract with $x^2$.",
+        "body_en": ["First paragraph.", "Second with \\cite{a}."],
+    }
+
+    first = svc.format_translation(translation)
+    assert session.calls == 1
+    assert first["abstract_md"] == "Abstract with $x^2$."
+    assert "\\cite{a}" in first["body_md"]
+
+    rerun, rerun_session = _service(monkeypatch, tmp_path)
+    second = rerun.format_translation(translation)
+    assert rerun_session.calls == 0
+    assert rerun.cache_hits == 1
+    assert second["body_md"] == first["body_md"]
+
+
+def test_format_translation_chunks_long_body_in_order(monkeypatch, tmp_path):
+    svc, session = _service(monkeypatch, tmp_path, max_chunk_tokens=5, max_workers=4)
+    paras = [f"Paragraph number {i} with $y_{i}$." for i in range(8)]
+    out = svc.format_translation(
+        {"title_en": "T", "abstract_en": "A", "body_en": paras}
+    )
+
+    assert session.calls == 8
+    assert out["abstract_md"] == "A"
+    assert out["body_md"] == "\n\n".join(paras)
+
+
+def test_format_translation_by_another_model_is_not_cached(monkeypatch, tmp_path):
+    translation = {"title_en": "T", "abstract_en": "A", "body_en": ["Body."]}
+    svc, session = _service(monkeypatch, tmp_path)
+    session.model = "other/fallback-model"
+    svc.format_translation(translation)
+
+    rerun, rerun_session = _service(monkeypatch, tmp_path)
+    rerun_session.model = "stub-model:free"
+    rerun.format_translation(translation)
+    assert rerun_session.calls == 1
+
+    cached, cached_session = _service(monkeypatch, tmp_path)
+    cached.format_translation(translation)
+    assert cached_session.calls == 0
@@ -0,0 +1,251 @@
+"""
+Tests for the headless browser pool used by the PDF download fallback.
+"""
+
+import functools
+import http.server
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src import pdf_pipeline
+from src.headless_pool import HeadlessBrowserPool
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    def set_default_timeout(self, ms):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.connected = True
+        self.thread = threading.get_ident()
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **kwargs):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+
+class FakeLauncher:
+    def __init__(self):
+        self.browsers = []
+        self.shutdowns = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, session_id):
+        browser = FakeBrowser(session_id)
+        with self._lock:
+            self.browsers.append(browser)
+
+        def shutdown():
+            with self._lock:
+                self.shutdowns += 1
+
+        return browser, shutdown
+
+
+@pytest.fixture
+def launcher():
+    return FakeLauncher()
+
+
+def _job(context):
+    # Jobs must run on the thread that opened the browser (Playwright sync API)
+    assert context.browser.thread == threading.get_ident()
+    return context
+
+
+class TestHeadlessBrowserPool:
+    def test_reuses_context_across_jobs(self, launcher):
+        pool = HeadlessBrowserPool(launcher, size=1, max_uses=10)
+        try:
+            contexts = [pool.run(_job) for _ in range(5)]
+        finally:
+            pool.close()
+
+        assert len(launcher.browsers) == 1
+        assert all(c is contexts[0] for c in contexts)
+        assert pool.stats == {"launches": 1, "jobs": 5}
+
+    def test_recycles_after_max_uses(self, launcher):
+        pool = HeadlessBrowserPool(launcher, size=1, max_uses=2)
+        try:
+            contexts = [pool.run(_job) for _ in range(5)]
+        finally:
+            pool.close()
+
+        assert len(launcher.browsers) == 3
+        assert contexts[0] is contexts[1] and contexts[1] is not contexts[2]
+        assert contexts[0].closed
+        # Each recycle gets a fresh sticky session
+        assert len({b.session_id for b in launcher.browsers}) == 3
+        assert launcher.shutdowns == 3
+
+    def test_reconnects_unhealthy_browser(self, launcher):
+        pool = HeadlessBrowserPool(launcher, size=1, max_uses=10)
+        try:
+            first = pool.run(_job)
+            first.browser.connected = False
+            second = pool.run(_job)
+        finally:
+            pool.close()
+
+        assert second is not first
+        assert len(launcher.browsers) == 2
+
+    def test_job_error_propagates_and_recycles(self, launcher):
+        def boom(context):
+            raise RuntimeError("page crashed")
+
+        pool = HeadlessBrowserPool(launcher, size=1, max_uses=10)
+        try:
+            first = pool.run(_job)
+            with pytest.raises(RuntimeError, match="page crashed"):
+                pool.run(boom)
+            after = pool.run(_job)
+        finally:
+            pool.close()
+
+        assert first.closed
+        assert after is not first
+
+    def test_concurrency_bounded_by_size(self, launcher):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow_job(context):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            threading.Event().wait(0.02)
+            with lock:
+                state["active"] -= 1
+            return context.browser.session_id
+
+        pool = HeadlessBrowserPool(launcher, size=2, max_uses=100)
+        try:
+            with ThreadPoolExecutor(max_workers=6) as callers:
+                sessions = list(callers.map(lambda _: pool.run(slow_job), range(12)))
+        finally:
+            pool.close()
+
+        assert state["peak"] == 2
+        assert len(set(sessions)) == 2
+        assert launcher.shutdowns == 2
+
+    def test_submit_after_close_fails(self, launcher):
+        pool = HeadlessBrowserPool(launcher, size=1)
+        pool.close()
+
+        with pytest.raises(RuntimeError):
+            pool.submit(_job)
+
+
+PDF_BODY = b"%PDF-1.4\n" + b"0" * 4096
+
+
+class _StaticHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def static_site(tmp_path):
+    (tmp_path / "paper.pdf").write_bytes(PDF_BODY)
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        functools.partial(_StaticHandler, directory=str(tmp_path)),
+    )
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    (tmp_path / "abs.html").write_text(
+        f'<a href="{base}/paper.pdf?filetype=pdf">PDF</a>', encoding="utf-8"
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield base
+    server.shutdown()
+
+
+def test_pooled_fetch_against_local_server(static_site, tmp_path):
+    pytest.importorskip("playwright.sync_api")
+    from playwright.sync_api import sync_playwright
+
+    def local_launcher(session_id):
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as exc:
+            playwright.stop()
+            pytest.skip(f"Chromium not installed: {exc}")
+
+        def shutdown():
+            browser.close()
+            playwright.stop()
+
+        return browser, shutdown
+
+    out = tmp_path / "out" / "paper.pdf"
+    pool = HeadlessBrowserPool(local_launcher, size=1, max_uses=5)
+    try:
+        results = [
+            pool.run(
+                lambda context: pdf_pipeline._fetch_pdf_in_context(
+                    context,
+                    f"{static_site}/missing.pdf",
+                    referer=f"{static_site}/abs.html",
+                )
+            )
+            for _ in range(2)
+        ]
+    finally:
+        pool.close()
+
+    assert pool.stats["launches"] == 1
+    assert results[0]["url"] == f"{static_site}/paper.pdf?filetype=pdf"
+    assert pdf_pipeline._save_headless_pdf(results[1], "u", str(out))
+    assert out.read_bytes() == PDF_BODY
+
+
+class TestSaveHeadlessPdf:
+    def test_rejects_non_pdf(self, tmp_path):
+        import base64
+
+        result = {
+            "success": True,
+            "base64": base64.b64encode(b"<html>" * 500).decode(),
+        }
+        out = tmp_path / "paper.pdf"
+
+        assert pdf_pipeline._save_headless_pdf(result, "u", str(out)) is False
+        assert not out.exists()
+
+    def test_reports_fetch_error(self, tmp_path):
+        result = {"error": "HTTP 404", "status": 404}
+
+        assert (
+            pdf_pipeline._save_headless_pdf(result, "u", str(tmp_path / "p")) is False
+        )
+
+    def test_pool_disabled_by_config(self, monkeypatch):
+        monkeypatch.setattr(
+            pdf_pipeline,
+            "get_config",
+            lambda: {"pdf_download": {"headless_pool_size": 0}},
+        )
+
+        assert pdf_pipeline._get_headless_pool("wss://example") is None
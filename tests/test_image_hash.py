@@ -0,0 +1,139 @@
+"""
+Tests for perceptual hashing and near-duplicate lookup used by FigureExtractor.
+"""
+
+import io
+import random
+
+import pytest
+from PIL import Image, ImageDraw, ImageFilter
+
+from src.figure_pipeline.extractor import HASH_DIFF_THRESHOLD, FigureExtractor
+from src.figure_pipeline.image_hash import (
+    HASH_ALGORITHMS,
+    HashIndex,
+    hamming,
+    hash_image_bytes,
+)
+from src.figure_pipeline.models import PipelineConfig
+
+pytest.importorskip("numpy")
+
+
+def _figure(seed: int, size=(320, 240)) -> Image.Image:
+    rng = random.Random(seed)
+    img = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(img)
+    for _ in range(8):
+        x0, y0 = rng.randrange(size[0]), rng.randrange(size[1])
+        box = [x0, y0, x0 + rng.randint(20, 120), y0 + rng.randint(20, 120)]
+        draw.rectangle(box, fill=tuple(rng.randrange(256) for _ in range(3)))
+    return img
+
+
+def _encode(img: Image.Image, fmt: str = "PNG") -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format=fmt)
+    return buf.getvalue()
+
+
+def _legacy_ahash(image_bytes: bytes) -> str:
+    """The extractor's original bit-string average hash."""
+    img = Image.open(io.BytesIO(image_bytes))
+    img = img.resize((8, 8), Image.Resampling.LANCZOS)
+    pixels = list(img.convert("L").getdata())
+    avg = sum(pixels) / len(pixels)
+    bits = "".join("1" if p > avg else "0" for p in pixels)
+    return format(int(bits, 2), "016x")
+
+
+class TestHashes:
+    @pytest.mark.parametrize("mode", ["RGB", "L", "RGBA", "P"])
+    def test_ahash_matches_legacy_implementation(self, mode):
+        for seed in range(10):
+            data = _encode(_figure(seed).convert(mode))
+
+            assert format(hash_image_bytes(data), "016x") == _legacy_ahash(data)
+
+    @pytest.mark.parametrize("algorithm", HASH_ALGORITHMS)
+    def test_near_duplicates_are_close_and_distinct_figures_far(self, algorithm):
+        original = _figure(1)
+        variants = [
+            _encode(original, "JPEG"),
+            _encode(original.resize((240, 180))),
+            _encode(original.filter(ImageFilter.GaussianBlur(1))),
+        ]
+        base = hash_image_bytes(_encode(original), algorithm)
+
+        for variant in variants:
+            assert hamming(base, hash_image_bytes(variant, algorithm)) <= 5
+        other = hash_image_bytes(_encode(_figure(2)), algorithm)
+        assert hamming(base, other) > HASH_DIFF_THRESHOLD
+
+    def test_undecodable_bytes_give_none(self):
+        assert hash_image_bytes(b"not an image") is None
+
+    def test_unknown_algorithm_raises(self):
+        with pytest.raises(ValueError):
+            hash_image_bytes(_encode(_figure(0)), "xhash")
+
+
+class TestHashIndex:
+    def test_matches_linear_scan(self):
+        rng = random.Random(42)
+        centers = [rng.getrandbits(64) for _ in range(50)]
+        hashes = []
+        for _ in range(2000):
+            value = rng.choice(centers)
+            for bit in rng.sample(range(64), rng.randint(0, 9)):
+                value ^= 1 << bit
+            hashes.append(value)
+
+        index = HashIndex(max_distance=5)
+        seen = []
+        for value in hashes:
+            expected = any(hamming(value, old) <= 5 for old in seen)
+            assert index.has_within(value) is expected
+            if not expected:
+                index.add(value)
+                seen.append(value)
+        assert len(index) == len(seen)
+
+    def test_find_returns_sorted_matches(self):
+        index = HashIndex(max_distance=3)
+        for value in (0b0, 0b1, 0b111, 0b1111_1111):
+            index.add(value)
+
+        assert index.find(0) == [(0, 0b0), (1, 0b1), (3, 0b111)]
+        assert index.find(1 << 63) == [(1, 0b0), (2, 0b1)]
+
+
+def _noisy_figure(seed: int) -> Image.Image:
+    """A figure with enough speckle to pass the extractor's 20KB minimum."""
+    img = _figure(seed, size=(400, 300))
+    rng = random.Random(seed)
+    draw = ImageDraw.Draw(img)
+    for _ in range(6000):
+        xy = (rng.randrange(400), rng.randrange(300))
+        draw.point(xy, fill=(rng.randrange(256),) * 3)
+    return img
+
+
+class TestExtractorDedup:
+    def test_reencoded_copy_is_dropped(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        original, other = _noisy_figure(3), _noisy_figure(4)
+        images = [original, original.resize((360, 270)), other]
+        for img in images:
+            page = doc.new_page()
+            page.insert_image(fitz.Rect(50, 50, 450, 350), stream=_encode(img))
+        pdf = tmp_path / "paper.pdf"
+        doc.save(str(pdf))
+        doc.close()
+
+        for algorithm in HASH_ALGORITHMS:
+            extractor = FigureExtractor(PipelineConfig(dedup_hash=algorithm))
+            figures = extractor.extract_all(str(pdf), str(tmp_path / algorithm))
+
+            assert [f.location.page_number for f in figures] == [1, 3], algorithm
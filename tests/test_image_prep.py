@@ -0,0 +1,143 @@
+"""
+Tests for figure preprocessing before translation (src/figure_pipeline/image_prep.py).
+"""
+
+import os
+import random
+from unittest.mock import MagicMock, patch
+
+from PIL import Image, ImageDraw
+
+from src.figure_pipeline.image_prep import (
+    PreparedImage,
+    max_side_for_model,
+    prepare_image,
+    restore_output_size,
+)
+from src.figure_pipeline.models import PipelineConfig
+from src.figure_pipeline.translator import FigureTranslator
+
+
+def _chart(path, size=(3000, 1500)):
+    img = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(img)
+    for i in range(10):
+        x = 100 + i * size[0] // 12
+        draw.rectangle([x, size[1] // 3, x + size[0] // 20, size[1] - 100], fill="blue")
+    img.save(path)
+    return str(path)
+
+
+def _photo(path, size=(600, 400)):
+    rng = random.Random(0)
+    data = bytes(rng.randrange(256) for _ in range(size[0] * size[1] * 3))
+    Image.frombytes("RGB", size, data).save(path)
+    return str(path)
+
+
+class TestModelLimits:
+    def test_lookup_order(self):
+        limits = {"gemini-3-pro-image-preview": 2048, "default": 1536, "off": 0}
+
+        assert max_side_for_model(limits, "google/gemini-3-pro-image-preview") == 2048
+        assert max_side_for_model(limits, "other-model") == 1536
+        assert max_side_for_model(limits, "off") is None
+        assert max_side_for_model({}, "other-model") is None
+
+
+class TestPrepareImage:
+    def test_large_chart_is_downscaled_as_png(self, tmp_path):
+        original = _chart(tmp_path / "fig.png")
+
+        prepared = prepare_image(original, 2048, str(tmp_path / "fig.input"))
+
+        assert prepared.path == str(tmp_path / "fig.input.png")
+        assert prepared.original_size == (3000, 1500)
+        assert prepared.sent_size == (2048, 1024)
+        assert Image.open(prepared.path).size == (2048, 1024)
+
+    def test_small_chart_is_sent_unchanged(self, tmp_path):
+        original = _chart(tmp_path / "fig.png", size=(800, 600))
+
+        prepared = prepare_image(original, 2048, str(tmp_path / "fig.input"))
+
+        assert prepared.path == original
+        assert not prepared.downscaled
+        assert os.listdir(tmp_path) == ["fig.png"]
+
+    def test_lossless_photo_is_recompressed_as_jpeg(self, tmp_path):
+        original = _photo(tmp_path / "photo.png")
+
+        prepared = prepare_image(original, 2048, str(tmp_path / "photo.input"))
+
+        assert prepared.path.endswith(".jpg")
+        assert not prepared.downscaled
+        assert os.path.getsize(prepared.path) < os.path.getsize(original)
+
+    def test_transparency_is_kept(self, tmp_path):
+        original = str(tmp_path / "fig.png")
+        Image.new("RGBA", (3000, 1000), (0, 0, 255, 128)).save(original)
+
+        prepared = prepare_image(original, 1500, str(tmp_path / "fig.input"))
+
+        assert Image.open(prepared.path).mode == "RGBA"
+
+    def test_undecodable_image_is_sent_unchanged(self, tmp_path):
+        original = tmp_path / "fig.png"
+        original.write_bytes(b"not an image")
+
+        prepared = prepare_image(str(original), 2048, str(tmp_path / "fig.input"))
+
+        assert prepared.path == str(original)
+
+
+class TestRestoreOutputSize:
+    def test_small_output_is_upscaled_to_min_side(self, tmp_path):
+        output = str(tmp_path / "out.png")
+        Image.new("RGB", (512, 256)).save(output)
+        prepared = PreparedImage("in.png", (3000, 1500), (2048, 1024))
+
+        assert restore_output_size(output, prepared, 1024)
+        assert Image.open(output).size == (1024, 512)
+
+    def test_upscale_is_capped_at_original_size(self, tmp_path):
+        output = str(tmp_path / "out.png")
+        Image.new("RGB", (400, 200)).save(output)
+        prepared = PreparedImage("in.png", (800, 400), (600, 300))
+
+        assert restore_output_size(output, prepared, 1024)
+        assert Image.open(output).size == (800, 400)
+
+    def test_large_or_unscaled_output_is_left_alone(self, tmp_path):
+        output = str(tmp_path / "out.png")
+        Image.new("RGB", (512, 256)).save(output)
+        unscaled = PreparedImage("in.png", (512, 256), (512, 256))
+        scaled = PreparedImage("in.png", (3000, 1500), (2048, 1024))
+
+        assert not restore_output_size(output, unscaled, 1024)
+        assert not restore_output_size(output, scaled, 512)
+        assert Image.open(output).size == (512, 256)
+
+
+class TestTranslatorInput:
+    def test_gemini_receives_downscaled_input(self, tmp_path):
+        original = _chart(tmp_path / "fig_1.png")
+        sent = {}
+
+        def translate_image(image_path, output_path, prompt, max_retries):
+            sent["size"] = Image.open(image_path).size
+            sent["path"] = image_path
+            Image.new("RGB", (800, 400), "white").save(output_path)
+            return output_path
+
+        translator = FigureTranslator(PipelineConfig(translation_cache_dir=None))
+        client = MagicMock(translate_image=translate_image)
+        out_dir = tmp_path / "translated"
+        with patch.object(FigureTranslator, "gemini_client", client):
+            result = translator.translate(original, "1", "paper", str(out_dir))
+
+        assert sent["size"] == (2048, 1024)
+        assert Image.open(result).size == (1024, 512)
+        # The temporary input is removed once the call returns
+        assert not os.path.exists(sent["path"])
+        assert os.listdir(out_dir) == ["fig_1_en.png"]
@@ -838,7 +838,9 @@ class TestOrchestratorIntegration:
         )
 
         # Dry run should still call functions (they handle dry_run internally)
-        mock_text.assert_called_once_with('chinaxiv-202401.00001', dry_run=True)
+        mock_text.assert_called_once_with(
+            'chinaxiv-202401.00001', dry_run=True, pdf_engine='pdfminer'
+        )
 
     def test_orchestrator_empty_queue(self, sample_orchestrator_papers):
         """Test orchestrator with no papers to process."""
@@ -1316,6 +1318,16 @@ class TestDiscovery:
         with pytest.raises(ValueError, match="YYYYMM"):
             run_orchestrator(scope='discover', target='invalid')
 
+    def test_run_orchestrator_rejects_unknown_pdf_engine(self):
+        """An unknown PDF engine should fail the run before any work starts."""
+        from src.orchestrator import run_orchestrator
+
+        with patch('src.orchestrator.run_discover') as mock_discover:
+            with pytest.raises(ValueError, match="poppler"):
+                run_orchestrator(scope='discover', target='202501', pdf_engine='poppler')
+
+        mock_discover.assert_not_called()
+
 
 class TestBackfillPreservesFailedStatus:
     """Tests for backfill_state_from_b2.py preserving failed status."""
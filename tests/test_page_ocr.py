@@ -0,0 +1,156 @@
+"""
+Tests for selective, page-parallel OCR in src/page_ocr.py.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src import page_ocr
+
+fitz = pytest.importorskip("fitz")
+
+NATIVE_TEXT = "This page has a native text layer. " * 12
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(path))
+    return path
+
+
+def _mixed_pdf(tmp_path: Path) -> str:
+    """Pages 0 and 2 have text; page 1 is a blank 'scan'."""
+    doc = fitz.open()
+    for text in (NATIVE_TEXT, None, NATIVE_TEXT):
+        page = doc.new_page()
+        if text:
+            page.insert_textbox(fitz.Rect(50, 50, 550, 750), text)
+    path = tmp_path / "mixed.pdf"
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def _fake_tesseract(png: bytes, languages: str, dpi: int) -> bytes:
+    pix = fitz.Pixmap(png)
+    doc = fitz.open()
+    page = doc.new_page(width=pix.width * 72 / dpi, height=pix.height * 72 / dpi)
+    page.insert_text((50, 100), "Recognized scanned text")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class TestPageSelection:
+    def test_counts_non_whitespace_chars_per_page(self, tmp_path):
+        counts = page_ocr.page_char_counts(_mixed_pdf(tmp_path))
+
+        assert len(counts) == 3
+        assert counts[1] == 0
+        assert counts[0] == counts[2] > 200
+
+    def test_selects_pages_below_threshold(self):
+        assert page_ocr.select_sparse_pages([500, 0, 199, 200], 200) == [1, 2]
+
+
+class TestOcrSparsePages:
+    def test_only_sparse_pages_are_ocrd(self, tmp_path, cache_dir):
+        pdf = _mixed_pdf(tmp_path)
+        out = tmp_path / "ocr" / "mixed.pdf"
+
+        with patch.object(
+            page_ocr, "_run_tesseract", side_effect=_fake_tesseract
+        ) as mock_ocr:
+            result = page_ocr.ocr_sparse_pages(pdf, str(out), workers=2)
+
+        assert mock_ocr.call_count == 1
+        assert result.pages == [1]
+        assert result.page_count == 3
+        with fitz.open(str(out)) as doc:
+            texts = [page.get_text() for page in doc]
+            original = fitz.open(pdf)
+            # Page size survives the render at `dpi` (to within a pixel)
+            assert abs(doc[1].rect.width - original[1].rect.width) < 1
+            assert abs(doc[1].rect.height - original[1].rect.height) < 1
+            original.close()
+        assert "Recognized scanned text" in texts[1]
+        assert "native text layer" in texts[0]
+        assert "native text layer" in texts[2]
+
+    def test_second_run_uses_page_image_cache(self, tmp_path, cache_dir):
+        pdf = _mixed_pdf(tmp_path)
+
+        with patch.object(page_ocr, "_run_tesseract", side_effect=_fake_tesseract):
+            first = page_ocr.ocr_sparse_pages(pdf, str(tmp_path / "a.pdf"))
+        with patch.object(
+            page_ocr, "_run_tesseract", side_effect=AssertionError
+        ) as mock_ocr:
+            second = page_ocr.ocr_sparse_pages(pdf, str(tmp_path / "b.pdf"))
+
+        assert first.cached_pages == 0
+        assert second.cached_pages == 1
+        assert mock_ocr.call_count == 0
+        with fitz.open(str(tmp_path / "b.pdf")) as doc:
+            assert "Recognized scanned text" in doc[1].get_text()
+
+    def test_many_sparse_pages_keep_order(self, tmp_path, cache_dir):
+        doc = fitz.open()
+        for i in range(12):
+            page = doc.new_page()
+            # Distinct images per page so each gets its own cache entry
+            page.draw_rect(fitz.Rect(10 + i * 20, 10, 30 + i * 20, 30), fill=(0, 0, 0))
+        pdf = tmp_path / "scan.pdf"
+        doc.save(str(pdf))
+        doc.close()
+
+        def numbered_tesseract(png, languages, dpi):
+            pix = fitz.Pixmap(png)
+            # The black square's position identifies the page
+            column = next(
+                x for x in range(pix.width) if pix.pixel(x, int(20 * dpi / 72))[0] < 128
+            )
+            page_no = round((column * 72 / dpi - 10) / 20)
+            ocr = fitz.open()
+            page = ocr.new_page(
+                width=pix.width * 72 / dpi, height=pix.height * 72 / dpi
+            )
+            page.insert_text((50, 100), f"page {page_no}")
+            return ocr.tobytes()
+
+        out = tmp_path / "out.pdf"
+        with patch.object(page_ocr, "_run_tesseract", side_effect=numbered_tesseract):
+            result = page_ocr.ocr_sparse_pages(str(pdf), str(out), workers=2, dpi=72)
+
+        assert result.pages == list(range(12))
+        with fitz.open(str(out)) as ocr_doc:
+            assert [p.get_text().strip() for p in ocr_doc] == [
+                f"page {i}" for i in range(12)
+            ]
+
+    def test_no_sparse_pages_writes_nothing(self, tmp_path, cache_dir):
+        doc = fitz.open()
+        doc.new_page().insert_textbox(fitz.Rect(50, 50, 550, 750), NATIVE_TEXT)
+        pdf = tmp_path / "native.pdf"
+        doc.save(str(pdf))
+        doc.close()
+        out = tmp_path / "out.pdf"
+
+        with patch.object(page_ocr, "_run_tesseract", side_effect=AssertionError):
+            assert page_ocr.ocr_sparse_pages(str(pdf), str(out)) is None
+
+        assert not out.exists()
+
+
+class TestRunTesseract:
+    def test_tesseract_is_limited_to_one_openmp_thread(self):
+        def fake_run(cmd, **kwargs):
+            Path(f"{cmd[2]}.pdf").write_bytes(b"%PDF-")
+            return kwargs
+
+        with patch.object(page_ocr.subprocess, "run", side_effect=fake_run) as run:
+            assert page_ocr._run_tesseract(b"png", "eng", 300) == b"%PDF-"
+
+        assert run.call_args.kwargs["env"]["OMP_THREAD_LIMIT"] == "1"
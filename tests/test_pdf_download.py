@@ -0,0 +1,101 @@
+"""
+Tests for streaming PDF downloads in src/pdf_pipeline.py.
+"""
+
+import hashlib
+
+import pytest
+import responses
+
+from src import extraction_cache, pdf_pipeline
+
+PDF_URL = "https://example.org/paper.pdf"
+
+
+@pytest.fixture(autouse=True)
+def no_proxies_or_fallbacks(monkeypatch):
+    monkeypatch.setattr(pdf_pipeline, "get_proxies", lambda: (None, "none"))
+    monkeypatch.setattr(pdf_pipeline, "_unlocker_raw_fetch", lambda *a, **k: False)
+    monkeypatch.setattr(pdf_pipeline, "_headless_pdf_fetch", lambda *a, **k: False)
+
+
+def _pdf_body(size: int) -> bytes:
+    header = b"%PDF-1.7\n"
+    return header + b"0" * (size - len(header))
+
+
+class TestStreamingDownload:
+    @responses.activate
+    def test_writes_file_atomically_and_records_digest(self, tmp_path):
+        body = _pdf_body(50_000)
+        responses.add(responses.GET, PDF_URL, body=body, status=200)
+        out = tmp_path / "pdfs" / "paper.pdf"
+
+        assert pdf_pipeline.download_pdf(PDF_URL, str(out)) is True
+
+        assert out.read_bytes() == body
+        assert not (tmp_path / "pdfs" / "paper.pdf.part").exists()
+        assert extraction_cache.pdf_digest(str(out)) == hashlib.sha256(body).hexdigest()
+
+    @responses.activate
+    def test_html_response_falls_back_without_writing(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            pdf_pipeline,
+            "_unlocker_raw_fetch",
+            lambda url, path, **kw: calls.append(url) or False,
+        )
+        responses.add(
+            responses.GET,
+            PDF_URL,
+            body=b"<html><body>Access denied</body></html>" * 100,
+            status=200,
+            content_type="application/pdf",
+        )
+        out = tmp_path / "paper.pdf"
+
+        assert pdf_pipeline.download_pdf(PDF_URL, str(out)) is False
+
+        assert calls == [PDF_URL]
+        assert not out.exists()
+
+    @responses.activate
+    def test_declared_oversize_rejected_before_body(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pdf_pipeline, "_max_pdf_bytes", lambda: 10_000)
+        responses.add(
+            responses.GET,
+            PDF_URL,
+            body=_pdf_body(20_000),
+            status=200,
+            headers={"Content-Length": "20000"},
+        )
+        out = tmp_path / "paper.pdf"
+
+        assert pdf_pipeline.download_pdf(PDF_URL, str(out)) is False
+        assert not out.exists()
+
+    def test_stream_aborts_past_cap(self, tmp_path):
+        out = tmp_path / "paper.pdf"
+        chunks = (_pdf_body(4096) for _ in range(10))
+
+        assert pdf_pipeline._write_pdf_atomic(str(out), chunks, 20_000) is None
+
+        assert not out.exists()
+        assert not (tmp_path / "paper.pdf.part").exists()
+
+    @responses.activate
+    def test_too_small_rejected(self, tmp_path):
+        responses.add(responses.GET, PDF_URL, body=b"%PDF-1.4 tiny", status=200)
+        out = tmp_path / "paper.pdf"
+
+        assert pdf_pipeline.download_pdf(PDF_URL, str(out)) is False
+        assert not out.exists()
+
+    @responses.activate
+    def test_existing_file_kept_when_download_fails(self, tmp_path):
+        out = tmp_path / "paper.pdf"
+        out.write_bytes(b"previous")
+        responses.add(responses.GET, PDF_URL, body=b"%PDF-1.4 tiny", status=200)
+
+        assert pdf_pipeline.download_pdf(PDF_URL, str(out)) is False
+        assert out.read_bytes() == b"previous"
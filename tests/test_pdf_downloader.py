@@ -0,0 +1,307 @@
+"""
+Tests for the concurrent bulk PDF downloader in src/pdf_downloader.py.
+"""
+
+import hashlib
+import json
+import threading
+
+import pytest
+import requests
+import responses
+
+from src import extraction_cache, pdf_downloader, pdf_pipeline
+from src.pdf_downloader import BulkPdfDownloader, DownloadJob, fetch_pdf_resumable
+
+BASE_URL = "https://example.org/pdf"
+
+
+@pytest.fixture(autouse=True)
+def no_proxies_or_fallbacks(monkeypatch):
+    monkeypatch.setattr(pdf_pipeline, "get_proxies", lambda: (None, "none"))
+    monkeypatch.setattr(pdf_pipeline, "_unlocker_raw_fetch", lambda *a, **k: False)
+    monkeypatch.setattr(pdf_pipeline, "_headless_pdf_fetch", lambda *a, **k: False)
+    monkeypatch.setattr(pdf_downloader.time, "sleep", lambda s: None)
+
+
+def _pdf_body(size: int, fill: bytes = b"0") -> bytes:
+    header = b"%PDF-1.7\n"
+    return header + fill * (size - len(header))
+
+
+def _job(tmp_path, paper_id: str, **kw) -> DownloadJob:
+    return DownloadJob(
+        paper_id, f"{BASE_URL}/{paper_id}", str(tmp_path / f"{paper_id}.pdf"), **kw
+    )
+
+
+def _range_callback(body: bytes, seen_ranges: list, etag: str = '"v1"'):
+    def callback(request):
+        header = request.headers.get("Range")
+        seen_ranges.append(header)
+        headers = {"ETag": etag}
+        if header and request.headers.get("If-Range") == etag:
+            start = int(header.split("=")[1].rstrip("-"))
+            headers["Content-Length"] = str(len(body) - start)
+            return 206, headers, body[start:]
+        headers["Content-Length"] = str(len(body))
+        return 200, headers, body
+
+    return callback
+
+
+class TestRangeResume:
+    @responses.activate
+    def test_resumes_partial_file_with_range_request(self, tmp_path):
+        body = _pdf_body(200_000, b"abc")
+        job = _job(tmp_path, "p1")
+        (tmp_path / "p1.pdf.part").write_bytes(body[:70_000])
+        (tmp_path / "p1.pdf.part.validator").write_text('"v1"')
+        seen = []
+        responses.add_callback(responses.GET, job.url, _range_callback(body, seen))
+
+        status, digest = fetch_pdf_resumable(job)
+
+        assert status == pdf_downloader.OK
+        assert seen == ["bytes=70000-"]
+        assert responses.calls[0].request.headers["If-Range"] == '"v1"'
+        assert (tmp_path / "p1.pdf").read_bytes() == body
+        assert not (tmp_path / "p1.pdf.part").exists()
+        assert not (tmp_path / "p1.pdf.part.validator").exists()
+        assert digest == hashlib.sha256(body).hexdigest()
+        assert extraction_cache.pdf_digest(job.output_path) == digest
+
+    @responses.activate
+    def test_restarts_when_server_ignores_range(self, tmp_path):
+        body = _pdf_body(50_000)
+        job = _job(tmp_path, "p1")
+        (tmp_path / "p1.pdf.part").write_bytes(b"stale bytes" * 100)
+        responses.add(responses.GET, job.url, body=body, status=200)
+
+        status, _ = fetch_pdf_resumable(job)
+
+        assert status == pdf_downloader.OK
+        assert (tmp_path / "p1.pdf").read_bytes() == body
+
+    @responses.activate
+    def test_changed_file_restarts_from_zero(self, tmp_path):
+        body = _pdf_body(200_000, b"new")
+        job = _job(tmp_path, "p1")
+        (tmp_path / "p1.pdf.part").write_bytes(_pdf_body(200_000, b"old")[:70_000])
+        (tmp_path / "p1.pdf.part.validator").write_text('"v1"')
+        seen = []
+        responses.add_callback(
+            responses.GET, job.url, _range_callback(body, seen, etag='"v2"')
+        )
+
+        status, _ = fetch_pdf_resumable(job)
+
+        assert status == pdf_downloader.OK
+        assert (tmp_path / "p1.pdf").read_bytes() == body
+
+    @responses.activate
+    def test_partial_without_validator_is_not_resumed(self, tmp_path):
+        body = _pdf_body(50_000)
+        job = _job(tmp_path, "p1")
+        (tmp_path / "p1.pdf.part").write_bytes(b"unknown origin" * 100)
+        seen = []
+        responses.add_callback(responses.GET, job.url, _range_callback(body, seen))
+
+        status, _ = fetch_pdf_resumable(job)
+
+        assert status == pdf_downloader.OK
+        assert seen == [None]
+        assert (tmp_path / "p1.pdf").read_bytes() == body
+
+    @responses.activate
+    def test_unsatisfiable_range_discards_partial(self, tmp_path):
+        job = _job(tmp_path, "p1")
+        (tmp_path / "p1.pdf.part").write_bytes(b"x" * 5_000)
+        (tmp_path / "p1.pdf.part.validator").write_text('"v1"')
+        responses.add(responses.GET, job.url, status=416)
+
+        status, _ = fetch_pdf_resumable(job)
+
+        assert status == pdf_downloader.NETWORK_ERROR
+        assert not (tmp_path / "p1.pdf.part").exists()
+        assert not (tmp_path / "p1.pdf.part.validator").exists()
+
+    @responses.activate
+    def test_dropped_connection_keeps_partial_for_resume(self, tmp_path, monkeypatch):
+        body = _pdf_body(200_000)
+        job = _job(tmp_path, "p1")
+        responses.add(
+            responses.GET,
+            job.url,
+            body=body,
+            status=200,
+            headers={"Last-Modified": "Tue, 06 Oct 2026 10:00:00 GMT"},
+        )
+
+        def broken_stream(self, chunk_size=1, decode_unicode=False):
+            yield body[:chunk_size]
+            raise requests.ConnectionError("connection reset")
+
+        with monkeypatch.context() as m:
+            m.setattr(requests.Response, "iter_content", broken_stream)
+            status, _ = fetch_pdf_resumable(job)
+
+        assert status == pdf_downloader.NETWORK_ERROR
+        part = tmp_path / "p1.pdf.part"
+        assert part.read_bytes() == body[: pdf_pipeline.DOWNLOAD_CHUNK_BYTES]
+        assert not (tmp_path / "p1.pdf").exists()
+        validator = tmp_path / "p1.pdf.part.validator"
+        assert validator.read_text() == "Tue, 06 Oct 2026 10:00:00 GMT"
+
+
+class TestBulkPdfDownloader:
+    @responses.activate
+    def test_downloads_all_and_persists_progress(self, tmp_path):
+        bodies = {f"p{i}": _pdf_body(10_000 + i) for i in range(6)}
+        for paper_id, body in bodies.items():
+            responses.add(responses.GET, f"{BASE_URL}/{paper_id}", body=body)
+        progress = tmp_path / "progress.json"
+        jobs = [_job(tmp_path, paper_id) for paper_id in bodies]
+
+        results = BulkPdfDownloader(workers=3, progress_path=str(progress)).run(jobs)
+
+        assert results == {paper_id: "downloaded" for paper_id in bodies}
+        for paper_id, body in bodies.items():
+            assert (tmp_path / f"{paper_id}.pdf").read_bytes() == body
+        saved = json.loads(progress.read_text())
+        assert saved["p0"]["status"] == "done"
+        assert saved["p0"]["sha256"] == hashlib.sha256(bodies["p0"]).hexdigest()
+
+    @responses.activate
+    def test_non_pdf_goes_to_fallback_queue(self, tmp_path, monkeypatch):
+        calls = []
+
+        def fake_unlocker(url, path, **kw):
+            calls.append((url, kw["session_id"]))
+            with open(path, "wb") as f:
+                f.write(_pdf_body(5_000))
+            return True
+
+        monkeypatch.setattr(pdf_pipeline, "_unlocker_raw_fetch", fake_unlocker)
+        job = _job(tmp_path, "p1")
+        responses.add(responses.GET, job.url, body=b"<html>denied</html>" * 100)
+
+        results = BulkPdfDownloader(progress_path=None).run([job])
+
+        assert results == {"p1": "fallback"}
+        assert calls == [(job.url, "p1")]
+
+    @responses.activate
+    def test_rerun_skips_existing_and_failed(self, tmp_path):
+        progress = tmp_path / "progress.json"
+        ok_job = _job(tmp_path, "ok")
+        bad_job = _job(tmp_path, "bad")
+        responses.add(responses.GET, ok_job.url, body=_pdf_body(5_000))
+        responses.add(responses.GET, bad_job.url, status=404)
+
+        first = BulkPdfDownloader(progress_path=str(progress)).run([ok_job, bad_job])
+        second = BulkPdfDownloader(progress_path=str(progress)).run([ok_job, bad_job])
+        retried = BulkPdfDownloader(progress_path=str(progress), retry_failed=True).run(
+            [bad_job]
+        )
+
+        assert first == {"ok": "downloaded", "bad": "failed"}
+        assert second == {"ok": "exists", "bad": "skipped"}
+        assert retried == {"bad": "failed"}
+
+    def test_per_host_limit(self, tmp_path, monkeypatch):
+        lock = threading.Lock()
+        active = {"a.example": 0, "b.example": 0}
+        peak = dict(active)
+
+        def fake_fetch(job):
+            host = job.url.split("/")[2]
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            threading.Event().wait(0.02)  # time.sleep is patched out
+            with lock:
+                active[host] -= 1
+            with open(job.output_path, "wb") as f:
+                f.write(b"%PDF")
+            return pdf_downloader.OK, "digest"
+
+        monkeypatch.setattr(pdf_downloader, "fetch_pdf_resumable", fake_fetch)
+        jobs = [
+            DownloadJob(
+                f"{host}-{i}", f"https://{host}/{i}", str(tmp_path / f"{host}-{i}")
+            )
+            for host in active
+            for i in range(8)
+        ]
+
+        results = BulkPdfDownloader(workers=8, per_host=2, progress_path=None).run(jobs)
+
+        assert set(results.values()) == {"downloaded"}
+        assert peak == {"a.example": 2, "b.example": 2}
+
+    def test_network_errors_are_retried(self, tmp_path, monkeypatch):
+        outcomes = [pdf_downloader.NETWORK_ERROR, pdf_downloader.NETWORK_ERROR]
+
+        def flaky_fetch(job):
+            if outcomes:
+                return outcomes.pop(), None
+            with open(job.output_path, "wb") as f:
+                f.write(b"%PDF")
+            return pdf_downloader.OK, "digest"
+
+        monkeypatch.setattr(pdf_downloader, "fetch_pdf_resumable", flaky_fetch)
+
+        results = BulkPdfDownloader(max_attempts=3, progress_path=None).run(
+            [_job(tmp_path, "p1")]
+        )
+
+        assert results == {"p1": "downloaded"}
+
+    def test_unexpected_error_fails_only_that_paper(self, tmp_path, monkeypatch):
+        def fetch(job):
+            if job.paper_id == "bad":
+                raise OSError("disk full")
+            with open(job.output_path, "wb") as f:
+                f.write(b"%PDF")
+            return pdf_downloader.OK, "digest"
+
+        monkeypatch.setattr(pdf_downloader, "fetch_pdf_resumable", fetch)
+        progress = tmp_path / "progress.json"
+        jobs = [_job(tmp_path, paper_id) for paper_id in ("bad", "ok")]
+
+        results = BulkPdfDownloader(progress_path=str(progress)).run(jobs)
+
+        assert results == {"bad": "failed", "ok": "downloaded"}
+        assert json.loads(progress.read_text())["bad"]["reason"] == "error"
+
+    def test_failures_reach_fallback_before_slow_downloads_finish(
+        self, tmp_path, monkeypatch
+    ):
+        slow_done = threading.Event()
+        fallback_started = []
+
+        def fetch(job):
+            if job.paper_id == "slow":
+                slow_done.wait(5)
+                with open(job.output_path, "wb") as f:
+                    f.write(b"%PDF")
+                return pdf_downloader.OK, "digest"
+            return pdf_downloader.NOT_PDF, None
+
+        def fake_unlocker(url, path, **kw):
+            fallback_started.append(slow_done.is_set())
+            slow_done.set()
+            with open(path, "wb") as f:
+                f.write(b"%PDF")
+            return True
+
+        monkeypatch.setattr(pdf_downloader, "fetch_pdf_resumable", fetch)
+        monkeypatch.setattr(pdf_pipeline, "_unlocker_raw_fetch", fake_unlocker)
+        # Submission order puts the slow download first
+        jobs = [_job(tmp_path, "slow"), _job(tmp_path, "blocked")]
+
+        results = BulkPdfDownloader(workers=2, progress_path=None).run(jobs)
+
+        assert results == {"slow": "downloaded", "blocked": "fallback"}
+        assert fallback_started == [False]
@@ -277,6 +277,7 @@ class TestDeleteFigures:
         mock_file2.file_name = "figures/paper-001/fig_2.png"
 
         mock_bucket.ls.return_value = [(mock_file1, None), (mock_file2, None)]
+        mock_bucket.get_file_info_by_name.side_effect = Exception("Not found")
         mock_bucket_prop.return_value = mock_bucket
 
         storage = FigureStorage()
@@ -286,6 +287,28 @@ class TestDeleteFigures:
         assert count == 2
         assert mock_bucket.delete_file_version.call_count == 2
 
+    @patch.object(FigureStorage, "bucket", new_callable=PropertyMock)
+    def test_overwrites_manifest_shard_with_tombstone(self, mock_bucket_prop):
+        """Replaces the paper's manifest shard so compaction drops the paper."""
+        mock_bucket = MagicMock()
+        mock_bucket.ls.return_value = []
+        mock_bucket_prop.return_value = mock_bucket
+        written = {}
+
+        def upload_local_file(local_file, file_name):
+            with open(local_file) as f:
+                written[file_name] = json.load(f)
+
+        mock_bucket.upload_local_file.side_effect = upload_local_file
+
+        storage = FigureStorage()
+
+        assert storage.delete_figures("paper-001") == 0
+        mock_bucket.delete_file_version.assert_not_called()
+        shard = written["figures/manifests/paper-001.json"]
+        assert shard["deleted"] is True
+        assert shard["figures"] == []
+
 
 class TestManifestManagement:
     """Test manifest download/upload/update."""
@@ -340,15 +363,9 @@ class TestManifestManagement:
         mock_bucket.upload_local_file.assert_called_once()
 
     @patch.object(FigureStorage, "download_manifest")
-    @patch.object(FigureStorage, "upload_manifest")
-    def test_update_manifest_adds_paper(self, mock_upload, mock_download):
-        """Updates manifest with new paper entry."""
-        mock_download.return_value = {
-            "updated_at": "2024-01-01",
-            "papers": {"existing": {"figure_count": 1}},
-        }
-        mock_upload.return_value = True
-
+    @patch.object(FigureStorage, "_write_json")
+    def test_update_manifest_writes_paper_shard(self, mock_write, mock_download):
+        """Writes only the paper's own shard, without reading the index."""
         storage = FigureStorage()
 
         figures = [
@@ -359,29 +376,23 @@ class TestManifestManagement:
         result = storage.update_manifest("new-paper", figures)
 
         assert result is True
-        mock_upload.assert_called_once()
+        mock_download.assert_not_called()
+        mock_write.assert_called_once()
 
-        # Check the manifest passed to upload
-        uploaded_manifest = mock_upload.call_args[0][0]
-        assert "new-paper" in uploaded_manifest["papers"]
-        assert uploaded_manifest["papers"]["new-paper"]["figure_count"] == 2
+        key, shard = mock_write.call_args[0]
+        assert key == "figures/manifests/new-paper.json"
+        assert shard["paper_id"] == "new-paper"
+        assert shard["figure_count"] == 2
+        assert "updated_at" in shard
 
-    @patch.object(FigureStorage, "download_manifest")
-    @patch.object(FigureStorage, "upload_manifest")
-    def test_update_manifest_creates_new(self, mock_upload, mock_download):
-        """Creates new manifest if none exists."""
-        mock_download.return_value = None
-        mock_upload.return_value = True
+    @patch.object(FigureStorage, "_write_json")
+    def test_update_manifest_shard_failure(self, mock_write):
+        """Returns False when the shard cannot be written."""
+        mock_write.side_effect = Exception("B2 down")
 
         storage = FigureStorage()
 
-        result = storage.update_manifest("paper-001", [{"number": "1", "url": "url"}])
-
-        assert result is True
-
-        uploaded_manifest = mock_upload.call_args[0][0]
-        assert "papers" in uploaded_manifest
-        assert "updated_at" in uploaded_manifest
+        assert storage.update_manifest("paper-001", [{"number": "1", "url": "url"}]) is False
 
 
 class TestEnvironmentVariables:
@@ -2,7 +2,13 @@
 Tests for math/LaTeX masking and unmasking functionality.
 """
 
-from src.tex_guard import mask_math, unmask_math, verify_token_parity, MATH_TOKEN_FMT
+from src.tex_guard import (
+    MATH_PATTERNS,
+    MATH_TOKEN_FMT,
+    mask_math,
+    unmask_math,
+    verify_token_parity,
+)
 
 
 class TestMathMasking:
@@ -148,3 +154,47 @@ class TestMathMasking:
         # Verify that the text is properly masked
         for mapping in mappings:
             assert mapping.token in masked
+
+    def test_single_pass_matches_sequential_patterns(self):
+        """The combined scanner masks the same spans as MATH_PATTERNS one by one."""
+        text = (
+            "Let $a$ and $$b = c$$ hold, see \\cite{k1} and \\ref{fig:1}. "
+            "\\begin{align*}x &= 1\\end{align*} with \\(y\\) and \\[z\\], "
+            "\\textbf{bold} \\emph{em} \\label{l} \\eqref{e} \\section{S}."
+        )
+        masked, mappings = mask_math(text)
+
+        expected = []
+        remaining = text
+        for pat in MATH_PATTERNS:
+            expected.extend(m.group(0) for m in pat.finditer(remaining))
+            remaining = pat.sub("\x00", remaining)
+        assert sorted(m.content for m in mappings) == sorted(expected)
+        assert [m.token for m in mappings] == [
+            MATH_TOKEN_FMT.format(i + 1) for i in range(len(mappings))
+        ]
+        assert unmask_math(masked, mappings) == text
+
+    def test_nested_markup_round_trips(self):
+        """Math inside preserved markup is masked once by the outer span."""
+        text = "See \\textbf{$x$} and \\[ $y$ \\] here."
+        masked, mappings = mask_math(text)
+
+        assert [m.content for m in mappings] == ["\\textbf{$x$}", "\\[ $y$ \\]"]
+        assert unmask_math(masked, mappings) == text
+
+    def test_unmask_leaves_unknown_tokens(self):
+        """Tokens without a mapping are left in place."""
+        _, mappings = mask_math("$x$")
+        stray = MATH_TOKEN_FMT.format(42)
+
+        assert unmask_math(f"{mappings[0].token} {stray}", mappings) == f"$x$ {stray}"
+
+    def test_many_tokens_beyond_four_digits(self):
+        """Token width grows past 9999 without breaking unmask or parity."""
+        text = " ".join(f"${i}$" for i in range(10001))
+        masked, mappings = mask_math(text)
+
+        assert mappings[-1].token == MATH_TOKEN_FMT.format(10001)
+        assert verify_token_parity(mappings, masked) is True
+        assert unmask_math(masked, mappings) == text
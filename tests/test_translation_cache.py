@@ -0,0 +1,285 @@
+"""
+Tests for the cross-paper figure translation cache.
+"""
+
+import os
+from collections import OrderedDict
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.figure_pipeline import FigurePipeline
+from src.figure_pipeline.models import (
+    Figure,
+    FigureType,
+    PipelineConfig,
+    ProcessingStatus,
+)
+from src.figure_pipeline import translation_cache
+from src.figure_pipeline.translation_cache import TranslationCache, image_digest
+from src.figure_pipeline.translator import FigureTranslator
+
+
+def _figure(path, label_x=20, compress_level=6):
+    img = Image.new("RGB", (200, 120), "white")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([10, 10, 190, 110], outline="black")
+    draw.rectangle([label_x, 40, label_x + 30, 60], fill="red")
+    img.save(path, compress_level=compress_level)
+    return str(path)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return PipelineConfig(
+        temp_dir=str(tmp_path / "work"),
+        translation_cache_dir=str(tmp_path / "cache"),
+    )
+
+
+def _fake_api(calls, model="gemini-3-pro-image-preview"):
+    def call_api(image_path, prompt, output_path):
+        calls.append(image_path)
+        Image.open(image_path).convert("L").save(output_path, format="PNG")
+        return output_path, model
+
+    return call_api
+
+
+class TestImageDigest:
+    def test_same_pixels_in_different_encodings_match(self, tmp_path):
+        a = _figure(tmp_path / "a.png", compress_level=1)
+        b = _figure(tmp_path / "b.png", compress_level=9)
+
+        assert os.path.getsize(a) != os.path.getsize(b)
+        assert image_digest(a) == image_digest(b)
+
+    def test_changed_label_misses(self, tmp_path):
+        a = _figure(tmp_path / "a.png")
+        b = _figure(tmp_path / "b.png", label_x=22)
+
+        assert image_digest(a) != image_digest(b)
+
+    def test_memo_keeps_most_recent_images(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(translation_cache, "DIGEST_MEMO_SIZE", 2)
+        monkeypatch.setattr(translation_cache, "_digest_memo", OrderedDict())
+        a, b, c = (_figure(tmp_path / f"{name}.png") for name in "abc")
+
+        image_digest(a)
+        image_digest(b)
+        image_digest(a)
+        image_digest(c)
+
+        remembered = {key[0] for key in translation_cache._digest_memo}
+        assert remembered == {os.path.abspath(a), os.path.abspath(c)}
+
+    def test_disabled_cache_never_hits(self, tmp_path):
+        cache = TranslationCache(None, "ns")
+        original = _figure(tmp_path / "a.png")
+
+        cache.put(original, original, 1)
+
+        assert cache.get(original) is None
+
+
+    def test_entry_that_failed_qa_is_evicted(self, tmp_path):
+        cache = TranslationCache(str(tmp_path / "cache"), "ns")
+        original = _figure(tmp_path / "fig.png")
+        translated = _figure(tmp_path / "fig_en.png", label_x=50)
+        cache.put(original, translated, 1)
+        cache.record_qa(original, passed=False, notes="Chinese text still present")
+
+        assert cache.get(original) is None
+        assert not any(files for _, _, files in os.walk(tmp_path / "cache"))
+
+
+class TestTranslatorCache:
+    def test_second_paper_reuses_translation(self, tmp_path, config):
+        translator = FigureTranslator(config)
+        calls = []
+        v1 = _figure(tmp_path / "v1.png", compress_level=1)
+        v2 = _figure(tmp_path / "v2.png", compress_level=9)
+
+        with patch.object(translator, "_call_api", side_effect=_fake_api(calls)):
+            first = translator.translate(
+                v1, "3", "paper-v1", qa_check=lambda path: False
+            )
+            second = translator.translate(
+                v2, "2", "paper-v2", qa_check=lambda path: False
+            )
+
+        assert calls == [v1]
+        assert translator.cache_hits == 1
+        assert os.path.basename(second) == "fig_2_en.png"
+        assert "paper-v2" in second
+        with open(first, "rb") as f1, open(second, "rb") as f2:
+            assert f1.read() == f2.read()
+
+    def test_prompt_change_misses(self, tmp_path, config):
+        calls = []
+        original = _figure(tmp_path / "fig.png")
+        translator = FigureTranslator(config)
+        with patch.object(translator, "_call_api", side_effect=_fake_api(calls)):
+            translator.translate(original, "1", "paper")
+
+        with patch.object(FigureTranslator, "TRANSLATION_PROMPT", "New prompt"):
+            changed = FigureTranslator(config)
+            with patch.object(changed, "_call_api", side_effect=_fake_api(calls)):
+                changed.translate(original, "1", "paper")
+
+        assert calls == [original, original]
+
+    def test_translation_with_chinese_left_is_not_cached(self, tmp_path, config):
+        translator = FigureTranslator(config)
+        calls = []
+        original = _figure(tmp_path / "fig.png")
+
+        with (
+            patch.object(translator, "_call_api", side_effect=_fake_api(calls)),
+            patch("src.figure_pipeline.translator.time.sleep"),
+        ):
+            translator.translate(
+                original, "1", "paper", max_passes=2, qa_check=lambda path: True
+            )
+
+        assert len(calls) == 2
+        assert translator.cache.get(original) is None
+
+    def test_fallback_model_translation_is_not_cached(self, tmp_path, config):
+        translator = FigureTranslator(config)
+        calls = []
+        original = _figure(tmp_path / "fig.png")
+        flash = _fake_api(calls, model=FigureTranslator.MODEL_FLASH)
+
+        with patch.object(translator, "_call_api", side_effect=flash):
+            assert translator.translate(original, "1", "paper")
+
+        assert translator.cache.get(original) is None
+
+    def test_openrouter_primary_model_is_cached(self, tmp_path, config):
+        translator = FigureTranslator(config)
+        calls = []
+        original = _figure(tmp_path / "fig.png")
+        pro = _fake_api(calls, model=FigureTranslator.MODEL_PRO)
+
+        with patch.object(translator, "_call_api", side_effect=pro):
+            translator.translate(original, "1", "paper")
+
+        assert translator.cache.get(original) is not None
+
+
+class TestPipelineCache:
+    @patch.object(FigurePipeline, "_find_pdf")
+    @patch.object(FigurePipeline, "extractor", new_callable=PropertyMock)
+    @patch.object(FigurePipeline, "validator", new_callable=PropertyMock)
+    def test_reprocessing_unchanged_figure_makes_no_api_calls(
+        self,
+        mock_validator_prop,
+        mock_extractor_prop,
+        mock_find_pdf,
+        tmp_path,
+        config,
+    ):
+        mock_find_pdf.return_value = str(tmp_path / "paper.pdf")
+        config = config.model_copy(update={"dry_run": True, "chinese_prefilter": "off"})
+
+        def extract_all(pdf_path, output_dir):
+            path = _figure(os.path.join(output_dir, "fig_1.png"))
+            return [
+                Figure(
+                    paper_id="paper",
+                    figure_number="1",
+                    figure_type=FigureType.FIGURE,
+                    status=ProcessingStatus.EXTRACTED,
+                    original_path=path,
+                )
+            ]
+
+        mock_extractor_prop.return_value = MagicMock(extract_all=extract_all)
+        validator = MagicMock()
+        validator.validate.side_effect = lambda path: {
+            "readable": True,
+            "has_chinese": "_en" not in os.path.basename(path),
+            "figure_type": "chart",
+        }
+        validator.has_chinese.return_value = False
+        validator.qa_translation.return_value = {"passed": True, "differences": "ok"}
+        mock_validator_prop.return_value = validator
+        calls = []
+
+        results = []
+        for _ in range(2):
+            pipeline = FigurePipeline(config)
+            with patch.object(
+                pipeline.translator, "_call_api", side_effect=_fake_api(calls)
+            ):
+                results.append(pipeline.process_paper("paper"))
+
+        first, second = results
+        assert first.translated == second.translated == 1
+        assert (first.cached, second.cached) == (0, 1)
+        assert len(calls) == 1
+        # First paper only: validation, then the re-check after the pass
+        assert validator.validate.call_count == 1
+        assert validator.has_chinese.call_count == 1
+        assert validator.qa_translation.call_count == 1
+        assert second.figures[0].qa_translation_passed is True
+        assert second.figures[0].qa_translation_notes == "ok"
+
+    @patch.object(FigurePipeline, "_find_pdf")
+    @patch.object(FigurePipeline, "extractor", new_callable=PropertyMock)
+    @patch.object(FigurePipeline, "validator", new_callable=PropertyMock)
+    def test_translation_that_failed_qa_is_retranslated(
+        self,
+        mock_validator_prop,
+        mock_extractor_prop,
+        mock_find_pdf,
+        tmp_path,
+        config,
+    ):
+        mock_find_pdf.return_value = str(tmp_path / "paper.pdf")
+        config = config.model_copy(update={"dry_run": True, "chinese_prefilter": "off"})
+
+        def extract_all(pdf_path, output_dir):
+            path = _figure(os.path.join(output_dir, "fig_1.png"))
+            return [
+                Figure(
+                    paper_id="paper",
+                    figure_number="1",
+                    figure_type=FigureType.FIGURE,
+                    status=ProcessingStatus.EXTRACTED,
+                    original_path=path,
+                )
+            ]
+
+        mock_extractor_prop.return_value = MagicMock(extract_all=extract_all)
+        validator = MagicMock()
+        validator.validate.return_value = {
+            "readable": True,
+            "has_chinese": True,
+            "figure_type": "chart",
+        }
+        validator.has_chinese.return_value = False
+        validator.qa_translation.side_effect = [
+            {"passed": False, "differences": "Chinese text still present"},
+            {"passed": True, "differences": "ok"},
+        ]
+        mock_validator_prop.return_value = validator
+        calls = []
+
+        results = []
+        for _ in range(2):
+            pipeline = FigurePipeline(config)
+            with patch.object(
+                pipeline.translator, "_call_api", side_effect=_fake_api(calls)
+            ):
+                results.append(pipeline.process_paper("paper"))
+
+        first, second = results
+        assert (first.cached, second.cached) == (0, 0)
+        assert len(calls) == 2
+        assert validator.validate.call_count == 2
+        assert validator.qa_translation.call_count == 2
+        assert first.figures[0].qa_translation_passed is False
+        assert second.figures[0].qa_translation_passed is True